@@ -1,16 +1,15 @@
-import random
 import typing
-from collections import Counter
 from enum import Enum
 
 import pyxel
 
-from source.util.calculator import calculate_yield_for_quad, attack, investigate_relic, heal
+from source.util.calculator import attack, investigate_relic, heal, get_night_affinity
 from source.foundation.catalogue import get_default_unit, Namer
 from source.foundation.models import Player, Quad, Biome, Settlement, Unit, Heathen, GameConfig, InvestigationResult, \
-    Faction, DeployerUnit
+    Faction, DeployerUnit, AchievementTrigger
 from source.display.overlay import Overlay
 from source.display.overlay_display import display_overlay
+from source.game_management.board_state import BoardState
 
 
 class HelpOption(Enum):
@@ -24,7 +23,7 @@ class HelpOption(Enum):
     END_TURN = "ENTER: End turn"
 
 
-class Board:
+class Board(BoardState):
     """
     The class responsible for drawing everything in-game (i.e. not on menu).
     """
@@ -43,24 +42,13 @@ class Board:
         self.construction_prompt_time_bank = 0
         self.heal_time_bank = 0
 
-        self.game_config: GameConfig = cfg
-        self.namer: Namer = namer
-
-        # We allow quads to be supplied here in load game cases.
-        if quads is not None:
-            self.quads = quads
-        else:
-            self.quads: typing.List[typing.List[typing.Optional[Quad]]] = [[None] * 100 for _ in range(90)]
-            random.seed()
-            self.generate_quads(cfg.biome_clustering)
+        super().__init__(cfg, namer, Overlay(), quads)
 
         self.quad_selected: typing.Optional[Quad] = None
 
-        self.overlay = Overlay()
         self.selected_settlement: typing.Optional[Settlement] = None
         self.deploying_army = False
         self.deploying_army_from_unit = False
-        self.selected_unit: typing.Optional[Unit | Heathen] = None
 
     def draw(self, players: typing.List[Player], map_pos: (int, int), turn: int, heathens: typing.List[Heathen],
              is_night: bool, turns_until_change: int):  # pragma: no cover
@@ -119,7 +107,7 @@ class Board:
                                 quad_x = 16
                             case _:
                                 quad_x = 24
-                        quad_y = 20 if quad.is_relic else 4
+                        quad_y = 20 if (i, j) in self.relics else 4
                         if is_night:
                             quad_x += 32
                         pyxel.blt((i - map_pos[0]) * 8 + 4, (j - map_pos[1]) * 8 + 4, 0, quad_x, quad_y, 8, 8)
@@ -322,6 +310,21 @@ class Board:
         # Also display the overlay.
         display_overlay(self.overlay, is_night)
 
+    def draw_processing_indicator(self, fast_forward_done: int, fast_forward_left: int):  # pragma: no cover
+        """
+        Draws an indicator over the last drawn frame of the board to show that the turn is being processed.
+        :param fast_forward_done: The number of turns fast-forwarded through so far.
+        :param fast_forward_left: The number of turns left to fast-forward through.
+        """
+        pyxel.rect(56, 90, 88, 14, pyxel.COLOR_BLACK)
+        pyxel.rectb(56, 90, 88, 14, pyxel.COLOR_WHITE)
+        # Show the progress made when fast-forwarding through several turns.
+        if fast_forward_done + fast_forward_left > 0:
+            pyxel.text(60, 95, f"Fast-forwarding {fast_forward_done}/{fast_forward_done + fast_forward_left}",
+                       pyxel.COLOR_WHITE)
+        else:
+            pyxel.text(69, 95, "Processing turn...", pyxel.COLOR_WHITE)
+
     def update(self, elapsed_time: float):
         """
         Update the time banks with the supplied elapsed time since the last update.
@@ -372,50 +375,6 @@ class Board:
                 self.overlay.toggle_heal(None)
                 self.heal_time_bank = 0
 
-    def generate_quads(self, biome_clustering: bool):
-        """
-        Generate the quads to be used for this game.
-        :param biome_clustering: Whether biome clustering is enabled or not.
-        """
-        for i in range(90):
-            for j in range(100):
-                if biome_clustering:
-                    # The below block of code gets all directly adjacent quads to the one being currently generated.
-                    surrounding_biomes = []
-                    if i > 0:
-                        if j > 0:
-                            surrounding_biomes.append(self.quads[i - 1][j - 1].biome)
-                        surrounding_biomes.append(self.quads[i - 1][j].biome)
-                        if j < 99:
-                            surrounding_biomes.append(self.quads[i - 1][j + 1].biome)
-                    if j > 0:
-                        surrounding_biomes.append(self.quads[i][j - 1].biome)
-                    if len(surrounding_biomes) > 0:
-                        # Work out which biome nearby is most prevalent, and 40% of the time, choose that biome. This
-                        # 40% rate is adjustable. Note that 100% would result in the entire board having the same biome
-                        # and 0% would result in random picks.
-                        biome_ctr = Counter(surrounding_biomes)
-                        max_rate: Biome = max(biome_ctr, key=biome_ctr.get)
-                        biome: Biome
-                        rand = random.random()
-                        if rand < 0.4:
-                            biome = max_rate
-                        else:
-                            biome = random.choice(list(Biome))
-                    else:
-                        biome = random.choice(list(Biome))
-                else:
-                    # If we're not using biome clustering, just randomly choose one.
-                    biome = random.choice(list(Biome))
-                quad_yield: (float, float, float, float) = calculate_yield_for_quad(biome)
-
-                is_relic = False
-                relic_chance = random.randint(0, 100)
-                if relic_chance < 1:
-                    is_relic = True
-
-                self.quads[i][j] = Quad(biome, *quad_yield, location=(j, i), is_relic=is_relic)
-
     def process_right_click(self, mouse_x: int, mouse_y: int, map_pos: (int, int)):
         """
         Process a right click by the player at given coordinates with the current map position.
@@ -485,7 +444,7 @@ class Board:
                     quad_biome = self.quads[adj_y][adj_x].biome
                     setl_name = self.namer.get_settlement_name(quad_biome)
                     new_settl = Settlement(setl_name, (adj_x, adj_y), [], [self.quads[adj_y][adj_x]],
-                                           [get_default_unit((adj_x, adj_y))])
+                                           [get_default_unit((adj_x, adj_y), get_night_affinity(player))])
                     match player.faction:
                         case Faction.CONCENTRATED:
                             new_settl.strength *= 2
@@ -495,7 +454,9 @@ class Board:
                         case Faction.IMPERIALS:
                             new_settl.strength /= 2
                             new_settl.max_strength /= 2
+                    self.events.settlement_founded(player, new_settl)
                     player.settlements.append(new_settl)
+                    self.achievements.trigger(AchievementTrigger.SETTLEMENT_GAINED)
                     # Automatically add 5 quads in either direction to the player's seen.
                     for i in range(adj_y - 5, adj_y + 6):
                         for j in range(adj_x - 5, adj_x + 6):
@@ -533,9 +494,12 @@ class Board:
                         initial = self.selected_unit.location
                         distance_travelled = max(abs(initial[0] - adj_x), abs(initial[1] - adj_y))
                         self.selected_unit.remaining_stamina -= distance_travelled
+                        self.events.unit_garrisoned(self.selected_unit, to_select)
                         self.selected_unit.garrisoned = True
+                        self.sieges.end(self.selected_unit)
                         to_select.garrison.append(self.selected_unit)
                         player.units.remove(self.selected_unit)
+                        self.achievements.trigger(AchievementTrigger.GARRISON_GREW)
                         # Deselect the unit now.
                         self.selected_unit = None
                         self.overlay.toggle_unit(None)
@@ -556,6 +520,8 @@ class Board:
                         initial = self.selected_unit.location
                         distance_travelled = max(abs(initial[0] - adj_x), abs(initial[1] - adj_y))
                         self.selected_unit.remaining_stamina -= distance_travelled
+                        self.events.unit_boarded(self.selected_unit, to_select)
+                        self.sieges.end(self.selected_unit)
                         to_select.passengers.append(self.selected_unit)
                         player.units.remove(self.selected_unit)
                         # Deselect the unit now.
@@ -576,6 +542,9 @@ class Board:
                         deployed.garrisoned = False
                         deployed.location = adj_x, adj_y
                         player.units.append(deployed)
+                        self.events.unit_deployed(self.selected_settlement, len(self.selected_settlement.garrison),
+                                                  deployed)
+                        self.achievements.trigger(AchievementTrigger.UNIT_DEPLOYED)
                         # Add the surrounding quads to the player's seen.
                         for i in range(adj_y - 5, adj_y + 6):
                             for j in range(adj_x - 5, adj_x + 6):
@@ -600,8 +569,10 @@ class Board:
                         unit_idx = self.overlay.unit_passengers_idx
                         deployed = self.selected_unit.passengers[unit_idx]
                         deployed.location = adj_x, adj_y
+                        self.events.passenger_deployed(self.selected_unit, unit_idx, deployed)
                         self.selected_unit.passengers[unit_idx:unit_idx + 1] = []
                         player.units.append(deployed)
+                        self.achievements.trigger(AchievementTrigger.UNIT_DEPLOYED)
                         # Add the surrounding quads to the player's seen.
                         for i in range(adj_y - 5, adj_y + 6):
                             for j in range(adj_x - 5, adj_x + 6):
@@ -629,9 +600,11 @@ class Board:
                         if self.selected_unit is not other_unit and other_unit not in player.units and \
                                 abs(self.selected_unit.location[0] - other_unit.location[0]) <= 1 and \
                                 abs(self.selected_unit.location[1] - other_unit.location[1]) <= 1:
+                            self.events.unit_attacked(self.selected_unit, other_unit, ai=False)
                             data = attack(self.selected_unit, other_unit, ai=False)
                             # Destroy the player's unit if it died.
                             if self.selected_unit.health <= 0:
+                                self.sieges.end(self.selected_unit)
                                 player.units.remove(self.selected_unit)
                                 self.selected_unit = None
                                 self.overlay.toggle_unit(None)
@@ -640,6 +613,7 @@ class Board:
                                 if other_unit in heathens:
                                     heathens.remove(other_unit)
                                 else:
+                                    self.sieges.end(other_unit)
                                     for p in all_players:
                                         if other_unit in p.units:
                                             p.units.remove(other_unit)
@@ -656,6 +630,7 @@ class Board:
                                     not isinstance(other_unit, DeployerUnit) and \
                                     abs(self.selected_unit.location[0] - other_unit.location[0]) <= 1 and \
                                     abs(self.selected_unit.location[1] - other_unit.location[1]) <= 1:
+                                self.events.unit_healed(self.selected_unit, other_unit)
                                 data = heal(self.selected_unit, other_unit, ai=False)
                                 self.overlay.toggle_heal(data)
                                 self.heal_time_bank = 0
@@ -688,7 +663,7 @@ class Board:
                             not any(unit.location == (adj_x, adj_y) for unit in all_units) and \
                             not any(any(setl_quad.location == (adj_x, adj_y) for setl_quad in setl.quads)
                                     for setl in other_setls) and \
-                            not self.quads[adj_y][adj_x].is_relic and \
+                            (adj_x, adj_y) not in self.relics and \
                             self.selected_unit.location[0] - self.selected_unit.remaining_stamina <= adj_x <= \
                             self.selected_unit.location[0] + self.selected_unit.remaining_stamina and \
                             self.selected_unit.location[1] - self.selected_unit.remaining_stamina <= adj_y <= \
@@ -697,13 +672,19 @@ class Board:
                         distance_travelled = max(abs(initial[0] - adj_x), abs(initial[1] - adj_y))
                         self.selected_unit.remaining_stamina -= distance_travelled
                         self.selected_unit.location = adj_x, adj_y
-                        # Any unit that moves more than 1 quad away while besieging ends their siege on the settlement.
-                        found_besieged_setl = False
+                        self.events.unit_moved(self.selected_unit)
+                        # Any unit that moves more than 1 quad away while besieging ends their siege on the settlement,
+                        # and any unit that moves next to a settlement under siege joins the siege.
+                        if self.selected_unit.besieging:
+                            self.events.siege_ended(self.selected_unit)
+                        self.sieges.end(self.selected_unit)
                         for setl in other_setls:
                             if setl.besieged and abs(self.selected_unit.location[0] - setl.location[0]) <= 1 and \
                                         abs(self.selected_unit.location[1] - setl.location[1]) <= 1:
-                                found_besieged_setl = True
-                        self.selected_unit.besieging = found_besieged_setl
+                                self.events.siege_begun(self.selected_unit, setl)
+                                self.sieges.begin(self.selected_unit, setl)
+                                self.achievements.trigger(AchievementTrigger.SIEGE_BEGUN)
+                                break
                         # Update the player's seen quads.
                         for i in range(adj_y - 5, adj_y + 6):
                             for j in range(adj_x - 5, adj_x + 6):
@@ -711,15 +692,16 @@ class Board:
                     # If the player has selected one of their units and clicked on a relic, investigate it, providing
                     # that their unit is close enough.
                     elif not self.deploying_army_from_unit and self.selected_unit is not None and \
-                            self.selected_unit in player.units and self.quads[adj_y][adj_x].is_relic:
+                            self.selected_unit in player.units and (adj_x, adj_y) in self.relics:
                         if abs(self.selected_unit.location[0] - adj_x) <= 1 and \
                                 abs(self.selected_unit.location[1] - adj_y) <= 1:
                             result: InvestigationResult = investigate_relic(player,
                                                                             self.selected_unit,
                                                                             (adj_x, adj_y),
                                                                             self.game_config)
+                            self.events.relic_investigated(self.selected_unit, (adj_x, adj_y), result)
                             # Relics cease to exist once investigated.
-                            self.quads[adj_y][adj_x].is_relic = False
+                            self.relics.remove((adj_x, adj_y))
                             self.overlay.toggle_investigation(result)
                     # Lastly, if the player has selected a unit and they click elsewhere, deselect the unit.
                     elif not self.deploying_army_from_unit and self.selected_unit is not None and \
@@ -750,7 +732,9 @@ class Board:
             elif player.faction is Faction.IMPERIALS:
                 new_settl.strength /= 2
                 new_settl.max_strength /= 2
+            self.events.settlement_founded(player, new_settl, self.selected_unit)
             player.settlements.append(new_settl)
+            self.achievements.trigger(AchievementTrigger.SETTLEMENT_GAINED)
             # Destroy the settler unit and select the new settlement.
             player.units.remove(self.selected_unit)
             self.selected_unit = None
@@ -11,7 +11,7 @@ from source.util.calculator import clamp
 from source.foundation.catalogue import BLESSINGS, FACTION_DETAILS, VICTORY_TYPE_COLOURS, get_unlockable_improvements, \
     IMPROVEMENTS, UNIT_PLANS, FACTION_COLOURS, PROJECTS, ACHIEVEMENTS
 from source.foundation.models import GameConfig, VictoryType, Faction, ProjectType, Statistics, UnitPlan, \
-    DeployerUnitPlan
+    DeployerUnitPlan, SaveMetadata
 
 
 class MainMenuOption(Enum):
@@ -86,6 +86,8 @@ class Menu:
         self.improvement_boundaries = 0, 3
         self.unit_boundaries = 0, 8
         self.saves: List[str] = []
+        # The metadata of each save, for those that have any.
+        self.save_metadata: List[Optional[SaveMetadata]] = []
         self.save_idx: Optional[int] = 0
         self.setup_option = SetupOption.PLAYER_FACTION
         self.faction_idx = 0
@@ -206,6 +208,19 @@ class Menu:
                     draw_paragraph(147, 135, "More down!", 5)
                     pyxel.blt(167, 136, 0, 0, 76, 8, 8)
                 pyxel.text(56, 152, "Press SPACE to go back", pyxel.COLOR_WHITE)
+                # Display the details of the selected save beneath the list, for saves that have metadata.
+                if 0 <= self.save_idx < len(self.save_metadata) and \
+                        (metadata := self.save_metadata[self.save_idx]) is not None:
+                    pyxel.rectb(20, 167, 160, 30, pyxel.COLOR_WHITE)
+                    pyxel.rect(21, 168, 158, 28, pyxel.COLOR_BLACK)
+                    for pixel_y, row in enumerate(metadata.thumbnail):
+                        for pixel_x, colour in enumerate(row):
+                            pyxel.pset(26 + pixel_x, 173 + pixel_y, colour)
+                    pyxel.text(52, 171, f"Turn {metadata.turn}", pyxel.COLOR_WHITE)
+                    pyxel.text(52, 179, f"{metadata.player_faction.value}, {metadata.player_count} players",
+                               pyxel.COLOR_WHITE)
+                    pyxel.text(52, 187, f"{metadata.map_size[0]}x{metadata.map_size[1]} map, format "
+                                        f"v{metadata.version}", pyxel.COLOR_GRAY)
         elif self.in_wiki:
             match self.wiki_showing:
                 case WikiOption.VICTORIES:
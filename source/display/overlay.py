@@ -3,6 +3,7 @@ import typing
 from source.foundation.models import Settlement, Player, Improvement, Unit, Blessing, CompletedConstruction, UnitPlan, \
     Heathen, AttackData, SetlAttackData, Victory, InvestigationResult, OverlayType, SettlementAttackType, PauseOption, \
     Project, ConstructionMenu, HealData, Achievement
+from source.game_management.turn_profiler import TurnProfiler
 
 
 class Overlay:
@@ -61,6 +62,8 @@ class Overlay:
         self.show_unit_passengers: bool = False
         self.unit_passengers_idx: int = 0
         self.new_achievements: typing.List[Achievement] = []
+        self.turn_profiler: typing.Optional[TurnProfiler] = None
+        self.has_exported_profiles: bool = False
 
     """
     Note that the below methods feature some somewhat complex conditional logic in terms of which overlays may be
@@ -745,6 +748,25 @@ class Overlay:
         """
         return OverlayType.ACH_NOTIF in self.showing
 
+    def toggle_profiler(self, turn_profiler: typing.Optional[TurnProfiler]):
+        """
+        Toggle the turn profiler overlay, used for debugging.
+        :param turn_profiler: The profiler whose most recent turn profile should be displayed.
+        """
+        if OverlayType.PROFILER in self.showing:
+            self.showing.remove(OverlayType.PROFILER)
+        else:
+            self.showing.append(OverlayType.PROFILER)
+            self.turn_profiler = turn_profiler
+            self.has_exported_profiles = False
+
+    def is_profiler(self):
+        """
+        Returns whether the turn profiler overlay is currently being displayed.
+        :return: Whether the turn profiler overlay is being displayed.
+        """
+        return OverlayType.PROFILER in self.showing
+
     def remove_layer(self) -> typing.Optional[OverlayType]:
         """
         Remove a layer of the overlay, where possible.
@@ -786,3 +808,92 @@ class Overlay:
             self.toggle_settlement(None, self.current_player)
             return OverlayType.SETTLEMENT
         return None
+
+
+class NullOverlay(Overlay):
+    """
+    An overlay that discards the notifications sent to it, for games that are run without anyone to display them to,
+    e.g. headless simulations.
+    """
+
+    def toggle_unit(self, unit: typing.Optional[Unit | Heathen]):
+        """
+        Discard the unit overlay.
+        :param unit: The unit that would have been displayed.
+        """
+
+    def toggle_warning(self, settlements: typing.List[Settlement], no_blessing: bool, will_have_negative_wealth: bool):
+        """
+        Discard the warning overlay.
+        :param settlements: The settlements with no construction that would have been displayed.
+        :param no_blessing: Whether the player has no ongoing blessing.
+        :param will_have_negative_wealth: Whether the player will have negative wealth next turn.
+        """
+
+    def toggle_blessing_notification(self, blessing: typing.Optional[Blessing]):
+        """
+        Discard the blessing notification overlay.
+        :param blessing: The completed blessing that would have been displayed.
+        """
+
+    def toggle_construction_notification(self, constructions: typing.List[CompletedConstruction]):
+        """
+        Discard the construction notification overlay.
+        :param constructions: The completed constructions that would have been displayed.
+        """
+
+    def toggle_level_up_notification(self, settlements: typing.List[Settlement]):
+        """
+        Discard the level up notification overlay.
+        :param settlements: The levelled-up settlements that would have been displayed.
+        """
+
+    def toggle_attack(self, attack_data: typing.Optional[AttackData]):
+        """
+        Discard the attack overlay.
+        :param attack_data: The data that would have been displayed.
+        """
+
+    def toggle_setl_attack(self, attack_data: typing.Optional[SetlAttackData]):
+        """
+        Discard the settlement attack overlay.
+        :param attack_data: The data that would have been displayed.
+        """
+
+    def toggle_siege_notif(self, sieged: typing.Optional[Settlement], sieger: typing.Optional[Player]):
+        """
+        Discard the siege notification overlay.
+        :param sieged: The settlement placed under siege.
+        :param sieger: The player placing the settlement under siege.
+        """
+
+    def toggle_victory(self, victory: Victory):
+        """
+        Record the victory without displaying it, so that the outcome of the game is still known.
+        :param victory: The victory achieved by a player.
+        """
+        self.current_victory = victory
+
+    def toggle_elimination(self, eliminated: typing.Optional[Player]):
+        """
+        Discard the elimination overlay.
+        :param eliminated: The player that has just been eliminated.
+        """
+
+    def toggle_close_to_vic(self, close_to_vics: typing.List[Victory]):
+        """
+        Discard the close-to-victory overlay.
+        :param close_to_vics: The victories that are close to being achieved, and the players close to achieving them.
+        """
+
+    def toggle_night(self, beginning: typing.Optional[bool]):
+        """
+        Discard the night overlay.
+        :param beginning: Whether the night is beginning (will be False if dawn has broken).
+        """
+
+    def toggle_ach_notif(self, new_achievements: typing.List[Achievement]):
+        """
+        Discard the achievement notification overlay.
+        :param new_achievements: The new achievements that would have been displayed.
+        """
@@ -58,7 +58,7 @@ def display_overlay(overlay: Overlay, is_night: bool):
         if overlay.just_eliminated is overlay.current_player:
             pyxel.text(82, 65, "Game Over!", pyxel.COLOR_RED)
             pyxel.text(32, 75, "Defeat has arrived at your doorstep.", pyxel.COLOR_WHITE)
-            pyxel.text(35, 85, "Press ENTER to return to the menu.", pyxel.COLOR_WHITE)
+            pyxel.text(42, 85, "ENTER: Menu    F5: Spectate", pyxel.COLOR_WHITE)
         else:
             pyxel.text(56, 65, "Consigned to folklore", pyxel.COLOR_RED)
             pyxel.text(50, 75, f"{overlay.just_eliminated.name} has been eliminated.", overlay.just_eliminated.colour)
@@ -780,3 +780,21 @@ def display_overlay(overlay: Overlay, is_night: bool):
                 pyxel.blt(180, 150, 0, 8, 76, 8, 8)
 
                 pyxel.text(54, 150, "Press SPACE to go back.", pyxel.COLOR_WHITE)
+    # The profiler overlay is a debugging aid that displays the slowest phases of the most recent turn. It is drawn over
+    # everything else, so that it can be used no matter what else is being displayed.
+    if OverlayType.PROFILER in overlay.showing:
+        pyxel.rectb(60, 10, 138, 100, pyxel.COLOR_WHITE)
+        pyxel.rect(61, 11, 136, 98, pyxel.COLOR_BLACK)
+        if (profile := overlay.turn_profiler.latest) is None:
+            pyxel.text(66, 16, "Profiling from next turn", pyxel.COLOR_WHITE)
+        else:
+            pyxel.text(66, 16, f"Turn {profile.turn}: {sum(profile.timings.values()) * 1000:.1f}ms",
+                       pyxel.COLOR_WHITE)
+            slowest = sorted(profile.timings.items(), key=lambda timing: timing[1], reverse=True)[:9]
+            for idx, (phase, seconds) in enumerate(slowest):
+                pyxel.text(66, 28 + idx * 8, phase[:24], pyxel.COLOR_WHITE)
+                pyxel.text(166, 28 + idx * 8, f"{seconds * 1000:.1f}ms", pyxel.COLOR_YELLOW)
+        if overlay.has_exported_profiles:
+            pyxel.text(66, 101, "Exported!", pyxel.COLOR_GREEN)
+        else:
+            pyxel.text(66, 101, "F4: Export CSV", pyxel.COLOR_WHITE)
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import typing
 
-from source.foundation.models import Statistics, Settlement
+from source.foundation.models import Statistics
 
 if typing.TYPE_CHECKING:
     from source.game_management.game_state import GameState
@@ -18,20 +18,11 @@ def verify_full_house(game_state: GameState, _: Statistics) -> bool:
     :param _: The current statistics, which are unused.
     :return: Whether the achievement's criteria have been met.
     """
-    # Store which settlements in the game are under siege, and by how many units.
+    # Store which settlements in the game are under siege, and by how many of the player's units.
     setl_siege_counts: typing.Dict[str, int] = {}
-    all_setls: typing.List[Settlement] = []
-    for player in game_state.players:
-        all_setls.extend(player.settlements)
-
     for unit in game_state.players[0].units:
-        if unit.besieging:
-            for setl in all_setls:
-                for quad in setl.quads:
-                    # Associate the current besieging unit with a settlement under siege based on location.
-                    if abs(unit.location[0] - quad.location[0]) <= 1 and abs(unit.location[1] - quad.location[1]) <= 1:
-                        setl_siege_counts[setl.name] = \
-                            setl_siege_counts[setl.name] + 1 if setl.name in setl_siege_counts else 1
+        if (setl := game_state.board.sieges.target_of(unit)) is not None:
+            setl_siege_counts[setl.name] = setl_siege_counts[setl.name] + 1 if setl.name in setl_siege_counts else 1
 
     # If the player has eight or more units besieging another settlement, they have met the criterion for this
     # achievement.
@@ -2,12 +2,10 @@ import random
 import typing
 from copy import deepcopy
 
-import pyxel
-
-from source.foundation import achievements
+from source.foundation import achievements, palette
 from source.foundation.models import FactionDetail, Player, Improvement, ImprovementType, Effect, Blessing, \
     Settlement, UnitPlan, Unit, Biome, Heathen, Faction, Project, ProjectType, VictoryType, DeployerUnitPlan, \
-    Achievement, HarvestStatus, EconomicStatus
+    Achievement, AchievementTrigger, HarvestStatus, EconomicStatus, NightAffinity
 
 # The list of settlement names, for each biome.
 SETL_NAMES = {
@@ -304,56 +302,59 @@ UNIT_PLANS = [
 
 # A map of factions to their respective colours.
 FACTION_COLOURS: typing.Dict[Faction, int] = {
-    Faction.AGRICULTURISTS: pyxel.COLOR_GREEN,
-    Faction.CAPITALISTS: pyxel.COLOR_YELLOW,
-    Faction.SCRUTINEERS: pyxel.COLOR_LIGHT_BLUE,
-    Faction.GODLESS: pyxel.COLOR_CYAN,
-    Faction.RAVENOUS: pyxel.COLOR_LIME,
-    Faction.FUNDAMENTALISTS: pyxel.COLOR_ORANGE,
-    Faction.ORTHODOX: pyxel.COLOR_PURPLE,
-    Faction.CONCENTRATED: pyxel.COLOR_GRAY,
-    Faction.FRONTIERSMEN: pyxel.COLOR_PEACH,
-    Faction.IMPERIALS: pyxel.COLOR_DARK_BLUE,
-    Faction.PERSISTENT: pyxel.COLOR_RED,
-    Faction.EXPLORERS: pyxel.COLOR_PINK,
-    Faction.INFIDELS: pyxel.COLOR_BROWN,
-    Faction.NOCTURNE: pyxel.COLOR_NAVY
+    Faction.AGRICULTURISTS: palette.COLOR_GREEN,
+    Faction.CAPITALISTS: palette.COLOR_YELLOW,
+    Faction.SCRUTINEERS: palette.COLOR_LIGHT_BLUE,
+    Faction.GODLESS: palette.COLOR_CYAN,
+    Faction.RAVENOUS: palette.COLOR_LIME,
+    Faction.FUNDAMENTALISTS: palette.COLOR_ORANGE,
+    Faction.ORTHODOX: palette.COLOR_PURPLE,
+    Faction.CONCENTRATED: palette.COLOR_GRAY,
+    Faction.FRONTIERSMEN: palette.COLOR_PEACH,
+    Faction.IMPERIALS: palette.COLOR_DARK_BLUE,
+    Faction.PERSISTENT: palette.COLOR_RED,
+    Faction.EXPLORERS: palette.COLOR_PINK,
+    Faction.INFIDELS: palette.COLOR_BROWN,
+    Faction.NOCTURNE: palette.COLOR_NAVY
 }
 
 # A map of victory types to their respective colours.
 VICTORY_TYPE_COLOURS: typing.Dict[VictoryType, int] = {
-    VictoryType.ELIMINATION: pyxel.COLOR_RED,
-    VictoryType.JUBILATION: pyxel.COLOR_GREEN,
-    VictoryType.GLUTTONY: pyxel.COLOR_GREEN,
-    VictoryType.AFFLUENCE: pyxel.COLOR_YELLOW,
-    VictoryType.VIGOUR: pyxel.COLOR_ORANGE,
-    VictoryType.SERENDIPITY: pyxel.COLOR_PURPLE
+    VictoryType.ELIMINATION: palette.COLOR_RED,
+    VictoryType.JUBILATION: palette.COLOR_GREEN,
+    VictoryType.GLUTTONY: palette.COLOR_GREEN,
+    VictoryType.AFFLUENCE: palette.COLOR_YELLOW,
+    VictoryType.VIGOUR: palette.COLOR_ORANGE,
+    VictoryType.SERENDIPITY: palette.COLOR_PURPLE
 }
 
 # The list of achievements that the player can obtain.
 ACHIEVEMENTS: typing.List[Achievement] = [
     Achievement("Chicken Dinner", "Win a game.",
-                lambda _, stats: len(stats.victories) > 0),
+                lambda _, stats: len(stats.victories) > 0, {AchievementTrigger.VICTORY}),
     Achievement("Fully Improved", "Build every non-victory improvement in one game.",
-                lambda gs, _: sum(len(s.improvements) for s in gs.players[0].settlements) >= len(IMPROVEMENTS) - 1),
+                lambda gs, _: sum(len(s.improvements) for s in gs.players[0].settlements) >= len(IMPROVEMENTS) - 1,
+                {AchievementTrigger.IMPROVEMENT_BUILT, AchievementTrigger.SETTLEMENT_GAINED}),
     Achievement("Harvest Galore", "Have at least 5 settlements with plentiful harvests.",
                 lambda gs, _: len([s for s in gs.players[0].settlements
-                                   if s.harvest_status == HarvestStatus.PLENTIFUL]) >= 5),
+                                   if s.harvest_status == HarvestStatus.PLENTIFUL]) >= 5,
+                {AchievementTrigger.STATUS_CHANGED, AchievementTrigger.SETTLEMENT_GAINED}),
     Achievement("Mansa Musa", "Have at least 5 settlements with boom economies.",
                 lambda gs, _: len([s for s in gs.players[0].settlements
-                                   if s.economic_status == EconomicStatus.BOOM]) >= 5),
+                                   if s.economic_status == EconomicStatus.BOOM]) >= 5,
+                {AchievementTrigger.STATUS_CHANGED, AchievementTrigger.SETTLEMENT_GAINED}),
     Achievement("Last One Standing", "Achieve an elimination victory.",
-                lambda _, stats: VictoryType.ELIMINATION in stats.victories),
+                lambda _, stats: VictoryType.ELIMINATION in stats.victories, {AchievementTrigger.VICTORY}),
     Achievement("They Love Me!", "Achieve a jubilation victory.",
-                lambda _, stats: VictoryType.JUBILATION in stats.victories),
+                lambda _, stats: VictoryType.JUBILATION in stats.victories, {AchievementTrigger.VICTORY}),
     Achievement("Megalopoleis", "Achieve a gluttony victory.",
-                lambda _, stats: VictoryType.GLUTTONY in stats.victories),
+                lambda _, stats: VictoryType.GLUTTONY in stats.victories, {AchievementTrigger.VICTORY}),
     Achievement("Wealth Upon Wealth", "Achieve an affluence victory.",
-                lambda _, stats: VictoryType.AFFLUENCE in stats.victories),
+                lambda _, stats: VictoryType.AFFLUENCE in stats.victories, {AchievementTrigger.VICTORY}),
     Achievement("Sanctum Sanctorum", "Achieve a vigour victory.",
-                lambda _, stats: VictoryType.VIGOUR in stats.victories),
+                lambda _, stats: VictoryType.VIGOUR in stats.victories, {AchievementTrigger.VICTORY}),
     Achievement("Arduously Blessed", "Achieve a serendipity victory.",
-                lambda _, stats: VictoryType.SERENDIPITY in stats.victories),
+                lambda _, stats: VictoryType.SERENDIPITY in stats.victories, {AchievementTrigger.VICTORY}),
     Achievement("Grow And Grow", "Win with the Agriculturists.",
                 lambda gs, _: gs.players[0].faction == Faction.AGRICULTURISTS, post_victory=True),
     Achievement("Money Talks", "Win with the Capitalists.",
@@ -385,59 +386,73 @@ ACHIEVEMENTS: typing.List[Achievement] = [
     Achievement("The Golden Quad", "Found a settlement on a quad with at least 19 total yield.",
                 lambda gs, _: any((setl.quads[0].wealth + setl.quads[0].harvest +
                                    setl.quads[0].zeal + setl.quads[0].fortune) >= 19
-                                  for setl in gs.players[0].settlements)),
+                                  for setl in gs.players[0].settlements), {AchievementTrigger.SETTLEMENT_GAINED}),
     Achievement("Wholly Blessed", "Undergo all non-victory blessings.",
-                lambda gs, _: len(gs.players[0].blessings) >= len(BLESSINGS) - 4),
+                lambda gs, _: len(gs.players[0].blessings) >= len(BLESSINGS) - 4,
+                {AchievementTrigger.BLESSING_UNDERGONE}),
     Achievement("Unstoppable Force", "Have 20 deployed units.",
-                lambda gs, _: len(gs.players[0].units) >= 20),
+                lambda gs, _: len(gs.players[0].units) >= 20, {AchievementTrigger.UNIT_DEPLOYED}),
     Achievement("Full House", "Besiege a settlement with 8 units at once.",
-                achievements.verify_full_house),
+                achievements.verify_full_house, {AchievementTrigger.SIEGE_BEGUN}),
     Achievement("Sprawling Skyscrapers", "Fully expand a Concentrated settlement.",
                 lambda gs, _: (gs.players[0].faction == Faction.CONCENTRATED and
-                               any(setl.level == 10 for setl in gs.players[0].settlements))),
+                               any(setl.level == 10 for setl in gs.players[0].settlements)),
+                {AchievementTrigger.SETTLEMENT_GREW}),
     Achievement("Ready Reservists", "Accumulate 10 units in a garrison.",
-                lambda gs, _: any(len(setl.garrison) >= 10 for setl in gs.players[0].settlements)),
+                lambda gs, _: any(len(setl.garrison) >= 10 for setl in gs.players[0].settlements),
+                {AchievementTrigger.GARRISON_GREW, AchievementTrigger.SETTLEMENT_GAINED}),
     Achievement("The Big Wall", "Have a settlement reach 300 strength.",
-                lambda gs, _: any(setl.strength >= 300 for setl in gs.players[0].settlements)),
+                lambda gs, _: any(setl.strength >= 300 for setl in gs.players[0].settlements),
+                {AchievementTrigger.SETTLEMENT_GREW, AchievementTrigger.IMPROVEMENT_BUILT,
+                 AchievementTrigger.SETTLEMENT_GAINED}),
     Achievement("Utopia", "Reach 100 satisfaction in a settlement.",
-                lambda gs, _: any(setl.satisfaction == 100 for setl in gs.players[0].settlements)),
+                lambda gs, _: any(setl.satisfaction == 100 for setl in gs.players[0].settlements),
+                {AchievementTrigger.SETTLEMENT_GREW, AchievementTrigger.IMPROVEMENT_BUILT,
+                 AchievementTrigger.SETTLEMENT_GAINED}),
     Achievement("All Grown Up", "Reach level 10 in a settlement.",
-                lambda gs, _: any(setl.level == 10 for setl in gs.players[0].settlements)),
+                lambda gs, _: any(setl.level == 10 for setl in gs.players[0].settlements),
+                {AchievementTrigger.SETTLEMENT_GREW, AchievementTrigger.SETTLEMENT_GAINED}),
     Achievement("Terra Nullius", "Found 10 settlements.",
-                lambda gs, _: len(gs.players[0].settlements) >= 10),
+                lambda gs, _: len(gs.players[0].settlements) >= 10, {AchievementTrigger.SETTLEMENT_GAINED}),
     Achievement("All Is Revealed", "See all quads in a fog of war game.",
-                lambda gs, _: len(gs.players[0].quads_seen) == 9000),
+                lambda gs, _: len(gs.players[0].quads_seen) == 9000, {AchievementTrigger.TURN_ENDED}),
     Achievement("Player's Choice", "Have at least 3 imminent victories in one game.",
-                lambda gs, _: len(gs.players[0].imminent_victories) >= 3),
+                lambda gs, _: len(gs.players[0].imminent_victories) >= 3, {AchievementTrigger.TURN_ENDED}),
     # The below will need to be changed if extra factions are ever introduced.
     Achievement("Free For All", "Win a game with 14 players.",
                 lambda gs, _: len(gs.players) == 14, post_victory=True),
     Achievement("Sleepwalker", "Have 5 units deployed at nighttime.",
-                lambda gs, _: gs.nighttime_left > 0 and len(gs.players[0].units) >= 5),
+                lambda gs, _: gs.nighttime_left > 0 and len(gs.players[0].units) >= 5,
+                {AchievementTrigger.UNIT_DEPLOYED, AchievementTrigger.NIGHTFALL}),
     Achievement("Just Before Bed", "Play for 1 hour total.",
-                lambda _, stats: int(stats.playtime // 3600) >= 1),
+                lambda _, stats: int(stats.playtime // 3600) >= 1, {AchievementTrigger.TURN_ENDED}),
     Achievement("All Nighter", "Play for 5 hours total.",
-                lambda _, stats: int(stats.playtime // 3600) >= 5),
+                lambda _, stats: int(stats.playtime // 3600) >= 5, {AchievementTrigger.TURN_ENDED}),
     Achievement("Keep Coming Back", "Play for 20 hours total.",
-                lambda _, stats: int(stats.playtime // 3600) >= 20),
+                lambda _, stats: int(stats.playtime // 3600) >= 20, {AchievementTrigger.TURN_ENDED}),
     Achievement("One More Turn", "Play 250 turns.",
-                lambda _, stats: stats.turns_played >= 250),
+                lambda _, stats: stats.turns_played >= 250, {AchievementTrigger.TURN_ENDED}),
     Achievement("What Time Is It?", "Play 1000 turns.",
-                lambda _, stats: stats.turns_played >= 1000),
+                lambda _, stats: stats.turns_played >= 1000, {AchievementTrigger.TURN_ENDED}),
     Achievement("The Collector", "Achieve every type of victory.",
-                lambda _, stats: len(stats.victories) == 6),
+                lambda _, stats: len(stats.victories) == 6, {AchievementTrigger.VICTORY}),
     Achievement("Globalist", "Use every faction.",
                 # The below will need to be changed if extra factions are ever introduced.
-                lambda _, stats: len(stats.factions) == 14),
+                lambda _, stats: len(stats.factions) == 14,
+                # Factions are used before the game's players exist, so this is verified once the first turn ends.
+                {AchievementTrigger.TURN_ENDED}),
     Achievement("Midnight Feast", "Achieve plentiful harvest in a settlement at nighttime.",
                 lambda gs, _: gs.nighttime_left > 0 and any(setl.harvest_status == HarvestStatus.PLENTIFUL
-                                                            for setl in gs.players[0].settlements)),
+                                                            for setl in gs.players[0].settlements),
+                {AchievementTrigger.STATUS_CHANGED, AchievementTrigger.NIGHTFALL,
+                 AchievementTrigger.SETTLEMENT_GAINED}),
     Achievement("It's Worth It", "Build an improvement that decreases satisfaction.",
-                achievements.verify_its_worth_it),
+                achievements.verify_its_worth_it,
+                {AchievementTrigger.IMPROVEMENT_BUILT, AchievementTrigger.SETTLEMENT_GAINED}),
     Achievement("On The Brink", "Found a settlement on the edge of the map.",
                 lambda gs, _: any(setl.location[0] == 0 or setl.location[0] == 99 or
                                   setl.location[1] == 0 or setl.location[1] == 89
-                                  for setl in gs.players[0].settlements)),
+                                  for setl in gs.players[0].settlements), {AchievementTrigger.SETTLEMENT_GAINED}),
     Achievement("Speed Run", "Win a 2 player game in 25 turns or less.",
                 lambda gs, _: len(gs.players) == 2 and gs.turn <= 25, post_victory=True)
 ]
@@ -450,7 +465,8 @@ def get_heathen_plan(turn: int) -> UnitPlan:
     :param turn: The game's current turn.
     :return: The UnitPlan to use for the created Heathen.
     """
-    return UnitPlan(80 + 10 * (turn // 40), 80 + 10 * (turn // 40), 2, "Heathen" + "+" * (turn // 40), None, 0)
+    return UnitPlan(80 + 10 * (turn // 40), 80 + 10 * (turn // 40), 2, "Heathen" + "+" * (turn // 40), None, 0,
+                    night_affinity=NightAffinity.HEATHEN)
 
 
 def get_heathen(location: (int, int), turn: int) -> Heathen:
@@ -464,13 +480,16 @@ def get_heathen(location: (int, int), turn: int) -> Heathen:
     return Heathen(plan.max_health, plan.total_stamina, location, plan)
 
 
-def get_default_unit(location: (int, int)) -> Unit:
+def get_default_unit(location: (int, int), night_affinity: typing.Optional[NightAffinity] = None) -> Unit:
     """
     Creates the default unit for each player in their first settlement, which is a Warrior.
     :param location: The location for the unit. Largely irrelevant due to the fact that it is garrisoned.
+    :param night_affinity: The affinity for the night that the player's units have, if any.
     :return: The created Unit object.
     """
-    return Unit(UNIT_PLANS[0].max_health, UNIT_PLANS[0].total_stamina, location, True, deepcopy(UNIT_PLANS[0]))
+    plan = deepcopy(UNIT_PLANS[0])
+    plan.night_affinity = night_affinity
+    return Unit(UNIT_PLANS[0].max_health, UNIT_PLANS[0].total_stamina, location, True, plan)
 
 
 def get_available_improvements(player: Player, settlement: Settlement) -> typing.List[Improvement]:
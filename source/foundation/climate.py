@@ -0,0 +1,119 @@
+import typing
+from contextlib import contextmanager
+from enum import Enum
+
+
+class NightAffinity(str, Enum):
+    """
+    The ways in which units can be affected by the night.
+    """
+    HEATHEN = "HEATHEN"  # Stronger at night.
+    NOCTURNE = "NOCTURNE"  # Stronger at night, but weakened during the day once the first night has passed.
+
+
+class Climate:
+    """
+    The state of a game's climate, which modifies the stats of units with an affinity for the night whenever they are
+    read. Only each unit's base stats are stored, meaning that day and night can be toggled without updating every unit,
+    and that stats are unaffected by rounding no matter how many nights pass. Each game state has its own climate, and
+    stats are modified by whichever climate has been applied, i.e. that of the game being played.
+    """
+    # The climate that has been applied, by which stats are modified when read.
+    current: typing.ClassVar["Climate"]
+
+    def __init__(self):
+        """
+        Initialise the climate at the start of a game, in the daytime.
+        """
+        self.is_night = False
+        # Units of The Nocturne are only weakened during the day once they have experienced their first night.
+        self.has_dawned = False
+        # Whether modifiers are currently suspended, meaning that base stats are read instead.
+        self.suspended = False
+
+    def reset(self, is_night: bool = False, has_dawned: bool = False):
+        """
+        Reset the climate for a new or loaded game.
+        :param is_night: Whether it is night.
+        :param has_dawned: Whether a night has passed in the game.
+        """
+        self.is_night = is_night
+        self.has_dawned = has_dawned
+        self.suspended = False
+
+    def multiplier(self, affinity: typing.Optional[NightAffinity], stat: str) -> float:
+        """
+        :param affinity: The night affinity of the unit plan the stat belongs to.
+        :param stat: The name of the stat.
+        :return: The multiplier to apply to the given stat.
+        """
+        if affinity is None or self.suspended:
+            return 1
+        # Both heathens and units of The Nocturne have their power doubled at night.
+        if self.is_night:
+            return 2 if stat == "power" else 1
+        # During the day, units of The Nocturne have their power, health, and stamina halved.
+        return 0.5 if affinity is NightAffinity.NOCTURNE and self.has_dawned else 1
+
+    def apply(self):
+        """
+        Apply this climate, meaning that stats will be modified by it when read, e.g. when its game is being played.
+        """
+        Climate.current = self
+
+    @contextmanager
+    def applied(self):
+        """
+        Apply this climate while in this context, restoring the previously-applied climate afterwards, e.g. so that a
+        game can be replayed without affecting the game being played.
+        """
+        previous = Climate.current
+        self.apply()
+        try:
+            yield
+        finally:
+            previous.apply()
+
+    @contextmanager
+    def unmodified(self):
+        """
+        Apply this climate with all modifiers suspended while in this context, e.g. so that base stats can be saved.
+        """
+        with self.applied():
+            self.suspended = True
+            try:
+                yield
+            finally:
+                self.suspended = False
+
+
+# Before any game is played, stats are modified by a climate in the daytime, i.e. not at all.
+Climate.current = Climate()
+
+
+class ClimaticStat:
+    """
+    A unit plan stat that is modified by the climate when read, based on the plan's night affinity. Only the base value
+    is stored, with changes made to the modified value being applied to the base value proportionally.
+    """
+
+    def __init__(self, name: str, rounded: bool = False):
+        """
+        :param name: The name of the stat.
+        :param rounded: Whether the modified value should be rounded, for stats that are whole numbers.
+        """
+        self.name = name
+        self.rounded = rounded
+
+    def __get__(self, plan, owner: type = None):
+        if plan is None:
+            return self
+        value = plan.__dict__[self.name] * Climate.current.multiplier(plan.night_affinity, self.name)
+        return round(value) if self.rounded else value
+
+    def __set__(self, plan, value: float):
+        # When a plan is created, its stats are set before its night affinity, and are always its base stats.
+        if "night_affinity" not in plan.__dict__:
+            plan.__dict__[self.name] = value
+        else:
+            plan.__dict__[self.name] = value / Climate.current.multiplier(plan.night_affinity, self.name)
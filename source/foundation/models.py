@@ -4,6 +4,9 @@ import typing
 from dataclasses import dataclass, field
 from enum import Enum
 
+from source.foundation.climate import NightAffinity, ClimaticStat
+from source.foundation.unit_store import StoredField, ActedFlag, unstored_state
+
 if typing.TYPE_CHECKING:
     from source.game_management.game_state import GameState
 
@@ -157,6 +160,7 @@ class OverlayType(Enum):
     INVESTIGATION = "INVESTIGATION"
     NIGHT = "NIGHT"
     ACH_NOTIF = "ACH_NOTIF"
+    PROFILER = "PROFILER"
 
 
 class SettlementAttackType(Enum):
@@ -272,6 +276,7 @@ class UnitPlan:
     cost: float  # Measured in zeal.
     can_settle: bool = False
     heals: bool = False
+    night_affinity: typing.Optional[NightAffinity] = None
 
 
 @dataclass
@@ -298,6 +303,21 @@ class Unit:
     besieging: bool = False
 
 
+# The power, maximum health, and total stamina of unit plans, as well as the health of units, are modified by the
+# climate when read, depending on the plan's affinity for the night. These are attached once the classes have been
+# defined, as otherwise the dataclasses would take them to be the fields' default values. Since stats are modified
+# whenever they are read, units of The Nocturne have their full health and stamina at night, and units created during
+# the day once a night has passed are weakened straight away.
+UnitPlan.power = ClimaticStat("power")
+UnitPlan.max_health = ClimaticStat("max_health")
+UnitPlan.total_stamina = ClimaticStat("total_stamina", rounded=True)
+# The per-turn state of units is kept in the unit store while they are held there. Copies of units are not held.
+Unit.health = StoredField("health", "health", climatic=True)
+Unit.remaining_stamina = StoredField("remaining_stamina", "stamina")
+Unit.has_acted = ActedFlag("has_acted", "acted")
+Unit.__getstate__ = unstored_state
+
+
 @dataclass
 class DeployerUnit(Unit):
     """
@@ -318,6 +338,11 @@ class Heathen:
     has_attacked: bool = False  # Heathens can also only attack once per turn.
 
 
+Heathen.health = StoredField("health", "health")
+Heathen.remaining_stamina = StoredField("remaining_stamina", "stamina")
+Heathen.__getstate__ = unstored_state
+
+
 @dataclass
 class Construction:
     """
@@ -389,6 +414,30 @@ class AIPlaystyle:
     expansion: ExpansionPlaystyle
 
 
+@dataclass
+class AIBudgetUsage:
+    """
+    The record of how much of its per-turn compute budget an AI player used while making its most recent move.
+    """
+    budget: float  # The allotted time, in seconds.
+    time_used: float  # The time actually taken, in seconds.
+    units_planned: int  # The number of units that were moved using the full planning logic.
+    units_defaulted: int  # The number of units that were given a cheap default move once the budget ran out.
+
+
+@dataclass
+class InfluenceStamp:
+    """
+    The influence exerted by a unit or settlement over the quads surrounding it.
+    """
+    entity: Unit | Settlement  # Kept so that the entity's ID cannot be reused while the stamp is applied.
+    owner: str  # The name of the player the entity belongs to.
+    location: (int, int)
+    radius: int
+    value: int  # Measured in hundredths.
+    is_threat: bool  # Whether the stamp applies to the threat grid, as opposed to the opportunity grid.
+
+
 @dataclass
 class Player:
     """
@@ -463,6 +512,21 @@ class GameConfig:
     climatic_effects: bool
 
 
+@dataclass
+class SaveMetadata:
+    """
+    The details of a saved game that are displayed when choosing a game to load, which are read without the rest of the
+    save.
+    """
+    version: int  # The version of the save format the game was saved in.
+    turn: int
+    player_faction: Faction
+    player_count: int
+    map_size: (int, int)  # Measured in quads.
+    # A small minimap of the board, with each row of pixels being the pyxel colours of the quads they depict.
+    thumbnail: typing.List[bytes]
+
+
 @dataclass
 class Victory:
     """
@@ -472,6 +536,40 @@ class Victory:
     type: VictoryType
 
 
+@dataclass
+class VictoryProgress:
+    """
+    A player's progress towards the victories that depend on their settlements and blessings.
+    """
+    jubilated_setls: int = 0  # Settlements at 100% satisfaction.
+    lvl_ten_setls: int = 0
+    constructed_sanctum: bool = False
+    constructing_sanctums: int = 0  # Settlements constructing the Holy Sanctum.
+    ardour_pieces: int = 0
+
+
+@dataclass
+class TurnProfile:
+    """
+    The time spent in each phase of a turn, used to find where the time taken to process turns goes.
+    """
+    turn: int
+    # The seconds spent in each phase, in the order in which the phases were first entered. Phases that are repeated for
+    # each player are suffixed with the player's name, e.g. make_move:NPC1.
+    timings: typing.Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class SimulationResult:
+    """
+    The outcome of a headless simulation of a game between AI players.
+    """
+    turns_played: int
+    victory: typing.Optional[Victory]  # Will be None if the turn limit was reached before anyone won.
+    time_elapsed: float  # In seconds.
+    profiles: typing.List[TurnProfile] = field(default_factory=list)  # Only populated if the game was profiled.
+
+
 @dataclass
 class Statistics:
     """
@@ -485,6 +583,24 @@ class Statistics:
     achievements: typing.Set[str] = field(default_factory=set)
 
 
+class AchievementTrigger(str, Enum):
+    """
+    The events that can lead to the player obtaining an achievement. Each achievement is only verified when one of the
+    events it is triggered by has occurred since achievements were last checked.
+    """
+    TURN_ENDED = "TURN_ENDED"  # Also covers the player's playtime being updated.
+    VICTORY = "VICTORY"
+    IMPROVEMENT_BUILT = "IMPROVEMENT_BUILT"
+    STATUS_CHANGED = "STATUS_CHANGED"  # A change in a settlement's harvest or economic status.
+    SIEGE_BEGUN = "SIEGE_BEGUN"
+    SETTLEMENT_GAINED = "SETTLEMENT_GAINED"  # Whether founded or taken.
+    SETTLEMENT_GREW = "SETTLEMENT_GREW"  # An increase in a settlement's level, strength, or satisfaction.
+    BLESSING_UNDERGONE = "BLESSING_UNDERGONE"
+    UNIT_DEPLOYED = "UNIT_DEPLOYED"
+    GARRISON_GREW = "GARRISON_GREW"  # Whether by a unit being garrisoned or constructed.
+    NIGHTFALL = "NIGHTFALL"
+
+
 @dataclass
 class Achievement:
     """
@@ -494,5 +610,188 @@ class Achievement:
     description: str
     # The function to call to verify whether the achievement has been obtained.
     verification_fn: typing.Callable[[GameState, Statistics], bool]
+    # The events that can lead to the achievement being obtained, and thus that it is verified after.
+    triggers: typing.Set[AchievementTrigger] = field(default_factory=set)
     # Whether this achievement can only be verified immediately after the player has won a game.
     post_victory: bool = False
+
+
+# The events below make up the event log of a game, which records every change made to the game state outside of the
+# processing of turns, so that the game can be replayed. Players are referred to by their index in the list of players,
+# and units and settlements by a pair of their owner's index and their index in the owner's units or settlements. As
+# such, events are always recorded before any units or settlements they refer to are removed.
+@dataclass
+class GameStartedEvent:
+    """
+    The start of a game, from which the board and the AI players' first settlements can be regenerated.
+    """
+    seed: int
+    until_night: int
+    config: GameConfig
+    # The name, faction, and playstyle of each player, with the latter being None for the non-AI player.
+    players: typing.List[typing.Tuple[str, Faction, typing.Optional[AIPlaystyle]]]
+
+
+@dataclass
+class TurnEndedEvent:
+    """
+    The end of a turn, including the movement of the heathens. Turns are processed from the given seed.
+    """
+    seed: int
+
+
+@dataclass
+class SettlementFoundedEvent:
+    """
+    A settlement founded by the given settler unit, or as the player's first settlement if there is no settler.
+    """
+    player: int
+    name: str
+    location: typing.Tuple[int, int]
+    settler: typing.Optional[int]
+
+
+@dataclass
+class BlessingSetEvent:
+    """
+    A player beginning to undergo a blessing.
+    """
+    player: int
+    blessing: str
+
+
+@dataclass
+class ConstructionSetEvent:
+    """
+    A settlement beginning a construction.
+    """
+    settlement: typing.Tuple[int, int]
+    construction: str
+
+
+@dataclass
+class ConstructionBoughtOutEvent:
+    """
+    The remaining cost of a settlement's current construction being bought out.
+    """
+    settlement: typing.Tuple[int, int]
+
+
+@dataclass
+class UnitMovedEvent:
+    """
+    A unit moving to a new location.
+    """
+    unit: typing.Tuple[int, int]
+    location: typing.Tuple[int, int]
+    remaining_stamina: int
+
+
+@dataclass
+class UnitDeployedEvent:
+    """
+    A unit being deployed from a settlement's garrison.
+    """
+    settlement: typing.Tuple[int, int]
+    garrison_idx: int
+    location: typing.Tuple[int, int]
+
+
+@dataclass
+class PassengerDeployedEvent:
+    """
+    A unit being deployed from a deployer unit.
+    """
+    deployer: typing.Tuple[int, int]
+    passenger_idx: int
+    location: typing.Tuple[int, int]
+
+
+@dataclass
+class UnitGarrisonedEvent:
+    """
+    A unit moving into one of its player's settlements.
+    """
+    unit: typing.Tuple[int, int]
+    settlement: typing.Tuple[int, int]
+    remaining_stamina: int
+
+
+@dataclass
+class UnitBoardedEvent:
+    """
+    A unit boarding one of its player's deployer units.
+    """
+    unit: typing.Tuple[int, int]
+    deployer: typing.Tuple[int, int]
+    remaining_stamina: int
+
+
+@dataclass
+class UnitAttackedEvent:
+    """
+    A unit attacking another unit or a heathen, the latter of which are referred to with an owner index of -1.
+    """
+    attacker: typing.Tuple[int, int]
+    defender: typing.Tuple[int, int]
+    ai: bool  # AI units end any siege they are part of before attacking.
+
+
+@dataclass
+class SettlementAttackedEvent:
+    """
+    A unit attacking a settlement.
+    """
+    attacker: typing.Tuple[int, int]
+    settlement: typing.Tuple[int, int]
+
+
+@dataclass
+class UnitHealedEvent:
+    """
+    A unit healing another.
+    """
+    healer: typing.Tuple[int, int]
+    healed: typing.Tuple[int, int]
+
+
+@dataclass
+class SiegeBegunEvent:
+    """
+    A unit beginning to besiege a settlement.
+    """
+    unit: typing.Tuple[int, int]
+    settlement: typing.Tuple[int, int]
+
+
+@dataclass
+class SiegeEndedEvent:
+    """
+    A unit ending its siege.
+    """
+    unit: typing.Tuple[int, int]
+
+
+@dataclass
+class RelicInvestigatedEvent:
+    """
+    A unit investigating the relic at the given location.
+    """
+    unit: typing.Tuple[int, int]
+    location: typing.Tuple[int, int]
+    result: InvestigationResult
+
+
+@dataclass
+class UnitDisbandedEvent:
+    """
+    A unit being disbanded or sold, with its cost being credited to its player.
+    """
+    unit: typing.Tuple[int, int]
+
+
+GameEvent = typing.Union[GameStartedEvent, TurnEndedEvent, SettlementFoundedEvent, BlessingSetEvent,
+                         ConstructionSetEvent, ConstructionBoughtOutEvent, UnitMovedEvent, UnitDeployedEvent,
+                         PassengerDeployedEvent, UnitGarrisonedEvent, UnitBoardedEvent, UnitAttackedEvent,
+                         SettlementAttackedEvent, UnitHealedEvent, SiegeBegunEvent, SiegeEndedEvent,
+                         RelicInvestigatedEvent, UnitDisbandedEvent]
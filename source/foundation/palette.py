@@ -0,0 +1,21 @@
+"""
+The colours of pyxel's default palette, which resolve to integers. These are mirrored here so that the catalogue, and
+in turn the game logic, can be used without pyxel, e.g. when running a headless simulation.
+"""
+
+COLOR_BLACK = 0
+COLOR_NAVY = 1
+COLOR_PURPLE = 2
+COLOR_GREEN = 3
+COLOR_BROWN = 4
+COLOR_DARK_BLUE = 5
+COLOR_LIGHT_BLUE = 6
+COLOR_WHITE = 7
+COLOR_RED = 8
+COLOR_ORANGE = 9
+COLOR_YELLOW = 10
+COLOR_LIME = 11
+COLOR_CYAN = 12
+COLOR_GRAY = 13
+COLOR_PINK = 14
+COLOR_PEACH = 15
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import re
+import typing
+from array import array
+from collections.abc import Sequence
+
+from source.foundation.models import Quad, Biome
+
+# The biomes, in the order in which they are indexed.
+_BIOMES = list(Biome)
+_BIOME_IDS = {biome: idx for idx, biome in enumerate(Biome)}
+# Matches the flags of quads that are relics, whether or not they are also selected.
+_RELIC_FLAGS = re.compile(rb"[\x02\x03]")
+
+
+class QuadRow(Sequence):
+    """
+    A row of a quad grid, which materialises each of its quads the first time it is accessed.
+    """
+
+    def __init__(self, grid: QuadGrid, y: int):
+        """
+        Initialise the row with none of its quads materialised.
+        :param grid: The grid the row belongs to.
+        :param y: The index of the row within the grid.
+        """
+        self.grid = grid
+        self.y = y
+        self.quads: typing.List[typing.Optional[Quad]] = [None] * grid.width
+
+    def __getitem__(self, x: int | slice) -> Quad | typing.List[Quad]:
+        """
+        :param x: The index of the quad within the row, or a slice of indices.
+        :return: The quad at the given index, or the quads at the given slice of indices.
+        """
+        if isinstance(x, slice):
+            return [self[idx] for idx in range(*x.indices(len(self.quads)))]
+        if (quad := self.quads[x]) is None:
+            x %= len(self.quads)
+            quad = self.quads[x] = self.grid.materialise(x, self.y)
+        return quad
+
+    def __len__(self) -> int:
+        """
+        :return: The number of quads in the row.
+        """
+        return len(self.quads)
+
+    def __eq__(self, other) -> bool:
+        """
+        :param other: The row to compare to, which may also be a list of quads.
+        :return: Whether the rows have the same quads.
+        """
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    __hash__ = None
+
+
+class QuadGrid(Sequence):
+    """
+    The quads of a loaded board, backed by packed columns of each quad's biome, yields, and flags, in row-major order.
+    As most of the board is never looked at closely, quads are only materialised as objects once they are accessed,
+    meaning that loading a board takes the same time regardless of its size. From then on, the materialised quad is the
+    source of truth for its location, with the columns only holding the quads as they were loaded.
+    """
+
+    def __init__(self, biome_ids: typing.Sequence[int], yields: typing.Sequence[float], flags: typing.Sequence[int],
+                 width: int = 100):
+        """
+        Initialise the grid over the given columns, which are not copied.
+        :param biome_ids: The index of each quad's biome within its enum's definition.
+        :param yields: The wealth, harvest, zeal, and fortune of each quad, in that order.
+        :param flags: Whether each quad is selected in the first bit, and whether it is a relic in the second.
+        :param width: The number of quads in each row.
+        """
+        self.biome_ids = biome_ids
+        self.yields = yields
+        self.flags = flags
+        self.width = width
+        self.rows = [QuadRow(self, y) for y in range(len(biome_ids) // width)]
+        # The quads that have been materialised, in the order in which they were accessed.
+        self.materialised: typing.List[Quad] = []
+
+    def materialise(self, x: int, y: int) -> Quad:
+        """
+        :param x: The column of the quad.
+        :param y: The row of the quad.
+        :return: A new quad populated from the columns.
+        """
+        idx = y * self.width + x
+        flags = self.flags[idx]
+        quad = Quad(_BIOMES[self.biome_ids[idx]], *self.yields[idx * 4:idx * 4 + 4], (x, y), bool(flags & 1),
+                    bool(flags & 2))
+        self.materialised.append(quad)
+        return quad
+
+    def __getitem__(self, y: int | slice) -> QuadRow | typing.List[QuadRow]:
+        """
+        :param y: The index of the row, or a slice of indices.
+        :return: The row at the given index, or the rows at the given slice of indices.
+        """
+        return self.rows[y]
+
+    def __len__(self) -> int:
+        """
+        :return: The number of rows in the grid.
+        """
+        return len(self.rows)
+
+    def __eq__(self, other) -> bool:
+        """
+        :param other: The grid to compare to, which may also be a list of lists of quads.
+        :return: Whether the grids have the same quads.
+        """
+        return isinstance(other, Sequence) and len(self) == len(other) and \
+            all(row == other_row for row, other_row in zip(self.rows, other))
+
+    __hash__ = None
+
+    def relics(self) -> typing.Set[typing.Tuple[int, int]]:
+        """
+        :return: The locations of the quads that are relics, which are found without materialising any quads.
+        """
+        relics = {(match.start() % self.width, match.start() // self.width)
+                  for match in _RELIC_FLAGS.finditer(self.flags)}
+        for quad in self.materialised:
+            if quad.is_relic:
+                relics.add(quad.location)
+            else:
+                relics.discard(quad.location)
+        return relics
+
+    def packed(self) -> typing.Tuple[array, array, array]:
+        """
+        :return: A tuple of the packed arrays of the current biomes, yields, and flags of the quads. The columns are
+        copied in bulk, with only the materialised quads being packed individually.
+        """
+        biome_ids, yields, flags = array("B"), array("d"), array("B")
+        biome_ids.frombytes(memoryview(self.biome_ids).cast("B"))
+        yields.frombytes(memoryview(self.yields).cast("B"))
+        flags.frombytes(memoryview(self.flags).cast("B"))
+        for quad in self.materialised:
+            idx = quad.location[1] * self.width + quad.location[0]
+            biome_ids[idx] = _BIOME_IDS[quad.biome]
+            yields[idx * 4:idx * 4 + 4] = array("d", (quad.wealth, quad.harvest, quad.zeal, quad.fortune))
+            flags[idx] = quad.selected | quad.is_relic << 1
+        return biome_ids, yields, flags
@@ -0,0 +1,187 @@
+import typing
+
+from source.foundation.climate import Climate
+
+
+class UnitColumns:
+    """
+    The struct-of-arrays store for the units of a single owner, i.e. a player or the heathens. Each unit held in the
+    store occupies a row, and its health, stamina, and whether it has acted are kept in columns rather than on the unit
+    itself, meaning that every unit can be reset and healed at the end of a turn in bulk operations over each column.
+    Units are held again each turn, and any that were not are released from the store, e.g. because they were killed or
+    boarded a deployer unit.
+    """
+
+    def __init__(self):
+        """
+        Initialise the empty columns.
+        """
+        self.units: typing.List = []
+        # Note that health is stored without any modification from the climate.
+        self.health: typing.List[float] = []
+        self.stamina: typing.List[int] = []
+        self.acted = bytearray()
+        # Whether each unit has been held this turn.
+        self.held = bytearray()
+
+    def hold(self, unit):
+        """
+        Hold the given unit in the store for this turn, adding it to the store if it is not already present.
+        :param unit: The unit to hold.
+        """
+        attrs = unit.__dict__
+        if attrs.get("_columns") is self:
+            self.held[attrs["_row"]] = 1
+            return
+        # Units only belong to one owner, so take the unit's state from wherever it is currently stored.
+        if (columns := attrs.get("_columns")) is not None:
+            row = attrs["_row"]
+            health, stamina, acted = columns.health[row], columns.stamina[row], columns.acted[row]
+        else:
+            health, stamina, acted = \
+                attrs.pop("health"), attrs.pop("remaining_stamina"), attrs.pop("has_acted", False)
+        attrs["_columns"] = self
+        attrs["_row"] = len(self.units)
+        self.units.append(unit)
+        self.health.append(health)
+        self.stamina.append(stamina)
+        self.acted.append(acted)
+        self.held.append(1)
+
+    def release(self, row: int):
+        """
+        Release the unit in the given row from the store, returning its state to the unit itself.
+        :param row: The row of the unit to release.
+        """
+        unit = self.units[row]
+        attrs = unit.__dict__
+        # Units that have since been held by another owner are left alone.
+        if attrs.get("_columns") is self:
+            del attrs["_columns"]
+            del attrs["_row"]
+            attrs["health"] = self.health[row]
+            attrs["remaining_stamina"] = self.stamina[row]
+            if hasattr(type(unit), "has_acted"):
+                attrs["has_acted"] = bool(self.acted[row])
+
+    def compact(self):
+        """
+        Release all units that have not been held this turn, removing their rows.
+        """
+        kept = [row for row, held in enumerate(self.held) if held]
+        for row, held in enumerate(self.held):
+            if not held:
+                self.release(row)
+        self.units = [self.units[row] for row in kept]
+        self.health = [self.health[row] for row in kept]
+        self.stamina = [self.stamina[row] for row in kept]
+        self.acted = bytearray(self.acted[row] for row in kept)
+        self.held = bytearray(b"\x01" * len(kept))
+        for row, unit in enumerate(self.units):
+            unit.__dict__["_row"] = row
+
+    def reset(self, heal_cap: typing.Optional[float] = None):
+        """
+        Reset the stamina of each unit held this turn, and heal those that are not at full health by 10% of their
+        maximum health.
+        :param heal_cap: The health that units can be healed up to, if not their maximum health.
+        """
+        if 0 in self.held:
+            self.compact()
+        plans = [unit.plan for unit in self.units]
+        self.stamina[:] = [plan.total_stamina for plan in plans]
+        self.acted[:] = bytes(len(self.acted))
+        # Healing is done with base values, which are in the same proportion as the values modified by the climate.
+        with Climate.current.unmodified():
+            max_healths = [plan.max_health for plan in plans]
+        self.health[:] = [health if health >= max_health
+                          else min(health + max_health * 0.1, max_health if heal_cap is None else heal_cap)
+                          for health, max_health in zip(self.health, max_healths)]
+        # Each unit must be held again next turn.
+        self.held[:] = bytes(len(self.held))
+
+
+class UnitStore:
+    """
+    The store of the units of each owner in the game, kept alongside the board.
+    """
+
+    def __init__(self):
+        """
+        Initialise the empty store.
+        """
+        # The columns for each player's units, keyed by the player's ID.
+        self.players: typing.Dict[int, UnitColumns] = {}
+        self.heathens = UnitColumns()
+
+    def of(self, player) -> UnitColumns:
+        """
+        :param player: The player to get the columns of.
+        :return: The columns holding the given player's units.
+        """
+        return self.players.setdefault(id(player), UnitColumns())
+
+
+class StoredField:
+    """
+    A unit attribute that is kept in the unit store while the unit is held there, and on the unit itself otherwise.
+    """
+
+    def __init__(self, name: str, column: str, climatic: bool = False):
+        """
+        :param name: The name of the attribute.
+        :param column: The name of the column the attribute is stored in.
+        :param climatic: Whether the attribute is modified by the climate in the same way as the unit's plan's maximum
+        health, so that it remains proportional to the maximum.
+        """
+        self.name = name
+        self.column = column
+        self.climatic = climatic
+
+    def __get__(self, unit, owner: type = None):
+        if unit is None:
+            return self
+        attrs = unit.__dict__
+        columns = attrs.get("_columns")
+        value = attrs[self.name] if columns is None else columns.__dict__[self.column][attrs["_row"]]
+        if self.climatic and (affinity := attrs["plan"].night_affinity) is not None:
+            return value * Climate.current.multiplier(affinity, "max_health")
+        return value
+
+    def __set__(self, unit, value):
+        attrs = unit.__dict__
+        # When a unit is created, its health is set before its plan, and is always its base health.
+        if self.climatic and "plan" in attrs:
+            value = value / Climate.current.multiplier(attrs["plan"].night_affinity, "max_health")
+        if (columns := attrs.get("_columns")) is None:
+            attrs[self.name] = value
+        else:
+            columns.__dict__[self.column][attrs["_row"]] = value
+
+
+class ActedFlag(StoredField):
+    """
+    The flag recording whether a unit has acted this turn, which is stored as a byte while the unit is held.
+    """
+
+    def __get__(self, unit, owner: type = None):
+        if unit is None:
+            return self
+        return bool(super().__get__(unit, owner))
+
+
+def unstored_state(unit) -> dict:
+    """
+    Get the state of the given unit as if it were not held in the unit store, e.g. so that copies of units are not held
+    in the store alongside the original.
+    :param unit: The unit to get the state of.
+    :return: The unit's attributes.
+    """
+    state = dict(unit.__dict__)
+    if (columns := state.pop("_columns", None)) is not None:
+        row = state.pop("_row")
+        state["health"] = columns.health[row]
+        state["remaining_stamina"] = columns.stamina[row]
+        if hasattr(type(unit), "has_acted"):
+            state["has_acted"] = bool(columns.acted[row])
+    return state
@@ -6,7 +6,7 @@ from source.game_management.game_controller import GameController
 from source.game_management.game_input_handler import on_key_arrow_down, on_key_arrow_up, on_key_arrow_left, \
     on_key_arrow_right, on_key_return, on_mouse_button_right, on_mouse_button_left, on_key_shift, on_key_c, on_key_f, \
     on_key_d, on_key_tab, on_key_space, on_key_m, on_key_s, on_key_n, on_key_b, on_key_escape, on_key_a, on_key_j, \
-    on_key_x
+    on_key_x, on_key_f3, on_key_f4, on_key_f5, on_key_f6, continue_fast_forward
 from source.game_management.game_state import GameState
 from source.saving.game_save_manager import init_app_data
 
@@ -27,6 +27,8 @@ class Game:
 
         self.game_controller = GameController()
         self.game_state = GameState()
+        # Units' stats are modified by the climate of the game being played.
+        self.game_state.climate.apply()
 
         pyxel.run(self.on_update, self.draw)
 
@@ -37,14 +39,22 @@ class Game:
         time_elapsed = time.time() - self.game_controller.last_time
         self.game_controller.last_time = time.time()
 
-        if self.game_state.board is not None:
-            self.game_state.board.update(time_elapsed)
-
         if self.game_state.on_menu:
             self.game_controller.music_player.restart_menu_if_necessary()
         elif not self.game_controller.music_player.is_playing():
             self.game_controller.music_player.next_song()
 
+        # The game state belongs to the turn thread while it is running, so it can't be updated or responded to.
+        if self.game_controller.is_processing_turn():
+            return
+        # When fast-forwarding, the board is drawn for a frame between each batch of turns.
+        if not self.game_controller.finish_turn_processing() and \
+                continue_fast_forward(self.game_controller, self.game_state):
+            return
+
+        if self.game_state.board is not None:
+            self.game_state.board.update(time_elapsed)
+
         self.on_input()
 
     def draw(self):
@@ -53,6 +63,10 @@ class Game:
         """
         if self.game_state.on_menu:
             self.game_controller.menu.draw()
+        elif self.game_controller.is_processing_turn():
+            # Leave the last drawn frame of the board in place while the turn is being processed.
+            self.game_state.board.draw_processing_indicator(self.game_controller.fast_forward_done,
+                                                            self.game_controller.fast_forward_left)
         elif self.game_state.game_started:
             self.game_state.board.draw(self.game_state.players, self.game_state.map_pos, self.game_state.turn,
                                        self.game_state.heathens, self.game_state.nighttime_left > 0,
@@ -105,3 +119,11 @@ class Game:
             on_key_j(self.game_state)
         elif pyxel.btnp(pyxel.KEY_X):
             on_key_x(self.game_state)
+        elif pyxel.btnp(pyxel.KEY_F3):
+            on_key_f3(self.game_state)
+        elif pyxel.btnp(pyxel.KEY_F4):
+            on_key_f4(self.game_state)
+        elif pyxel.btnp(pyxel.KEY_F5):
+            on_key_f5(self.game_controller, self.game_state)
+        elif pyxel.btnp(pyxel.KEY_F6):
+            on_key_f6(self.game_state)
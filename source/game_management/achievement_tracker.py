@@ -0,0 +1,44 @@
+import typing
+
+from source.foundation.models import AchievementTrigger, Improvement, Project, UnitPlan
+
+
+class AchievementTracker:
+    """
+    The tracker of the events that have occurred for the player since their achievements were last checked. The tracker
+    is notified as the player acts and as their turn is processed, meaning that only the achievements that could have
+    been obtained need to be verified, rather than every achievement going through the player's settlements and units.
+    """
+
+    def __init__(self):
+        """
+        Initialise the tracker. Every event begins as having occurred, so that each achievement is verified the first
+        time achievements are checked, e.g. for a game that was loaded.
+        """
+        self.occurred: typing.Set[AchievementTrigger] = set(AchievementTrigger)
+
+    def trigger(self, trigger: AchievementTrigger):
+        """
+        Mark the given event as having occurred.
+        :param trigger: The event that occurred.
+        """
+        self.occurred.add(trigger)
+
+    def construction_completed(self, construction: Improvement | Project | UnitPlan):
+        """
+        Mark the completion of the given construction in one of the player's settlements, which adds either an
+        improvement to the settlement, or a unit to its garrison.
+        :param construction: The completed construction.
+        """
+        if isinstance(construction, Improvement):
+            self.occurred.add(AchievementTrigger.IMPROVEMENT_BUILT)
+        elif isinstance(construction, UnitPlan):
+            self.occurred.add(AchievementTrigger.GARRISON_GREW)
+
+    def take(self) -> typing.Set[AchievementTrigger]:
+        """
+        :return: The events that have occurred since achievements were last checked, which are then cleared.
+        """
+        occurred = self.occurred
+        self.occurred = set()
+        return occurred
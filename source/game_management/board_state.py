@@ -0,0 +1,94 @@
+import random
+import typing
+from collections import Counter
+
+from source.display.overlay import Overlay
+from source.foundation.catalogue import Namer
+from source.foundation.models import Quad, Biome, GameConfig, Unit, Heathen
+from source.foundation.unit_store import UnitStore
+from source.game_management.achievement_tracker import AchievementTracker
+from source.game_management.event_log import EventLog
+from source.game_management.relic_registry import RelicRegistry
+from source.game_management.siege_registry import SiegeRegistry
+from source.game_management.victory_tracker import VictoryTracker
+from source.util.calculator import calculate_yield_for_quad
+
+
+class BoardState:
+    """
+    The logical state of the board, i.e. its quads and the registries kept alongside them, along with the overlay that
+    notifications are sent to. This is kept separate from the Board, which draws everything and processes clicks, so
+    that games can be run without pyxel.
+    """
+
+    def __init__(self, cfg: GameConfig, namer: Namer, overlay: Overlay, quads: typing.List[typing.List[Quad]] = None):
+        """
+        Initialises the board state with the given config and quads, if supplied.
+        :param cfg: The game config.
+        :param namer: The Namer instance to use for settlement names.
+        :param overlay: The overlay to send notifications to.
+        :param quads: The quads loaded in, if we are loading a game.
+        """
+        self.game_config: GameConfig = cfg
+        self.namer: Namer = namer
+
+        # We allow quads to be supplied here in load game cases.
+        if quads is not None:
+            self.quads = quads
+            self.relics = RelicRegistry(self.quads)
+        else:
+            self.quads: typing.List[typing.List[typing.Optional[Quad]]] = [[None] * 100 for _ in range(90)]
+            self.generate_quads(cfg.biome_clustering)
+        self.sieges = SiegeRegistry()
+        self.events = EventLog()
+        self.victories = VictoryTracker()
+        self.units = UnitStore()
+        self.achievements = AchievementTracker()
+
+        self.overlay = overlay
+        self.selected_unit: typing.Optional[Unit | Heathen] = None
+
+    def generate_quads(self, biome_clustering: bool):
+        """
+        Generate the quads to be used for this game.
+        :param biome_clustering: Whether biome clustering is enabled or not.
+        """
+        for i in range(90):
+            for j in range(100):
+                if biome_clustering:
+                    # The below block of code gets all directly adjacent quads to the one being currently generated.
+                    surrounding_biomes = []
+                    if i > 0:
+                        if j > 0:
+                            surrounding_biomes.append(self.quads[i - 1][j - 1].biome)
+                        surrounding_biomes.append(self.quads[i - 1][j].biome)
+                        if j < 99:
+                            surrounding_biomes.append(self.quads[i - 1][j + 1].biome)
+                    if j > 0:
+                        surrounding_biomes.append(self.quads[i][j - 1].biome)
+                    if len(surrounding_biomes) > 0:
+                        # Work out which biome nearby is most prevalent, and 40% of the time, choose that biome. This
+                        # 40% rate is adjustable. Note that 100% would result in the entire board having the same biome
+                        # and 0% would result in random picks.
+                        biome_ctr = Counter(surrounding_biomes)
+                        max_rate: Biome = max(biome_ctr, key=biome_ctr.get)
+                        biome: Biome
+                        rand = random.random()
+                        if rand < 0.4:
+                            biome = max_rate
+                        else:
+                            biome = random.choice(list(Biome))
+                    else:
+                        biome = random.choice(list(Biome))
+                else:
+                    # If we're not using biome clustering, just randomly choose one.
+                    biome = random.choice(list(Biome))
+                quad_yield: (float, float, float, float) = calculate_yield_for_quad(biome)
+
+                is_relic = False
+                relic_chance = random.randint(0, 100)
+                if relic_chance < 1:
+                    is_relic = True
+
+                self.quads[i][j] = Quad(biome, *quad_yield, location=(j, i), is_relic=is_relic)
+        self.relics = RelicRegistry(self.quads)
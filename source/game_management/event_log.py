@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+import json
+import os
+import typing
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from itertools import islice
+
+from source.foundation.models import GameEvent, GameStartedEvent, TurnEndedEvent, SettlementFoundedEvent, \
+    BlessingSetEvent, ConstructionSetEvent, ConstructionBoughtOutEvent, UnitMovedEvent, UnitDeployedEvent, \
+    PassengerDeployedEvent, UnitGarrisonedEvent, UnitBoardedEvent, UnitAttackedEvent, SettlementAttackedEvent, \
+    UnitHealedEvent, SiegeBegunEvent, SiegeEndedEvent, RelicInvestigatedEvent, UnitDisbandedEvent, GameConfig, \
+    InvestigationResult, Player, Settlement, Unit, Heathen
+
+if typing.TYPE_CHECKING:
+    from source.game_management.game_state import GameState
+
+# The owner index used to refer to heathens, which do not belong to any player.
+HEATHEN_OWNER = -1
+
+# Each type of event, keyed by the name it is stored under.
+EVENT_TYPES: typing.Dict[str, type] = {event_type.__name__: event_type for event_type in typing.get_args(GameEvent)}
+# The type hints for the fields of each event type, in the order in which the fields are stored.
+_FIELD_HINTS: typing.Dict[type, typing.List[typing.Any]] = {}
+
+
+def _encode_value(value: typing.Any) -> typing.Any:
+    """
+    Convert the given value into a JSON-compatible one, with dataclasses being stored as lists of their fields.
+    :param value: The value to convert.
+    :return: The converted value.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value):
+        return [_encode_value(getattr(value, fld.name)) for fld in fields(value)]
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(val) for val in value]
+    return value
+
+
+def _decode_value(hint: typing.Any, value: typing.Any) -> typing.Any:
+    """
+    Convert the given JSON value back into a value of the type described by the given type hint.
+    :param hint: The type hint for the value.
+    :param value: The value to convert.
+    :return: The converted value.
+    """
+    if value is None:
+        return None
+    origin = typing.get_origin(hint)
+    if origin is typing.Union:
+        # Optional values are converted as their non-None type.
+        return _decode_value(typing.get_args(hint)[0], value)
+    if origin is tuple:
+        return tuple(_decode_value(arg, val) for arg, val in zip(typing.get_args(hint), value))
+    if origin is list:
+        return [_decode_value(typing.get_args(hint)[0], val) for val in value]
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return hint(value)
+    if is_dataclass(hint):
+        if hint not in _FIELD_HINTS:
+            _FIELD_HINTS[hint] = list(typing.get_type_hints(hint).values())
+        return hint(*[_decode_value(fld_hint, val) for fld_hint, val in zip(_FIELD_HINTS[hint], value)])
+    return value
+
+
+def _is_at(items: typing.List[typing.Any], idx: int, item: typing.Any) -> bool:
+    """
+    :param items: The list to check.
+    :param idx: The index to check.
+    :param item: The item expected to be at the index.
+    :return: Whether the given item itself is at the given index in the list.
+    """
+    return idx < len(items) and items[idx] is item
+
+
+def encode_event(event: GameEvent) -> str:
+    """
+    Encode the given event compactly, as a JSON list of its type's name followed by its fields.
+    :param event: The event to encode.
+    :return: The encoded event.
+    """
+    return json.dumps([type(event).__name__, *_encode_value(event)], separators=(",", ":"))
+
+
+def decode_event(encoded: str) -> GameEvent:
+    """
+    Decode the given event.
+    :param encoded: The event, as encoded by encode_event().
+    :return: The decoded event.
+    """
+    event_type, *values = json.loads(encoded)
+    return _decode_value(EVENT_TYPES[event_type], values)
+
+
+class EventLog:
+    """
+    The append-only log of the events in a game, i.e. every change made to the game state outside of the processing of
+    turns. Combined with the seed each turn is processed from, this allows any turn of the game to be replayed. Events
+    are only recorded once the log has been attached to a game state, as they refer to players, units and settlements
+    by their positions within it.
+    """
+
+    def __init__(self):
+        """
+        Initialise the empty log.
+        """
+        self.events: typing.List[GameEvent] = []
+        self.game_state: typing.Optional[GameState] = None
+        # The name of the file the log is written to, alongside the game's saves, and the number of events written.
+        self.file_name: typing.Optional[str] = None
+        self.written = 0
+        # The unit currently being moved by an AI player, along with its reference, location and remaining stamina
+        # before it moved. Its move is recorded when it takes an action, or once it has finished moving.
+        self.tracked: typing.Optional[typing.Tuple[Unit, typing.Tuple[int, int], typing.Tuple[int, int], int]] = None
+        # The last known positions of the players, units and settlements in the game state, keyed by their IDs. As the
+        # position of each is checked before it is used, these only need to be rebuilt once they have gone out of date,
+        # e.g. when a unit before another in its player's units has been removed.
+        self.player_idxs: typing.Dict[int, int] = {}
+        self.unit_refs: typing.Dict[int, typing.Tuple[int, int]] = {}
+        self.setl_refs: typing.Dict[int, typing.Tuple[int, int]] = {}
+
+    def attach(self, game_state: GameState):
+        """
+        Attach the log to the given game state, recording events for it from now on.
+        :param game_state: The game state to record events for.
+        """
+        self.game_state = game_state
+
+    def record(self, event: GameEvent):
+        """
+        Add the given event to the log, recording the move of the tracked unit first if necessary.
+        :param event: The event to add.
+        """
+        if self.tracked is not None:
+            self.untrack()
+        self.events.append(event)
+
+    def player_idx(self, player: Player) -> int:
+        """
+        :param player: The player to get the index of.
+        :return: The index of the given player.
+        """
+        players = self.game_state.players
+        idx = self.player_idxs.get(id(player))
+        if idx is None or idx >= len(players) or players[idx] is not player:
+            self.player_idxs = {id(pl): pl_idx for pl_idx, pl in enumerate(players)}
+            idx = self.player_idxs[id(player)]
+        return idx
+
+    def unit_ref(self, unit: Unit | Heathen) -> typing.Tuple[int, int]:
+        """
+        :param unit: The unit or heathen to refer to. Units are compared by identity, as distinct units can be equal.
+        :return: The index of the unit's owner and the unit's index in their units.
+        """
+        ref = self.unit_refs.get(id(unit))
+        if ref is None or not _is_at(self.game_state.heathens if ref[0] == HEATHEN_OWNER
+                                     else self.game_state.players[ref[0]].units, ref[1], unit):
+            self.unit_refs = {id(player_unit): (player_idx, unit_idx)
+                              for player_idx, player in enumerate(self.game_state.players)
+                              for unit_idx, player_unit in enumerate(player.units)}
+            self.unit_refs.update((id(heathen), (HEATHEN_OWNER, idx))
+                                  for idx, heathen in enumerate(self.game_state.heathens))
+            ref = self.unit_refs[id(unit)]
+        return ref
+
+    def setl_ref(self, setl: Settlement) -> typing.Tuple[int, int]:
+        """
+        :param setl: The settlement to refer to.
+        :return: The index of the settlement's owner and the settlement's index in their settlements.
+        """
+        ref = self.setl_refs.get(id(setl))
+        if ref is None or not _is_at(self.game_state.players[ref[0]].settlements, ref[1], setl):
+            self.setl_refs = {id(player_setl): (player_idx, setl_idx)
+                              for player_idx, player in enumerate(self.game_state.players)
+                              for setl_idx, player_setl in enumerate(player.settlements)}
+            ref = self.setl_refs[id(setl)]
+        return ref
+
+    def track(self, unit: Unit):
+        """
+        Track the given unit as it is moved by an AI player, so that its move can be recorded.
+        :param unit: The unit about to be moved.
+        """
+        if self.game_state is not None:
+            self.tracked = unit, self.unit_ref(unit), unit.location, unit.remaining_stamina
+
+    def untrack(self):
+        """
+        Stop tracking the tracked unit, recording its move if it has moved.
+        """
+        if self.tracked is not None:
+            unit, ref, location, remaining_stamina = self.tracked
+            self.tracked = None
+            if unit.location != location or unit.remaining_stamina != remaining_stamina:
+                self.events.append(UnitMovedEvent(ref, unit.location, unit.remaining_stamina))
+
+    def game_started(self, seed: int, cfg: GameConfig):
+        """
+        Record the start of the game, once the board has been generated from the given seed.
+        :param seed: The seed the board was generated from.
+        :param cfg: The game config.
+        """
+        if self.game_state is not None:
+            self.record(GameStartedEvent(seed, self.game_state.until_night, cfg,
+                                         [(player.name, player.faction, player.ai_playstyle)
+                                          for player in self.game_state.players]))
+
+    def turn_ended(self, seed: int):
+        """
+        Record the end of a turn.
+        :param seed: The seed the turn is processed from.
+        """
+        if self.game_state is not None:
+            self.record(TurnEndedEvent(seed))
+
+    def settlement_founded(self, player: Player, setl: Settlement, settler: typing.Optional[Unit] = None):
+        """
+        Record the founding of a settlement, before the settler is removed.
+        :param player: The player founding the settlement.
+        :param setl: The new settlement.
+        :param settler: The settler unit founding the settlement, if this is not the player's first settlement.
+        """
+        if self.game_state is not None:
+            self.record(SettlementFoundedEvent(self.player_idx(player), setl.name, setl.location,
+                                               None if settler is None else self.unit_ref(settler)[1]))
+
+    def blessing_set(self, player: Player):
+        """
+        Record a player beginning to undergo their current blessing.
+        :param player: The player undergoing the blessing.
+        """
+        if self.game_state is not None:
+            self.record(BlessingSetEvent(self.player_idx(player), player.ongoing_blessing.blessing.name))
+
+    def construction_set(self, setl: Settlement):
+        """
+        Record a settlement beginning its current construction.
+        :param setl: The settlement beginning the construction.
+        """
+        if self.game_state is not None:
+            self.record(ConstructionSetEvent(self.setl_ref(setl), setl.current_work.construction.name))
+
+    def construction_bought_out(self, setl: Settlement):
+        """
+        Record the buyout of a settlement's current construction, before it is completed.
+        :param setl: The settlement whose construction is being bought out.
+        """
+        if self.game_state is not None:
+            self.record(ConstructionBoughtOutEvent(self.setl_ref(setl)))
+
+    def unit_moved(self, unit: Unit):
+        """
+        Record a unit moving to its current location.
+        :param unit: The unit that moved.
+        """
+        if self.game_state is not None:
+            self.record(UnitMovedEvent(self.unit_ref(unit), unit.location, unit.remaining_stamina))
+
+    def unit_deployed(self, setl: Settlement, garrison_idx: int, unit: Unit):
+        """
+        Record a unit being deployed from a settlement's garrison to its current location.
+        :param setl: The settlement the unit was deployed from.
+        :param garrison_idx: The index of the unit in the settlement's garrison before it was deployed.
+        :param unit: The deployed unit.
+        """
+        if self.game_state is not None:
+            self.record(UnitDeployedEvent(self.setl_ref(setl), garrison_idx, unit.location))
+
+    def passenger_deployed(self, deployer: Unit, passenger_idx: int, unit: Unit):
+        """
+        Record a unit being deployed from a deployer unit to its current location.
+        :param deployer: The deployer unit the unit was deployed from.
+        :param passenger_idx: The index of the unit in the deployer unit's passengers before it was deployed.
+        :param unit: The deployed unit.
+        """
+        if self.game_state is not None:
+            self.record(PassengerDeployedEvent(self.unit_ref(deployer), passenger_idx, unit.location))
+
+    def unit_garrisoned(self, unit: Unit, setl: Settlement):
+        """
+        Record a unit moving into a settlement's garrison, before it is removed from its player's units.
+        :param unit: The unit being garrisoned.
+        :param setl: The settlement the unit is moving into.
+        """
+        if self.game_state is not None:
+            self.record(UnitGarrisonedEvent(self.unit_ref(unit), self.setl_ref(setl), unit.remaining_stamina))
+
+    def unit_boarded(self, unit: Unit, deployer: Unit):
+        """
+        Record a unit boarding a deployer unit, before it is removed from its player's units.
+        :param unit: The unit boarding the deployer unit.
+        :param deployer: The deployer unit being boarded.
+        """
+        if self.game_state is not None:
+            self.record(UnitBoardedEvent(self.unit_ref(unit), self.unit_ref(deployer), unit.remaining_stamina))
+
+    def unit_attacked(self, attacker: Unit, defender: Unit | Heathen, ai: bool):
+        """
+        Record an attack on a unit or heathen, before it takes place.
+        :param attacker: The attacking unit.
+        :param defender: The unit or heathen being attacked.
+        :param ai: Whether the attack was by an AI player.
+        """
+        if self.game_state is not None:
+            self.record(UnitAttackedEvent(self.unit_ref(attacker), self.unit_ref(defender), ai))
+
+    def settlement_attacked(self, attacker: Unit, setl: Settlement):
+        """
+        Record an attack on a settlement, before it takes place.
+        :param attacker: The attacking unit.
+        :param setl: The settlement being attacked.
+        """
+        if self.game_state is not None:
+            self.record(SettlementAttackedEvent(self.unit_ref(attacker), self.setl_ref(setl)))
+
+    def unit_healed(self, healer: Unit, healed: Unit):
+        """
+        Record a unit healing another.
+        :param healer: The unit doing the healing.
+        :param healed: The unit being healed.
+        """
+        if self.game_state is not None:
+            self.record(UnitHealedEvent(self.unit_ref(healer), self.unit_ref(healed)))
+
+    def siege_begun(self, unit: Unit, setl: Settlement):
+        """
+        Record a unit beginning to besiege a settlement.
+        :param unit: The besieging unit.
+        :param setl: The settlement being placed under siege.
+        """
+        if self.game_state is not None:
+            self.record(SiegeBegunEvent(self.unit_ref(unit), self.setl_ref(setl)))
+
+    def siege_ended(self, unit: Unit):
+        """
+        Record a unit ending its siege.
+        :param unit: The unit ending its siege.
+        """
+        if self.game_state is not None:
+            self.record(SiegeEndedEvent(self.unit_ref(unit)))
+
+    def relic_investigated(self, unit: Unit, relic_loc: typing.Tuple[int, int], result: InvestigationResult):
+        """
+        Record the investigation of a relic.
+        :param unit: The unit investigating the relic.
+        :param relic_loc: The location of the relic.
+        :param result: The result of the investigation.
+        """
+        if self.game_state is not None:
+            self.record(RelicInvestigatedEvent(self.unit_ref(unit), relic_loc, result))
+
+    def unit_disbanded(self, unit: Unit):
+        """
+        Record a unit being disbanded or sold, before it is removed from its player's units.
+        :param unit: The unit being disbanded.
+        """
+        if self.game_state is not None:
+            self.record(UnitDisbandedEvent(self.unit_ref(unit)))
+
+    def take_unwritten(self) -> str:
+        """
+        Encode the events recorded since the log was last written, marking them as written. This allows the encoded
+        events to be written elsewhere, e.g. on another thread, while further events are recorded.
+        :return: The encoded events, one per line.
+        """
+        unwritten = "".join(encode_event(event) + "\n" for event in self.events[self.written:])
+        self.written = len(self.events)
+        return unwritten
+
+    def write(self, directory: str):
+        """
+        Append the events recorded since the log was last written to its file in the given directory.
+        :param directory: The directory to write the log to.
+        """
+        with open(os.path.join(directory, self.file_name), "a", encoding="utf-8") as log_file:
+            log_file.write(self.take_unwritten())
+
+    def read(self, directory: str, file_name: str, length: int):
+        """
+        Read the log from the given file in the given directory, keeping only the given number of events. Any later
+        events belong to a different branch of the game, i.e. one played after a later save. So that the saves made on
+        every branch remain replayable, the events read are written to a new file the next time the log is written.
+        :param directory: The directory to read the log from.
+        :param file_name: The name of the file to read the log from.
+        :param length: The number of events to keep.
+        """
+        with open(os.path.join(directory, file_name), "r", encoding="utf-8") as log_file:
+            self.events = [decode_event(line) for line in islice(log_file, length)]
+        self.file_name = None
+        self.written = 0
@@ -1,4 +1,6 @@
+import threading
 import time
+import typing
 
 from source.foundation.catalogue import Namer
 from source.display.menu import Menu
@@ -26,3 +28,49 @@ class GameController:
 
         self.namer = Namer()
         self.move_maker = MoveMaker(self.namer)
+
+        # The thread processing the end of the player's turn, if there is one.
+        self.turn_thread: typing.Optional[threading.Thread] = None
+        # Any error raised while processing the turn, kept so that it can be re-raised on the main thread.
+        self.turn_error: typing.Optional[Exception] = None
+        # The number of turns left to fast-forward through while spectating, and the number already fast-forwarded
+        # through.
+        self.fast_forward_left = 0
+        self.fast_forward_done = 0
+
+    def begin_turn_processing(self, process_turn: typing.Callable[[], None]):
+        """
+        Begin processing the end of the player's turn on a separate thread, so that the game remains responsive while
+        the AI players make their moves.
+        :param process_turn: The function that processes the turn.
+        """
+        self.turn_error = None
+
+        def run():
+            try:
+                process_turn()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                self.turn_error = err
+
+        self.turn_thread = threading.Thread(target=run, daemon=True)
+        self.turn_thread.start()
+
+    def is_processing_turn(self) -> bool:
+        """
+        Determine whether the end of the player's turn is currently being processed.
+        :return: Whether the turn thread is still running.
+        """
+        return self.turn_thread is not None and self.turn_thread.is_alive()
+
+    def finish_turn_processing(self) -> bool:
+        """
+        Tidy up after the turn thread has finished, re-raising any error that occurred on it.
+        :return: Whether a turn had been processed and needed tidying up.
+        """
+        if self.turn_thread is None or self.turn_thread.is_alive():
+            return False
+        self.turn_thread = None
+        if self.turn_error is not None:
+            err, self.turn_error = self.turn_error, None
+            raise err
+        return True
@@ -12,10 +12,16 @@ from source.game_management.game_controller import GameController
 from source.game_management.game_state import GameState
 from source.display.menu import MainMenuOption, SetupOption, WikiOption
 from source.foundation.models import Construction, OngoingBlessing, CompletedConstruction, Heathen, GameConfig, \
-    OverlayType, Faction, ConstructionMenu, Project, DeployerUnit
+    OverlayType, Faction, ConstructionMenu, Project, DeployerUnit, AchievementTrigger
 from source.game_management.movemaker import set_player_construction
-from source.display.overlay import SettlementAttackType, PauseOption
-from source.saving.game_save_manager import load_game, get_saves, save_game, save_stats_achievements, get_stats
+from source.display.overlay import SettlementAttackType, PauseOption, NullOverlay
+from source.saving.game_save_manager import load_game, get_saves, save_game, save_stats_achievements, get_stats, \
+    save_turn_profiles, STATISTICS
+
+# The number of turns fast-forwarded through each time F5 is pressed while spectating, and the number of turns
+# processed between each time the board is drawn.
+FAST_FORWARD_TURNS = 50
+FAST_FORWARD_REDRAW_TURNS = 10
 
 
 def on_key_arrow_down(game_controller: GameController, game_state: GameState, is_ctrl_key: bool):
@@ -163,16 +169,23 @@ def on_key_return(game_controller: GameController, game_state: GameState):
             random.seed()
             game_state.until_night = random.randint(10, 20)
             game_state.nighttime_left = 0
+            game_state.climate.reset()
             game_state.on_menu = False
             cfg: GameConfig = game_controller.menu.get_game_config()
             # Update stats to include the newly-selected faction.
             save_stats_achievements(game_state, faction_to_add=cfg.player_faction)
             game_state.gen_players(cfg)
+            # The board and the AI players' settlements are generated from a recorded seed, so that the game can be
+            # replayed from its event log.
+            seed = random.getrandbits(32)
+            random.seed(seed)
             game_state.board = Board(cfg, game_controller.namer)
             game_controller.move_maker.board_ref = game_state.board
             game_state.board.overlay.toggle_tutorial()
             game_controller.namer.reset()
             game_state.initialise_ais(game_controller.namer)
+            game_state.board.events.attach(game_state)
+            game_state.board.events.game_started(seed, cfg)
             game_controller.music_player.stop_menu_music()
             game_controller.music_player.play_game_music()
         elif game_controller.menu.loading_game:
@@ -201,6 +214,8 @@ def on_key_return(game_controller: GameController, game_state: GameState):
                 case MainMenuOption.WIKI:
                     game_controller.menu.in_wiki = True
                 case MainMenuOption.EXIT:
+                    # Pyxel exits the process directly, so any statistics yet to be written must be written first.
+                    STATISTICS.flush()
                     pyxel.quit()
     elif game_state.game_started and (game_state.board.overlay.is_victory() or
                                       game_state.board.overlay.is_elimination() and game_state.players[0].eliminated):
@@ -218,37 +233,41 @@ def on_key_return(game_controller: GameController, game_state: GameState):
         if game_state.board.overlay.selected_construction is not None:
             game_state.board.selected_settlement.current_work = Construction(
                 game_state.board.overlay.selected_construction)
+            game_state.board.events.construction_set(game_state.board.selected_settlement)
+            game_state.board.victories.construction_set(game_state.players[0], game_state.board.selected_settlement)
         game_state.board.overlay.toggle_construction([], [], [])
     elif game_state.game_started and game_state.board.overlay.is_blessing():
         if game_state.board.overlay.selected_blessing is not None:
             game_state.players[0].ongoing_blessing = OngoingBlessing(game_state.board.overlay.selected_blessing)
+            game_state.board.events.blessing_set(game_state.players[0])
         game_state.board.overlay.toggle_blessing([])
     elif game_state.game_started and game_state.board.overlay.is_setl_click():
         match game_state.board.overlay.setl_attack_opt:
             # If the player has chosen to attack a settlement, execute the attack.
             case SettlementAttackType.ATTACK:
                 game_state.board.overlay.toggle_setl_click(None, None)
+                game_state.board.events.settlement_attacked(game_state.board.selected_unit,
+                                                            game_state.board.overlay.attacked_settlement)
                 data = attack_setl(game_state.board.selected_unit, game_state.board.overlay.attacked_settlement,
                                    game_state.board.overlay.attacked_settlement_owner, False)
                 if data.attacker_was_killed:
                     # If the player's unit died, destroy and deselect it.
+                    game_state.board.sieges.end(game_state.board.selected_unit)
                     game_state.players[0].units.remove(game_state.board.selected_unit)
                     game_state.board.selected_unit = None
                     game_state.board.overlay.toggle_unit(None)
                 elif data.setl_was_taken:
                     # If the settlement was taken, transfer it to the player, while also marking any units that
                     # were involved in the siege as no longer besieging.
-                    data.settlement.besieged = False
-                    for unit in game_state.players[0].units:
-                        for setl_quad in data.settlement.quads:
-                            if abs(unit.location[0] - setl_quad.location[0]) <= 1 and \
-                                    abs(unit.location[1] - setl_quad.location[1]) <= 1:
-                                unit.besieging = False
-                                break
+                    game_state.board.sieges.lift(data.settlement)
                     # The Concentrated can only have a single settlement, so when they take others, the
                     # settlements simply disappear.
                     if game_state.players[0].faction is not Faction.CONCENTRATED:
                         game_state.players[0].settlements.append(data.settlement)
+                        game_state.board.victories.settlement_changed(game_state.players[0], data.settlement)
+                        game_state.board.achievements.trigger(AchievementTrigger.SETTLEMENT_GAINED)
+                    else:
+                        game_state.board.victories.settlement_lost(data.settlement)
                     for idx, p in enumerate(game_state.players):
                         if data.settlement in p.settlements and idx != 0:
                             p.settlements.remove(data.settlement)
@@ -257,8 +276,11 @@ def on_key_return(game_controller: GameController, game_state: GameState):
                 game_state.board.attack_time_bank = 0
             case SettlementAttackType.BESIEGE:
                 # Alternatively, begin a siege on the settlement.
-                game_state.board.selected_unit.besieging = True
-                game_state.board.overlay.attacked_settlement.besieged = True
+                game_state.board.events.siege_begun(game_state.board.selected_unit,
+                                                    game_state.board.overlay.attacked_settlement)
+                game_state.board.sieges.begin(game_state.board.selected_unit,
+                                              game_state.board.overlay.attacked_settlement)
+                game_state.board.achievements.trigger(AchievementTrigger.SIEGE_BEGUN)
                 game_state.board.overlay.toggle_setl_click(None, None)
             case _:
                 game_state.board.overlay.toggle_setl_click(None, None)
@@ -291,20 +313,81 @@ def on_key_return(game_controller: GameController, game_state: GameState):
             game_state.board.overlay.is_close_to_vic() or
             game_state.board.overlay.is_investigation() or game_state.board.overlay.is_night() or
             game_state.board.overlay.is_ach_notif()):
-        # If we are not in any of the above situations, end the turn.
-        if game_state.end_turn():
-            # Autosave every turn, but only if the player is actually still in the game.
-            if game_state.players[0].settlements:
+        # If we are not in any of the above situations, end the turn. This is done on a separate thread so that the
+        # game remains responsive while the AI players make their moves.
+        game_controller.begin_turn_processing(lambda: process_turn(game_controller, game_state))
+
+
+def process_turn(game_controller: GameController, game_state: GameState):
+    """
+    Process the end of the player's turn, moving the heathens and AI players. This is run on the turn thread, while
+    the game loop neither accepts input nor draws the board, so the state only becomes visible once it is complete.
+    :param game_controller: The current GameController object.
+    :param game_state: The current GameState object.
+    """
+    if game_state.end_turn():
+        # Autosave every turn, but only if the player is actually still in the game.
+        if game_state.players[0].settlements:
+            with game_state.profiler.measure("save_game"):
                 save_game(game_state, auto=True)
-            # Update the playtime statistic and check if any achievements have been obtained.
+        # Update the playtime statistic and check if any achievements have been obtained, unless the player is only
+        # spectating.
+        if not game_state.ai_only:
             time_elapsed = time.time() - game_controller.last_turn_time
             game_controller.last_turn_time = time.time()
-            if new_achs := save_stats_achievements(game_state, time_elapsed):
+            with game_state.profiler.measure("save_stats_achievements"):
+                new_achs = save_stats_achievements(game_state, time_elapsed)
+            if new_achs:
                 game_state.board.overlay.toggle_ach_notif(new_achs)
 
-            game_state.board.overlay.update_turn(game_state.turn)
+        game_state.board.overlay.update_turn(game_state.turn)
+        with game_state.profiler.measure("process_heathens"):
             game_state.process_heathens()
+        game_state.process_ais(game_controller.move_maker)
+
+
+def continue_fast_forward(game_controller: GameController, game_state: GameState) -> bool:
+    """
+    Begin processing the next batch of turns being fast-forwarded through on the turn thread, if there are any left.
+    :param game_controller: The current GameController object.
+    :param game_state: The current GameState object.
+    :return: Whether a batch of turns has begun processing.
+    """
+    if game_controller.fast_forward_left == 0:
+        game_controller.fast_forward_done = 0
+        return False
+    turns = min(game_controller.fast_forward_left, FAST_FORWARD_REDRAW_TURNS)
+    game_controller.begin_turn_processing(lambda: fast_forward(game_controller, game_state, turns))
+    return True
+
+
+def fast_forward(game_controller: GameController, game_state: GameState, turns: int):
+    """
+    Process the given number of turns in a row for the AI players, stopping early if a victory is achieved. The board is
+    not drawn while this is run on the turn thread, and the game is neither autosaved nor are statistics updated.
+    :param game_controller: The current GameController object.
+    :param game_state: The current GameState object.
+    :param turns: The number of turns to process.
+    """
+    overlay = game_state.board.overlay
+    # Nobody is able to see notifications while turns are being fast-forwarded through, so they are discarded.
+    game_state.board.overlay = NullOverlay()
+    try:
+        for _ in range(turns):
+            game_controller.fast_forward_left -= 1
+            game_controller.fast_forward_done += 1
+            if not game_state.end_turn():
+                # The only thing that can stop the turn from ending while spectating is the game ending, so we stop
+                # fast-forwarding and display the victory.
+                game_controller.fast_forward_left = 0
+                overlay.toggle_victory(game_state.board.overlay.current_victory)
+                break
+            with game_state.profiler.measure("process_heathens"):
+                game_state.process_heathens()
             game_state.process_ais(game_controller.move_maker)
+    finally:
+        game_state.board.overlay = overlay
+    overlay.update_turn(game_state.turn)
 
 
 def on_key_shift(game_state: GameState):
@@ -480,6 +563,7 @@ def on_key_a(game_state: GameState):
         # selected).
         set_player_construction(game_state.players[0], game_state.board.selected_settlement,
                                 game_state.nighttime_left > 0)
+        game_state.board.events.construction_set(game_state.board.selected_settlement)
 
 
 def on_key_escape(game_state: GameState):
@@ -493,7 +577,8 @@ def on_key_escape(game_state: GameState):
         if not game_state.board.overlay.showing or all(overlay in (OverlayType.ATTACK,
                                                                    OverlayType.SETL_ATTACK,
                                                                    OverlayType.SIEGE_NOTIF,
-                                                                   OverlayType.HEAL)
+                                                                   OverlayType.HEAL,
+                                                                   OverlayType.PROFILER)
                                                        for overlay in game_state.board.overlay.showing):
             game_state.board.overlay.toggle_pause()
         # Remove one overlay layer per ESCAPE press, assuming it is a layer that can be removed.
@@ -524,7 +609,12 @@ def on_key_b(game_state: GameState):
                 CompletedConstruction(game_state.board.selected_settlement.current_work.construction,
                                       game_state.board.selected_settlement)
             ])
+            game_state.board.events.construction_bought_out(game_state.board.selected_settlement)
+            game_state.board.achievements.construction_completed(current_work.construction)
             complete_construction(game_state.board.selected_settlement, game_state.players[0])
+            game_state.board.victories.construction_completed(game_state.players[0],
+                                                              game_state.board.selected_settlement,
+                                                              current_work.construction)
             game_state.players[0].wealth -= remaining_work
 
 
@@ -630,7 +720,58 @@ def on_key_x(game_state: GameState):
     if game_state.game_started and game_state.board.selected_unit is not None and \
             game_state.board.selected_unit in game_state.players[0].units:
         # If a unit is selected, pressing X disbands the army, destroying the unit and adding to the player's wealth.
+        game_state.board.events.unit_disbanded(game_state.board.selected_unit)
         game_state.players[0].wealth += game_state.board.selected_unit.plan.cost
+        game_state.board.sieges.end(game_state.board.selected_unit)
         game_state.players[0].units.remove(game_state.board.selected_unit)
         game_state.board.selected_unit = None
         game_state.board.overlay.toggle_unit(None)
+
+
+def on_key_f3(game_state: GameState):
+    """
+    Handles an F3 key event in the game loop.
+    :param game_state: The current GameState object.
+    """
+    if game_state.game_started:
+        # F3 is a debug key that toggles both turn profiling and the overlay displaying the profiles, so that profiling
+        # costs nothing while it is not being looked at.
+        game_state.profiler.toggle()
+        game_state.board.overlay.toggle_profiler(game_state.profiler)
+
+
+def on_key_f4(game_state: GameState):
+    """
+    Handles an F4 key event in the game loop.
+    :param game_state: The current GameState object.
+    """
+    if game_state.game_started and game_state.board.overlay.is_profiler() and game_state.profiler.profiles:
+        # Export the recorded turn profiles, so that they can be analysed outside of the game.
+        save_turn_profiles(game_state.profiler)
+        game_state.board.overlay.has_exported_profiles = True
+
+
+def on_key_f5(game_controller: GameController, game_state: GameState):
+    """
+    Handles an F5 key event in the game loop.
+    :param game_controller: The current GameController object.
+    :param game_state: The current GameState object.
+    """
+    if game_state.game_started and game_state.players[0].eliminated and not game_state.board.overlay.is_victory():
+        # Once eliminated, the player can spectate the rest of the game, fast-forwarding through the AI players' turns.
+        # From this point on, there is no player to show warnings to or keep statistics for.
+        game_state.ai_only = True
+        if game_state.board.overlay.is_elimination():
+            game_state.board.overlay.toggle_elimination(None)
+        game_controller.fast_forward_left += FAST_FORWARD_TURNS
+
+
+def on_key_f6(game_state: GameState):
+    """
+    Handles an F6 key event in the game loop.
+    :param game_state: The current GameState object.
+    """
+    if game_state.game_started and not game_state.on_menu:
+        # Games are saved in a compact binary format, but can also be exported as JSON alongside the other saves, e.g.
+        # for inspection or for use in other tools. Exported games can be loaded just like any other save.
+        save_game(game_state, as_json=True)
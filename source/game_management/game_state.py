@@ -1,14 +1,32 @@
+from __future__ import annotations
+
 import random
 import typing
 
-from source.display.board import Board
-from source.saving.game_save_manager import save_stats_achievements
 from source.util.calculator import clamp, attack, get_setl_totals, complete_construction
+from source.foundation.climate import Climate
+from source.foundation.unit_store import UnitColumns
 from source.foundation.catalogue import get_heathen, get_default_unit, FACTION_COLOURS, Namer
-from source.foundation.models import Heathen, Quad
+from source.foundation.models import Heathen, Quad, Achievement, AchievementTrigger
 from source.foundation.models import Player, Settlement, CompletedConstruction, Unit, HarvestStatus, EconomicStatus, \
     AttackPlaystyle, GameConfig, Victory, VictoryType, AIPlaystyle, ExpansionPlaystyle, Faction, Project
+from source.game_management.board_state import BoardState
 from source.game_management.movemaker import MoveMaker
+from source.game_management.turn_profiler import TurnProfiler
+from source.game_management.unit_index import UnitIndex
+
+
+def save_stats_achievements(game_state: GameState, **kwargs) -> typing.List[Achievement]:
+    """
+    Save the player's statistics and check for any newly-obtained achievements. The save manager depends on pyxel, so
+    it is only imported once there are statistics to save, meaning that games between AI players only can be run without
+    pyxel.
+    :param game_state: The current game state object.
+    :param kwargs: The statistics to save, as accepted by the save manager's save_stats_achievements().
+    :return: Any new achievements that have been obtained by the player.
+    """
+    from source.saving import game_save_manager  # pylint: disable=import-outside-toplevel
+    return game_save_manager.save_stats_achievements(game_state, **kwargs)
 
 
 class GameState:
@@ -20,12 +38,17 @@ class GameState:
         """
         Creates the initial game state.
         """
-        self.board: typing.Optional[Board] = None
+        self.board: typing.Optional[BoardState] = None
         self.players: typing.List[Player] = []
         self.heathens: typing.List[Heathen] = []
 
         self.on_menu = True
         self.game_started = False
+        # Whether the game is between AI players only, e.g. in a headless simulation, meaning that there is no player to
+        # show warnings to or keep statistics for.
+        self.ai_only = False
+        # Records where the time taken to process each turn goes, if enabled.
+        self.profiler = TurnProfiler()
 
         # The map begins at a random position.
         self.map_pos: (int, int) = random.randint(0, 76), random.randint(0, 68)
@@ -36,6 +59,8 @@ class GameState:
         self.until_night: int = random.randint(10, 20)
         # Also keep track of how many turns of night are left. If this is 0, it is daytime.
         self.nighttime_left = 0
+        # The climate is only applied while this game is being played.
+        self.climate = Climate()
 
     def gen_players(self, cfg: GameConfig):
         """
@@ -96,6 +121,7 @@ class GameState:
         - Update settlement satisfaction.
         - Process settlement current work.
         - Update settlement level.
+        - Count changed settlements towards the player's progress towards victory.
         - Show notifications for completed constructions or blessings.
         - Process ongoing blessing.
         - Update player wealth, auto-selling units if required.
@@ -105,7 +131,13 @@ class GameState:
         overall_wealth = 0
         completed_constructions: typing.List[CompletedConstruction] = []
         levelled_up_settlements: typing.List[Settlement] = []
+        held_units: UnitColumns = self.board.units.of(player)
+        # Changes to the player's settlements can lead to achievements, so they are noted for the non-AI player.
+        statuses_changed = False
+        setls_grew = False
         for setl in player.settlements:
+            previous_statuses = setl.harvest_status, setl.economic_status
+            previous_counted = setl.satisfaction, setl.level
             # Based on the settlement's satisfaction, place the settlement in a specific state of wealth and
             # harvest. More specifically, a satisfaction of less than 20 will yield 0 wealth and 0 harvest, a
             # satisfaction of [20, 40) will yield 0 harvest, a satisfaction of [60, 80) will yield 150% harvest,
@@ -128,22 +160,20 @@ class GameState:
             else:
                 setl.harvest_status = HarvestStatus.PLENTIFUL
                 setl.economic_status = EconomicStatus.BOOM
+            statuses_changed |= (setl.harvest_status, setl.economic_status) != previous_statuses
 
             total_wealth, total_harvest, total_zeal, total_fortune = \
                 get_setl_totals(player, setl, self.nighttime_left > 0)
             overall_fortune += total_fortune
             overall_wealth += total_wealth
 
-            # If the settlement is under siege, decrease its strength based on the number of besieging units.
+            # If the settlement is under siege, decrease its strength based on the number of besieging units. Only the
+            # besiegers that are actually next to the settlement count towards this.
             if setl.besieged:
-                besieging_units: typing.List[Unit] = []
-                for p in self.players:
-                    if p is not player:
-                        for u in p.units:
-                            for setl_quad in setl.quads:
-                                if abs(u.location[0] - setl_quad.location[0]) <= 1 and \
-                                        abs(u.location[1] - setl_quad.location[1]) <= 1:
-                                    besieging_units.append(u)
+                besieging_units: typing.List[Unit] = \
+                    [u for u in self.board.sieges.besiegers_of(setl)
+                     if any(abs(u.location[0] - setl_quad.location[0]) <= 1 and
+                            abs(u.location[1] - setl_quad.location[1]) <= 1 for setl_quad in setl.quads)]
                 if not besieging_units:
                     setl.besieged = False
                 else:
@@ -156,27 +186,28 @@ class GameState:
                 # strength.
                 if setl.strength < setl.max_strength:
                     setl.strength = min(setl.strength + setl.max_strength * 0.1, setl.max_strength)
+                    setls_grew = True
 
-            # Reset all units in the garrison in case any were garrisoned this turn.
+            # Hold all units in the garrison so that they are reset too, in case any were garrisoned this turn.
             for g in setl.garrison:
-                g.has_acted = False
-                g.remaining_stamina = g.plan.total_stamina
-                if g.health < g.plan.max_health:
-                    g.health = min(g.health + g.plan.max_health * 0.1, g.plan.max_health)
+                held_units.hold(g)
 
             # Settlement satisfaction is regulated by the amount of harvest generated against the level.
             if total_harvest < setl.level * 4:
                 setl.satisfaction -= (1 if player.faction is Faction.CAPITALISTS else 0.5)
             elif total_harvest >= setl.level * 8:
                 setl.satisfaction += 0.25
+                setls_grew = True
             setl.satisfaction = clamp(setl.satisfaction, 0, 100)
 
             # Process the current construction, completing it if it has been finished.
             if setl.current_work is not None and not isinstance(setl.current_work.construction, Project):
                 setl.current_work.zeal_consumed += total_zeal
                 if setl.current_work.zeal_consumed >= setl.current_work.construction.cost:
-                    completed_constructions.append(CompletedConstruction(setl.current_work.construction, setl))
+                    completed = setl.current_work.construction
+                    completed_constructions.append(CompletedConstruction(completed, setl))
                     complete_construction(setl, player)
+                    self.board.victories.construction_completed(player, setl, completed)
 
             setl.harvest_reserves += total_harvest
             # Settlement levels are increased if the settlement's harvest reserves exceed a certain level (specified
@@ -209,32 +240,44 @@ class GameState:
                                            best_quad_with_yield[0].location[0] + 6):
                                 self.players[0].quads_seen.add((j, i))
 
+            # Count any change in the settlement's satisfaction or level towards the player's progress towards victory.
+            if (setl.satisfaction, setl.level) != previous_counted:
+                self.board.victories.settlement_changed(player, setl)
+
+        if player.ai_playstyle is None:
+            if statuses_changed:
+                self.board.achievements.trigger(AchievementTrigger.STATUS_CHANGED)
+            if setls_grew or levelled_up_settlements:
+                self.board.achievements.trigger(AchievementTrigger.SETTLEMENT_GREW)
+            for completed in completed_constructions:
+                self.board.achievements.construction_completed(completed.construction)
+
         # Show notifications if the player's constructions have completed or one of their settlements has levelled
         # up.
         if player.ai_playstyle is None and len(completed_constructions) > 0:
             self.board.overlay.toggle_construction_notification(completed_constructions)
         if player.ai_playstyle is None and len(levelled_up_settlements) > 0:
             self.board.overlay.toggle_level_up_notification(levelled_up_settlements)
-        # Reset all units.
+        # Reset and heal all units in bulk, once each of them has been held in the unit store.
         for unit in player.units:
-            unit.remaining_stamina = unit.plan.total_stamina
-            # Heal the unit.
-            if unit.health < unit.plan.max_health:
-                unit.health = min(unit.health + unit.plan.max_health * 0.1, unit.plan.max_health)
-            unit.has_acted = False
+            held_units.hold(unit)
             overall_wealth -= unit.plan.cost / 10
+        held_units.reset()
         # Process the current blessing, completing it if it was finished.
         if player.ongoing_blessing is not None:
             player.ongoing_blessing.fortune_consumed += overall_fortune
             if player.ongoing_blessing.fortune_consumed >= player.ongoing_blessing.blessing.cost:
                 player.blessings.append(player.ongoing_blessing.blessing)
+                self.board.victories.blessing_completed(player, player.ongoing_blessing.blessing)
                 # Show a notification if the player is non-AI.
                 if player.ai_playstyle is None:
                     self.board.overlay.toggle_blessing_notification(player.ongoing_blessing.blessing)
+                    self.board.achievements.trigger(AchievementTrigger.BLESSING_UNDERGONE)
                 player.ongoing_blessing = None
         # If the player's wealth will go into the negative this turn, sell their units until it's above 0 again.
         while player.wealth + overall_wealth < 0:
             sold_unit = player.units.pop()
+            self.board.sieges.end(sold_unit)
             if self.board.selected_unit is sold_unit:
                 self.board.selected_unit = None
                 self.board.overlay.toggle_unit(None)
@@ -245,128 +288,115 @@ class GameState:
 
     def process_climatic_effects(self):
         """
-        Updates current night tracking variables, and toggles nighttime if the correct turn arrives.
+        Updates current night tracking variables, and toggles nighttime if the correct turn arrives. The stats of
+        heathens and units of The Nocturne are modified by the climate when they are read, so no units need updating.
         """
-        random.seed()
         if self.nighttime_left == 0:
             self.until_night -= 1
             if self.until_night == 0:
                 self.board.overlay.toggle_night(True)
                 # Nights last for between 5 and 20 turns.
                 self.nighttime_left = random.randint(5, 20)
-                for h in self.heathens:
-                    h.plan.power = round(2 * h.plan.power)
-                if self.players[0].faction is Faction.NOCTURNE:
-                    for u in self.players[0].units:
-                        u.plan.power = round(2 * u.plan.power)
-                    for setl in self.players[0].settlements:
-                        for unit in setl.garrison:
-                            unit.plan.power = round(2 * unit.plan.power)
+                self.climate.is_night = True
+                self.board.achievements.trigger(AchievementTrigger.NIGHTFALL)
         else:
             self.nighttime_left -= 1
             if self.nighttime_left == 0:
                 self.until_night = random.randint(10, 20)
                 self.board.overlay.toggle_night(False)
-                for h in self.heathens:
-                    h.plan.power = round(h.plan.power / 2)
-                if self.players[0].faction is Faction.NOCTURNE:
-                    for u in self.players[0].units:
-                        u.plan.power = round(u.plan.power / 4)
-                        u.health = round(u.health / 2)
-                        u.plan.max_health = round(u.plan.max_health / 2)
-                        u.plan.total_stamina = round(u.plan.total_stamina / 2)
-                    for setl in self.players[0].settlements:
-                        for unit in setl.garrison:
-                            unit.plan.power = round(unit.plan.power / 4)
-                            unit.health = round(unit.health / 2)
-                            unit.plan.max_health = round(unit.plan.max_health / 2)
-                            unit.plan.total_stamina = round(unit.plan.total_stamina / 2)
-
-    def end_turn(self) -> bool:
+                self.climate.is_night = False
+                self.climate.has_dawned = True
+
+    def end_turn(self, seed: typing.Optional[int] = None) -> bool:
         """
         Ends the current game turn, processing settlements, blessings, and units.
+        :param seed: The seed to process the turn from, which is randomly chosen if not supplied.
         :return: Whether the turn was successfully ended. Will be False in cases where a warning is generated, or the
         game ends.
         """
-        # First make sure the player hasn't ended their turn without a construction or blessing.
-        if self.check_for_warnings():
-            return False
+        # First make sure the player hasn't ended their turn without a construction or blessing. There is no player to
+        # warn in games between AI players only.
+        self.profiler.begin_turn(self.turn)
+        if not self.ai_only:
+            with self.profiler.measure("check_for_warnings"):
+                if self.check_for_warnings():
+                    return False
+
+        # Process the turn, and the heathens' moves afterwards, from a recorded seed, so that they can be replayed.
+        seed = random.getrandbits(32) if seed is None else seed
+        random.seed(seed)
+        self.board.events.turn_ended(seed)
 
         for player in self.players:
-            self.process_player(player)
+            with self.profiler.measure(f"process_player:{player.name}"):
+                self.process_player(player)
 
-        # Spawn a heathen every 5 turns.
-        if self.turn % 5 == 0:
-            heathen_loc = random.randint(0, 89), random.randint(0, 99)
-            self.heathens.append(get_heathen(heathen_loc, self.turn))
+        with self.profiler.measure("heathen_spawn_reset"):
+            # Spawn a heathen every 5 turns.
+            if self.turn % 5 == 0:
+                heathen_loc = random.randint(0, 89), random.randint(0, 99)
+                self.heathens.append(get_heathen(heathen_loc, self.turn))
 
-        # Reset all heathens.
-        for heathen in self.heathens:
-            heathen.remaining_stamina = heathen.plan.total_stamina
-            if heathen.health < heathen.plan.max_health:
-                heathen.health = min(heathen.health + heathen.plan.max_health * 0.1, 100)
+            # Reset all heathens.
+            for heathen in self.heathens:
+                self.board.units.heathens.hold(heathen)
+            self.board.units.heathens.reset(heal_cap=100)
 
         self.board.overlay.remove_warning_if_possible()
         self.turn += 1
 
         # Make night-related calculations, but only if climatic effects are enabled.
         if self.board.game_config.climatic_effects:
-            self.process_climatic_effects()
+            with self.profiler.measure("process_climatic_effects"):
+                self.process_climatic_effects()
 
-        possible_victory = self.check_for_victory()
+        with self.profiler.measure("check_for_victory"):
+            possible_victory = self.check_for_victory()
         if possible_victory is not None:
             self.board.overlay.toggle_victory(possible_victory)
             # Update the victory/defeat statistics, depending on whether the player achieved a victory, or an AI player
-            # did. Also check for any newly-obtained achievements.
-            if possible_victory.player is self.players[0]:
-                if new_achs := save_stats_achievements(self, victory_to_add=possible_victory.type):
-                    self.board.overlay.toggle_ach_notif(new_achs)
-            # We need an extra eliminated check in here because if the player was eliminated at the same time that the
-            # victory was achieved, e.g. in an elimination victory between two players, the defeat count would be
-            # incremented twice - once here and once when they are marked as eliminated.
-            elif not self.players[0].eliminated:
-                if new_achs := save_stats_achievements(self, increment_defeats=True):
-                    self.board.overlay.toggle_ach_notif(new_achs)
+            # did. Also check for any newly-obtained achievements. Naturally, games between AI players only have no
+            # statistics to update.
+            if self.ai_only:
+                return False
+            with self.profiler.measure("save_stats_achievements"):
+                if possible_victory.player is self.players[0]:
+                    if new_achs := save_stats_achievements(self, victory_to_add=possible_victory.type):
+                        self.board.overlay.toggle_ach_notif(new_achs)
+                # We need an extra eliminated check in here because if the player was eliminated at the same time that
+                # the victory was achieved, e.g. in an elimination victory between two players, the defeat count would
+                # be incremented twice - once here and once when they are marked as eliminated.
+                elif not self.players[0].eliminated:
+                    if new_achs := save_stats_achievements(self, increment_defeats=True):
+                        self.board.overlay.toggle_ach_notif(new_achs)
             return False
         return True
 
     def check_for_victory(self) -> typing.Optional[Victory]:
         """
         Check if any of the six victories have been achieved by any of the players. Also check if any players are close
-        to a victory.
+        to a victory. Progress towards the victories that depend on settlements and blessings is tracked as turns are
+        processed, so only each player's progress needs to be checked here.
         :return: A Victory, if one has been achieved.
         """
         close_to_vics: typing.List[Victory] = []
-        all_setls = []
-        for pl in self.players:
-            all_setls.extend(pl.settlements)
+        all_setls_count = sum(len(pl.settlements) for pl in self.players)
 
         players_with_setls = 0
         for p in self.players:
+            progress = self.board.victories.of(p)
             if len(p.settlements) > 0:
-                jubilated_setls = 0
-                lvl_ten_setls = 0
-                constructed_sanctum = False
-
                 # If a player controls all settlements bar one, they are close to an ELIMINATION victory.
-                if len(p.settlements) + 1 == len(all_setls) and VictoryType.ELIMINATION not in p.imminent_victories:
+                if len(p.settlements) + 1 == all_setls_count and VictoryType.ELIMINATION not in p.imminent_victories:
                     close_to_vics.append(Victory(p, VictoryType.ELIMINATION))
                     p.imminent_victories.add(VictoryType.ELIMINATION)
 
                 players_with_setls += 1
-                for s in p.settlements:
-                    if s.satisfaction == 100:
-                        jubilated_setls += 1
-                    if s.level == 10:
-                        lvl_ten_setls += 1
-                    if any(imp.name == "Holy Sanctum" for imp in s.improvements):
-                        constructed_sanctum = True
-                    # If a player is currently constructing the Holy Sanctum, they are close to a VIGOUR victory.
-                    elif s.current_work is not None and s.current_work.construction.name == "Holy Sanctum" and \
-                            VictoryType.VIGOUR not in p.imminent_victories:
-                        close_to_vics.append(Victory(p, VictoryType.VIGOUR))
-                        p.imminent_victories.add(VictoryType.VIGOUR)
-                if jubilated_setls >= 5:
+                # If a player is currently constructing the Holy Sanctum, they are close to a VIGOUR victory.
+                if progress.constructing_sanctums and VictoryType.VIGOUR not in p.imminent_victories:
+                    close_to_vics.append(Victory(p, VictoryType.VIGOUR))
+                    p.imminent_victories.add(VictoryType.VIGOUR)
+                if progress.jubilated_setls >= 5:
                     p.jubilation_ctr += 1
                     # If a player has achieved 100% satisfaction in 5 settlements, they are close to (25 turns away)
                     # from a JUBILATION victory.
@@ -380,14 +410,14 @@ class GameState:
                 if p.jubilation_ctr == 25:
                     return Victory(p, VictoryType.JUBILATION)
                 # If the player has at least 10 settlements of level 10, they have achieved a GLUTTONY victory.
-                if lvl_ten_setls >= 10:
+                if progress.lvl_ten_setls >= 10:
                     return Victory(p, VictoryType.GLUTTONY)
                 # If a player has 8 level 10 settlements, they are close to a GLUTTONY victory.
-                if lvl_ten_setls >= 8 and VictoryType.GLUTTONY not in p.imminent_victories:
+                if progress.lvl_ten_setls >= 8 and VictoryType.GLUTTONY not in p.imminent_victories:
                     close_to_vics.append(Victory(p, VictoryType.GLUTTONY))
                     p.imminent_victories.add(VictoryType.GLUTTONY)
                 # If the player has constructed the Holy Sanctum, they have achieved a VIGOUR victory.
-                if constructed_sanctum:
+                if progress.constructed_sanctum:
                     return Victory(p, VictoryType.VIGOUR)
             # The player has a special advantage over the AIs - if they have a settler unit despite losing all of their
             # settlements, they are considered to still be in the game.
@@ -395,7 +425,7 @@ class GameState:
                 p.eliminated = True
                 self.board.overlay.toggle_elimination(p)
                 # Update the defeats stat if the eliminated player is the human player.
-                if p == self.players[0]:
+                if p == self.players[0] and not self.ai_only:
                     # We ignore any returned achievements here for a couple of reasons - mainly because once eliminated,
                     # the player can't actually view them anyway, because they're taken back to the menu, but also
                     # because it is exceedingly unlikely that the player will have achieved one in the same turn that
@@ -410,12 +440,11 @@ class GameState:
                 p.imminent_victories.add(VictoryType.AFFLUENCE)
             # If the player has undergone the blessings for all three pieces of ardour, they have achieved a
             # SERENDIPITY victory.
-            ardour_pieces = len([bls for bls in p.blessings if "Piece of" in bls.name])
-            if ardour_pieces == 3:
+            if progress.ardour_pieces == 3:
                 return Victory(p, VictoryType.SERENDIPITY)
             # If a player has undergone two of the required three blessings for the pieces of ardour, they are close to
             # a SERENDIPITY victory.
-            if ardour_pieces == 2 and VictoryType.SERENDIPITY not in p.imminent_victories:
+            if progress.ardour_pieces == 2 and VictoryType.SERENDIPITY not in p.imminent_victories:
                 close_to_vics.append(Victory(p, VictoryType.SERENDIPITY))
                 p.imminent_victories.add(VictoryType.SERENDIPITY)
 
@@ -436,50 +465,46 @@ class GameState:
         """
         Process the turns for each of the heathens.
         """
-        all_units = []
-        for player in self.players:
-            # Heathens will not attack Infidel units.
-            if player.faction is not Faction.INFIDELS:
-                for unit in player.units:
-                    all_units.append(unit)
-        for heathen in self.heathens:
+        index = UnitIndex(self.players, self.heathens)
+        for heathen in list(self.heathens):
             within_range: typing.Optional[Unit] = None
-            # Check if any player unit is within range of the heathen.
-            for unit in all_units:
-                if max(abs(unit.location[0] - heathen.location[0]),
-                       abs(unit.location[1] - heathen.location[1])) <= heathen.remaining_stamina and \
-                        heathen.health >= unit.health / 2:
+            # Check if any player unit is within range of the heathen. Heathens will not attack Infidel units.
+            for unit in index.units_within(heathen.location, heathen.remaining_stamina):
+                if index.owner_of(unit).faction is not Faction.INFIDELS and heathen.health >= unit.health / 2:
                     within_range = unit
                     break
             # If there is a unit within range, move next to it and attack it.
             if within_range is not None:
                 if within_range.location[0] - heathen.location[0] < 0:
-                    heathen.location = within_range.location[0] + 1, within_range.location[1]
+                    index.relocate(heathen, (within_range.location[0] + 1, within_range.location[1]))
                 else:
-                    heathen.location = within_range.location[0] - 1, within_range.location[1]
+                    index.relocate(heathen, (within_range.location[0] - 1, within_range.location[1]))
                 heathen.remaining_stamina = 0
                 data = attack(heathen, within_range)
+                unit_owner = index.owner_of(within_range)
                 # Only show the attack overlay if the unit attacked was the non-AI player's.
-                if within_range in self.players[0].units:
+                if unit_owner is self.players[0]:
                     self.board.overlay.toggle_attack(data)
                 if within_range.health <= 0:
-                    for player in self.players:
-                        if within_range in player.units:
-                            player.units.remove(within_range)
-                            break
+                    self.board.sieges.end(within_range)
+                    unit_owner.units.remove(within_range)
+                    index.remove(within_range)
                     if self.board.selected_unit is within_range:
                         self.board.selected_unit = None
                         self.board.overlay.toggle_unit(None)
                 if heathen.health <= 0:
                     self.heathens.remove(heathen)
+                    index.vacate(heathen.location)
             else:
-                # If there are no units within range, just move randomly.
+                # If there are no units within range, just move randomly, so long as the heathen would not collide with
+                # anything.
                 x_movement = random.randint(-heathen.remaining_stamina, heathen.remaining_stamina)
                 rem_movement = heathen.remaining_stamina - abs(x_movement)
                 y_movement = random.choice([-rem_movement, rem_movement])
-                heathen.location = (clamp(heathen.location[0] + x_movement, 0, 99),
-                                    clamp(heathen.location[1] + y_movement, 0, 89))
-                heathen.remaining_stamina -= abs(x_movement) + abs(y_movement)
+                loc = clamp(heathen.location[0] + x_movement, 0, 99), clamp(heathen.location[1] + y_movement, 0, 89)
+                if not index.is_occupied(loc):
+                    index.relocate(heathen, loc)
+                    heathen.remaining_stamina -= abs(x_movement) + abs(y_movement)
 
             # Players of the Infidels faction share vision with Heathen units.
             if self.players[0].faction is Faction.INFIDELS:
@@ -516,5 +541,6 @@ class GameState:
         """
         for player in self.players:
             if player.ai_playstyle is not None:
-                move_maker.make_move(player, self.players, self.board.quads, self.board.game_config,
-                                     self.nighttime_left > 0)
+                with self.profiler.measure(f"make_move:{player.name}"):
+                    move_maker.make_move(player, self.players, self.board.relics, self.board.game_config,
+                                         self.nighttime_left > 0, self.heathens)
@@ -0,0 +1,146 @@
+import typing
+
+from source.foundation.models import InfluenceStamp, Player, Settlement, Unit
+
+# The dimensions of the board, in quads.
+BOARD_WIDTH = 100
+BOARD_HEIGHT = 90
+# How far beyond their own quad settlements present an opportunity to other players' units.
+SETTLEMENT_INFLUENCE_RADIUS = 5
+
+
+def grid_index(loc: (int, int)) -> typing.Optional[int]:
+    """
+    :param loc: The location to get the index of.
+    :return: The index of the given location in the grids, or None if it is off the board, where units attacking from
+    the edges of the board can end up.
+    """
+    if not (0 <= loc[0] < BOARD_WIDTH and 0 <= loc[1] < BOARD_HEIGHT):
+        return None
+    return int(loc[1]) * BOARD_WIDTH + int(loc[0])
+
+
+class InfluenceMap:
+    """
+    The threat and opportunity grids covering every quad on the board. Threat comes from the power of units, and
+    opportunity comes from settlements, which become more appealing the weaker they are and the better their quads'
+    yields. Each grid holds the combined influence of all players as well as each player's own contribution, meaning
+    that the influence of everyone but a given player can be queried in constant time. Rather than being rebuilt each
+    turn, the grids are updated incrementally as units move and settlements change.
+    """
+
+    def __init__(self):
+        """
+        Initialise the empty grids. Influence is stored in hundredths so that repeated incremental updates never
+        accumulate floating-point error.
+        """
+        self.total_threat: typing.List[int] = [0] * (BOARD_WIDTH * BOARD_HEIGHT)
+        self.total_opportunity: typing.List[int] = [0] * (BOARD_WIDTH * BOARD_HEIGHT)
+        self.player_threat: typing.Dict[str, typing.List[int]] = {}
+        self.player_opportunity: typing.Dict[str, typing.List[int]] = {}
+        # The stamp currently applied for each unit and settlement, keyed by the entity's ID.
+        self.stamps: typing.Dict[int, InfluenceStamp] = {}
+
+    def _apply(self, stamp: InfluenceStamp, sign: int):
+        """
+        Add or subtract the given stamp's influence to or from the grids.
+        :param stamp: The stamp to apply.
+        :param sign: 1 to add the influence, -1 to subtract it.
+        """
+        total = self.total_threat if stamp.is_threat else self.total_opportunity
+        player_grids = self.player_threat if stamp.is_threat else self.player_opportunity
+        if stamp.owner not in player_grids:
+            player_grids[stamp.owner] = [0] * (BOARD_WIDTH * BOARD_HEIGHT)
+        own = player_grids[stamp.owner]
+        value = stamp.value * sign
+        min_x = max(stamp.location[0] - stamp.radius, 0)
+        max_x = min(stamp.location[0] + stamp.radius, BOARD_WIDTH - 1)
+        for y in range(max(stamp.location[1] - stamp.radius, 0),
+                       min(stamp.location[1] + stamp.radius, BOARD_HEIGHT - 1) + 1):
+            for idx in range(y * BOARD_WIDTH + min_x, y * BOARD_WIDTH + max_x + 1):
+                total[idx] += value
+                own[idx] += value
+
+    def _restamp(self, new_stamp: InfluenceStamp):
+        """
+        Replace the stamp for the new stamp's entity, only touching the grids if the stamp has actually changed.
+        :param new_stamp: The up-to-date stamp for the entity.
+        """
+        old_stamp = self.stamps.get(id(new_stamp.entity))
+        if old_stamp is not None:
+            if old_stamp.owner == new_stamp.owner and old_stamp.location == new_stamp.location and \
+                    old_stamp.radius == new_stamp.radius and old_stamp.value == new_stamp.value:
+                return
+            self._apply(old_stamp, -1)
+        self._apply(new_stamp, 1)
+        self.stamps[id(new_stamp.entity)] = new_stamp
+
+    def update_unit(self, unit: Unit, owner: str):
+        """
+        Bring the threat exerted by the given unit up to date. Units threaten every quad they could attack next turn.
+        :param unit: The unit that has moved or otherwise changed.
+        :param owner: The name of the player the unit belongs to.
+        """
+        self._restamp(InfluenceStamp(unit, owner, (int(unit.location[0]), int(unit.location[1])),
+                                     unit.plan.total_stamina + 1, round(unit.plan.power * 100), True))
+
+    def update_settlement(self, setl: Settlement, owner: str):
+        """
+        Bring the opportunity presented by the given settlement up to date.
+        :param setl: The settlement that has changed.
+        :param owner: The name of the player the settlement belongs to.
+        """
+        quad_yields = sum(quad.wealth + quad.harvest + quad.zeal + quad.fortune for quad in setl.quads)
+        weakness = max(setl.max_strength - setl.strength, 0)
+        self._restamp(InfluenceStamp(setl, owner, setl.location, SETTLEMENT_INFLUENCE_RADIUS,
+                                     round((quad_yields + weakness) * 100), False))
+
+    def remove(self, entity: Unit | Settlement):
+        """
+        Remove the influence of the given entity, e.g. when a unit is killed.
+        :param entity: The unit or settlement to remove.
+        """
+        if (stamp := self.stamps.pop(id(entity), None)) is not None:
+            self._apply(stamp, -1)
+
+    def refresh(self, players: typing.List[Player]):
+        """
+        Reconcile the grids with the given players' units and settlements. Only entities that have changed since they
+        were last stamped are re-applied, and those that no longer exist are removed.
+        :param players: The list of all players.
+        """
+        current_ids: typing.Set[int] = set()
+        for player in players:
+            for unit in player.units:
+                self.update_unit(unit, player.name)
+                current_ids.add(id(unit))
+            for setl in player.settlements:
+                self.update_settlement(setl, player.name)
+                current_ids.add(id(setl))
+        for stale_id in [entity_id for entity_id in self.stamps if entity_id not in current_ids]:
+            self._apply(self.stamps.pop(stale_id), -1)
+
+    def threat_at(self, player_name: str, loc: (int, int)) -> float:
+        """
+        Get the threat posed to the given player at the given location by the units of all other players.
+        :param player_name: The name of the player to get the threat for.
+        :param loc: The location to query.
+        :return: The combined power of the other players' units that could attack the location.
+        """
+        if (idx := grid_index(loc)) is None:
+            return 0
+        own = self.player_threat.get(player_name)
+        return (self.total_threat[idx] - (own[idx] if own is not None else 0)) / 100
+
+    def opportunity_at(self, player_name: str, loc: (int, int)) -> float:
+        """
+        Get the opportunity presented to the given player at the given location by the settlements of all other
+        players.
+        :param player_name: The name of the player to get the opportunity for.
+        :param loc: The location to query.
+        :return: The combined value of the other players' settlements near the location.
+        """
+        if (idx := grid_index(loc)) is None:
+            return 0
+        own = self.player_opportunity.get(player_name)
+        return (self.total_opportunity[idx] - (own[idx] if own is not None else 0)) / 100
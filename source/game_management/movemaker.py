@@ -1,12 +1,20 @@
 import random
+import time
 import typing
 
 from source.util.calculator import get_player_totals, get_setl_totals, attack, complete_construction, clamp, \
     attack_setl, investigate_relic, heal, gen_spiral_indices
 from source.foundation.catalogue import get_available_blessings, get_unlockable_improvements, get_unlockable_units, \
     get_available_improvements, get_available_unit_plans, Namer
+from source.game_management.event_log import EventLog
+from source.game_management.influence_map import InfluenceMap
+from source.game_management.relic_registry import RelicRegistry
+from source.game_management.unit_index import UnitIndex
 from source.foundation.models import Player, Blessing, AttackPlaystyle, OngoingBlessing, Settlement, Improvement, \
-    UnitPlan, Construction, Unit, ExpansionPlaystyle, Quad, GameConfig, Faction
+    UnitPlan, Construction, Unit, ExpansionPlaystyle, GameConfig, Faction, AIBudgetUsage, Heathen
+
+# The compute time, in seconds, that each AI player is allotted per turn to make its move.
+AI_TURN_BUDGET = 0.05
 
 
 def set_blessing(player: Player, player_totals: (float, float, float, float)):
@@ -325,46 +333,47 @@ def set_ai_construction(player: Player, setl: Settlement, is_night: bool):
 
 
 def search_for_relics_or_move(unit: Unit,
-                              quads: typing.List[typing.List[Quad]],
+                              relics: RelicRegistry,
                               player: Player,
                               other_units: typing.List[Unit],
                               all_setls: typing.List[Settlement],
-                              cfg: GameConfig) -> None:
+                              cfg: GameConfig,
+                              events: EventLog) -> None:
     """
     Units that have no action to take can look for relics, or just simply move randomly.
     :param unit: The unit to move.
-    :param quads: The game quads.
+    :param relics: The registry of relics on the board.
     :param player: The current AI player.
     :param other_units: All the other units in the game.
     :param all_setls: All the settlements in the game.
     :param cfg: The current game configuration.
+    :param events: The event log to record any investigation in.
     """
     # The range in which a unit can investigate is actually further than its remaining stamina, as you only
     # have to be next to a relic to investigate it.
     investigate_range = unit.remaining_stamina + 1
-    for i in range(unit.location[1] - investigate_range, unit.location[1] + investigate_range + 1):
-        for j in range(unit.location[0] - investigate_range, unit.location[0] + investigate_range + 1):
-            if 0 <= i <= 99 and 0 <= j <= 89 and quads[j][i].is_relic:
-                first_resort: (int, int)
-                second_resort = j, i + 1
-                third_resort = j, i - 1
-                if j - unit.location[0] < 0:
-                    first_resort = j + 1, i
-                else:
-                    first_resort = j - 1, i
-                found_valid_loc = False
-                for loc in [first_resort, second_resort, third_resort]:
-                    if not any(u.location == loc for u in player.units) and \
-                            not any(other_u.location == loc for other_u in other_units) and \
-                            not any(any(setl_quad.location == loc for setl_quad in setl.quads) for setl in all_setls):
-                        unit.location = loc
-                        found_valid_loc = True
-                        break
-                unit.remaining_stamina = 0
-                if found_valid_loc:
-                    investigate_relic(player, unit, (j, i), cfg)
-                    quads[j][i].is_relic = False
-                    return
+    for relic_loc in relics.within(unit.location, investigate_range):
+        first_resort: (int, int)
+        second_resort = relic_loc[0], relic_loc[1] + 1
+        third_resort = relic_loc[0], relic_loc[1] - 1
+        if relic_loc[0] - unit.location[0] < 0:
+            first_resort = relic_loc[0] + 1, relic_loc[1]
+        else:
+            first_resort = relic_loc[0] - 1, relic_loc[1]
+        found_valid_loc = False
+        for loc in [first_resort, second_resort, third_resort]:
+            if not any(u.location == loc for u in player.units) and \
+                    not any(other_u.location == loc for other_u in other_units) and \
+                    not any(any(setl_quad.location == loc for setl_quad in setl.quads) for setl in all_setls):
+                unit.location = loc
+                found_valid_loc = True
+                break
+        unit.remaining_stamina = 0
+        if found_valid_loc:
+            result = investigate_relic(player, unit, relic_loc, cfg)
+            events.relic_investigated(unit, relic_loc, result)
+            relics.remove(relic_loc)
+            return
     # We only get to this point if a valid relic was not found. Make sure when moving randomly that the unit does not
     # collide with other units or settlements.
     found_valid_loc = False
@@ -382,7 +391,7 @@ def search_for_relics_or_move(unit: Unit,
 
 
 def move_healer_unit(player: Player, unit: Unit, other_units: typing.List[Unit],
-                     all_setls: typing.List[Settlement], quads: typing.List[typing.List[Quad]], cfg: GameConfig):
+                     all_setls: typing.List[Settlement], relics: RelicRegistry, cfg: GameConfig, events: EventLog):
     """
     Search for any friendly units within range that aren't at full health. If one is found, move next to it and
     heal it. Otherwise, the healer unit looks for relics or moves randomly.
@@ -391,8 +400,9 @@ def move_healer_unit(player: Player, unit: Unit, other_units: typing.List[Unit],
     :param other_units: The other units in the game. Used to make sure no unit collisions occur.
     :param all_setls: All of the settlements in the game. Used to make sure no collisions occur between the healer unit
     and settlements.
-    :param quads: The quads on the board.
+    :param relics: The registry of relics on the board.
     :param cfg: The current game configuration.
+    :param events: The event log to record any healing or investigation in.
     """
     within_range: typing.Optional[Unit] = None
     for player_u in player.units:
@@ -424,10 +434,43 @@ def move_healer_unit(player: Player, unit: Unit, other_units: typing.List[Unit],
         unit.remaining_stamina = 0
         # Assuming we found a valid location, the healing can take place.
         if found_valid_loc:
+            events.unit_healed(unit, within_range)
             heal(unit, within_range)
     # If there's nothing within range, look for relics or just move randomly.
     else:
-        search_for_relics_or_move(unit, quads, player, other_units, all_setls, cfg)
+        search_for_relics_or_move(unit, relics, player, other_units, all_setls, cfg, events)
+
+
+def is_unit_engaged(unit: Unit, player: Player, influence: InfluenceMap) -> bool:
+    """
+    Determine whether the given unit is near enough to a threat or target that its move warrants full planning.
+    :param unit: The unit to check.
+    :param player: The player owner of the unit.
+    :param influence: The influence map to consult.
+    :return: Whether the unit is engaged.
+    """
+    # Settlers are always considered engaged, as they are how an AI player expands its empire.
+    return unit.plan.can_settle or influence.threat_at(player.name, unit.location) > 0 or \
+        influence.opportunity_at(player.name, unit.location) > 0
+
+
+def make_default_move(unit: Unit, unit_index: UnitIndex):
+    """
+    Make a cheap default move for the given unit, moving it randomly within its remaining stamina. Unlike the full
+    planning logic, only a single destination is tried; if it is occupied, the unit simply stays where it is.
+    :param unit: The unit to move.
+    :param unit_index: The index of units and occupied locations. Updated to reflect the unit's move.
+    """
+    # Units besieging a settlement hold their position rather than wandering off.
+    if unit.besieging:
+        return
+    x_movement = random.randint(-unit.remaining_stamina, unit.remaining_stamina)
+    rem_movement = unit.remaining_stamina - abs(x_movement)
+    y_movement = random.choice([-rem_movement, rem_movement])
+    loc = clamp(unit.location[0] + x_movement, 0, 99), clamp(unit.location[1] + y_movement, 0, 89)
+    if not unit_index.is_occupied(loc):
+        unit_index.relocate(unit, loc)
+        unit.remaining_stamina -= abs(x_movement) + abs(y_movement)
 
 
 class MoveMaker:
@@ -435,24 +478,32 @@ class MoveMaker:
     The MoveMaker class handles AI moves for each turn.
     """
 
-    def __init__(self, namer: Namer):
+    def __init__(self, namer: Namer, turn_budget: float = AI_TURN_BUDGET):
         """
-        Initialise the MoveMaker's Namer reference.
+        Initialise the MoveMaker's Namer reference and compute budget.
         :param namer: The Namer instance to use for settlement names.
+        :param turn_budget: The compute time, in seconds, that each AI player is allotted per turn.
         """
         self.namer: Namer = namer
         self.board_ref = None
+        self.turn_budget: float = turn_budget
+        # The budget usage for each AI player's most recent move, keyed by player name.
+        self.budget_usage: typing.Dict[str, AIBudgetUsage] = {}
+        self.influence: InfluenceMap = InfluenceMap()
 
-    def make_move(self, player: Player, all_players: typing.List[Player], quads: typing.List[typing.List[Quad]],
-                  cfg: GameConfig, is_night: bool):
+    def make_move(self, player: Player, all_players: typing.List[Player], relics: RelicRegistry, cfg: GameConfig,
+                  is_night: bool, heathens: typing.List[Heathen] = None):
         """
-        Make a move for the given AI player.
+        Make a move for the given AI player. Units near threats or targets are moved first, and once the player's
+        compute budget has been used up, any remaining units are given a cheap default move instead.
         :param player: The AI player to make a move for.
         :param all_players: The list of all players.
-        :param quads: The 2D list of quads to use to search for relics.
+        :param relics: The registry of relics on the board.
         :param cfg: The game configuration.
         :param is_night: Whether it is night.
+        :param heathens: The heathens on the board, which units given a default move must not collide with.
         """
+        start_time = time.perf_counter()
         all_setls = []
         for pl in all_players:
             all_setls.extend(pl.settlements)
@@ -460,9 +511,14 @@ class MoveMaker:
         overall_wealth = player_totals[0]
         if player.ongoing_blessing is None:
             set_blessing(player, player_totals)
+            if player.ongoing_blessing is not None:
+                self.board_ref.events.blessing_set(player)
         for setl in player.settlements:
             if setl.current_work is None:
                 set_ai_construction(player, setl, is_night)
+                if setl.current_work is not None:
+                    self.board_ref.events.construction_set(setl)
+                    self.board_ref.victories.construction_set(player, setl)
             elif player.faction is not Faction.FUNDAMENTALISTS:
                 constr = setl.current_work.construction
                 # If the buyout cost for the settlement is less than a third of the player's wealth, buy it out. In
@@ -472,8 +528,10 @@ class MoveMaker:
                 if (constr.cost - setl.current_work.zeal_consumed) < player.wealth / 3 or \
                         (setl.satisfaction < 50 and player.wealth >= constr.cost and isinstance(constr, Improvement) and
                          (constr.effect.satisfaction > 0 or constr.effect.harvest > 0)):
+                    self.board_ref.events.construction_bought_out(setl)
                     player.wealth -= constr.cost - setl.current_work.zeal_consumed
                     complete_construction(setl, player)
+                    self.board_ref.victories.construction_completed(player, setl, constr)
             # If the settlement has a settler, deploy them.
             if len([unit for unit in setl.garrison if unit.plan.can_settle]) > 0:
                 for unit in setl.garrison:
@@ -483,6 +541,8 @@ class MoveMaker:
                                              if not any(setl_quad.location == loc for setl_quad in setl.quads) and
                                              0 <= loc[0] <= 99 and 0 <= loc[1] <= 89)
                         player.units.append(unit)
+                        self.board_ref.events.unit_deployed(
+                            setl, next(idx for idx, garrisoned in enumerate(setl.garrison) if garrisoned is unit), unit)
                         setl.garrison.remove(unit)
             # Deploy a unit from the garrison if the AI is not defensive, or the settlement is under siege or attack, or
             # there are too many units garrisoned.
@@ -495,21 +555,61 @@ class MoveMaker:
                                          if not any(setl_quad.location == loc for setl_quad in setl.quads) and
                                          0 <= loc[0] <= 99 and 0 <= loc[1] <= 89)
                 player.units.append(deployed)
+                self.board_ref.events.unit_deployed(setl, len(setl.garrison), deployed)
         all_units = []
         for p in all_players:
             if p is not player:
                 for unit in p.units:
                     all_units.append(unit)
         min_pow_health: (float, Unit) = 9999, None  # 9999 is arbitrary, but no unit will ever have this.
-        # Move each deployed unit, and also work out which of the player's units has the lowest combined power and
-        # health. This is subsequently used if we need to sell units due to negative wealth.
+        # Work out which of the player's units has the lowest combined power and health. This is subsequently used if
+        # we need to sell units due to negative wealth. Note that this is done in the player's own unit order, rather
+        # than the order in which units are moved.
         for unit in player.units:
             if pow_health := (unit.health + unit.plan.power) < min_pow_health[0]:
                 min_pow_health = pow_health, unit
-            self.move_unit(player, unit, all_units, all_players, all_setls, quads, cfg)
+        # Bring the influence map up to date with everything that has happened since the previous player's move. Only
+        # the units and settlements that have actually changed are re-applied.
+        self.influence.refresh(all_players)
+        # Units that are near threats or targets are moved first, so that they are the ones that benefit from full
+        # planning should the budget run out.
+        prioritised_units = sorted(player.units, key=lambda u: not is_unit_engaged(u, player, self.influence))
+        unit_index: typing.Optional[UnitIndex] = None
+        units_planned = 0
+        units_defaulted = 0
+        # Move each deployed unit.
+        for unit in prioritised_units:
+            # Each unit's move is recorded once it has taken an action or finished moving.
+            self.board_ref.events.track(unit)
+            # Units are never added to the player's units while they move, and the only unit that can be removed is the
+            # one moving, e.g. if it is killed or founds a settlement. As such, the moving unit is still one of the
+            # player's units if and only if the player has as many units as before it moved.
+            unit_count = len(player.units)
+            # At least one unit is always fully planned, regardless of the budget.
+            if units_planned == 0 or time.perf_counter() - start_time < self.turn_budget:
+                self.move_unit(player, unit, all_units, all_players, all_setls, relics, cfg)
+                units_planned += 1
+            else:
+                # The unit index is only built once it is actually needed.
+                if unit_index is None:
+                    unit_index = UnitIndex(all_players if any(pl is player for pl in all_players)
+                                           else all_players + [player], heathens)
+                make_default_move(unit, unit_index)
+                units_defaulted += 1
+            self.board_ref.events.untrack()
+            # Keep the influence map current as each unit moves, so that later units in this move see it.
+            if len(player.units) == unit_count:
+                self.influence.update_unit(unit, player.name)
+            else:
+                self.influence.remove(unit)
             overall_wealth -= unit.plan.cost / 10
-        if (player.wealth + overall_wealth < 0) and min_pow_health[1] in player.units:
+        self.budget_usage[player.name] = AIBudgetUsage(self.turn_budget, time.perf_counter() - start_time,
+                                                       units_planned, units_defaulted)
+        # Units are compared by identity, as distinct units can be equal.
+        if (player.wealth + overall_wealth < 0) and any(unit is min_pow_health[1] for unit in player.units):
+            self.board_ref.events.unit_disbanded(min_pow_health[1])
             player.wealth += min_pow_health[1].plan.cost
+            self.board_ref.sieges.end(min_pow_health[1])
             player.units.remove(min_pow_health[1])
 
     def move_settler_unit(self, unit: Unit, player: Player, other_units: typing.List[Unit],
@@ -552,11 +652,12 @@ class MoveMaker:
             elif player.faction is Faction.IMPERIALS:
                 new_settl.strength /= 2
                 new_settl.max_strength /= 2
+            self.board_ref.events.settlement_founded(player, new_settl, unit)
             player.settlements.append(new_settl)
             player.units.remove(unit)
 
     def move_unit(self, player: Player, unit: Unit, other_units: typing.List[Unit], all_players: typing.List[Player],
-                  all_setls: typing.List[Settlement], quads: typing.List[typing.List[Quad]], cfg: GameConfig):
+                  all_setls: typing.List[Settlement], relics: RelicRegistry, cfg: GameConfig):
         """
         Move the given unit, attacking if the right conditions are met.
         :param player: The AI owner of the unit being moved.
@@ -564,9 +665,10 @@ class MoveMaker:
         :param other_units: The list of all enemy units.
         :param all_players: The list of all players.
         :param all_setls: The list of all settlements.
-        :param quads: The 2D list of quads to use to search for relics.
+        :param relics: The registry of relics on the board.
         :param cfg: The game configuration.
         """
+        initial_location = unit.location
         # If the unit can settle, randomly move it until it is far enough away from any of the player's other
         # settlements, ensuring that it does not collide with any other units or settlements. Once this has been
         # achieved, found a new settlement and destroy the unit.
@@ -575,7 +677,9 @@ class MoveMaker:
         # If the unit is a healer, look around for any friendly units within range that aren't at full health. If one is
         # found, move next to it and heal it. Otherwise, just look for relics or move randomly.
         elif unit.plan.heals:
-            move_healer_unit(player, unit, other_units, all_setls, quads, cfg)
+            move_healer_unit(player, unit, other_units, all_setls, relics, cfg, self.board_ref.events)
+            if unit.location != initial_location:
+                self.leave_siege(unit)
         else:
             attack_over_siege = True  # If False, the unit will siege the settlement.
             within_range: typing.Optional[Unit | Settlement] = None
@@ -621,10 +725,13 @@ class MoveMaker:
                         else:
                             # If there are no attackable settlements, we check if the AI player can place any under
                             # siege. Aggressive AIs will place any settlement they can see under siege, and neutral AIs
-                            # will do the same if they have the upper hand.
+                            # will do the same if they have the upper hand, so long as the units around the settlement
+                            # are not more powerful than the besieger.
                             could_siege: bool = player.ai_playstyle.attacking is AttackPlaystyle.AGGRESSIVE or \
                                                 (player.ai_playstyle.attacking is AttackPlaystyle.NEUTRAL and
-                                                 unit.health >= other_setl.strength * 2)
+                                                 unit.health >= other_setl.strength * 2 and
+                                                 self.influence.threat_at(player.name, other_setl.location) <
+                                                 unit.health)
                             if could_siege:
                                 if any(max(abs(unit.location[0] - setl_quad.location[0]),
                                            abs(unit.location[1] - setl_quad.location[1])) <= unit.remaining_stamina
@@ -655,20 +762,28 @@ class MoveMaker:
                 unit.remaining_stamina = 0
                 # If there is no location we can move to that allows us to attack, don't move or attack.
                 if found_valid_loc:
+                    # Having moved, the unit can no longer be besieging the settlement it was previously. If it is
+                    # placing a settlement under siege, it begins a new siege below.
+                    if unit.location != initial_location:
+                        self.leave_siege(unit)
                     if attack_over_siege:
                         # If we are attacking another unit, we stop our siege first, and then attack.
                         if isinstance(within_range, Unit):
-                            unit.besieging = False
+                            self.board_ref.events.unit_attacked(unit, within_range, ai=True)
+                            self.board_ref.sieges.end(unit)
                             data = attack(unit, within_range)
 
                             # Show the attack notification if we attacked the player.
                             if within_range in all_players[0].units:
                                 self.board_ref.overlay.toggle_attack(data)
                             if within_range.health <= 0:
+                                self.board_ref.sieges.end(within_range)
                                 for p in all_players:
                                     if within_range in p.units:
                                         p.units.remove(within_range)
                                         break
+                                # Make sure the player's other units don't go on to attack the destroyed unit.
+                                other_units.remove(within_range)
                             if unit.health <= 0:
                                 player.units.remove(unit)
                         # Alternatively, we are attacking a settlement.
@@ -681,32 +796,42 @@ class MoveMaker:
                             # was planning to attack, then the settlement will cease to exist. As such, only proceed
                             # with the attack if we can find the owner, and thus, the settlement.
                             if setl_owner:
+                                self.board_ref.events.settlement_attacked(unit, within_range)
                                 data = attack_setl(unit, within_range, setl_owner)
 
                                 # Show the settlement attack notification if we attacked the player.
                                 if within_range in all_players[0].settlements:
                                     self.board_ref.overlay.toggle_setl_attack(data)
                                 if data.attacker_was_killed:
+                                    self.board_ref.sieges.end(data.attacker)
                                     player.units.remove(data.attacker)
                                 elif data.setl_was_taken:
-                                    data.settlement.besieged = False
-                                    for u in player.units:
-                                        if any(abs(u.location[0] - setl_quad.location[0]) <= 1 and
-                                               abs(u.location[1] - setl_quad.location[1]) <= 1
-                                               for setl_quad in data.settlement.quads):
-                                            u.besieging = False
+                                    self.board_ref.sieges.lift(data.settlement)
                                     if player.faction is not Faction.CONCENTRATED:
                                         player.settlements.append(data.settlement)
+                                        self.board_ref.victories.settlement_changed(player, data.settlement)
+                                    else:
+                                        self.board_ref.victories.settlement_lost(data.settlement)
                                     setl_owner.settlements.remove(data.settlement)
                     # If we have chosen to place a settlement under siege, and the unit is not already besieging another
                     # settlement, do so.
                     elif not unit.besieging:
-                        unit.besieging = True
-                        if not within_range.besieged:
-                            within_range.besieged = True
-                            # Show the siege notification if we have placed one of the player's settlements under siege.
-                            if within_range in all_players[0].settlements:
-                                self.board_ref.overlay.toggle_siege_notif(within_range, player)
+                        # Show the siege notification if we are placing one of the player's settlements under siege.
+                        if not within_range.besieged and within_range in all_players[0].settlements:
+                            self.board_ref.overlay.toggle_siege_notif(within_range, player)
+                        self.board_ref.events.siege_begun(unit, within_range)
+                        self.board_ref.sieges.begin(unit, within_range)
             # If there's nothing within range, look for relics or just move randomly.
             else:
-                search_for_relics_or_move(unit, quads, player, other_units, all_setls, cfg)
+                search_for_relics_or_move(unit, relics, player, other_units, all_setls, cfg, self.board_ref.events)
+                if unit.location != initial_location:
+                    self.leave_siege(unit)
+
+    def leave_siege(self, unit: Unit):
+        """
+        End the siege of the given unit, if it is besieging a settlement, e.g. because it has moved away from it.
+        :param unit: The unit that may be leaving a siege.
+        """
+        if unit.besieging:
+            self.board_ref.events.siege_ended(unit)
+            self.board_ref.sieges.end(unit)
@@ -0,0 +1,85 @@
+import typing
+
+from source.foundation.models import Quad
+from source.foundation.quad_grid import QuadGrid
+
+# The side length of the square buckets that relics are grouped into.
+RELIC_BUCKET_SIZE = 10
+
+
+class RelicRegistry:
+    """
+    The registry of the relics remaining on the board. Relics are held both as a set of locations and grouped into
+    spatial buckets, meaning that the relics near a location can be found without checking every quad around it. The
+    relic status of each quad is kept in sync by the registry, so that it continues to be saved and loaded as normal.
+    """
+
+    def __init__(self, quads: typing.List[typing.List[Quad]] | QuadGrid):
+        """
+        Initialise the registry with the relics on the given quads. The relics of loaded boards are found from the flags
+        they were loaded from, so that their quads are not all materialised.
+        :param quads: The quads on the board.
+        """
+        self.quads = quads
+        self.locations: typing.Set[typing.Tuple[int, int]] = set()
+        self.buckets: typing.Dict[typing.Tuple[int, int], typing.Set[typing.Tuple[int, int]]] = {}
+        if isinstance(quads, QuadGrid):
+            for loc in quads.relics():
+                self._index(loc)
+            return
+        for i, row in enumerate(quads):
+            for j, quad in enumerate(row):
+                if quad.is_relic:
+                    self._index((j, i))
+
+    def _index(self, loc: (int, int)):
+        """
+        Add the given location to the set of relic locations and its bucket.
+        :param loc: The location of the relic.
+        """
+        self.locations.add(loc)
+        self.buckets.setdefault((loc[0] // RELIC_BUCKET_SIZE, loc[1] // RELIC_BUCKET_SIZE), set()).add(loc)
+
+    def remove(self, loc: (int, int)):
+        """
+        Remove the relic at the given location, e.g. once it has been investigated.
+        :param loc: The location of the relic.
+        """
+        self.quads[loc[1]][loc[0]].is_relic = False
+        self.locations.discard(loc)
+        bucket_loc = loc[0] // RELIC_BUCKET_SIZE, loc[1] // RELIC_BUCKET_SIZE
+        if bucket_loc in self.buckets:
+            self.buckets[bucket_loc].discard(loc)
+            if not self.buckets[bucket_loc]:
+                del self.buckets[bucket_loc]
+
+    def within(self, loc: (int, int), radius: int) -> typing.List[typing.Tuple[int, int]]:
+        """
+        Find the relics within the given distance of a location, where distance is measured the same way as unit
+        movement, i.e. diagonals count as one.
+        :param loc: The location to search around.
+        :param radius: The maximum distance a relic can be from the location.
+        :return: The locations of the relics found, ordered by row and then column.
+        """
+        found = []
+        for bucket_x in range((loc[0] - radius) // RELIC_BUCKET_SIZE, (loc[0] + radius) // RELIC_BUCKET_SIZE + 1):
+            for bucket_y in range((loc[1] - radius) // RELIC_BUCKET_SIZE, (loc[1] + radius) // RELIC_BUCKET_SIZE + 1):
+                for relic_loc in self.buckets.get((bucket_x, bucket_y), ()):
+                    if max(abs(relic_loc[0] - loc[0]), abs(relic_loc[1] - loc[1])) <= radius:
+                        found.append(relic_loc)
+        found.sort(key=lambda relic_loc: (relic_loc[1], relic_loc[0]))
+        return found
+
+    @property
+    def count(self) -> int:
+        """
+        :return: The number of relics remaining on the board.
+        """
+        return len(self.locations)
+
+    def __contains__(self, loc: (int, int)) -> bool:
+        """
+        :param loc: The location to check.
+        :return: Whether there is a relic at the given location.
+        """
+        return loc in self.locations
@@ -0,0 +1,248 @@
+import random
+import typing
+
+from source.display.overlay import NullOverlay
+from source.foundation.catalogue import FACTION_COLOURS, Namer, IMPROVEMENTS, PROJECTS, get_available_unit_plans, \
+    get_available_blessings, get_default_unit, get_improvement, get_project
+from source.foundation.models import GameEvent, GameStartedEvent, TurnEndedEvent, SettlementFoundedEvent, \
+    BlessingSetEvent, ConstructionSetEvent, ConstructionBoughtOutEvent, UnitMovedEvent, UnitDeployedEvent, \
+    PassengerDeployedEvent, UnitGarrisonedEvent, UnitBoardedEvent, UnitAttackedEvent, SettlementAttackedEvent, \
+    UnitHealedEvent, SiegeBegunEvent, SiegeEndedEvent, RelicInvestigatedEvent, UnitDisbandedEvent, Player, Unit, \
+    Heathen, Settlement, Construction, OngoingBlessing, Faction, Improvement, Project, UnitPlan
+from source.game_management.board_state import BoardState
+from source.game_management.event_log import HEATHEN_OWNER
+from source.game_management.game_state import GameState
+from source.util.calculator import attack, attack_setl, heal, complete_construction, grant_investigation_result, \
+    get_night_affinity
+
+
+def replay(events: typing.List[GameEvent], until_turn: typing.Optional[int] = None) -> GameState:
+    """
+    Reconstruct the state of a game by replaying the events in its log, without making any AI moves or drawing anything.
+    :param events: The events to replay, the first of which must be the start of the game.
+    :param until_turn: The turn to stop at, before it ends. If not supplied, every event is replayed.
+    :return: The state of the game once the events have been replayed.
+    """
+    if not events or not isinstance(events[0], GameStartedEvent):
+        raise ValueError("Event logs must begin with the start of the game.")
+    game_state = start_game(events[0])
+    # The replayed game's climate is only applied while it is being replayed, leaving that of any game being played as
+    # it was.
+    with game_state.climate.applied():
+        for event in events[1:]:
+            if isinstance(event, TurnEndedEvent):
+                if game_state.turn == until_turn:
+                    break
+                # The turn and the heathens' moves are processed from the same seed as they were originally.
+                if game_state.end_turn(seed=event.seed):
+                    game_state.process_heathens()
+            else:
+                apply_event(game_state, event)
+    return game_state
+
+
+def start_game(event: GameStartedEvent) -> GameState:
+    """
+    Start the game described by the given event, generating the same board and AI settlements as it originally had.
+    :param event: The event recording the start of the game.
+    :return: The state of the started game.
+    """
+    game_state = GameState()
+    # There is nobody to show warnings to or keep statistics for when replaying a game.
+    game_state.ai_only = True
+    game_state.until_night = event.until_night
+    game_state.players = [Player(name, faction, FACTION_COLOURS[faction], ai_playstyle=ai_playstyle)
+                          for name, faction, ai_playstyle in event.players]
+    random.seed(event.seed)
+    namer = Namer()
+    game_state.board = BoardState(event.config, namer, NullOverlay())
+    game_state.initialise_ais(namer)
+    game_state.game_started = True
+    game_state.on_menu = False
+    return game_state
+
+
+def get_unit(game_state: GameState, ref: typing.Tuple[int, int]) -> Unit | Heathen:
+    """
+    :param game_state: The state of the game being replayed.
+    :param ref: The index of the unit's owner and the unit's index in their units.
+    :return: The unit or heathen referred to.
+    """
+    if ref[0] == HEATHEN_OWNER:
+        return game_state.heathens[ref[1]]
+    return game_state.players[ref[0]].units[ref[1]]
+
+
+def get_setl(game_state: GameState, ref: typing.Tuple[int, int]) -> Settlement:
+    """
+    :param game_state: The state of the game being replayed.
+    :param ref: The index of the settlement's owner and the settlement's index in their settlements.
+    :return: The settlement referred to.
+    """
+    return game_state.players[ref[0]].settlements[ref[1]]
+
+
+def get_construction(player: Player, setl: Settlement, name: str) -> Improvement | Project | UnitPlan:
+    """
+    Get the construction with the given name, as it was available to the given settlement.
+    :param player: The owner of the settlement.
+    :param setl: The settlement the construction was begun in.
+    :param name: The name of the construction.
+    :return: The construction with the given name.
+    """
+    if any(imp.name == name for imp in IMPROVEMENTS):
+        return get_improvement(name)
+    if any(prj.name == name for prj in PROJECTS):
+        return get_project(name)
+    # Unit plans are modified depending on the player's faction, so they must be retrieved in the same way as they were
+    # when the construction was originally begun.
+    return next(plan for plan in get_available_unit_plans(player, setl.level) if plan.name == name)
+
+
+def reveal(player: Player, location: typing.Tuple[int, int]):
+    """
+    Add the quads surrounding the given location to the given player's seen quads, as the game does for the player
+    whenever their units move.
+    :param player: The player who may be seeing the quads.
+    :param location: The location to reveal the surroundings of.
+    """
+    if player.ai_playstyle is None:
+        for i in range(location[1] - 5, location[1] + 6):
+            for j in range(location[0] - 5, location[0] + 6):
+                player.quads_seen.add((j, i))
+
+
+def apply_event(game_state: GameState, event: GameEvent):  # pylint: disable=too-many-branches,too-many-statements
+    """
+    Apply the given event to the game being replayed, in the same way as the original action was applied.
+    :param game_state: The state of the game being replayed.
+    :param event: The event to apply.
+    """
+    board = game_state.board
+    match event:
+        case SettlementFoundedEvent():
+            player = game_state.players[event.player]
+            quad = board.quads[event.location[1]][event.location[0]]
+            board.namer.remove_settlement_name(event.name, quad.biome)
+            # Players' first settlements come with a default unit in their garrison.
+            if event.settler is None:
+                new_settl = Settlement(event.name, event.location, [], [quad],
+                                       [get_default_unit(event.location, get_night_affinity(player))])
+                if player.faction is Faction.CONCENTRATED:
+                    new_settl.strength *= 2
+                    new_settl.max_strength *= 2
+            else:
+                new_settl = Settlement(event.name, event.location, [], [quad], [])
+            if player.faction is Faction.FRONTIERSMEN:
+                new_settl.satisfaction = 75
+            elif player.faction is Faction.IMPERIALS:
+                new_settl.strength /= 2
+                new_settl.max_strength /= 2
+            player.settlements.append(new_settl)
+            if event.settler is None:
+                reveal(player, event.location)
+            else:
+                player.units.pop(event.settler)
+        case BlessingSetEvent():
+            # Much like unit plans, blessings are modified depending on the player's faction.
+            player = game_state.players[event.player]
+            player.ongoing_blessing = \
+                OngoingBlessing(next(bls for bls in get_available_blessings(player) if bls.name == event.blessing))
+        case ConstructionSetEvent():
+            setl = get_setl(game_state, event.settlement)
+            setl.current_work = \
+                Construction(get_construction(game_state.players[event.settlement[0]], setl, event.construction))
+            board.victories.construction_set(game_state.players[event.settlement[0]], setl)
+        case ConstructionBoughtOutEvent():
+            player = game_state.players[event.settlement[0]]
+            setl = get_setl(game_state, event.settlement)
+            current_work = setl.current_work
+            remaining_work = current_work.construction.cost - current_work.zeal_consumed
+            complete_construction(setl, player)
+            board.victories.construction_completed(player, setl, current_work.construction)
+            player.wealth -= remaining_work
+        case UnitMovedEvent():
+            unit = get_unit(game_state, event.unit)
+            unit.location = event.location
+            unit.remaining_stamina = event.remaining_stamina
+            reveal(game_state.players[event.unit[0]], event.location)
+        case UnitDeployedEvent():
+            player = game_state.players[event.settlement[0]]
+            deployed = get_setl(game_state, event.settlement).garrison.pop(event.garrison_idx)
+            deployed.garrisoned = False
+            deployed.location = event.location
+            player.units.append(deployed)
+            reveal(player, event.location)
+        case PassengerDeployedEvent():
+            player = game_state.players[event.deployer[0]]
+            deployed = get_unit(game_state, event.deployer).passengers.pop(event.passenger_idx)
+            deployed.location = event.location
+            player.units.append(deployed)
+            reveal(player, event.location)
+        case UnitGarrisonedEvent():
+            unit = get_unit(game_state, event.unit)
+            unit.remaining_stamina = event.remaining_stamina
+            unit.garrisoned = True
+            board.sieges.end(unit)
+            get_setl(game_state, event.settlement).garrison.append(unit)
+            game_state.players[event.unit[0]].units.pop(event.unit[1])
+        case UnitBoardedEvent():
+            unit = get_unit(game_state, event.unit)
+            unit.remaining_stamina = event.remaining_stamina
+            board.sieges.end(unit)
+            get_unit(game_state, event.deployer).passengers.append(unit)
+            game_state.players[event.unit[0]].units.pop(event.unit[1])
+        case UnitAttackedEvent():
+            attacker = get_unit(game_state, event.attacker)
+            defender = get_unit(game_state, event.defender)
+            # AI units end their sieges before attacking, whereas the player's units only do so if they are killed.
+            if event.ai:
+                board.sieges.end(attacker)
+            attack(attacker, defender, event.ai)
+            # The attacker and defender always belong to different players, so removing one does not affect the index
+            # of the other.
+            if attacker.health <= 0:
+                if not event.ai:
+                    board.sieges.end(attacker)
+                game_state.players[event.attacker[0]].units.pop(event.attacker[1])
+            if defender.health <= 0:
+                if event.defender[0] == HEATHEN_OWNER:
+                    game_state.heathens.pop(event.defender[1])
+                else:
+                    board.sieges.end(defender)
+                    game_state.players[event.defender[0]].units.pop(event.defender[1])
+        case SettlementAttackedEvent():
+            player = game_state.players[event.attacker[0]]
+            setl_owner = game_state.players[event.settlement[0]]
+            setl = get_setl(game_state, event.settlement)
+            data = attack_setl(get_unit(game_state, event.attacker), setl, setl_owner)
+            if data.attacker_was_killed:
+                board.sieges.end(data.attacker)
+                player.units.pop(event.attacker[1])
+            elif data.setl_was_taken:
+                board.sieges.lift(setl)
+                # The Concentrated can only have a single settlement, so settlements they take simply disappear.
+                if player.faction is not Faction.CONCENTRATED:
+                    player.settlements.append(setl)
+                    board.victories.settlement_changed(player, setl)
+                else:
+                    board.victories.settlement_lost(setl)
+                setl_owner.settlements.pop(event.settlement[1])
+        case UnitHealedEvent():
+            heal(get_unit(game_state, event.healer), get_unit(game_state, event.healed))
+        case SiegeBegunEvent():
+            board.sieges.begin(get_unit(game_state, event.unit), get_setl(game_state, event.settlement))
+        case SiegeEndedEvent():
+            board.sieges.end(get_unit(game_state, event.unit))
+        case RelicInvestigatedEvent():
+            grant_investigation_result(game_state.players[event.unit[0]], get_unit(game_state, event.unit),
+                                       event.location, event.result)
+            board.relics.remove(event.location)
+        case UnitDisbandedEvent():
+            player = game_state.players[event.unit[0]]
+            unit = get_unit(game_state, event.unit)
+            player.wealth += unit.plan.cost
+            board.sieges.end(unit)
+            player.units.pop(event.unit[1])
+        case _:
+            raise ValueError(f"{type(event).__name__} cannot be applied once the game has started.")
@@ -0,0 +1,99 @@
+import typing
+
+from source.foundation.models import Player, Settlement, Unit
+
+
+class SiegeRegistry:
+    """
+    The registry of the sieges taking place on the board, mapping each settlement under siege to the units besieging
+    it. The registry is updated as units begin and end sieges, meaning that the besiegers of a settlement can be found
+    without checking the location of every unit in the game. The besieging and besieged statuses of units and
+    settlements are kept in sync by the registry, so that they continue to be saved and loaded as normal.
+    """
+
+    def __init__(self):
+        """
+        Initialise the empty registry.
+        """
+        # The units besieging each settlement, keyed by the settlement's ID and then each unit's ID.
+        self.besiegers: typing.Dict[int, typing.Dict[int, Unit]] = {}
+        # The settlement each besieging unit is besieging, keyed by the unit's ID.
+        self.targets: typing.Dict[int, Settlement] = {}
+
+    def begin(self, unit: Unit, setl: Settlement):
+        """
+        Have the given unit begin besieging the given settlement, ending any siege it was previously part of.
+        :param unit: The unit beginning the siege.
+        :param setl: The settlement being placed under siege.
+        """
+        if self.targets.get(id(unit)) is not setl:
+            self.end(unit)
+        unit.besieging = True
+        setl.besieged = True
+        self.besiegers.setdefault(id(setl), {})[id(unit)] = unit
+        self.targets[id(unit)] = setl
+
+    def end(self, unit: Unit):
+        """
+        Have the given unit end its siege, e.g. when it moves away from the settlement, attacks, or is killed. Note that
+        the settlement remains under siege until its strength is next updated, even if it has no besiegers left.
+        :param unit: The unit ending its siege.
+        """
+        unit.besieging = False
+        if (setl := self.targets.pop(id(unit), None)) is not None:
+            setl_besiegers = self.besiegers[id(setl)]
+            del setl_besiegers[id(unit)]
+            if not setl_besiegers:
+                del self.besiegers[id(setl)]
+
+    def lift(self, setl: Settlement):
+        """
+        Lift the siege on the given settlement entirely, e.g. when it has been taken, ending the siege for every unit
+        besieging it.
+        :param setl: The settlement to lift the siege on.
+        """
+        for unit in self.besiegers.pop(id(setl), {}).values():
+            unit.besieging = False
+            del self.targets[id(unit)]
+        setl.besieged = False
+
+    def besiegers_of(self, setl: Settlement) -> typing.List[Unit]:
+        """
+        :param setl: The settlement to get the besiegers of.
+        :return: The units besieging the given settlement, in the order in which they began their sieges.
+        """
+        return list(self.besiegers.get(id(setl), {}).values())
+
+    def target_of(self, unit: Unit) -> typing.Optional[Settlement]:
+        """
+        :param unit: The unit to get the target of.
+        :return: The settlement the given unit is besieging, if it is besieging one.
+        """
+        return self.targets.get(id(unit))
+
+    def rebuild(self, players: typing.List[Player]):
+        """
+        Rebuild the registry from the besieging and besieged statuses of the given players' units and settlements, e.g.
+        when a game has been loaded. Each besieging unit is associated with the adjacent settlement under siege.
+        :param players: The list of all players.
+        """
+        self.besiegers = {}
+        self.targets = {}
+        # Map the location of each quad belonging to a settlement under siege to the settlement and its owner.
+        besieged_quads: typing.Dict[typing.Tuple[int, int], typing.Tuple[Settlement, Player]] = {}
+        for player in players:
+            for setl in player.settlements:
+                if setl.besieged:
+                    for setl_quad in setl.quads:
+                        besieged_quads[setl_quad.location] = setl, player
+        for player in players:
+            for unit in player.units:
+                if unit.besieging:
+                    # A unit cannot besiege its own player's settlements.
+                    adjacent = [besieged_quads[(unit.location[0] + dx, unit.location[1] + dy)]
+                                for dx in range(-1, 2) for dy in range(-1, 2)
+                                if (unit.location[0] + dx, unit.location[1] + dy) in besieged_quads]
+                    if (target := next((setl for setl, owner in adjacent if owner is not player), None)) is not None:
+                        self.begin(unit, target)
+                    else:
+                        unit.besieging = False
@@ -0,0 +1,110 @@
+import contextlib
+import csv
+import json
+import time
+import typing
+from collections import deque
+
+from source.foundation.models import TurnProfile
+
+# The number of most recent turns that profiles are kept for.
+PROFILER_CAPACITY = 100
+
+# Returned when profiling is disabled, so that measuring a phase costs no more than entering an empty context.
+_NOT_MEASURED = contextlib.nullcontext()
+
+
+class _PhaseTimer:
+    """
+    Times a single phase of a turn, adding the time taken to the phase's existing time, if there is one.
+    """
+
+    def __init__(self, profile: TurnProfile, phase: str):
+        """
+        Initialise the timer for the given phase.
+        :param profile: The profile of the turn the phase is part of.
+        :param phase: The name of the phase.
+        """
+        self.profile = profile
+        self.phase = phase
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *_):
+        self.profile.timings[self.phase] = \
+            self.profile.timings.get(self.phase, 0.0) + time.perf_counter() - self.start
+
+
+class TurnProfiler:
+    """
+    Records the time spent in each phase of each turn, keeping the profiles of the most recent turns in a ring buffer.
+    Profiling is disabled by default, in which case nothing is recorded.
+    """
+
+    def __init__(self, capacity: int = PROFILER_CAPACITY):
+        """
+        Initialise the profiler with an empty ring buffer.
+        :param capacity: The number of most recent turns to keep profiles for.
+        """
+        self.enabled = False
+        self.profiles: typing.Deque[TurnProfile] = deque(maxlen=capacity)
+        self.current: typing.Optional[TurnProfile] = None
+
+    def begin_turn(self, turn: int):
+        """
+        Begin profiling the given turn, with all phases measured from now on being attributed to it.
+        :param turn: The turn being profiled.
+        """
+        if self.enabled:
+            self.current = TurnProfile(turn)
+            self.profiles.append(self.current)
+
+    def measure(self, phase: str) -> typing.ContextManager:
+        """
+        Measure a phase of the current turn, for use in a with statement.
+        :param phase: The name of the phase.
+        :return: A context manager that times the phase, or does nothing if profiling is disabled.
+        """
+        if not self.enabled or self.current is None:
+            return _NOT_MEASURED
+        return _PhaseTimer(self.current, phase)
+
+    def toggle(self):
+        """
+        Toggle profiling on or off. The current turn is discarded either way, so that no turn is partially profiled.
+        """
+        self.enabled = not self.enabled
+        self.current = None
+
+    @property
+    def latest(self) -> typing.Optional[TurnProfile]:
+        """
+        :return: The profile of the most recent turn, if there is one.
+        """
+        return self.profiles[-1] if self.profiles else None
+
+
+def export_csv(profiles: typing.Iterable[TurnProfile], path: str):
+    """
+    Export the given profiles to a CSV file, with a row for each phase of each turn.
+    :param profiles: The profiles to export.
+    :param path: The path of the file to write.
+    """
+    with open(path, "w", encoding="utf-8", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["turn", "phase", "seconds"])
+        for profile in profiles:
+            for phase, seconds in profile.timings.items():
+                writer.writerow([profile.turn, phase, seconds])
+
+
+def export_json(profiles: typing.Iterable[TurnProfile], path: str):
+    """
+    Export the given profiles to a JSON file, as a list of objects with the turn and the timings of its phases.
+    :param profiles: The profiles to export.
+    :param path: The path of the file to write.
+    """
+    with open(path, "w", encoding="utf-8") as json_file:
+        json.dump([{"turn": profile.turn, "timings": profile.timings} for profile in profiles], json_file, indent=2)
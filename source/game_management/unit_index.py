@@ -0,0 +1,128 @@
+import typing
+from collections import Counter
+
+from source.foundation.models import Player, Unit, Heathen
+
+# The side length of the square buckets that units are grouped into.
+UNIT_BUCKET_SIZE = 10
+
+
+class UnitIndex:
+    """
+    A spatial index of the units on the board, grouping them into buckets so that the units near a location can be
+    found without checking every unit in the game. The index also records the owner of each unit, and which locations
+    are occupied by units, heathens and settlements, so that entities can be moved without colliding with one another.
+    """
+
+    def __init__(self, players: typing.List[Player], heathens: typing.List[Heathen] = None):
+        """
+        Build the index from the given players' units and settlements, as well as any heathens.
+        :param players: The players whose units and settlements should be indexed.
+        :param heathens: The heathens occupying locations on the board.
+        """
+        self.buckets: typing.Dict[typing.Tuple[int, int], typing.List[Unit]] = {}
+        self.owners: typing.Dict[int, Player] = {}
+        # The order in which each unit was added, used to return units in a consistent order regardless of bucket.
+        self.ordinals: typing.Dict[int, int] = {}
+        self.next_ordinal = 0
+        # Locations are counted rather than simply stored, as an attacking heathen can share a location with a unit.
+        self.occupied: typing.Counter[typing.Tuple[int, int]] = Counter()
+        for player in players:
+            for unit in player.units:
+                self.add(unit, player)
+            for setl in player.settlements:
+                self.occupied.update(setl_quad.location for setl_quad in setl.quads)
+        for heathen in heathens or []:
+            self.occupied[heathen.location] += 1
+
+    @staticmethod
+    def _bucket_for(loc: (int, int)) -> (int, int):
+        """
+        :param loc: The location to get the bucket for.
+        :return: The bucket the given location falls into.
+        """
+        return int(loc[0]) // UNIT_BUCKET_SIZE, int(loc[1]) // UNIT_BUCKET_SIZE
+
+    def _unbucket(self, unit: Unit):
+        """
+        Take the given unit out of its bucket. Units are compared by identity, as distinct units can be equal.
+        :param unit: The unit to take out.
+        """
+        bucket = self.buckets[self._bucket_for(unit.location)]
+        bucket.pop(next(idx for idx, bucket_unit in enumerate(bucket) if bucket_unit is unit))
+
+    def add(self, unit: Unit, owner: Player):
+        """
+        Add the given unit to the index.
+        :param unit: The unit to add.
+        :param owner: The player the unit belongs to.
+        """
+        self.owners[id(unit)] = owner
+        self.ordinals[id(unit)] = self.next_ordinal
+        self.next_ordinal += 1
+        self.buckets.setdefault(self._bucket_for(unit.location), []).append(unit)
+        self.occupied[unit.location] += 1
+
+    def remove(self, unit: Unit):
+        """
+        Remove the given unit from the index, e.g. when it has been killed.
+        :param unit: The unit to remove.
+        """
+        self._unbucket(unit)
+        del self.owners[id(unit)]
+        self.vacate(unit.location)
+
+    def vacate(self, loc: (int, int)):
+        """
+        Mark the given location as no longer being occupied by one of the entities there.
+        :param loc: The location being vacated.
+        """
+        self.occupied[loc] -= 1
+        if self.occupied[loc] <= 0:
+            del self.occupied[loc]
+
+    def relocate(self, entity: Unit | Heathen, loc: (int, int)):
+        """
+        Move the given unit or heathen to a new location, keeping the index in sync.
+        :param entity: The unit or heathen to move.
+        :param loc: The location to move the entity to.
+        """
+        self.vacate(entity.location)
+        self.occupied[loc] += 1
+        if id(entity) in self.owners:
+            self._unbucket(entity)
+            self.buckets.setdefault(self._bucket_for(loc), []).append(entity)
+        entity.location = loc
+
+    def is_occupied(self, loc: (int, int)) -> bool:
+        """
+        :param loc: The location to check.
+        :return: Whether the given location is occupied by a unit, heathen or settlement.
+        """
+        return loc in self.occupied
+
+    def owner_of(self, unit: Unit) -> typing.Optional[Player]:
+        """
+        :param unit: The unit to get the owner of.
+        :return: The player the unit belongs to, if it has been indexed.
+        """
+        return self.owners.get(id(unit))
+
+    def units_within(self, loc: (int, int), radius: int) -> typing.List[Unit]:
+        """
+        Find the units within the given distance of a location, where distance is measured the same way as unit
+        movement, i.e. diagonals count as one.
+        :param loc: The location to search around.
+        :param radius: The maximum distance a unit can be from the location.
+        :return: The units found, in the order in which they were added to the index.
+        """
+        found = []
+        min_bucket = self._bucket_for((loc[0] - radius, loc[1] - radius))
+        max_bucket = self._bucket_for((loc[0] + radius, loc[1] + radius))
+        for bucket_x in range(min_bucket[0], max_bucket[0] + 1):
+            for bucket_y in range(min_bucket[1], max_bucket[1] + 1):
+                for unit in self.buckets.get((bucket_x, bucket_y), ()):
+                    if max(abs(unit.location[0] - loc[0]), abs(unit.location[1] - loc[1])) <= radius:
+                        found.append(unit)
+        found.sort(key=lambda unit: self.ordinals[id(unit)])
+        return found
@@ -0,0 +1,126 @@
+import typing
+
+from source.foundation.models import Player, Settlement, Blessing, VictoryProgress, Improvement, Project, UnitPlan
+
+
+class SettlementTally(typing.NamedTuple):
+    """
+    What a settlement is currently counted towards in its owner's progress.
+    """
+    owner: int  # The ID of the owner.
+    jubilated: bool
+    lvl_ten: bool
+    constructing_sanctum: bool
+
+
+class VictoryTracker:
+    """
+    The tracker of each player's progress towards the victories that depend on their settlements and blessings. The
+    tracker is updated as settlements change, e.g. when their satisfaction or level changes, when constructions are set
+    or completed, or when they are captured, meaning that victories can be checked without going through every
+    settlement and blessing in the game.
+    """
+
+    def __init__(self):
+        """
+        Initialise the empty tracker.
+        """
+        # The progress of each player, keyed by the player's ID.
+        self.progress: typing.Dict[int, VictoryProgress] = {}
+        # What each settlement is counted towards, keyed by the settlement's ID.
+        self.tallies: typing.Dict[int, SettlementTally] = {}
+
+    def of(self, player: Player) -> VictoryProgress:
+        """
+        :param player: The player to get the progress of.
+        :return: The given player's progress towards victory.
+        """
+        return self.progress.setdefault(id(player), VictoryProgress())
+
+    def _count(self, player: Player, setl: Settlement, constructing_sanctum: bool):
+        """
+        Count the given settlement towards the given player's progress, replacing what it was counted towards before.
+        :param player: The owner of the settlement.
+        :param setl: The settlement to count.
+        :param constructing_sanctum: Whether the settlement is constructing the Holy Sanctum.
+        """
+        self.settlement_lost(setl)
+        tally = SettlementTally(id(player), setl.satisfaction == 100, setl.level == 10, constructing_sanctum)
+        progress = self.of(player)
+        progress.jubilated_setls += tally.jubilated
+        progress.lvl_ten_setls += tally.lvl_ten
+        progress.constructing_sanctums += tally.constructing_sanctum
+        self.tallies[id(setl)] = tally
+
+    def settlement_changed(self, player: Player, setl: Settlement):
+        """
+        Count the given settlement's satisfaction and level towards its owner's progress, e.g. after either of them has
+        changed, or after the settlement has been captured.
+        :param player: The owner of the settlement.
+        :param setl: The settlement that has changed.
+        """
+        previous = self.tallies.get(id(setl))
+        self._count(player, setl, previous is not None and previous.constructing_sanctum)
+
+    def construction_set(self, player: Player, setl: Settlement):
+        """
+        Count whether the given settlement is constructing the Holy Sanctum, once its construction has been set.
+        :param player: The owner of the settlement.
+        :param setl: The settlement whose construction has been set.
+        """
+        self._count(player, setl,
+                    setl.current_work is not None and setl.current_work.construction.name == "Holy Sanctum")
+
+    def construction_completed(self, player: Player, setl: Settlement,
+                               construction: Improvement | Project | UnitPlan):
+        """
+        Count the given completed construction towards the given player's progress, along with any changes it made to
+        the settlement's satisfaction and level.
+        :param player: The owner of the settlement.
+        :param setl: The settlement that completed the construction.
+        :param construction: The completed construction.
+        """
+        if construction.name == "Holy Sanctum":
+            self.of(player).constructed_sanctum = True
+        self._count(player, setl, False)
+
+    def settlement_lost(self, setl: Settlement):
+        """
+        Stop counting the given settlement towards its owner's progress, e.g. when it has been captured and destroyed.
+        :param setl: The settlement to stop counting.
+        """
+        if (tally := self.tallies.pop(id(setl), None)) is not None:
+            progress = self.progress[tally.owner]
+            progress.jubilated_setls -= tally.jubilated
+            progress.lvl_ten_setls -= tally.lvl_ten
+            progress.constructing_sanctums -= tally.constructing_sanctum
+
+    def blessing_completed(self, player: Player, blessing: Blessing):
+        """
+        Count the given blessing towards the given player's progress, if it is one of the pieces of ardour.
+        :param player: The player who completed the blessing.
+        :param blessing: The completed blessing.
+        """
+        if "Piece of" in blessing.name:
+            self.of(player).ardour_pieces += 1
+
+    def rebuild(self, players: typing.List[Player]):
+        """
+        Rebuild the tracker from the current settlements and blessings of the given players, e.g. when a game has been
+        loaded.
+        :param players: The list of all players.
+        """
+        self.progress = {}
+        self.tallies = {}
+        for player in players:
+            progress = self.of(player)
+            for setl in player.settlements:
+                # Settlements that have already constructed the Holy Sanctum are not also considered to be constructing
+                # it.
+                if any(imp.name == "Holy Sanctum" for imp in setl.improvements):
+                    progress.constructed_sanctum = True
+                    self.settlement_changed(player, setl)
+                else:
+                    self.construction_set(player, setl)
+            for bls in player.blessings:
+                self.blessing_completed(player, bls)
@@ -0,0 +1,145 @@
+import os
+import struct
+import typing
+import zlib
+
+"""
+Autosaves are appended to a single journal file as records, rather than each being written to a separate file. Each
+record is laid out as follows, with all values being little-endian:
+
+- The length of the record's save, as an unsigned int.
+- The kind of the record, i.e. whether its save is a full save, or a delta save against the most recent full record
+  preceding it in the journal.
+- The CRC-32 checksum of the record's kind and save, as an unsigned int.
+- The save itself, compressed in the same way as save files.
+
+Records are only ever appended, meaning that a crash while writing one can only leave a torn record at the end of the
+journal, which is identified by being truncated or by its checksum, and is truncated away when the journal is
+recovered. Once a full record has been written, the records preceding it are no longer needed, and are removed by
+compacting the journal.
+"""
+
+# The kinds of record in the journal.
+FULL_RECORD, DELTA_RECORD = range(2)
+
+_RECORD = struct.Struct("<IBI")
+
+
+class JournalRecord(typing.NamedTuple):
+    """
+    The location of a record in the journal.
+    """
+    offset: int
+    kind: int
+    length: int
+
+
+class AutosaveJournal:
+    """
+    The journal file that autosaves are appended to.
+    """
+
+    def __init__(self, file_name: str):
+        """
+        Initialise the journal, which must be recovered before it is appended to.
+        :param file_name: The name of the journal file, including its directory.
+        """
+        self.file_name = file_name
+        self.recovered = False
+
+    def scan(self) -> typing.Tuple[typing.List[JournalRecord], int]:
+        """
+        Read through the journal, verifying the checksum of each record.
+        :return: A tuple of the intact records in the journal, and the offset at which they end, beyond which any torn
+        record lies.
+        """
+        records = []
+        offset = 0
+        if not os.path.exists(self.file_name):
+            return records, offset
+        with open(self.file_name, "rb") as journal:
+            while len(header := journal.read(_RECORD.size)) == _RECORD.size:
+                length, kind, checksum = _RECORD.unpack(header)
+                save = journal.read(length)
+                if len(save) < length or zlib.crc32(save, zlib.crc32(bytes([kind]))) != checksum:
+                    break
+                records.append(JournalRecord(offset, kind, length))
+                offset += _RECORD.size + length
+        return records, offset
+
+    def recover(self) -> typing.List[JournalRecord]:
+        """
+        Recover the journal after a crash, truncating any torn record at its end.
+        :return: The intact records in the journal.
+        """
+        records, end = self.scan()
+        if os.path.exists(self.file_name) and os.path.getsize(self.file_name) > end:
+            os.truncate(self.file_name, end)
+        self.recovered = True
+        return records
+
+    def append(self, kind: int, save: bytes) -> int:
+        """
+        Append a record to the journal, recovering it first if it has not been recovered yet. The record is flushed to
+        disk before this returns.
+        :param kind: The kind of the record.
+        :param save: The compressed save to record.
+        :return: The offset of the record in the journal.
+        """
+        if not self.recovered:
+            self.recover()
+        try:
+            with open(self.file_name, "ab") as journal:
+                offset = journal.tell()
+                journal.write(_RECORD.pack(len(save), kind, zlib.crc32(save, zlib.crc32(bytes([kind])))) + save)
+                journal.flush()
+                os.fsync(journal.fileno())
+        except OSError:
+            # The record may have been partially written, so the journal must be recovered before it is appended to
+            # again.
+            self.recovered = False
+            raise
+        return offset
+
+    def compact(self, offset: int):
+        """
+        Remove the records preceding the given offset from the journal, by copying the records that follow it to a
+        temporary file that then replaces the journal.
+        :param offset: The offset of the first record to keep.
+        """
+        directory, base_name = os.path.split(self.file_name)
+        temp_name = os.path.join(directory, f".{base_name}.tmp")
+        with open(self.file_name, "rb") as journal, open(temp_name, "wb") as temp_file:
+            journal.seek(offset)
+            while chunk := journal.read(1024 * 1024):
+                temp_file.write(chunk)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_name, self.file_name)
+
+    def read(self, record: JournalRecord) -> bytes:
+        """
+        :param record: The record to read.
+        :return: The compressed save of the record.
+        """
+        with open(self.file_name, "rb") as journal:
+            journal.seek(record.offset + _RECORD.size)
+            return journal.read(record.length)
+
+    def latest(self, recover: bool = True) -> typing.Tuple[bytes, typing.Optional[bytes]]:
+        """
+        Recover the journal, and read its latest intact record.
+        :param recover: Whether to recover the journal, truncating any torn record at its end. The journal is left as it
+        is if not, e.g. when only reading the metadata of its latest record.
+        :return: A tuple of the compressed save of the latest record, and that of the full record it is a delta against,
+        if it is a delta record.
+        """
+        records = self.recover() if recover else self.scan()[0]
+        if not records:
+            raise ValueError("Autosave journal has no intact records.")
+        if records[-1].kind == FULL_RECORD:
+            return self.read(records[-1]), None
+        base = next((record for record in reversed(records) if record.kind == FULL_RECORD), None)
+        if base is None:
+            raise ValueError("Autosave journal has no full record for its latest record to be applied to.")
+        return self.read(records[-1]), self.read(base)
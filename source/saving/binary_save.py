@@ -0,0 +1,736 @@
+from __future__ import annotations
+
+import gzip
+import io
+import struct
+import sys
+import typing
+from array import array
+from dataclasses import replace
+from itertools import chain
+from operator import attrgetter
+
+from source.foundation import palette
+from source.foundation.catalogue import BLESSINGS, IMPROVEMENTS, PROJECTS, UNIT_PLANS
+from source.foundation.climate import NightAffinity
+from source.foundation.models import Quad, Biome, Player, Faction, Settlement, Unit, DeployerUnit, UnitPlan, Heathen, \
+    Construction, OngoingBlessing, AIPlaystyle, AttackPlaystyle, ExpansionPlaystyle, VictoryType, HarvestStatus, \
+    EconomicStatus, GameConfig, Improvement, Project, SaveMetadata
+from source.foundation.quad_grid import QuadGrid
+
+if typing.TYPE_CHECKING:
+    from source.game_management.game_state import GameState
+
+"""
+Games are saved in a compact binary format, laid out as follows, with all values being little-endian:
+
+- A header of the SAVE_MAGIC bytes, followed by the version of the format as an unsigned short.
+- The metadata displayed when choosing a game to load, including a small thumbnail of the board, so that it can be read
+  without reading the rest of the save. Saves of version 1 of the format have no metadata.
+- The turn, night status, game config, and optional event log reference.
+- The quads of the board, as packed arrays of biomes, yields, and flags, in row-major order.
+- Each player, with their settlements and units as fixed records.
+- Each heathen, as a fixed record.
+
+Save files are compressed with gzip, and are written and read as streams, meaning that neither the compressed nor the
+uncompressed save is ever held in memory in full. Uncompressed saves, i.e. those written before saves were compressed,
+are still read as-is.
+
+Autosaves can also be written as deltas against an earlier full save of the same game, identified by the DELTA_MAGIC
+bytes. Delta saves are laid out in the same way, except that the name of the full save's file follows the metadata, only
+the quads that have changed are included, alongside their index, and each player is preceded by a flag indicating
+whether they have changed, with unchanged players being omitted.
+
+References to the catalogue, i.e. to blessings, improvements, projects, and unit plans, are stored as their index within
+the catalogue, and enums are stored as their index within their definition. Unit plans are stored alongside their
+catalogue index, since their stats can be modified by the player's faction and by relics. The format version must be
+incremented whenever the layout changes.
+"""
+
+SAVE_MAGIC = b"MCSV"
+# The magic bytes identifying delta saves, which only include the parts of the game that have changed since a full save.
+DELTA_MAGIC = b"MCSD"
+SAVE_VERSION = 2
+
+# The catalogue, in the order in which its entries are indexed.
+_BLESSINGS = list(BLESSINGS.values())
+_BLESSING_IDS = {bls.name: idx for idx, bls in enumerate(_BLESSINGS)}
+_IMPROVEMENT_IDS = {imp.name: idx for idx, imp in enumerate(IMPROVEMENTS)}
+_PROJECT_IDS = {prj.name: idx for idx, prj in enumerate(PROJECTS)}
+_UNIT_PLAN_IDS = {plan.name: idx for idx, plan in enumerate(UNIT_PLANS)}
+# The magic bytes at the start of every gzip stream, identifying compressed saves.
+COMPRESSED_MAGIC = b"\x1f\x8b"
+# The level of compression used for saves. Higher levels barely reduce the size of saves, most of which is made up of
+# the quads' yields, while taking longer to write them.
+COMPRESSION_LEVEL = 1
+
+# The plan ID used for unit plans that are not in the catalogue, i.e. those of heathens, which are stored with a name.
+_CUSTOM_PLAN = 0xFF
+# The value stored in place of an optional enum or catalogue reference that is not present.
+_ABSENT = 0xFF
+
+# The number of quads on the board, which is 100 quads wide and 90 high.
+_QUAD_COUNT = 90 * 100
+
+# The size of the thumbnails of the board included in each save, with each pixel depicting a square of quads.
+THUMBNAIL_SIZE = 20, 18
+_THUMBNAIL_SCALE = 5
+# The colours used to depict each biome in thumbnails.
+_THUMBNAIL_COLOURS = {
+    Biome.DESERT: palette.COLOR_YELLOW,
+    Biome.FOREST: palette.COLOR_GREEN,
+    Biome.SEA: palette.COLOR_DARK_BLUE,
+    Biome.MOUNTAIN: palette.COLOR_GRAY,
+}
+
+# The kinds of construction that a settlement can be working on.
+_NO_WORK, _IMPROVEMENT_WORK, _PROJECT_WORK, _UNIT_PLAN_WORK = range(4)
+
+# The fixed parts of each record.
+_HEADER = struct.Struct("<4sH")
+_COUNT = struct.Struct("<H")
+_METADATA = struct.Struct("<IBBHH")
+_GAME = struct.Struct("<IhhBBBBI")
+_PLAN = struct.Struct("<BddHdB")
+_UNIT = struct.Struct("<dhhhB")
+_SETTLEMENT = struct.Struct("<hhdddBdBBB")
+_PLAYER = struct.Struct("<BBdBBBIdB")
+_CONSTRUCTION = struct.Struct("<BBd")
+_BLESSING = struct.Struct("<Bd")
+_QUAD_CHANGE = struct.Struct("<HBddddB")
+_CHANGED = struct.Struct("<B")
+
+
+def _index(member) -> int:
+    """
+    :param member: The enum member to get the index of.
+    :return: The index of the member within its enum's definition.
+    """
+    return list(type(member)).index(member)
+
+
+class SaveWriter:
+    """
+    Accumulates the bytes of a binary save.
+    """
+
+    def __init__(self):
+        """
+        Initialise the writer with an empty buffer.
+        """
+        self.buffer = bytearray()
+
+    def pack(self, record: struct.Struct, *values):
+        """
+        Write the given values as a fixed record.
+        :param record: The structure of the record.
+        :param values: The values to write.
+        """
+        self.buffer += record.pack(*values)
+
+    def count(self, count: int):
+        """
+        Write the number of elements in a variable-length section of the save.
+        :param count: The number of elements.
+        """
+        self.buffer += _COUNT.pack(count)
+
+    def text(self, text: str):
+        """
+        Write the given text, prefixed by its length.
+        :param text: The text to write.
+        """
+        encoded = text.encode("utf-8")
+        self.count(len(encoded))
+        self.buffer += encoded
+
+    def packed(self, values: array):
+        """
+        Write the given array of values, without a length prefix.
+        :param values: The array to write.
+        """
+        if sys.byteorder == "big":
+            values = array(values.typecode, values)
+            values.byteswap()
+        self.buffer += values.tobytes()
+
+
+class SaveReader:
+    """
+    Reads the values of a binary save in the order in which they were written, from a stream of its bytes. Only the
+    bytes of each value are read at a time.
+    """
+
+    def __init__(self, stream: typing.BinaryIO):
+        """
+        Initialise the reader at the current position of the given stream.
+        :param stream: The stream of the save's bytes.
+        """
+        self.stream = stream
+
+    def read(self, size: int) -> bytes:
+        """
+        :param size: The number of bytes to read.
+        :return: The next bytes in the save.
+        """
+        data = self.stream.read(size)
+        if len(data) < size:
+            raise ValueError("Save is truncated.")
+        return data
+
+    def unpack(self, record: struct.Struct) -> tuple:
+        """
+        Read a fixed record.
+        :param record: The structure of the record.
+        :return: The values of the record.
+        """
+        return record.unpack(self.read(record.size))
+
+    def count(self) -> int:
+        """
+        :return: The number of elements in the next variable-length section of the save.
+        """
+        return self.unpack(_COUNT)[0]
+
+    def text(self) -> str:
+        """
+        :return: The next text in the save.
+        """
+        return str(self.read(self.count()), "utf-8")
+
+    def packed(self, typecode: str, length: int) -> array:
+        """
+        Read an array of values.
+        :param typecode: The type of the values in the array.
+        :param length: The number of values in the array.
+        :return: The array of values.
+        """
+        values = array(typecode)
+        values.frombytes(self.read(length * values.itemsize))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+
+def write_unit_plan(writer: SaveWriter, plan: UnitPlan):
+    """
+    Write the given unit plan, which is stored with its stats and cost, as these can differ from the catalogue's, e.g.
+    for units found in relics.
+    :param writer: The writer for the save.
+    :param plan: The unit plan to write.
+    """
+    plan_id = _UNIT_PLAN_IDS.get(plan.name, _CUSTOM_PLAN)
+    affinity = _ABSENT if plan.night_affinity is None else _index(plan.night_affinity)
+    writer.pack(_PLAN, plan_id, plan.power, plan.max_health, plan.total_stamina, plan.cost, affinity)
+    if plan_id == _CUSTOM_PLAN:
+        writer.text(plan.name)
+
+
+def read_unit_plan(reader: SaveReader) -> UnitPlan:
+    """
+    :param reader: The reader for the save.
+    :return: The next unit plan in the save.
+    """
+    plan_id, power, max_health, total_stamina, cost, affinity = reader.unpack(_PLAN)
+    night_affinity = None if affinity == _ABSENT else list(NightAffinity)[affinity]
+    if plan_id == _CUSTOM_PLAN:
+        return UnitPlan(power, max_health, total_stamina, reader.text(), None, cost, night_affinity=night_affinity)
+    return replace(UNIT_PLANS[plan_id], power=power, max_health=max_health, total_stamina=total_stamina, cost=cost,
+                   night_affinity=night_affinity)
+
+
+def write_unit(writer: SaveWriter, unit: Unit):
+    """
+    Write the given unit, along with its passengers if it is a deployer unit.
+    :param writer: The writer for the save.
+    :param unit: The unit to write.
+    """
+    write_unit_plan(writer, unit.plan)
+    flags = unit.garrisoned | unit.has_acted << 1 | unit.besieging << 2
+    writer.pack(_UNIT, unit.health, unit.remaining_stamina, *unit.location, flags)
+    if isinstance(unit, DeployerUnit):
+        writer.count(len(unit.passengers))
+        for passenger in unit.passengers:
+            write_unit(writer, passenger)
+
+
+def read_unit(reader: SaveReader) -> Unit:
+    """
+    :param reader: The reader for the save.
+    :return: The next unit in the save.
+    """
+    plan = read_unit_plan(reader)
+    health, remaining_stamina, loc_x, loc_y, flags = reader.unpack(_UNIT)
+    args = (health, remaining_stamina, (loc_x, loc_y), bool(flags & 1), plan, bool(flags & 2), bool(flags & 4))
+    # Deployer units are identified by their plan, as they are in the catalogue.
+    if hasattr(plan, "max_capacity"):
+        return DeployerUnit(*args, [read_unit(reader) for _ in range(reader.count())])
+    return Unit(*args)
+
+
+def write_settlement(writer: SaveWriter, settlement: Settlement):
+    """
+    Write the given settlement, with its quads referred to by their location on the board.
+    :param writer: The writer for the save.
+    :param settlement: The settlement to write.
+    """
+    writer.text(settlement.name)
+    writer.pack(_SETTLEMENT, *settlement.location, settlement.strength, settlement.max_strength,
+                settlement.satisfaction, settlement.level, settlement.harvest_reserves,
+                _index(settlement.harvest_status), _index(settlement.economic_status),
+                settlement.produced_settler | settlement.besieged << 1)
+    writer.count(len(settlement.quads))
+    writer.packed(array("h", [coord for quad in settlement.quads for coord in quad.location]))
+    writer.count(len(settlement.improvements))
+    writer.packed(array("B", [_IMPROVEMENT_IDS[imp.name] for imp in settlement.improvements]))
+    writer.count(len(settlement.garrison))
+    for unit in settlement.garrison:
+        write_unit(writer, unit)
+    work = settlement.current_work
+    if work is None:
+        writer.pack(_CONSTRUCTION, _NO_WORK, 0, 0)
+    elif isinstance(work.construction, Improvement):
+        writer.pack(_CONSTRUCTION, _IMPROVEMENT_WORK, _IMPROVEMENT_IDS[work.construction.name], work.zeal_consumed)
+    elif isinstance(work.construction, Project):
+        writer.pack(_CONSTRUCTION, _PROJECT_WORK, _PROJECT_IDS[work.construction.name], work.zeal_consumed)
+    else:
+        # Unit plans being recruited are stored in full, as their stats can be modified by the player's faction.
+        writer.pack(_CONSTRUCTION, _UNIT_PLAN_WORK, 0, work.zeal_consumed)
+        write_unit_plan(writer, work.construction)
+
+
+def read_settlement(reader: SaveReader, quads: typing.List[typing.List[Quad]]) -> Settlement:
+    """
+    :param reader: The reader for the save.
+    :param quads: The quads of the board, which the settlement's quads are taken from.
+    :return: The next settlement in the save.
+    """
+    name = reader.text()
+    loc_x, loc_y, strength, max_strength, satisfaction, level, harvest_reserves, harvest_status, economic_status, \
+        flags = reader.unpack(_SETTLEMENT)
+    coords = reader.packed("h", reader.count() * 2)
+    setl_quads = [quads[coords[idx + 1]][coords[idx]] for idx in range(0, len(coords), 2)]
+    improvements = [IMPROVEMENTS[imp_id] for imp_id in reader.packed("B", reader.count())]
+    garrison = [read_unit(reader) for _ in range(reader.count())]
+    kind, work_id, zeal_consumed = reader.unpack(_CONSTRUCTION)
+    current_work = None
+    if kind == _IMPROVEMENT_WORK:
+        current_work = Construction(IMPROVEMENTS[work_id], zeal_consumed)
+    elif kind == _PROJECT_WORK:
+        current_work = Construction(PROJECTS[work_id], zeal_consumed)
+    elif kind == _UNIT_PLAN_WORK:
+        current_work = Construction(read_unit_plan(reader), zeal_consumed)
+    return Settlement(name, (loc_x, loc_y), improvements, setl_quads, garrison, strength, max_strength, satisfaction,
+                      current_work, level, harvest_reserves, list(HarvestStatus)[harvest_status],
+                      list(EconomicStatus)[economic_status], bool(flags & 1), bool(flags & 2))
+
+
+def write_player(writer: SaveWriter, player: Player):
+    """
+    Write the given player, along with their settlements and units.
+    :param writer: The writer for the save.
+    :param player: The player to write.
+    """
+    writer.text(player.name)
+    victories = sum(1 << _index(victory) for victory in player.imminent_victories)
+    playstyle = (_ABSENT, _ABSENT) if player.ai_playstyle is None else \
+        (_index(player.ai_playstyle.attacking), _index(player.ai_playstyle.expansion))
+    writer.pack(_PLAYER, _index(player.faction), player.colour, player.wealth, victories, *playstyle,
+                player.jubilation_ctr, player.accumulated_wealth, player.eliminated)
+    writer.count(len(player.settlements))
+    for setl in player.settlements:
+        write_settlement(writer, setl)
+    writer.count(len(player.units))
+    for unit in player.units:
+        write_unit(writer, unit)
+    writer.count(len(player.blessings))
+    writer.packed(array("B", [_BLESSING_IDS[bls.name] for bls in player.blessings]))
+    if (ongoing := player.ongoing_blessing) is None:
+        writer.pack(_BLESSING, _ABSENT, 0)
+    else:
+        writer.pack(_BLESSING, _BLESSING_IDS[ongoing.blessing.name], ongoing.fortune_consumed)
+    # The quads each player has seen are stored as packed pairs of coordinates, which may lie beyond the board's edges.
+    writer.count(len(player.quads_seen))
+    writer.packed(array("h", [coord for loc in player.quads_seen for coord in loc]))
+
+
+def read_player(reader: SaveReader, quads: typing.List[typing.List[Quad]]) -> Player:
+    """
+    :param reader: The reader for the save.
+    :param quads: The quads of the board, which the player's settlements' quads are taken from.
+    :return: The next player in the save.
+    """
+    name = reader.text()
+    faction, colour, wealth, victories, attacking, expansion, jubilation_ctr, accumulated_wealth, eliminated = \
+        reader.unpack(_PLAYER)
+    player = Player(name, list(Faction)[faction], colour, wealth,
+                    settlements=[read_settlement(reader, quads) for _ in range(reader.count())],
+                    units=[read_unit(reader) for _ in range(reader.count())],
+                    blessings=[_BLESSINGS[bls_id] for bls_id in reader.packed("B", reader.count())],
+                    imminent_victories={victory for idx, victory in enumerate(VictoryType) if victories & 1 << idx},
+                    jubilation_ctr=jubilation_ctr, accumulated_wealth=accumulated_wealth, eliminated=bool(eliminated))
+    if attacking != _ABSENT:
+        player.ai_playstyle = AIPlaystyle(list(AttackPlaystyle)[attacking], list(ExpansionPlaystyle)[expansion])
+    bls_id, fortune_consumed = reader.unpack(_BLESSING)
+    if bls_id != _ABSENT:
+        player.ongoing_blessing = OngoingBlessing(_BLESSINGS[bls_id], fortune_consumed)
+    seen = reader.packed("h", reader.count() * 2)
+    player.quads_seen = {(seen[idx], seen[idx + 1]) for idx in range(0, len(seen), 2)}
+    return player
+
+
+def write_heathen(writer: SaveWriter, heathen: Heathen):
+    """
+    Write the given heathen.
+    :param writer: The writer for the save.
+    :param heathen: The heathen to write.
+    """
+    write_unit_plan(writer, heathen.plan)
+    writer.pack(_UNIT, heathen.health, heathen.remaining_stamina, *heathen.location, heathen.has_attacked)
+
+
+def read_heathen(reader: SaveReader) -> Heathen:
+    """
+    :param reader: The reader for the save.
+    :return: The next heathen in the save.
+    """
+    plan = read_unit_plan(reader)
+    health, remaining_stamina, loc_x, loc_y, has_attacked = reader.unpack(_UNIT)
+    return Heathen(health, remaining_stamina, (loc_x, loc_y), plan, bool(has_attacked))
+
+
+def write_quads(writer: SaveWriter, quads: typing.List[typing.List[Quad]]):
+    """
+    Write the quads of the board as packed arrays, with each quad's location being implied by its position. The quads of
+    loaded boards are written from the arrays they were loaded from, so that only those that have been accessed need to
+    be packed individually.
+    :param writer: The writer for the save.
+    :param quads: The quads to write.
+    """
+    if isinstance(quads, QuadGrid):
+        for values in quads.packed():
+            writer.packed(values)
+        return
+    all_quads = list(chain.from_iterable(quads))
+    biome_ids = {biome: idx for idx, biome in enumerate(Biome)}
+    writer.packed(array("B", [biome_ids[quad.biome] for quad in all_quads]))
+    writer.packed(array("d", chain.from_iterable(map(attrgetter("wealth", "harvest", "zeal", "fortune"), all_quads))))
+    writer.packed(array("B", [quad.selected | quad.is_relic << 1 for quad in all_quads]))
+
+
+def read_quads(reader: SaveReader) -> QuadGrid:
+    """
+    Read the quads section of the save in a single block, wrapping the packed arrays within it without copying them.
+    :param reader: The reader for the save.
+    :return: The quads of the board, which are materialised as they are accessed.
+    """
+    # Each quad has a byte for its biome, four doubles for its yields, and a byte for its flags. The block is read into
+    # its own buffer, so the yields following the biomes of the 9000 quads are aligned regardless of where the section
+    # is in the save.
+    section = memoryview(reader.read(_QUAD_COUNT * 34))
+    yields = section[_QUAD_COUNT:_QUAD_COUNT * 33].cast("d")
+    if sys.byteorder == "big":
+        yields = array("d", yields)
+        yields.byteswap()
+    return QuadGrid(section[:_QUAD_COUNT], yields, section[_QUAD_COUNT * 33:])
+
+
+def make_thumbnail(game_state: GameState) -> typing.List[bytes]:
+    """
+    Depict the board of the given game as a small thumbnail, sampling the quad at the centre of each pixel, and marking
+    the pixels that settlements are in with the colours of their owners. If fog of war is enabled, only the parts of the
+    board the player has seen are depicted.
+    :param game_state: The game state to depict.
+    :return: The rows of the thumbnail's pixels.
+    """
+    quads = game_state.board.quads
+    seen = game_state.players[0].quads_seen if game_state.board.game_config.fog_of_war else None
+    thumbnail = []
+    for pixel_y in range(THUMBNAIL_SIZE[1]):
+        row = bytearray()
+        for pixel_x in range(THUMBNAIL_SIZE[0]):
+            loc = pixel_x * _THUMBNAIL_SCALE + _THUMBNAIL_SCALE // 2, pixel_y * _THUMBNAIL_SCALE + _THUMBNAIL_SCALE // 2
+            row.append(palette.COLOR_BLACK if seen is not None and loc not in seen
+                       else _THUMBNAIL_COLOURS[quads[loc[1]][loc[0]].biome])
+        thumbnail.append(row)
+    for player in game_state.players:
+        for setl in player.settlements:
+            if seen is None or setl.location in seen:
+                thumbnail[setl.location[1] // _THUMBNAIL_SCALE][setl.location[0] // _THUMBNAIL_SCALE] = player.colour
+    return [bytes(row) for row in thumbnail]
+
+
+def write_metadata(writer: SaveWriter, game_state: GameState):
+    """
+    Write the metadata of the given game that is displayed when choosing a game to load.
+    :param writer: The writer for the save.
+    :param game_state: The game state to write the metadata of.
+    """
+    cfg: GameConfig = game_state.board.game_config
+    quads = game_state.board.quads
+    writer.pack(_METADATA, game_state.turn, _index(cfg.player_faction), cfg.player_count, len(quads[0]), len(quads))
+    writer.buffer += b"".join(make_thumbnail(game_state))
+
+
+def _read_metadata(reader: SaveReader, version: int) -> typing.Optional[SaveMetadata]:
+    """
+    :param reader: The reader for the save, positioned after its header.
+    :param version: The version of the save format the save was written in.
+    :return: The metadata of the save, if the version of its format includes metadata.
+    """
+    if version < 2:
+        return None
+    turn, faction, player_count, map_width, map_height = reader.unpack(_METADATA)
+    thumbnail = [reader.read(THUMBNAIL_SIZE[0]) for _ in range(THUMBNAIL_SIZE[1])]
+    return SaveMetadata(version, turn, list(Faction)[faction], player_count, (map_width, map_height), thumbnail)
+
+
+def write_game(writer: SaveWriter, game_state: GameState, event_log: typing.Optional[typing.Tuple[str, int]]):
+    """
+    Write the turn, night status, game config, and event log reference of the given game.
+    :param writer: The writer for the save.
+    :param game_state: The game state to write.
+    :param event_log: The name of the file containing the game's event log and the number of events the save includes,
+    if the game has an event log.
+    """
+    cfg: GameConfig = game_state.board.game_config
+    cfg_flags = cfg.biome_clustering | cfg.fog_of_war << 1 | cfg.climatic_effects << 2
+    writer.pack(_GAME, game_state.turn, game_state.until_night, game_state.nighttime_left,
+                game_state.climate.has_dawned, cfg.player_count, _index(cfg.player_faction), cfg_flags,
+                0 if event_log is None else event_log[1])
+    writer.text("" if event_log is None else event_log[0])
+
+
+def read_game(reader: SaveReader, game_state: GameState) -> \
+        typing.Tuple[GameConfig, typing.Optional[typing.Tuple[str, int]]]:
+    """
+    Read the turn and night status of the game into the given game state, resetting the climate to match.
+    :param reader: The reader for the save.
+    :param game_state: The game state to populate.
+    :return: A tuple of the game config, and the name of the file containing the game's event log and the number of
+    events the save includes, if the game has an event log.
+    """
+    game_state.turn, game_state.until_night, game_state.nighttime_left, dawned, player_count, faction, cfg_flags, \
+        log_length = reader.unpack(_GAME)
+    log_file = reader.text()
+    game_state.climate.reset(game_state.nighttime_left > 0, bool(dawned))
+    cfg = GameConfig(player_count, list(Faction)[faction], bool(cfg_flags & 1), bool(cfg_flags & 2),
+                     bool(cfg_flags & 4))
+    return cfg, (log_file, log_length) if log_file else None
+
+
+def _unpack_quads(quads: bytes) -> typing.Tuple[array, array, array]:
+    """
+    :param quads: The bytes of the quads section of a save.
+    :return: A tuple of the packed arrays of the quads' biomes, yields, and flags.
+    """
+    reader = SaveReader(io.BytesIO(quads))
+    return reader.packed("B", _QUAD_COUNT), reader.packed("d", _QUAD_COUNT * 4), reader.packed("B", _QUAD_COUNT)
+
+
+def _encode(write_fn: typing.Callable, *args) -> bytes:
+    """
+    :param write_fn: The function that writes a section of a save.
+    :param args: The arguments to write the section with.
+    :return: The bytes of the section.
+    """
+    writer = SaveWriter()
+    write_fn(writer, *args)
+    return bytes(writer.buffer)
+
+
+class SaveSections:
+    """
+    A game encoded in the binary save format, with each of its sections kept separately. This means that the game can
+    either be written in full, or as a delta against a game encoded earlier, including only the sections that differ.
+    Units' base stats are encoded, rather than the stats modified by the climate.
+    """
+
+    def __init__(self, game_state: GameState, event_log: typing.Optional[typing.Tuple[str, int]]):
+        """
+        Encode the given game state.
+        :param game_state: The game state to encode.
+        :param event_log: The name of the file containing the game's event log and the number of events the save
+        includes, if the game has an event log.
+        """
+        self.metadata = _encode(write_metadata, game_state)
+        self.game = _encode(write_game, game_state, event_log)
+        self.quads = _encode(write_quads, game_state.board.quads)
+        with game_state.climate.unmodified():
+            self.players = [_encode(write_player, player) for player in game_state.players]
+            self.heathens = [_encode(write_heathen, heathen) for heathen in game_state.heathens]
+
+    def full(self) -> typing.Iterator[bytes]:
+        """
+        :return: The chunks of the full save, which together make up the save.
+        """
+        yield _HEADER.pack(SAVE_MAGIC, SAVE_VERSION) + self.metadata + self.game
+        yield self.quads
+        yield _COUNT.pack(len(self.players))
+        yield from self.players
+        yield _COUNT.pack(len(self.heathens))
+        yield from self.heathens
+
+    def delta(self, base: SaveSections, base_name: str) -> typing.Iterator[bytes]:
+        """
+        Get the delta save against the given earlier encoding of the same game, which must have the same players. Only
+        the quads and players that have changed are included, along with all heathens.
+        :param base: The earlier encoding of the game, which has been saved in full.
+        :param base_name: The name of the file the earlier encoding was saved in.
+        :return: The chunks of the delta save, which together make up the save.
+        """
+        writer = SaveWriter()
+        writer.pack(_HEADER, DELTA_MAGIC, SAVE_VERSION)
+        writer.buffer += self.metadata
+        writer.text(base_name)
+        writer.buffer += self.game
+        # Quads rarely change, e.g. when relics are investigated, so only compare them individually if any have.
+        changed_quads = []
+        if self.quads != base.quads:
+            biome_ids, yields, flags = _unpack_quads(self.quads)
+            base_biome_ids, base_yields, base_flags = _unpack_quads(base.quads)
+            changed = {idx for idx, (biome_id, base_biome_id) in enumerate(zip(biome_ids, base_biome_ids))
+                       if biome_id != base_biome_id}
+            changed.update(idx for idx, (flag, base_flag) in enumerate(zip(flags, base_flags)) if flag != base_flag)
+            if yields != base_yields:
+                changed.update(idx // 4 for idx, (yld, base_yld) in enumerate(zip(yields, base_yields))
+                               if yld != base_yld)
+            changed_quads = sorted(changed)
+        writer.count(len(changed_quads))
+        for idx in changed_quads:
+            writer.pack(_QUAD_CHANGE, idx, biome_ids[idx], *yields[idx * 4:idx * 4 + 4], flags[idx])
+        writer.count(len(self.players))
+        yield bytes(writer.buffer)
+        for player, base_player in zip(self.players, base.players):
+            yield _CHANGED.pack(player != base_player)
+            if player != base_player:
+                yield player
+        yield _COUNT.pack(len(self.heathens))
+        yield from self.heathens
+
+
+def write_save(game_state: GameState, event_log: typing.Optional[typing.Tuple[str, int]]) -> bytes:
+    """
+    Encode the given game state in full in the binary save format.
+    :param game_state: The game state to encode.
+    :param event_log: The name of the file containing the game's event log and the number of events the save includes,
+    if the game has an event log.
+    :return: The encoded save.
+    """
+    return b"".join(SaveSections(game_state, event_log).full())
+
+
+def _read_header(reader: SaveReader, expected_magic: bytes) -> typing.Optional[SaveMetadata]:
+    """
+    Read the header and metadata of a save, ensuring that it is of the expected kind and a supported version of the
+    format.
+    :param reader: The reader for the save.
+    :param expected_magic: The magic bytes expected for the kind of save.
+    :return: The metadata of the save, if the version of its format includes metadata.
+    """
+    magic, version = reader.unpack(_HEADER)
+    if magic != expected_magic or version > SAVE_VERSION:
+        raise ValueError(f"Unsupported save format version {version}.")
+    return _read_metadata(reader, version)
+
+
+def compressing(save_file: typing.BinaryIO) -> typing.BinaryIO:
+    """
+    :param save_file: The file to write a save to.
+    :return: A stream that compresses the save as it is written to the given file. The stream must be closed once the
+    save has been written, so that the end of the compressed save is written.
+    """
+    # The modification time is omitted so that the same save is always compressed to the same bytes.
+    return gzip.GzipFile(fileobj=save_file, mode="wb", compresslevel=COMPRESSION_LEVEL, mtime=0)
+
+
+def open_save(save_file: typing.BinaryIO) -> typing.BinaryIO:
+    """
+    :param save_file: The file to read a save from, opened in buffered binary mode.
+    :return: A stream of the save's uncompressed bytes, which are decompressed as they are read if the save is
+    compressed.
+    """
+    if save_file.peek(len(COMPRESSED_MAGIC)).startswith(COMPRESSED_MAGIC):
+        return gzip.GzipFile(fileobj=save_file, mode="rb")
+    return save_file
+
+
+def save_magic(save: typing.BinaryIO) -> bytes:
+    """
+    :param save: The stream of a save's uncompressed bytes, at its start.
+    :return: The magic bytes at the start of the save, without reading past them. These identify the kind of save, with
+    JSON saves having none.
+    """
+    return save.peek(len(SAVE_MAGIC))[:len(SAVE_MAGIC)]
+
+
+def read_metadata(save: typing.BinaryIO) -> typing.Optional[SaveMetadata]:
+    """
+    Read only the metadata of the given save, which is displayed when choosing a game to load.
+    :param save: The stream of a save's uncompressed bytes, at its start.
+    :return: The metadata of the save, if it is a binary save of a version of the format that includes metadata.
+    """
+    if (magic := save_magic(save)) not in (SAVE_MAGIC, DELTA_MAGIC):
+        return None
+    return _read_header(SaveReader(save), magic)
+
+
+def read_save(save: typing.BinaryIO, game_state: GameState) -> \
+        typing.Tuple[QuadGrid, GameConfig, typing.Optional[typing.Tuple[str, int]]]:
+    """
+    Decode the given full binary save, populating the players, heathens, turn and night status of the given game state,
+    and resetting the climate to match.
+    :param save: The stream of the save's uncompressed bytes, at its start.
+    :param game_state: The game state to populate.
+    :return: A tuple of the quads of the board, the game config, and the name of the file containing the game's event
+    log and the number of events the save includes, if the game has an event log.
+    """
+    reader = SaveReader(save)
+    _read_header(reader, SAVE_MAGIC)
+    cfg, event_log = read_game(reader, game_state)
+    quads = read_quads(reader)
+    game_state.players = [read_player(reader, quads) for _ in range(reader.count())]
+    game_state.heathens = [read_heathen(reader) for _ in range(reader.count())]
+    return quads, cfg, event_log
+
+
+def delta_base(save: typing.BinaryIO) -> typing.Optional[str]:
+    """
+    Determine whether the given save is a delta save, reading its header if so. Full saves are left unread.
+    :param save: The stream of a save's uncompressed bytes, at its start.
+    :return: The name of the file containing the full save the given save is a delta against, if it is a delta save.
+    """
+    if save_magic(save) != DELTA_MAGIC:
+        return None
+    reader = SaveReader(save)
+    _read_header(reader, DELTA_MAGIC)
+    return reader.text()
+
+
+def read_delta(save: typing.BinaryIO, base: typing.BinaryIO, game_state: GameState) -> \
+        typing.Tuple[QuadGrid, GameConfig, typing.Optional[typing.Tuple[str, int]]]:
+    """
+    Decode the given delta save by applying it to the full save it is a delta against, populating the given game state
+    in the same way as read_save().
+    :param save: The stream of the delta save's uncompressed bytes, with its header already read by delta_base().
+    :param base: The stream of the full save's uncompressed bytes, at its start.
+    :param game_state: The game state to populate.
+    :return: A tuple of the quads of the board, the game config, and the name of the file containing the game's event
+    log and the number of events the save includes, if the game has an event log.
+    """
+    quads, _, _ = read_save(base, game_state)
+    reader = SaveReader(save)
+    cfg, event_log = read_game(reader, game_state)
+    for _ in range(reader.count()):
+        idx, biome_id, wealth, harvest, zeal, fortune, flags = reader.unpack(_QUAD_CHANGE)
+        quad = quads[idx // 100][idx % 100]
+        quad.biome, quad.wealth, quad.harvest, quad.zeal, quad.fortune = \
+            list(Biome)[biome_id], wealth, harvest, zeal, fortune
+        quad.selected, quad.is_relic = bool(flags & 1), bool(flags & 2)
+    if reader.count() != len(game_state.players):
+        raise ValueError("Delta save does not match its full save.")
+    for idx in range(len(game_state.players)):
+        if reader.unpack(_CHANGED)[0]:
+            game_state.players[idx] = read_player(reader, quads)
+    game_state.heathens = [read_heathen(reader) for _ in range(reader.count())]
+    return quads, cfg, event_log
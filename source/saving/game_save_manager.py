@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import atexit
+import dataclasses
+import io
 import json
 import os
 import pathlib
+import shutil
+import threading
 import time
 import typing
+import weakref
+import zlib
+from contextlib import nullcontext, contextmanager
 from datetime import datetime
 from itertools import chain
 from json import JSONDecodeError
@@ -14,22 +22,50 @@ from platformdirs import user_data_dir
 
 from source.display.board import Board
 from source.foundation.catalogue import get_blessing, get_project, get_unit_plan, get_improvement, ACHIEVEMENTS
-from source.foundation.models import Heathen, UnitPlan, VictoryType, Faction, Statistics, Achievement
+from source.foundation.models import Heathen, UnitPlan, VictoryType, Faction, Statistics, Achievement, NightAffinity, \
+    Quad, GameConfig, SaveMetadata, AchievementTrigger
+from source.game_management.board_state import BoardState
 from source.game_management.game_controller import GameController
+from source.game_management.turn_profiler import TurnProfiler, export_csv
 if typing.TYPE_CHECKING:
     from source.game_management.game_state import GameState
+from source.saving.autosave_journal import AutosaveJournal, FULL_RECORD, DELTA_RECORD
+from source.saving.binary_save import SAVE_MAGIC, SaveSections, read_save, delta_base, read_delta, compressing, \
+    open_save, save_magic, read_metadata, DELTA_MAGIC
 from source.saving.save_encoder import SaveEncoder, ObjectConverter
+from source.saving.save_decoder import JSON_SAVE_VERSION, decode_save
 from source.saving.save_migrator import migrate_unit, migrate_player, migrate_climatic_effects, \
-    migrate_quad, migrate_settlement, migrate_game_config
+    migrate_quad, migrate_settlement, migrate_game_config, to_objects
 from source.util.calculator import clamp
 
 # The prefix attached to save files created by the autosave feature.
 AUTOSAVE_PREFIX = "auto"
+# The name of the journal file that autosaves are appended to. Autosaves made before the journal was introduced were
+# each written to a separate file, and are still listed alongside it.
+AUTOSAVE_JOURNAL = f"{AUTOSAVE_PREFIX}save.journal"
 # The directory where save files are created and loaded from. This is a different directory depending on the operating
 # system the game is being run on. For example, on macOS, this will resolve to ~/Library/Application Support/microcosm.
 # Similarly, on Linux, it will resolve to ~/.local/share/microcosm. For more details, refer to the platformdirs
 # documentation.
 SAVES_DIR = user_data_dir("microcosm", "microcosm")
+# The extension of save files in the compact binary format. Games can also be exported as JSON saves, with the .json
+# extension.
+SAVE_EXTENSION = "sav"
+# The number of turns between each full autosave, with the autosaves in between being written as deltas against it.
+# The journal is compacted whenever a full autosave is written.
+SNAPSHOT_INTERVAL = 25
+# The directory within the saves directory that legacy saves, i.e. JSON saves made before saves recorded their version,
+# are backed up to before they are upgraded to the current version.
+LEGACY_BACKUPS_DIR = "legacy-backups"
+# The start of every JSON save that records its version, meaning that they can be identified without being parsed.
+_VERSIONED_JSON = b'{"version"'
+# The errors that can be raised when reading a save that is invalid.
+SAVE_ERRORS = (JSONDecodeError, AttributeError, KeyError, StopIteration, ValueError, IndexError, TypeError, OSError,
+               EOFError, zlib.error)
+# The name of the file the player's statistics and achievements are stored in, within the saves directory.
+STATISTICS_FILE = "statistics.json"
+# The number of seconds to wait after the player's statistics change before writing them.
+STATISTICS_FLUSH_DELAY = 2.0
 
 
 def init_app_data():
@@ -41,31 +77,270 @@ def init_app_data():
         pathlib.Path(SAVES_DIR).mkdir(parents=True, exist_ok=True)
 
 
-def save_game(game_state, auto: bool = False):
+class AutosaveWriter:
     """
-    Saves the current game with the current timestamp as the file name.
+    Writes autosaves to disk on a background thread, so that the time taken to process a turn does not include disk
+    I/O. Autosaves are written one at a time, in the order in which they were made.
     """
-    # Only maintain 3 autosaves at a time, delete the oldest if we already have 3 before saving the next.
-    if auto and len(
-            autosaves := list(filter(lambda fn: fn.startswith(AUTOSAVE_PREFIX), os.listdir(SAVES_DIR)))) == 3:
-        autosaves.sort()
-        os.remove(os.path.join(SAVES_DIR, autosaves[0]))
+
+    def __init__(self):
+        """
+        Initialise the writer, with no autosave being written.
+        """
+        # The thread writing the most recent autosave, if there is one.
+        self.thread: typing.Optional[threading.Thread] = None
+        # Any error raised while writing the autosave, kept so that it can be re-raised on the thread that waits for it.
+        self.error: typing.Optional[Exception] = None
+        # The journal autosaves are appended to.
+        self.journal: typing.Optional[AutosaveJournal] = None
+        # The most recent full autosave in the journal, which subsequent autosaves are written as deltas against, along
+        # with its turn, and the board of the game it was made for. The board is weakly referenced, so that starting a
+        # new game does not keep the previous one alive.
+        self.snapshot: typing.Optional[SaveSections] = None
+        self.snapshot_turn = 0
+        self.snapshot_board: typing.Callable[[], typing.Optional[BoardState]] = lambda: None
+
+    def write(self, write_fn: typing.Callable[[], None]):
+        """
+        Begin writing an autosave on a background thread, once any autosave already being written has been written.
+        :param write_fn: The function that writes the autosave.
+        """
+        self.wait()
+
+        def run():
+            try:
+                write_fn()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                self.error = err
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+
+    def journal_at(self, file_name: str) -> AutosaveJournal:
+        """
+        Get the journal with the given file name, which autosaves are to be appended to. If autosaves were previously
+        appended to a different journal, the full autosave in it cannot have deltas written against it any more.
+        :param file_name: The name of the journal file, including its directory.
+        :return: The journal.
+        """
+        if self.journal is None or self.journal.file_name != file_name:
+            self.journal = AutosaveJournal(file_name)
+            self.snapshot = None
+        return self.journal
+
+    def can_write_delta(self, game_state) -> bool:
+        """
+        Determine whether the next autosave of the given game can be written as a delta against the most recent full
+        autosave, i.e. whether the full autosave was made for the same game, recently enough.
+        :param game_state: The current GameState object.
+        :return: Whether a delta autosave can be written.
+        """
+        return self.snapshot is not None and self.snapshot_board() is game_state.board and \
+            len(self.snapshot.players) == len(game_state.players) and \
+            0 <= game_state.turn - self.snapshot_turn < SNAPSHOT_INTERVAL
+
+    def wait(self):
+        """
+        Wait for the autosave being written to be written, if there is one, re-raising any error that occurred.
+        """
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.error is not None:
+            err, self.error = self.error, None
+            raise err
+
+
+# The writer used for all autosaves. Anything reading from or writing to the saves directory should wait for it first.
+AUTOSAVE_WRITER = AutosaveWriter()
+
+
+def write_atomically(file_name: str, chunks: typing.Iterable[bytes], compress: bool = True):
+    """
+    Write the given data to the file with the given name, by writing it to a temporary file that then replaces the file.
+    This means that a crash while writing never leaves a truncated file behind.
+    :param file_name: The name of the file to write, including its directory.
+    :param chunks: The chunks of the data to write, which are written one at a time.
+    :param compress: Whether to compress the data as it is written.
+    """
+    directory, base_name = os.path.split(file_name)
+    # The temporary file is a dotfile, so it is never listed as a save.
+    temp_name = os.path.join(directory, f".{base_name}.tmp")
+    with open(temp_name, "wb") as temp_file:
+        with compressing(temp_file) if compress else nullcontext(temp_file) as stream:
+            for chunk in chunks:
+                stream.write(chunk)
+        temp_file.flush()
+        os.fsync(temp_file.fileno())
+    os.replace(temp_name, file_name)
+
+
+def encode_json_save(game_state, quads: typing.List[typing.List[Quad]], cfg: GameConfig,
+                     event_log: typing.Optional[typing.Tuple[str, int]]) -> typing.Iterator[bytes]:
+    """
+    Encode the given game as a JSON save of the current version.
+    :param game_state: The game state to encode the players, heathens, turn and night status of.
+    :param quads: The quads of the board.
+    :param cfg: The game config.
+    :param event_log: The name of the file containing the game's event log and the number of events the save includes,
+    if the game has an event log.
+    :return: The chunks of the save, which are encoded as they are retrieved.
+    """
+    # We use chain.from_iterable() here because the quads array is 2D.
+    save = {
+        "version": JSON_SAVE_VERSION,
+        "quads": list(chain.from_iterable(quads)),
+        "players": game_state.players,
+        "heathens": game_state.heathens,
+        "turn": game_state.turn,
+        "cfg": cfg,
+        "night_status": {"until": game_state.until_night, "remaining": game_state.nighttime_left,
+                         "dawned": game_state.climate.has_dawned}
+    }
+    if event_log is not None:
+        save["event_log"] = {"file": event_log[0], "length": event_log[1]}
+    # Note that we use the SaveEncoder here for custom encoding for some classes. Units' base stats are saved, rather
+    # than the stats modified by the climate. The save is encoded as it is written, rather than all at once, and JSON
+    # saves are left uncompressed so that they can be read by other programs.
+    with game_state.climate.unmodified():
+        for chunk in SaveEncoder().iterencode(save):
+            yield chunk.encode("utf-8")
+
+
+def save_game(game_state, auto: bool = False, as_json: bool = False):
+    """
+    Saves the current game with the current timestamp as the file name, or appends it to the autosave journal if it is
+    an autosave. Only a snapshot of the game is taken before this returns for autosaves, which are then written on a
+    background thread.
+    :param game_state: The current GameState object.
+    :param auto: Whether the save is an autosave.
+    :param as_json: Whether to export the game as JSON, rather than in the compact binary format.
+    """
+    # Saves are written one at a time, as they share the game's event log.
+    AUTOSAVE_WRITER.wait()
     # The ':' characters in the datestring must be replaced to conform with Windows files supported characters.
     sanitised_timestamp = datetime.now().isoformat(timespec='seconds').replace(':', '.')
-    save_name = os.path.join(SAVES_DIR, f"{AUTOSAVE_PREFIX if auto else ''}save-{sanitised_timestamp}.json")
-    with open(save_name, "w", encoding="utf-8") as save_file:
-        # We use chain.from_iterable() here because the quads array is 2D.
-        save = {
-            "quads": list(chain.from_iterable(game_state.board.quads)),
-            "players": game_state.players,
-            "heathens": game_state.heathens,
-            "turn": game_state.turn,
-            "cfg": game_state.board.game_config,
-            "night_status": {"until": game_state.until_night, "remaining": game_state.nighttime_left}
-        }
-        # Note that we use the SaveEncoder here for custom encoding for some classes.
-        save_file.write(json.dumps(save, cls=SaveEncoder))
-    save_file.close()
+    save_name = os.path.join(SAVES_DIR, f"save-{sanitised_timestamp}.{'json' if as_json else SAVE_EXTENSION}")
+    # The game's event log is kept alongside its saves, with each save recording how much of the log it includes. Games
+    # loaded from saves made before event logs were introduced have no log to continue.
+    event_log = None
+    unwritten_events = ""
+    if (events := game_state.board.events).game_state is not None:
+        if events.file_name is None:
+            events.file_name = f"events-{sanitised_timestamp}.jsonl"
+        unwritten_events = events.take_unwritten()
+        event_log = events.file_name, len(events.events)
+    # Encoding the game in memory takes the snapshot of it, which is much cheaper than writing it to disk.
+    if as_json:
+        save_data = encode_json_save(game_state, game_state.board.quads, game_state.board.game_config, event_log)
+    else:
+        sections = SaveSections(game_state, event_log)
+        journal = AUTOSAVE_WRITER.journal_at(os.path.join(SAVES_DIR, AUTOSAVE_JOURNAL)) if auto else None
+        # Autosaves are written as deltas against the most recent full autosave, which is only written every few turns,
+        # since most of the game, e.g. its quads, rarely changes from turn to turn.
+        is_delta = auto and AUTOSAVE_WRITER.can_write_delta(game_state)
+        save_data = sections.delta(AUTOSAVE_WRITER.snapshot, AUTOSAVE_JOURNAL) if is_delta else sections.full()
+
+    def write():
+        if event_log is not None:
+            with open(os.path.join(SAVES_DIR, event_log[0]), "a", encoding="utf-8") as log_file:
+                log_file.write(unwritten_events)
+        if not auto:
+            write_atomically(save_name, save_data, compress=not as_json)
+            return
+        # Autosaves are compressed in memory so that they can be appended to the journal as a single record.
+        buffer = io.BytesIO()
+        with compressing(buffer) as stream:
+            for chunk in save_data:
+                stream.write(chunk)
+        offset = journal.append(DELTA_RECORD if is_delta else FULL_RECORD, buffer.getvalue())
+        # Only autosaves that have been successfully written in full can have deltas written against them, at which
+        # point the records before them are no longer needed.
+        if not is_delta:
+            AUTOSAVE_WRITER.snapshot = sections
+            AUTOSAVE_WRITER.snapshot_turn = game_state.turn
+            AUTOSAVE_WRITER.snapshot_board = weakref.ref(game_state.board)
+            if offset > 0:
+                journal.compact(offset)
+
+    if auto:
+        AUTOSAVE_WRITER.write(write)
+    else:
+        write()
+
+
+def save_turn_profiles(turn_profiler: TurnProfiler):
+    """
+    Exports the turn profiles recorded by the given profiler to a CSV file with the current timestamp as the file name.
+    :param turn_profiler: The profiler to export the turn profiles of.
+    """
+    sanitised_timestamp = datetime.now().isoformat(timespec='seconds').replace(':', '.')
+    export_csv(turn_profiler.profiles, os.path.join(SAVES_DIR, f"profile-{sanitised_timestamp}.csv"))
+
+
+class StatisticsStore:
+    """
+    The player's statistics and achievements, which are read from the statistics file only once, updated in memory, and
+    written back to the file on a background thread. Writes are debounced, so that changes made in quick succession,
+    e.g. on consecutive turns, are written together.
+    """
+
+    def __init__(self):
+        """
+        Initialise the store, with the statistics yet to be read.
+        """
+        self.stats: typing.Optional[Statistics] = None
+        # Held while the statistics are being updated or written, since they are written on a background thread.
+        self.lock = threading.RLock()
+        # The timer that will write the statistics, if they have changed since they were last written.
+        self.timer: typing.Optional[threading.Timer] = None
+
+    def get(self) -> Statistics:
+        """
+        :return: The player's statistics, which are read from the statistics file the first time they are retrieved.
+        """
+        with self.lock:
+            if self.stats is None:
+                stats_file_name = os.path.join(SAVES_DIR, STATISTICS_FILE)
+                # If the player already has statistics and achievements, get those to add our new ones to.
+                if os.path.isfile(stats_file_name):
+                    with open(stats_file_name, "r", encoding="utf-8") as stats_file:
+                        stats_json = json.loads(stats_file.read())
+                    # Achievements were introduced after the initial statistics, so we have to make sure they are
+                    # present.
+                    stats_json["achievements"] = stats_json.get("achievements", [])
+                    self.stats = Statistics(**stats_json)
+                else:
+                    self.stats = Statistics(0, 0, {}, 0, {}, [])
+            return self.stats
+
+    def changed(self):
+        """
+        Schedule the statistics to be written, once the flush delay has passed since they first changed.
+        """
+        with self.lock:
+            if self.timer is None:
+                self.timer = threading.Timer(STATISTICS_FLUSH_DELAY, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        """
+        Write the statistics to the statistics file straight away, if they have changed since they were last written.
+        """
+        with self.lock:
+            if self.timer is None:
+                return
+            self.timer.cancel()
+            self.timer = None
+            stats_data = json.dumps(dataclasses.asdict(self.stats)).encode("utf-8")
+            write_atomically(os.path.join(SAVES_DIR, STATISTICS_FILE), [stats_data], compress=False)
+
+
+# The store of the player's statistics and achievements. Any statistics yet to be written are written when the game
+# exits.
+STATISTICS = StatisticsStore()
+atexit.register(STATISTICS.flush)
 
 
 def save_stats_achievements(game_state: GameState,
@@ -75,8 +350,10 @@ def save_stats_achievements(game_state: GameState,
                             increment_defeats: bool = False,
                             faction_to_add: typing.Optional[Faction] = None) -> typing.List[Achievement]:
     """
-    Saves the supplied statistics to the statistics JSON file. Additionally, check if any achievements have been
-    obtained. All parameters have default values so that they may be supplied at different times.
+    Updates the player's statistics with the supplied statistics, which are written to the statistics JSON file in the
+    background. Additionally, check if any achievements have been obtained, verifying only those triggered by the
+    supplied statistics or by the events that have occurred in the game since achievements were last checked. All
+    parameters have default values so that they may be supplied at different times.
     :param game_state: The current game state object.
     :param playtime: The elapsed time since the last turn was ended.
     :param increment_turn: Whether a turn was just ended.
@@ -85,182 +362,263 @@ def save_stats_achievements(game_state: GameState,
     :param faction_to_add: A chosen faction to log, if the player is starting a new game.
     :return: Any new achievements that have been obtained by the player.
     """
-    playtime_to_write: float = playtime
-    existing_turns: int = 0
-    existing_victories: typing.Dict[VictoryType, int] = {}
-    existing_defeats: int = 0
-    existing_factions: typing.Dict[Faction, int] = {}
-    existing_achievements: typing.List[str] = []
     new_achievements: typing.List[Achievement] = []
-
-    stats_file_name = os.path.join(SAVES_DIR, "statistics.json")
-    # If the player already has statistics and achievements, get those to add our new ones to.
-    if os.path.isfile(stats_file_name):
-        with open(stats_file_name, "r", encoding="utf-8") as stats_file:
-            stats_json = json.loads(stats_file.read())
-            playtime_to_write += stats_json["playtime"]
-            existing_turns = stats_json["turns_played"]
-            existing_victories = stats_json["victories"]
-            existing_defeats = stats_json["defeats"]
-            existing_factions = stats_json["factions"]
-            # Achievements were introduced after the initial statistics, so we have to make sure they are present.
-            existing_achievements = stats_json["achievements"] if "achievements" in stats_json else []
-
-    turns_to_write = existing_turns + 1 if increment_turn else existing_turns
-    defeats_to_write = existing_defeats + 1 if increment_defeats else existing_defeats
-    achievements_to_write = existing_achievements
-
-    victories_to_write = existing_victories
+    triggers: typing.Set[AchievementTrigger] = set()
+    if increment_turn or playtime:
+        triggers.add(AchievementTrigger.TURN_ENDED)
     if victory_to_add:
-        # If the player has achieved this victory before, increment it, otherwise just set it to 1.
-        if victory_to_add in existing_victories:
-            existing_victories[victory_to_add] = existing_victories[victory_to_add] + 1
-        else:
-            existing_victories[victory_to_add] = 1
-
-        # Check if any achievements have been obtained that can only be verified immediately after a player victory.
-        # Note that we don't need to supply a real Statistics object for this, since all post-victory achievements only
-        # require the game state to be verified.
-        for ach in ACHIEVEMENTS:
-            if ach.name not in achievements_to_write and ach.post_victory and \
-                    ach.verification_fn(game_state, Statistics()):
-                achievements_to_write.append(ach.name)
-                new_achievements.append(ach)
-
-    factions_to_write = existing_factions
-    if faction_to_add:
-        # If the player has used this faction before, increment it, otherwise just set it to 1.
-        if faction_to_add in existing_factions:
-            existing_factions[faction_to_add] = existing_factions[faction_to_add] + 1
-        else:
-            existing_factions[faction_to_add] = 1
-
-    # All other achievements can be checked on every save, with the real Statistics. Note that we need to ensure that
-    # the player objects for the game have been initialised. This is because player statistics are updated with faction
-    # usage when starting a new game, and this occurs prior to the players being initialised.
-    if game_state.players:
-        for ach in ACHIEVEMENTS:
-            if ach.name not in achievements_to_write and not ach.post_victory and \
-                    ach.verification_fn(game_state, Statistics(playtime_to_write, turns_to_write, victories_to_write,
-                                                               defeats_to_write, factions_to_write)):
-                achievements_to_write.append(ach.name)
-                new_achievements.append(ach)
-
-    # Write the newly-updated statistics to the file.
-    with open(stats_file_name, "w", encoding="utf-8") as stats_file:
-        stats = {
-            "playtime": playtime_to_write,
-            "turns_played": turns_to_write,
-            "victories": victories_to_write,
-            "defeats": defeats_to_write,
-            "factions": factions_to_write,
-            "achievements": achievements_to_write
-        }
-        stats_file.write(json.dumps(stats))
-    stats_file.close()
+        triggers.add(AchievementTrigger.VICTORY)
+
+    with STATISTICS.lock:
+        stats = STATISTICS.get()
+        stats.playtime += playtime
+        if increment_turn:
+            stats.turns_played += 1
+        if increment_defeats:
+            stats.defeats += 1
+
+        if victory_to_add:
+            # If the player has achieved this victory before, increment it, otherwise just set it to 1.
+            stats.victories[victory_to_add] = stats.victories.get(victory_to_add, 0) + 1
+            # Check if any achievements have been obtained that can only be verified immediately after a player
+            # victory. Note that we don't need to supply a real Statistics object for this, since all post-victory
+            # achievements only require the game state to be verified.
+            for ach in ACHIEVEMENTS:
+                if ach.name not in stats.achievements and ach.post_victory and \
+                        ach.verification_fn(game_state, Statistics()):
+                    stats.achievements.append(ach.name)
+                    new_achievements.append(ach)
+
+        if faction_to_add:
+            # If the player has used this faction before, increment it, otherwise just set it to 1.
+            stats.factions[faction_to_add] = stats.factions.get(faction_to_add, 0) + 1
+
+        # All other achievements are checked with the real Statistics, if they have been triggered. Note that we need to
+        # ensure that the player objects for the game have been initialised. This is because player statistics are
+        # updated with faction usage when starting a new game, and this occurs prior to the players being initialised.
+        if game_state.players:
+            triggers |= game_state.board.achievements.take()
+            for ach in ACHIEVEMENTS:
+                if ach.name not in stats.achievements and not ach.post_victory and \
+                        not triggers.isdisjoint(ach.triggers) and ach.verification_fn(game_state, stats):
+                    stats.achievements.append(ach.name)
+                    new_achievements.append(ach)
+
+        STATISTICS.changed()
 
     return new_achievements
 
 
 def get_stats() -> Statistics:
     """
-    Retrieve the player's statistics from the statistics JSON file, if they have one.
+    Retrieve the player's statistics, which are only read from the statistics JSON file the first time.
     :return: An object containing the player's statistics.
     """
-    stats_file_name = os.path.join(SAVES_DIR, "statistics.json")
-    if os.path.isfile(stats_file_name):
-        with open(stats_file_name, "r", encoding="utf-8") as stats_file:
-            stats_json = json.loads(stats_file.read())
-            return Statistics(**stats_json)
-    else:
-        return Statistics(0, 0, {}, 0, {}, set())
+    return STATISTICS.get()
+
+
+def load_json_save(save: typing.BinaryIO, game_state) -> \
+        typing.Tuple[typing.List[typing.List[Quad]], GameConfig, typing.Optional[typing.Tuple[str, int]]]:
+    """
+    Imports the game from the given JSON save, populating the players, heathens, turn and night status of the given
+    game state. Saves that record their version are decoded directly, with older saves being migrated.
+    :param save: The stream of the save file's contents.
+    :param game_state: The current GameState object.
+    :return: A tuple of the quads of the board, the game config, and the name of the file containing the game's event
+    log and the number of events the save includes, if the game has an event log.
+    """
+    save_data = json.load(save)
+    if "version" in save_data:
+        return decode_save(save_data, game_state)
+    return load_legacy_json_save(to_objects(save_data), game_state)
+
+
+def load_legacy_json_save(save: ObjectConverter, game_state) -> \
+        typing.Tuple[typing.List[typing.List[Quad]], GameConfig, typing.Optional[typing.Tuple[str, int]]]:
+    """
+    Imports the game from the given JSON save made before saves recorded their version, migrating it from older
+    versions of the game if required, and populating the players, heathens, turn and night status of the given game
+    state.
+    :param save: The save, with attribute access to its objects.
+    :param game_state: The current GameState object.
+    :return: A tuple of the quads of the board, the game config, and the name of the file containing the game's event
+    log and the number of events the save includes, if the game has an event log.
+    """
+    # Load in the quads.
+    quads = [[None] * 100 for _ in range(90)]
+    for i in range(90):
+        for j in range(100):
+            quads[i][j] = migrate_quad(save.quads[i * 100 + j], (j, i))
+    game_state.players = save.players
+    # The list of tuples that is quads_seen needs special loading, as do a few other of the same type,
+    # because tuples do not exist in JSON, so they are represented as arrays, which will clearly not work.
+    for i in range(len(game_state.players[0].quads_seen)):
+        game_state.players[0].quads_seen[i] = (
+            game_state.players[0].quads_seen[i][0], game_state.players[0].quads_seen[i][1])
+    game_state.players[0].quads_seen = set(game_state.players[0].quads_seen)
+    for p in game_state.players:
+        for idx, u in enumerate(p.units):
+            # We can do a direct conversion to Unit and UnitPlan objects for units.
+            p.units[idx] = migrate_unit(u)
+        for s in p.settlements:
+            # Another tuple-array fix.
+            s.location = (s.location[0], s.location[1])
+            if s.current_work is not None:
+                # Get the actual Improvement, Project, or UnitPlan objects for the current work. We use
+                # hasattr() because improvements have an effect where projects do not, and projects have
+                # a type where unit plans do not.
+                if hasattr(s.current_work.construction, "effect"):
+                    s.current_work.construction = get_improvement(s.current_work.construction.name)
+                elif hasattr(s.current_work.construction, "type"):
+                    s.current_work.construction = get_project(s.current_work.construction.name)
+                else:
+                    s.current_work.construction = get_unit_plan(s.current_work.construction.name)
+            for idx, imp in enumerate(s.improvements):
+                # Do another direct conversion for improvements.
+                s.improvements[idx] = get_improvement(imp.name)
+            # Also convert all units in garrisons to Unit objects.
+            for idx, u in enumerate(s.garrison):
+                s.garrison[idx] = migrate_unit(u)
+            migrate_settlement(s)
+        # We also do direct conversions to Blessing objects for the ongoing one, if there is one,
+        # as well as any previously-completed ones.
+        if p.ongoing_blessing:
+            p.ongoing_blessing.blessing = get_blessing(p.ongoing_blessing.blessing.name)
+        for idx, bls in enumerate(p.blessings):
+            p.blessings[idx] = get_blessing(bls.name)
+        migrate_player(p)
+    # For the AI players, we can just make quads_seen an empty set, as it's not used.
+    for i in range(1, len(game_state.players)):
+        game_state.players[i].quads_seen = set()
+
+    game_state.heathens = []
+    for h in save.heathens:
+        # Do another direct conversion for the heathens.
+        game_state.heathens.append(Heathen(h.health, h.remaining_stamina, (h.location[0], h.location[1]),
+                                           UnitPlan(h.plan.power, h.plan.max_health, 2, h.plan.name, None, 0,
+                                                    night_affinity=NightAffinity.HEATHEN),
+                                           h.has_attacked))
+
+    game_state.turn = save.turn
+    migrate_climatic_effects(game_state, save)
+    event_log = (save.event_log.file, save.event_log.length) if hasattr(save, "event_log") else None
+    return quads, migrate_game_config(save.cfg), event_log
+
+
+def read_game(save: typing.BinaryIO, open_base: typing.Callable[[str], typing.ContextManager[typing.BinaryIO]],
+              game_state) -> \
+        typing.Tuple[typing.List[typing.List[Quad]], GameConfig, typing.Optional[typing.Tuple[str, int]]]:
+    """
+    Read the game from the given save, populating the players, heathens, turn and night status of the given game state.
+    Saves in the binary format are identified by their header, with all other saves being imported as JSON.
+    :param save: The stream of the save's uncompressed bytes, at its start.
+    :param open_base: The function that opens a stream of the uncompressed bytes of the full save with the given name,
+    for delta saves.
+    :param game_state: The current GameState object.
+    :return: A tuple of the quads of the board, the game config, and the name of the file containing the game's event
+    log and the number of events the save includes, if the game has an event log.
+    """
+    if (base_name := delta_base(save)) is not None:
+        with open_base(base_name) as base:
+            return read_delta(save, base, game_state)
+    if save_magic(save) == SAVE_MAGIC:
+        return read_save(save, game_state)
+    return load_json_save(save, game_state)
+
+
+@contextmanager
+def open_file_save(file_name: str) -> typing.Iterator[typing.BinaryIO]:
+    """
+    :param file_name: The name of the save file.
+    :return: A stream of the save's uncompressed bytes, which are decompressed as they are read if the save is
+    compressed.
+    """
+    with open(os.path.join(SAVES_DIR, file_name), "rb") as save_file, open_save(save_file) as save:
+        yield save
+
+
+def open_journal_saves(recover: bool = True) -> typing.Tuple[typing.BinaryIO, typing.Optional[typing.BinaryIO]]:
+    """
+    :param recover: Whether to recover the journal before reading it, truncating any torn record at its end.
+    :return: A tuple of streams of the uncompressed bytes of the latest autosave in the journal, and of the full
+    autosave it is a delta against, if it is a delta.
+    """
+    save, base = AutosaveJournal(os.path.join(SAVES_DIR, AUTOSAVE_JOURNAL)).latest(recover)
+    return open_save(io.BufferedReader(io.BytesIO(save))), \
+        None if base is None else open_save(io.BufferedReader(io.BytesIO(base)))
+
+
+def upgrade_legacy_save(file_name: str) -> bool:
+    """
+    Upgrade the save with the given name to the current version of the JSON save format if it is a legacy save, i.e. a
+    JSON save made before saves recorded their version, which would otherwise be migrated every time it is loaded. The
+    save is rewritten in place, once the original has been backed up.
+    :param file_name: The name of the save file.
+    :return: Whether the save was a legacy save, and was upgraded.
+    """
+    with open_file_save(file_name) as save:
+        if save_magic(save) in (SAVE_MAGIC, DELTA_MAGIC) or save.peek(len(_VERSIONED_JSON)).startswith(_VERSIONED_JSON):
+            return False
+        save_data = json.load(save)
+    if "version" in save_data:
+        return False
+    # The game state is imported here, as it imports this module in turn.
+    from source.game_management.game_state import GameState  # pylint: disable=import-outside-toplevel
+    game_state = GameState()
+    quads, cfg, event_log = load_legacy_json_save(to_objects(save_data), game_state)
+    backups_dir = os.path.join(SAVES_DIR, LEGACY_BACKUPS_DIR)
+    pathlib.Path(backups_dir).mkdir(exist_ok=True)
+    shutil.copy2(os.path.join(SAVES_DIR, file_name), os.path.join(backups_dir, file_name))
+    write_atomically(os.path.join(SAVES_DIR, file_name), encode_json_save(game_state, quads, cfg, event_log),
+                     compress=False)
+    return True
+
+
+def upgrade_legacy_saves() -> typing.Tuple[typing.List[str], typing.List[str]]:
+    """
+    Upgrade every legacy save in the saves directory to the current version of the JSON save format.
+    :return: A tuple of the names of the saves that were upgraded, and of those that could not be read.
+    """
+    AUTOSAVE_WRITER.wait()
+    upgraded, failed = [], []
+    for file_name in list_saves():
+        if file_name == AUTOSAVE_JOURNAL:
+            continue
+        try:
+            if upgrade_legacy_save(file_name):
+                upgraded.append(file_name)
+        except SAVE_ERRORS:
+            failed.append(file_name)
+    return upgraded, failed
 
 
 def load_game(game_state, game_controller: GameController):
     """
-    Loads the game with the given index from the saves/ directory.
+    Loads the game with the given index from the saves/ directory. Loading the autosave journal loads the latest
+    autosave in it, and loading a legacy save upgrades it first.
     :param game_controller: The current GameController object.
     :param game_state: The current GameState object.
     """
     # Reset the namer so that we have our original set of names again.
     game_controller.namer.reset()
-    # Sort and reverse both the autosaves and manual saves, remembering that the (up to) 3 autosaves will be
-    # displayed first in the list.
-    autosaves = list(filter(lambda file_name: file_name.startswith(AUTOSAVE_PREFIX), os.listdir(SAVES_DIR)))
-    saves = list(
-        filter(lambda file_name: file_name.startswith("save-"),
-               [f for f in os.listdir(SAVES_DIR) if not f.startswith('.')]))
-    autosaves.sort()
-    autosaves.reverse()
-    saves.sort()
-    saves.reverse()
-    all_saves = autosaves + saves
+    # Make sure that the most recent autosave has been written before it can be loaded.
+    AUTOSAVE_WRITER.wait()
+    all_saves = list_saves()
 
     try:
-        with open(os.path.join(SAVES_DIR, all_saves[game_controller.menu.save_idx]), "r",
-                  encoding="utf-8") as save_file:
-            # Use a custom object hook when loading the JSON so that the resulting objects have attribute access.
-            save = json.loads(save_file.read(), object_hook=ObjectConverter)
-            # Load in the quads.
-            quads = [[None] * 100 for _ in range(90)]
-            for i in range(90):
-                for j in range(100):
-                    quads[i][j] = migrate_quad(save.quads[i * 100 + j], (j, i))
-            game_state.players = save.players
-            # The list of tuples that is quads_seen needs special loading, as do a few other of the same type,
-            # because tuples do not exist in JSON, so they are represented as arrays, which will clearly not work.
-            for i in range(len(game_state.players[0].quads_seen)):
-                game_state.players[0].quads_seen[i] = (
-                    game_state.players[0].quads_seen[i][0], game_state.players[0].quads_seen[i][1])
-            game_state.players[0].quads_seen = set(game_state.players[0].quads_seen)
-            for p in game_state.players:
-                for idx, u in enumerate(p.units):
-                    # We can do a direct conversion to Unit and UnitPlan objects for units.
-                    p.units[idx] = migrate_unit(u)
-                for s in p.settlements:
-                    # Make sure we remove the settlement's name so that we don't get duplicates.
-                    game_controller.namer.remove_settlement_name(s.name, s.quads[0].biome)
-                    # Another tuple-array fix.
-                    s.location = (s.location[0], s.location[1])
-                    if s.current_work is not None:
-                        # Get the actual Improvement, Project, or UnitPlan objects for the current work. We use
-                        # hasattr() because improvements have an effect where projects do not, and projects have
-                        # a type where unit plans do not.
-                        if hasattr(s.current_work.construction, "effect"):
-                            s.current_work.construction = get_improvement(s.current_work.construction.name)
-                        elif hasattr(s.current_work.construction, "type"):
-                            s.current_work.construction = get_project(s.current_work.construction.name)
-                        else:
-                            s.current_work.construction = get_unit_plan(s.current_work.construction.name)
-                    for idx, imp in enumerate(s.improvements):
-                        # Do another direct conversion for improvements.
-                        s.improvements[idx] = get_improvement(imp.name)
-                    # Also convert all units in garrisons to Unit objects.
-                    for idx, u in enumerate(s.garrison):
-                        s.garrison[idx] = migrate_unit(u)
-                    migrate_settlement(s)
-                # We also do direct conversions to Blessing objects for the ongoing one, if there is one,
-                # as well as any previously-completed ones.
-                if p.ongoing_blessing:
-                    p.ongoing_blessing.blessing = get_blessing(p.ongoing_blessing.blessing.name)
-                for idx, bls in enumerate(p.blessings):
-                    p.blessings[idx] = get_blessing(bls.name)
-                migrate_player(p)
-            # For the AI players, we can just make quads_seen an empty set, as it's not used.
-            for i in range(1, len(game_state.players)):
-                game_state.players[i].quads_seen = set()
-
-            game_state.heathens = []
-            for h in save.heathens:
-                # Do another direct conversion for the heathens.
-                game_state.heathens.append(Heathen(h.health, h.remaining_stamina, (h.location[0], h.location[1]),
-                                                   UnitPlan(h.plan.power, h.plan.max_health, 2, h.plan.name, None, 0),
-                                                   h.has_attacked))
-
-            game_state.turn = save.turn
-            migrate_climatic_effects(game_state, save)
-            game_cfg = migrate_game_config(save.cfg)
-        save_file.close()
+        # Saves are decompressed as they are read, with saves that are not compressed being read as-is.
+        if all_saves[game_controller.menu.save_idx] == AUTOSAVE_JOURNAL:
+            save, base = open_journal_saves()
+            with save, nullcontext() if base is None else base:
+                quads, game_cfg, event_log = read_game(save, lambda _: base, game_state)
+        else:
+            upgrade_legacy_save(all_saves[game_controller.menu.save_idx])
+            with open_file_save(all_saves[game_controller.menu.save_idx]) as save:
+                quads, game_cfg, event_log = read_game(save, open_file_save, game_state)
+        for p in game_state.players:
+            for s in p.settlements:
+                # Make sure we remove the settlement's name so that we don't get duplicates.
+                game_controller.namer.remove_settlement_name(s.name, s.quads[0].biome)
         # Now do all the same logic we do when starting a game.
         pyxel.mouse(visible=True)
         game_controller.last_turn_time = time.time()
@@ -268,34 +626,77 @@ def load_game(game_state, game_controller: GameController):
         game_state.on_menu = False
         game_state.board = Board(game_cfg, game_controller.namer, quads)
         game_controller.move_maker.board_ref = game_state.board
+        # Associate each besieging unit with the settlement it is besieging.
+        game_state.board.sieges.rebuild(game_state.players)
+        # Count each player's progress towards victory from their settlements and blessings.
+        game_state.board.victories.rebuild(game_state.players)
+        # Continue the game's event log from where the save was made, if it has one that still exists.
+        if event_log is not None and os.path.exists(os.path.join(SAVES_DIR, event_log[0])):
+            game_state.board.events.read(SAVES_DIR, *event_log)
+            game_state.board.events.attach(game_state)
         # Initialise the map position to the player's first settlement.
         game_state.map_pos = (clamp(game_state.players[0].settlements[0].location[0] - 12, -1, 77),
                               clamp(game_state.players[0].settlements[0].location[1] - 11, -1, 69))
         game_state.board.overlay.current_player = game_state.players[0]
         game_controller.music_player.stop_menu_music()
         game_controller.music_player.play_game_music()
-    except (JSONDecodeError, AttributeError, KeyError, StopIteration, ValueError):
+    except SAVE_ERRORS:
         game_controller.menu.load_failed = True
 
 
+def list_saves() -> typing.List[str]:
+    """
+    Get the file names of each save file in the saves/ directory, in the order they are displayed on the menu.
+    :return: The file names of the autosaves, most recent first, followed by those of the manual saves.
+    """
+    file_names = [f for f in os.listdir(SAVES_DIR) if not f.startswith('.')]
+    # Sort and reverse both the autosaves and manual saves, remembering that the autosaves will be displayed first in
+    # the list.
+    autosaves = sorted(filter(lambda file_name: file_name.startswith(AUTOSAVE_PREFIX), file_names), reverse=True)
+    saves = sorted(filter(lambda file_name: file_name.startswith("save-"), file_names), reverse=True)
+    return autosaves + saves
+
+
+def get_save_metadata(file_name: str) -> typing.Optional[SaveMetadata]:
+    """
+    Read only the metadata at the start of the save file with the given name, leaving the rest of it unread.
+    :param file_name: The name of the save file.
+    :return: The metadata of the save, if it has any, i.e. if it is a valid binary save of a recent enough format.
+    """
+    try:
+        if file_name == AUTOSAVE_JOURNAL:
+            # Listing saves should leave the journal as it is, with it only being recovered when it is loaded or
+            # appended to.
+            save, base = open_journal_saves(recover=False)
+            with save, nullcontext() if base is None else base:
+                return read_metadata(save)
+        with open_file_save(file_name) as save:
+            return read_metadata(save)
+    except (ValueError, OSError, EOFError, zlib.error):
+        return None
+
+
 def get_saves(game_controller: GameController):
     """
-    Get the prettified file names of each save file in the saves/ directory and pass them to the menu.
+    Get the prettified file names of each save file in the saves/ directory, along with their metadata, and pass them
+    to the menu.
     """
     game_controller.menu.saves = []
-    autosaves = list(filter(lambda file_name: file_name.startswith(AUTOSAVE_PREFIX), os.listdir(SAVES_DIR)))
-    saves = list(filter(lambda file_name: file_name.startswith("save-"),
-                        [f for f in os.listdir(SAVES_DIR) if not f.startswith('.')]))
+    game_controller.menu.save_metadata = []
+    # Make sure that the most recent autosave has been written before it can be listed.
+    AUTOSAVE_WRITER.wait()
+    all_saves = list_saves()
     # Default to a fake option if there are no saves available.
-    if len(autosaves) + len(saves) == 0:
+    if not all_saves:
         game_controller.menu.save_idx = -1
     else:
-        autosaves.sort()
-        autosaves.reverse()
-        saves.sort()
-        saves.reverse()
-        for f in autosaves:
-            game_controller.menu.saves.append(f[9:-5].replace("T", " ") + " (auto)")
-        for f in saves:
-            # Just show the date and time.
-            game_controller.menu.saves.append(f[5:-5].replace("T", " "))
+        for f in all_saves:
+            # Just show the date and time, which for the autosave journal is when it was last appended to.
+            if f == AUTOSAVE_JOURNAL:
+                modified = datetime.fromtimestamp(os.path.getmtime(os.path.join(SAVES_DIR, f)))
+                game_controller.menu.saves.append(modified.strftime("%Y-%m-%d %H.%M.%S") + " (auto)")
+            elif f.startswith(AUTOSAVE_PREFIX):
+                game_controller.menu.saves.append(os.path.splitext(f)[0][9:].replace("T", " ") + " (auto)")
+            else:
+                game_controller.menu.saves.append(os.path.splitext(f)[0][5:].replace("T", " "))
+            game_controller.menu.save_metadata.append(get_save_metadata(f))
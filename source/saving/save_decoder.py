@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import typing
+from dataclasses import replace
+
+from source.foundation.catalogue import get_blessing, IMPROVEMENTS, PROJECTS
+from source.foundation.climate import NightAffinity
+from source.foundation.models import Quad, Biome, Player, Faction, Settlement, Unit, DeployerUnit, UnitPlan, \
+    DeployerUnitPlan, Heathen, Construction, OngoingBlessing, AIPlaystyle, AttackPlaystyle, ExpansionPlaystyle, \
+    VictoryType, HarvestStatus, EconomicStatus, GameConfig, Blessing
+from source.saving.save_encoder import CATALOGUE_PLANS
+
+if typing.TYPE_CHECKING:
+    from source.game_management.game_state import GameState
+
+"""
+JSON saves record the version of their format, with saves of the current version being decoded directly into the
+game's dataclasses in a single pass. Each dataclass is constructed from the dictionary it was encoded as, with the
+fields in its schema below being decoded first, and all other fields being plain JSON values that are passed through
+as-is. Saves without a version predate it, and are migrated by save_migrator.py instead, before being upgraded to the
+current version so that they are only migrated once.
+
+The version must be incremented whenever the dataclasses in saves change, with the migrations for the previous version
+being selected by it. Version 1 saves stored catalogue entries and settlements' quads in full, rather than as their
+names and locations, and unit plans with all of their fields, rather than only those that differ from the catalogue.
+As catalogue entries and quads are decoded by name and location in both cases, they are decoded in the same way.
+"""
+
+JSON_SAVE_VERSION = 2
+
+# The improvements and projects in the catalogue, keyed by name.
+_CONSTRUCTIONS = {construction.name: construction for construction in IMPROVEMENTS + PROJECTS}
+
+
+def _location(value: typing.List[int]) -> (int, int):
+    """
+    :param value: The location as encoded, which is a list, as JSON has no tuples.
+    :return: The location as a tuple.
+    """
+    return value[0], value[1]
+
+
+def _name(value: str | typing.Dict[str, typing.Any]) -> str:
+    """
+    :param value: The catalogue entry as encoded, which is either its name, or the entire entry for version 1 saves.
+    :return: The name of the catalogue entry.
+    """
+    return value if isinstance(value, str) else value["name"]
+
+
+def _blessing(value: str | typing.Dict[str, typing.Any]) -> Blessing:
+    """
+    :param value: The blessing as encoded.
+    :return: The blessing from the catalogue.
+    """
+    return get_blessing(_name(value))
+
+
+def _optional(decode_fn: typing.Callable) -> typing.Callable:
+    """
+    :param decode_fn: The function that decodes a value.
+    :return: A function that decodes a value that may be null.
+    """
+    return lambda value: None if value is None else decode_fn(value)
+
+
+def _list_of(decode_fn: typing.Callable) -> typing.Callable:
+    """
+    :param decode_fn: The function that decodes a value.
+    :return: A function that decodes a list of values.
+    """
+    return lambda values: [decode_fn(value) for value in values]
+
+
+class SaveDecoder:
+    """
+    Decodes the dataclasses of a JSON save, according to the schema of each. Catalogue entries are decoded as references
+    to the catalogue, and settlements' quads as references to the quads of the board.
+    """
+
+    def __init__(self, quads: typing.List[typing.List[Quad]]):
+        """
+        Initialise the schema used to decode each dataclass.
+        :param quads: The quads of the board, which must be decoded before any settlements.
+        """
+        self.quads = quads
+        plan_schema = {
+            "prereq": _optional(_blessing),
+            "night_affinity": _optional(NightAffinity),
+        }
+        unit_schema = {"location": _location, "plan": self.decode_unit_plan}
+        self.schema: typing.Dict[type, typing.Dict[str, typing.Callable]] = {
+            UnitPlan: plan_schema,
+            DeployerUnitPlan: plan_schema,
+            Unit: unit_schema,
+            DeployerUnit: unit_schema | {"passengers": _list_of(self.decode_unit)},
+            Heathen: unit_schema,
+            Construction: {"construction": self.decode_construction},
+            OngoingBlessing: {"blessing": _blessing},
+            AIPlaystyle: {"attacking": AttackPlaystyle, "expansion": ExpansionPlaystyle},
+            Settlement: {
+                "location": _location,
+                "improvements": _list_of(lambda imp: _CONSTRUCTIONS[_name(imp)]),
+                "quads": _list_of(self.decode_quad),
+                "garrison": _list_of(self.decode_unit),
+                "current_work": _optional(lambda work: self.decode(Construction, work)),
+                "harvest_status": HarvestStatus,
+                "economic_status": EconomicStatus,
+            },
+            Player: {
+                "faction": Faction,
+                "settlements": _list_of(lambda setl: self.decode(Settlement, setl)),
+                "units": _list_of(self.decode_unit),
+                "blessings": _list_of(_blessing),
+                "quads_seen": lambda seen: {(loc[0], loc[1]) for loc in seen},
+                "imminent_victories": lambda victories: {VictoryType(victory) for victory in victories},
+                "ongoing_blessing": _optional(lambda ongoing: self.decode(OngoingBlessing, ongoing)),
+                "ai_playstyle": _optional(lambda playstyle: self.decode(AIPlaystyle, playstyle)),
+            },
+            GameConfig: {"player_faction": Faction},
+        }
+
+    def decode_fields(self, cls: type, values: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        """
+        :param cls: The dataclass the given values are the fields of.
+        :param values: The encoded fields of the dataclass.
+        :return: The decoded fields of the dataclass.
+        """
+        schema = self.schema.get(cls, {})
+        return {name: schema[name](value) if name in schema else value for name, value in values.items()}
+
+    def decode(self, cls: type, values: typing.Dict[str, typing.Any]):
+        """
+        :param cls: The dataclass to decode the given values as.
+        :param values: The encoded fields of the dataclass.
+        :return: The decoded dataclass.
+        """
+        return cls(**self.decode_fields(cls, values))
+
+    def decode_unit_plan(self, plan: typing.Dict[str, typing.Any]) -> UnitPlan:
+        """
+        :param plan: The encoded unit plan.
+        :return: The decoded unit plan. Plans from the catalogue are copies of the catalogue's plan with the encoded
+        fields replaced, and other plans, i.e. those of heathens, are decoded in full.
+        """
+        if (catalogue_plan := CATALOGUE_PLANS.get(plan["name"])) is not None:
+            return replace(catalogue_plan, **self.decode_fields(type(catalogue_plan), plan))
+        return self.decode(UnitPlan, plan)
+
+    def decode_unit(self, unit: typing.Dict[str, typing.Any]) -> Unit:
+        """
+        :param unit: The encoded unit.
+        :return: The decoded unit, which is a deployer unit if it has passengers.
+        """
+        return self.decode(DeployerUnit if "passengers" in unit else Unit, unit)
+
+    def decode_quad(self, quad: typing.List[int] | typing.Dict[str, typing.Any]) -> Quad:
+        """
+        :param quad: The location of one of a settlement's quads, or the entire quad for version 1 saves.
+        :return: The quad of the board at that location.
+        """
+        location = quad if isinstance(quad, list) else quad["location"]
+        return self.quads[location[1]][location[0]]
+
+    def decode_construction(self, construction: str | typing.Dict[str, typing.Any]):
+        """
+        Decode the given improvement, project, or unit plan being constructed. Improvements and projects are encoded as
+        their names, or in full for version 1 saves, where improvements have an effect and projects have a type. Unit
+        plans are encoded with their fields, as their stats can be modified by the player's faction.
+        :param construction: The encoded construction.
+        :return: The decoded improvement, project, or unit plan.
+        """
+        if isinstance(construction, str) or "effect" in construction or "type" in construction:
+            return _CONSTRUCTIONS[_name(construction)]
+        return self.decode_unit_plan(construction)
+
+
+def decode_save(save: typing.Dict[str, typing.Any], game_state: GameState) -> \
+        typing.Tuple[typing.List[typing.List[Quad]], GameConfig, typing.Optional[typing.Tuple[str, int]]]:
+    """
+    Decode the given JSON save of the current version or version 1, populating the players, heathens, turn and night
+    status of the given game state, and resetting the climate to match.
+    :param save: The parsed JSON save.
+    :param game_state: The game state to populate.
+    :return: A tuple of the quads of the board, the game config, and the name of the file containing the game's event
+    log and the number of events the save includes, if the game has an event log.
+    """
+    if not 1 <= save["version"] <= JSON_SAVE_VERSION:
+        raise ValueError(f"Unsupported JSON save version {save['version']}.")
+    # The quads make up most of the save, so they are constructed directly, rather than according to a schema.
+    biomes = {biome.value: biome for biome in Biome}
+    quads = [[Quad(biomes[quad["biome"]], quad["wealth"], quad["harvest"], quad["zeal"], quad["fortune"],
+                   (quad["location"][0], quad["location"][1]), quad["selected"], quad["is_relic"])
+              for quad in save["quads"][row * 100:row * 100 + 100]] for row in range(90)]
+    decoder = SaveDecoder(quads)
+    game_state.players = [decoder.decode(Player, player) for player in save["players"]]
+    game_state.heathens = [decoder.decode(Heathen, heathen) for heathen in save["heathens"]]
+    game_state.turn = save["turn"]
+    night_status = save["night_status"]
+    game_state.until_night = night_status["until"]
+    game_state.nighttime_left = night_status["remaining"]
+    game_state.climate.reset(game_state.nighttime_left > 0, night_status["dawned"])
+    event_log = (save["event_log"]["file"], save["event_log"]["length"]) if "event_log" in save else None
+    return quads, decoder.decode(GameConfig, save["cfg"]), event_log
@@ -1,10 +1,19 @@
 import dataclasses
 from json import JSONEncoder
 
+from source.foundation.catalogue import UNIT_PLANS
+from source.foundation.models import Blessing, Improvement, Project, UnitPlan, Settlement
+
+# The unit plans in the catalogue, keyed by name.
+CATALOGUE_PLANS = {plan.name: plan for plan in UNIT_PLANS}
+
 
 class SaveEncoder(JSONEncoder):
     """
-    The encoder used to encode game state to a JSON file.
+    The encoder used to encode game state to a JSON file. Blessings, improvements, and projects are static catalogue
+    entries, so they are encoded as just their names. Unit plans can have their stats modified, e.g. by the player's
+    faction, so those from the catalogue are encoded as their name along with any fields that differ from the catalogue.
+    Similarly, settlements' quads are encoded as their locations, as they are already encoded as part of the board.
     """
     def default(self, o):
         """
@@ -12,9 +21,18 @@ class SaveEncoder(JSONEncoder):
         :param o: The object to JSON-ify.
         :return: The JSON representation of the object.
         """
-        # Data classes have their own dictionary representations.
+        if isinstance(o, (Blessing, Improvement, Project)):
+            return o.name
+        if isinstance(o, UnitPlan) and (catalogue_plan := CATALOGUE_PLANS.get(o.name)) is not None:
+            return {fld.name: getattr(o, fld.name) for fld in dataclasses.fields(o)
+                    if fld.name == "name" or getattr(o, fld.name) != getattr(catalogue_plan, fld.name)}
+        if isinstance(o, Settlement):
+            return {fld.name: [quad.location for quad in o.quads] if fld.name == "quads" else getattr(o, fld.name)
+                    for fld in dataclasses.fields(o)}
+        # Data classes are represented by a dictionary of their fields, which are then encoded in turn. Note that
+        # dataclasses.asdict() is not used, as it would convert any catalogue entries the fields contain as well.
         if dataclasses.is_dataclass(o):
-            return dataclasses.asdict(o)
+            return {fld.name: getattr(o, fld.name) for fld in dataclasses.fields(o)}
         # Sets must be represented as lists, no real difference anyway.
         if isinstance(o, set):
             return list(o)
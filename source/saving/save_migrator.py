@@ -1,6 +1,10 @@
+import typing
+
 from source.foundation.catalogue import get_blessing, FACTION_COLOURS
+from source.foundation.climate import NightAffinity
 from source.foundation.models import UnitPlan, Unit, Faction, AIPlaystyle, AttackPlaystyle, ExpansionPlaystyle, Quad, \
     Biome, GameConfig, DeployerUnitPlan, DeployerUnit
+from source.saving.save_encoder import ObjectConverter
 
 """
 The following migrations have occurred during Microcosm's development:
@@ -40,25 +44,51 @@ v2.3
 v2.4
 - Deploying units and their plans were added. Since they had their own unique properties, no migration for existing
   units is required, and the new deploying units can be identified by these properties.
+
+v2.5
+- Climatic effects became applied to unit stats when they are read, rather than being applied to the stored stats. Unit
+  plans were given a night affinity, which can be mapped to None for all existing plans, leaving their stats as they
+  were saved. Whether the first night has passed was also added to the night status, and is mapped to False, with the
+  climate reverting to daytime, so that already-modified stats are not modified again.
+
+v2.6
+- JSON saves began recording the version of their format, and saves of the current version are decoded directly by
+  save_decoder.py. The migrations below are only applied to saves without a version, which have attribute access to
+  their objects.
 """
 
 
+def to_objects(value):
+    """
+    Give the objects of the given parsed JSON save attribute access, as expected by the migrations below.
+    :param value: The parsed JSON value.
+    :return: The value, with each dictionary within it converted to an ObjectConverter.
+    """
+    if isinstance(value, dict):
+        return ObjectConverter({key: to_objects(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return [to_objects(item) for item in value]
+    return value
+
+
 def migrate_unit_plan(unit_plan) -> UnitPlan:
     """
-    Apply the heals attribute migration for UnitPlans, if required.
+    Apply the heals and night_affinity attribute migrations for UnitPlans, if required.
     :param unit_plan: The loaded unit plan object.
     :return: An optionally-migrated UnitPlan representation.
     """
     plan_prereq = None if unit_plan.prereq is None else get_blessing(unit_plan.prereq.name)
     will_heal: bool = unit_plan.heals if hasattr(unit_plan, "heals") else False
+    affinity: typing.Optional[NightAffinity] = \
+        NightAffinity(unit_plan.night_affinity) if getattr(unit_plan, "night_affinity", None) else None
 
     if hasattr(unit_plan, "max_capacity"):
         return DeployerUnitPlan(unit_plan.power, unit_plan.max_health, unit_plan.total_stamina,
                                 unit_plan.name, plan_prereq, unit_plan.cost, unit_plan.can_settle,
-                                will_heal, unit_plan.max_capacity)
+                                will_heal, affinity, unit_plan.max_capacity)
     return UnitPlan(unit_plan.power, unit_plan.max_health, unit_plan.total_stamina,
                     unit_plan.name, plan_prereq, unit_plan.cost, unit_plan.can_settle,
-                    will_heal)
+                    will_heal, affinity)
 
 
 def migrate_unit(unit) -> Unit:
@@ -116,6 +146,10 @@ def migrate_climatic_effects(game_state, save):
     """
     game_state.until_night = save.night_status.until if hasattr(save, "night_status") else 0
     game_state.nighttime_left = save.night_status.remaining if hasattr(save, "night_status") else 0
+    if hasattr(save, "night_status") and hasattr(save.night_status, "dawned"):
+        game_state.climate.reset(game_state.nighttime_left > 0, save.night_status.dawned)
+    else:
+        game_state.climate.reset()
 
 
 def migrate_quad(quad, location: (int, int)) -> Quad:
@@ -0,0 +1,143 @@
+"""
+Run a headless simulation of a game between AI players, without pyxel or any audio. This is useful for benchmarking,
+soak testing, and balance testing the game logic on machines with no display. For example:
+
+    python -m source.sim --players 8 --turns 500 --seed 42
+"""
+import argparse
+import math
+import random
+import time
+import typing
+
+from source.display.overlay import NullOverlay
+from source.foundation.catalogue import FACTION_COLOURS, Namer
+from source.foundation.models import Player, Faction, AIPlaystyle, AttackPlaystyle, ExpansionPlaystyle, GameConfig, \
+    SimulationResult
+from source.game_management.board_state import BoardState
+from source.game_management.game_state import GameState
+from source.game_management.movemaker import MoveMaker
+from source.game_management.turn_profiler import TurnProfiler, export_csv, export_json
+
+
+def gen_ai_players(player_count: int) -> typing.List[Player]:
+    """
+    Generate the AI players for a simulated game, each with a different faction.
+    :param player_count: The number of players to generate.
+    :return: The generated players.
+    """
+    return [Player(f"NPC{idx + 1}", faction, FACTION_COLOURS[faction],
+                   ai_playstyle=AIPlaystyle(random.choice(list(AttackPlaystyle)),
+                                            random.choice(list(ExpansionPlaystyle))))
+            for idx, faction in enumerate(random.sample(list(Faction), player_count))]
+
+
+def new_game(player_count: int, seed: typing.Optional[int] = None,
+             turn_budget: float = math.inf) -> typing.Tuple[GameState, MoveMaker]:
+    """
+    Set up a new game between AI players, recording its events from the start so that it can be replayed.
+    :param player_count: The number of AI players in the game.
+    :param seed: The seed to use for the game.
+    :param turn_budget: The per-turn compute budget for each AI player, in seconds.
+    :return: The state of the new game, and the MoveMaker to make the AI players' moves with.
+    """
+    game_state = GameState()
+    # The simulated game is the one being played, so units' stats are modified by its climate.
+    game_state.climate.apply()
+    game_state.ai_only = True
+    # The game state seeds the random number generator itself, so we seed it again afterwards, and also re-roll the time
+    # until the first night.
+    random.seed(seed)
+    game_state.until_night = random.randint(10, 20)
+    game_state.players = gen_ai_players(player_count)
+    cfg = GameConfig(player_count, game_state.players[0].faction, True, True, True)
+    namer = Namer()
+    # The board and the AI players' settlements are generated from a recorded seed, just as they are in the game.
+    board_seed = random.getrandbits(32)
+    random.seed(board_seed)
+    game_state.board = BoardState(cfg, namer, NullOverlay())
+    game_state.initialise_ais(namer)
+    game_state.board.events.attach(game_state)
+    game_state.board.events.game_started(board_seed, cfg)
+    move_maker = MoveMaker(namer, turn_budget)
+    move_maker.board_ref = game_state.board
+    game_state.game_started = True
+    game_state.on_menu = False
+    return game_state, move_maker
+
+
+def play_turn(game_state: GameState, move_maker: MoveMaker) -> bool:
+    """
+    End the current turn, in the same way as the game does when the player ends theirs, with the heathens and AI players
+    making their moves afterwards.
+    :param game_state: The state of the game.
+    :param move_maker: The MoveMaker to make the AI players' moves with.
+    :return: Whether the game is still ongoing, i.e. whether no victory was achieved.
+    """
+    if not game_state.end_turn():
+        return False
+    with game_state.profiler.measure("process_heathens"):
+        game_state.process_heathens()
+    game_state.process_ais(move_maker)
+    return True
+
+
+def simulate(player_count: int, turns: int, seed: typing.Optional[int] = None,
+             turn_budget: float = math.inf, profile: bool = False) -> SimulationResult:
+    """
+    Simulate a game between AI players, ending each turn in the same way as the game does when the player ends theirs.
+    :param player_count: The number of AI players in the game.
+    :param turns: The maximum number of turns to simulate.
+    :param seed: The seed to use for the game. Note that simulations are only reproducible with an unlimited turn
+    budget, as otherwise the number of units that are fully planned depends on how quickly they can be.
+    :param turn_budget: The per-turn compute budget for each AI player, in seconds.
+    :param profile: Whether to record the time spent in each phase of every turn.
+    :return: The outcome of the simulated game.
+    """
+    game_state, move_maker = new_game(player_count, seed, turn_budget)
+    if profile:
+        # Keep the profiles of every turn, rather than just the most recent ones.
+        game_state.profiler = TurnProfiler(turns)
+        game_state.profiler.toggle()
+
+    start_time = time.perf_counter()
+    for _ in range(turns):
+        if not play_turn(game_state, move_maker):
+            return SimulationResult(game_state.turn - 1, game_state.board.overlay.current_victory,
+                                    time.perf_counter() - start_time, list(game_state.profiler.profiles))
+    return SimulationResult(turns, None, time.perf_counter() - start_time, list(game_state.profiler.profiles))
+
+
+def main(args: typing.Optional[typing.List[str]] = None):
+    """
+    Run a simulation with the supplied command-line arguments, and print its outcome.
+    :param args: The command-line arguments to parse, which default to those supplied to the process.
+    """
+    parser = argparse.ArgumentParser(description="Simulate a game of Microcosm between AI players.")
+    parser.add_argument("--players", type=int, default=8, choices=range(2, len(Faction) + 1),
+                        help="The number of AI players in the game.")
+    parser.add_argument("--turns", type=int, default=500, help="The maximum number of turns to simulate.")
+    parser.add_argument("--seed", type=int, default=None, help="The seed to use for the game.")
+    parser.add_argument("--budget", type=float, default=math.inf,
+                        help="The per-turn compute budget for each AI player, in seconds. Unlimited by default.")
+    parser.add_argument("--profile", default=None,
+                        help="The path to export the time spent in each phase of every turn to, as CSV if the path "
+                             "ends in .csv, and JSON otherwise.")
+    parsed = parser.parse_args(args)
+
+    result = simulate(parsed.players, parsed.turns, parsed.seed, parsed.budget, parsed.profile is not None)
+    if result.victory is not None:
+        print(f"{result.victory.player.name} ({result.victory.player.faction.value}) achieved a "
+              f"{result.victory.type.value} victory on turn {result.turns_played}.")
+    else:
+        print(f"No victory was achieved within {result.turns_played} turns.")
+    print(f"Simulated {result.turns_played} turns in {result.time_elapsed:.2f}s "
+          f"({result.time_elapsed / max(result.turns_played, 1) * 1000:.1f}ms per turn).")
+    if parsed.profile is not None:
+        export = export_csv if parsed.profile.endswith(".csv") else export_json
+        export(result.profiles, parsed.profile)
+        print(f"Exported turn profiles to {parsed.profile}.")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,49 @@
+import unittest
+
+from source.foundation.catalogue import IMPROVEMENTS, PROJECTS, UNIT_PLANS
+from source.foundation.models import AchievementTrigger
+from source.game_management.achievement_tracker import AchievementTracker
+
+
+class AchievementTrackerTest(unittest.TestCase):
+    """
+    The test class for achievement_tracker.py.
+    """
+
+    def setUp(self) -> None:
+        """
+        Initialise a tracker whose initial events have already been taken.
+        """
+        self.achievements = AchievementTracker()
+        self.achievements.take()
+
+    def test_initial(self):
+        """
+        Ensure that every event is considered to have occurred before achievements are first checked.
+        """
+        self.assertSetEqual(set(AchievementTrigger), AchievementTracker().take())
+
+    def test_trigger_take(self):
+        """
+        Ensure that triggered events are taken once each, regardless of how many times they occurred.
+        """
+        self.achievements.trigger(AchievementTrigger.SIEGE_BEGUN)
+        self.achievements.trigger(AchievementTrigger.NIGHTFALL)
+        self.achievements.trigger(AchievementTrigger.SIEGE_BEGUN)
+        self.assertSetEqual({AchievementTrigger.SIEGE_BEGUN, AchievementTrigger.NIGHTFALL}, self.achievements.take())
+        self.assertFalse(self.achievements.take())
+
+    def test_construction_completed(self):
+        """
+        Ensure that completed improvements and units trigger the correct events, and that projects trigger none.
+        """
+        self.achievements.construction_completed(PROJECTS[0])
+        self.assertFalse(self.achievements.take())
+        self.achievements.construction_completed(IMPROVEMENTS[0])
+        self.assertSetEqual({AchievementTrigger.IMPROVEMENT_BUILT}, self.achievements.take())
+        self.achievements.construction_completed(UNIT_PLANS[0])
+        self.assertSetEqual({AchievementTrigger.GARRISON_GREW}, self.achievements.take())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -50,24 +50,17 @@ class AchievementsTest(unittest.TestCase):
         """
         Ensure that verification for the 'Full House' achievement functions as expected.
         """
-        # Make each of the test player's units besieging.
-        for u in self.game_state.players[0].units:
-            u.besieging = True
-        # Position all but one of the test player's units around an enemy settlement.
-        self.TEST_UNIT.location = (self.TEST_SETTLEMENT_2.location[0] - 1, self.TEST_SETTLEMENT_2.location[1] - 1)
-        self.TEST_UNIT_2.location = (self.TEST_SETTLEMENT_2.location[0], self.TEST_SETTLEMENT_2.location[1] - 1)
-        self.TEST_UNIT_3.location = (self.TEST_SETTLEMENT_2.location[0] + 1, self.TEST_SETTLEMENT_2.location[1] - 1)
-        self.TEST_UNIT_4.location = (self.TEST_SETTLEMENT_2.location[0] - 1, self.TEST_SETTLEMENT_2.location[1])
-        self.TEST_UNIT_5.location = (self.TEST_SETTLEMENT_2.location[0] + 1, self.TEST_SETTLEMENT_2.location[1])
-        self.TEST_UNIT_6.location = (self.TEST_SETTLEMENT_2.location[0] - 1, self.TEST_SETTLEMENT_2.location[1] + 1)
-        self.TEST_UNIT_7.location = (self.TEST_SETTLEMENT_2.location[0], self.TEST_SETTLEMENT_2.location[1] + 1)
+        self.game_state.board = Board(GameConfig(2, Faction.INFIDELS, True, True, True), Namer())
+        # Have all but one of the test player's units besiege an enemy settlement.
+        for u in self.game_state.players[0].units[:-1]:
+            self.game_state.board.sieges.begin(u, self.TEST_SETTLEMENT_2)
 
         # Because the enemy settlement is not fully surrounded, the achievement should not be obtained.
         self._verify_achievement(verify_full_house, should_pass=False)
 
-        # However, if we now position the last unit to fill the last gap around the settlement, the achievement should
-        # be obtained.
-        self.TEST_UNIT_8.location = (self.TEST_SETTLEMENT_2.location[0] + 1, self.TEST_SETTLEMENT_2.location[1] + 1)
+        # However, if we now have the last unit join the siege, filling the last gap around the settlement, the
+        # achievement should be obtained.
+        self.game_state.board.sieges.begin(self.TEST_UNIT_8, self.TEST_SETTLEMENT_2)
         self._verify_achievement(verify_full_house, should_pass=True)
 
     def test_its_worth_it(self):
@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from source.saving.autosave_journal import AutosaveJournal, FULL_RECORD, DELTA_RECORD, JournalRecord
+
+
+class AutosaveJournalTest(unittest.TestCase):
+    """
+    The test class for autosave_journal.py.
+    """
+
+    def setUp(self) -> None:
+        """
+        Initialise a journal in a temporary directory.
+        """
+        temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        self.journal = AutosaveJournal(os.path.join(temp_dir.name, "autosave.journal"))
+
+    def test_append_latest(self):
+        """
+        Ensure that appended records are read back, with the latest delta record being read alongside the most recent
+        full record preceding it.
+        """
+        self.assertEqual(0, self.journal.append(FULL_RECORD, b"full-1"))
+        self.journal.append(DELTA_RECORD, b"delta-1")
+        self.journal.append(FULL_RECORD, b"full-2")
+        self.journal.append(DELTA_RECORD, b"delta-2")
+
+        self.assertTupleEqual((b"delta-2", b"full-2"), self.journal.latest())
+        self.journal.append(FULL_RECORD, b"full-3")
+        self.assertTupleEqual((b"full-3", None), self.journal.latest())
+
+    def test_scan_torn(self):
+        """
+        Ensure that scanning stops at a record that has been truncated or whose checksum does not match, and that
+        recovering the journal truncates it there, but reading the latest record without recovering it does not.
+        """
+        self.assertTupleEqual(([], 0), self.journal.scan())
+        self.journal.append(FULL_RECORD, b"full")
+        intact_size = os.path.getsize(self.journal.file_name)
+        self.journal.append(DELTA_RECORD, b"delta")
+        # Corrupt the last byte of the delta record.
+        with open(self.journal.file_name, "r+b") as journal_file:
+            journal_file.seek(-1, os.SEEK_END)
+            journal_file.write(b"!")
+
+        self.assertTupleEqual(([JournalRecord(0, FULL_RECORD, 4)], intact_size), self.journal.scan())
+        self.assertTupleEqual((b"full", None), self.journal.latest(recover=False))
+        self.assertLess(intact_size, os.path.getsize(self.journal.file_name))
+        self.assertEqual(1, len(self.journal.recover()))
+        self.assertEqual(intact_size, os.path.getsize(self.journal.file_name))
+
+        # A header without the rest of its record should also be truncated.
+        with open(self.journal.file_name, "ab") as journal_file:
+            journal_file.write(b"\x10\x00\x00\x00\x00\x00\x00\x00\x00trunc")
+        self.assertTupleEqual((b"full", None), self.journal.latest())
+        self.assertEqual(intact_size, os.path.getsize(self.journal.file_name))
+
+    def test_latest_invalid(self):
+        """
+        Ensure that an error is raised when the journal has no intact records, or no full record for its latest delta
+        record to be applied to.
+        """
+        with self.assertRaises(ValueError):
+            self.journal.latest()
+        self.journal.append(DELTA_RECORD, b"delta")
+        with self.assertRaises(ValueError):
+            self.journal.latest()
+
+    def test_append_failed(self):
+        """
+        Ensure that a journal is recovered before it is appended to again after an append fails, so that the new record
+        follows the intact records rather than a torn one.
+        """
+        self.journal.append(FULL_RECORD, b"full")
+        with patch("os.fsync", side_effect=OSError("Disk full")), self.assertRaises(OSError):
+            self.journal.append(DELTA_RECORD, b"delta")
+        self.assertFalse(self.journal.recovered)
+
+        # Simulate the failed record being torn.
+        with open(self.journal.file_name, "r+b") as journal_file:
+            journal_file.truncate(os.path.getsize(self.journal.file_name) - 2)
+        self.journal.append(DELTA_RECORD, b"delta")
+        self.assertTupleEqual((b"delta", b"full"), self.journal.latest())
+
+    def test_compact(self):
+        """
+        Ensure that compacting the journal removes the records before the given offset, leaving no temporary file.
+        """
+        self.journal.append(FULL_RECORD, b"full-1")
+        self.journal.append(DELTA_RECORD, b"delta-1")
+        offset = self.journal.append(FULL_RECORD, b"full-2")
+        self.journal.append(DELTA_RECORD, b"delta-2")
+
+        self.journal.compact(offset)
+        records, _ = self.journal.scan()
+        self.assertListEqual([FULL_RECORD, DELTA_RECORD], [record.kind for record in records])
+        self.assertTupleEqual((b"delta-2", b"full-2"), self.journal.latest())
+        self.assertListEqual(["autosave.journal"], os.listdir(os.path.dirname(self.journal.file_name)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,319 @@
+import io
+import struct
+import unittest
+from dataclasses import replace
+from unittest.mock import MagicMock, patch
+
+from source.display.board import Board
+from source.foundation import palette
+from source.foundation.catalogue import Namer, get_heathen, IMPROVEMENTS, PROJECTS, UNIT_PLANS, BLESSINGS, \
+    get_available_unit_plans
+from source.foundation.climate import Climate, NightAffinity
+from source.foundation.models import GameConfig, Faction, Settlement, Unit, DeployerUnit, Construction, \
+    OngoingBlessing, VictoryType, HarvestStatus, EconomicStatus, UnitPlan, Biome
+from source.foundation.quad_grid import QuadGrid
+from source.game_management.game_state import GameState
+from source.saving.binary_save import write_save, read_save, SAVE_MAGIC, SAVE_VERSION, SaveSections, delta_base, \
+    read_delta, compressing, open_save, save_magic, DELTA_MAGIC, read_metadata, THUMBNAIL_SIZE
+
+
+def stream(data: bytes) -> io.BufferedReader:
+    """
+    :param data: The bytes of a save.
+    :return: A stream of the given bytes, as if they were being read from a file.
+    """
+    return io.BufferedReader(io.BytesIO(data))
+
+
+class BinarySaveTest(unittest.TestCase):
+    """
+    The test class for binary_save.py.
+    """
+    TEST_CONFIG = GameConfig(3, Faction.NOCTURNE, True, False, True)
+
+    @patch("source.game_management.game_controller.MusicPlayer")
+    def setUp(self, _: MagicMock) -> None:
+        """
+        Initialise a test game state with a populated player, applying its climate, and restoring the default climate
+        after each test.
+        :param _: The unused MusicPlayer mock.
+        """
+        self.game_state = GameState()
+        self.game_state.climate.apply()
+        self.addCleanup(Climate().apply)
+        self.game_state.board = Board(self.TEST_CONFIG, Namer())
+        self.game_state.gen_players(self.TEST_CONFIG)
+        self.game_state.turn = 45
+        self.game_state.until_night = 0
+        self.game_state.nighttime_left = 3
+        self.game_state.heathens = [get_heathen((3, 4), 45)]
+
+        self.player = self.game_state.players[0]
+        self.player.wealth = 123.5
+        self.player.blessings = [BLESSINGS["beg_spl"], BLESSINGS["sl_vau"]]
+        self.player.ongoing_blessing = OngoingBlessing(BLESSINGS["inh_luc"], 12.5)
+        self.player.imminent_victories = {VictoryType.ELIMINATION, VictoryType.SERENDIPITY}
+        self.player.quads_seen = {(1, 2), (3, 4), (-1, 95)}
+        nocturne_plan = UnitPlan(100, 100, 3, "Warrior", None, 0, night_affinity=NightAffinity.NOCTURNE)
+        self.passenger = Unit(50, 1, (10, 10), False, nocturne_plan, has_acted=True)
+        self.deployer = DeployerUnit(80, 8, (10, 10), False, UNIT_PLANS[9], besieging=True,
+                                     passengers=[self.passenger])
+        self.player.units = [self.deployer]
+        # The settlement is recruiting a unit with stats modified by the player's faction.
+        recruited_plan = get_available_unit_plans(self.player, 5)[-1]
+        self.settlement = Settlement("Binaria", (20, 30), [IMPROVEMENTS[0], IMPROVEMENTS[5]],
+                                     [self.game_state.board.quads[30][20], self.game_state.board.quads[30][21]],
+                                     [Unit(100, 3, (20, 30), True, UNIT_PLANS[0])], satisfaction=75,
+                                     current_work=Construction(recruited_plan, 20), level=5, harvest_reserves=300,
+                                     harvest_status=HarvestStatus.PLENTIFUL, economic_status=EconomicStatus.BOOM,
+                                     besieged=True)
+        self.player.settlements = [self.settlement]
+        other_settlements = [
+            Settlement("Imp", (40, 40), [], [self.game_state.board.quads[40][40]], [],
+                       current_work=Construction(IMPROVEMENTS[3], 5)),
+            Settlement("Prj", (50, 50), [], [self.game_state.board.quads[50][50]], [],
+                       current_work=Construction(PROJECTS[2])),
+        ]
+        self.game_state.players[1].settlements = other_settlements
+        self.game_state.players[2].eliminated = True
+        self.game_state.board.quads[5][6].is_relic = True
+
+    def test_round_trip(self):
+        """
+        Ensure that a game state is identical once written and read back.
+        """
+        loaded = GameState()
+        quads, cfg, event_log = read_save(stream(write_save(self.game_state, ("events-test.jsonl", 12))), loaded)
+
+        self.assertEqual(self.TEST_CONFIG, cfg)
+        self.assertTupleEqual(("events-test.jsonl", 12), event_log)
+        self.assertEqual(self.game_state.board.quads, quads)
+        self.assertListEqual(self.game_state.players, loaded.players)
+        self.assertListEqual(self.game_state.heathens, loaded.heathens)
+        self.assertEqual(45, loaded.turn)
+        self.assertEqual(0, loaded.until_night)
+        self.assertEqual(3, loaded.nighttime_left)
+
+    def test_references(self):
+        """
+        Ensure that catalogue entries are restored as references to the catalogue, that settlements share the quads of
+        the board, and that deployer units are restored with their passengers.
+        """
+        loaded = GameState()
+        quads, _, event_log = read_save(stream(write_save(self.game_state, None)), loaded)
+        player = loaded.players[0]
+        setl = player.settlements[0]
+
+        self.assertIsNone(event_log)
+        self.assertIs(IMPROVEMENTS[5], setl.improvements[1])
+        self.assertIs(BLESSINGS["sl_vau"], player.blessings[1])
+        self.assertIs(BLESSINGS["inh_luc"], player.ongoing_blessing.blessing)
+        self.assertIs(PROJECTS[2], loaded.players[1].settlements[1].current_work.construction)
+        self.assertIs(quads[30][21], setl.quads[1])
+        self.assertIsInstance(player.units[0], DeployerUnit)
+        self.assertEqual(3, player.units[0].plan.max_capacity)
+        self.assertEqual(self.passenger, player.units[0].passengers[0])
+        # Unit plans not in the catalogue, i.e. those of heathens, are restored from their name.
+        self.assertEqual("Heathen+", loaded.heathens[0].plan.name)
+
+    def test_base_stats(self):
+        """
+        Ensure that units' base stats are saved rather than their stats as modified by the climate, and that the climate
+        is restored when the save is read.
+        """
+        self.game_state.climate.reset(is_night=True, has_dawned=True)
+        save = write_save(self.game_state, None)
+
+        loaded = GameState()
+        read_save(stream(save), loaded)
+        self.assertTrue(loaded.climate.is_night)
+        self.assertTrue(loaded.climate.has_dawned)
+        with loaded.climate.unmodified():
+            self.assertEqual(100, loaded.players[0].units[0].passengers[0].plan.power)
+            self.assertEqual(90, loaded.heathens[0].plan.power)
+        # Modifiers should apply again once the game has been saved, with the climate of the saved game still applied.
+        self.assertFalse(self.game_state.climate.suspended)
+        self.assertIs(self.game_state.climate, Climate.current)
+
+    def test_byte_order(self):
+        """
+        Ensure that packed arrays are byte-swapped when written and read on big-endian platforms, so that saves are
+        always little-endian.
+        """
+        save = write_save(self.game_state, None)
+        with patch("source.saving.binary_save.sys") as sys_mock:
+            sys_mock.byteorder = "big"
+            big_endian_save = write_save(self.game_state, None)
+            loaded = GameState()
+            quads, _, _ = read_save(stream(big_endian_save), loaded)
+
+        # This platform is actually little-endian, so the swapped arrays differ, but are swapped back when read.
+        self.assertNotEqual(save, big_endian_save)
+        self.assertEqual(self.game_state.board.quads, quads)
+        self.assertListEqual(self.game_state.players, loaded.players)
+
+    def test_lazy_quads(self):
+        """
+        Ensure that only the quads that are accessed are materialised when a save is read, and that those quads, along
+        with any changes made to them, are written when the loaded game is saved again.
+        """
+        loaded = GameState()
+        quads, _, _ = read_save(stream(write_save(self.game_state, None)), loaded)
+        # Only the quads of the players' settlements are accessed while reading the save.
+        setl_quads = [quad for player in loaded.players for setl in player.settlements for quad in setl.quads]
+        self.assertIsInstance(quads, QuadGrid)
+        self.assertListEqual(setl_quads, quads.materialised)
+
+        loaded.board = MagicMock(quads=quads, game_config=self.TEST_CONFIG)
+        quads[7][8].fortune = 42
+        quads[9][10].biome = Biome.DESERT
+        self.game_state.board.quads[7][8].fortune = 42
+        self.game_state.board.quads[9][10].biome = Biome.DESERT
+        self.assertEqual(SaveSections(self.game_state, None).quads, SaveSections(loaded, None).quads)
+
+    def test_delta(self):
+        """
+        Ensure that delta saves only include what has changed since the full save they are against, and that applying
+        them to the full save restores the game state.
+        """
+        base = SaveSections(self.game_state, None)
+        full_save = b"".join(base.full())
+        self.game_state.turn += 1
+        self.game_state.board.quads[5][6].is_relic = False
+        self.game_state.players[1].wealth += 10
+        self.game_state.heathens[0].location = (4, 4)
+        delta_save = b"".join(SaveSections(self.game_state, ("events-test.jsonl", 15)).delta(base, "autosave-base.sav"))
+        self.assertLess(len(delta_save) * 10, len(full_save))
+
+        # Full saves should be left unread when determining whether they are delta saves.
+        full_stream = stream(full_save)
+        self.assertIsNone(delta_base(full_stream))
+        self.assertEqual(SAVE_MAGIC, save_magic(full_stream))
+        delta_stream = stream(delta_save)
+        self.assertEqual(DELTA_MAGIC, save_magic(delta_stream))
+        self.assertEqual("autosave-base.sav", delta_base(delta_stream))
+
+        loaded = GameState()
+        quads, cfg, event_log = read_delta(delta_stream, full_stream, loaded)
+        self.assertEqual(self.TEST_CONFIG, cfg)
+        self.assertTupleEqual(("events-test.jsonl", 15), event_log)
+        self.assertEqual(46, loaded.turn)
+        self.assertEqual(self.game_state.board.quads, quads)
+        self.assertListEqual(self.game_state.players, loaded.players)
+        self.assertListEqual(self.game_state.heathens, loaded.heathens)
+        # Unchanged players should still refer to the quads of the board.
+        self.assertIs(quads[30][20], loaded.players[0].settlements[0].quads[0])
+
+    def test_delta_quads(self):
+        """
+        Ensure that changes to any part of a quad are included in delta saves.
+        """
+        base = SaveSections(self.game_state, None)
+        self.game_state.board.quads[0][1].biome = Biome.MOUNTAIN
+        self.game_state.board.quads[2][3].fortune = 99
+        self.game_state.board.quads[4][5].selected = True
+
+        delta_stream = stream(b"".join(SaveSections(self.game_state, None).delta(base, "autosave-base.sav")))
+        delta_base(delta_stream)
+
+        loaded = GameState()
+        quads, _, _ = read_delta(delta_stream, stream(b"".join(base.full())), loaded)
+        self.assertEqual(self.game_state.board.quads, quads)
+
+    def test_delta_mismatched(self):
+        """
+        Ensure that delta saves are rejected if they do not have the same players as their full save.
+        """
+        base = SaveSections(self.game_state, None)
+        delta_stream = stream(b"".join(SaveSections(self.game_state, None).delta(base, "autosave-base.sav")))
+        delta_base(delta_stream)
+        self.game_state.players.pop()
+
+        with self.assertRaises(ValueError):
+            read_delta(delta_stream, stream(write_save(self.game_state, None)), GameState())
+
+    def test_header(self):
+        """
+        Ensure that saves begin with the header identifying the format and its version, and that saves from newer
+        versions of the format or with invalid data are rejected.
+        """
+        save = write_save(self.game_state, None)
+        self.assertTrue(save.startswith(SAVE_MAGIC + struct.pack("<H", SAVE_VERSION)))
+
+        with self.assertRaises(ValueError):
+            read_save(stream(SAVE_MAGIC + struct.pack("<H", SAVE_VERSION + 1) + save[6:]), GameState())
+        with self.assertRaises(ValueError):
+            read_save(stream(save[:200]), GameState())
+        with self.assertRaises(ValueError):
+            read_save(stream(save[:10]), GameState())
+
+    def test_metadata(self):
+        """
+        Ensure that the metadata at the start of full and delta saves can be read without reading the rest of the save,
+        and that saves without metadata are identified.
+        """
+        sections = SaveSections(self.game_state, None)
+        full_save = b"".join(sections.full())
+        delta_save = b"".join(sections.delta(sections, "autosave-base.sav"))
+
+        for save in [full_save, delta_save]:
+            save_stream = stream(save)
+            metadata = read_metadata(save_stream)
+            self.assertEqual(SAVE_VERSION, metadata.version)
+            self.assertEqual(45, metadata.turn)
+            self.assertEqual(Faction.NOCTURNE, metadata.player_faction)
+            self.assertEqual(3, metadata.player_count)
+            self.assertTupleEqual((100, 90), metadata.map_size)
+            self.assertListEqual([THUMBNAIL_SIZE[0]] * THUMBNAIL_SIZE[1], [len(row) for row in metadata.thumbnail])
+            # Only the header and metadata should have been read.
+            self.assertEqual(len(sections.metadata) + 6, save_stream.tell())
+
+        # Saves from the first version of the format have no metadata, nor do JSON saves.
+        old_save = SAVE_MAGIC + struct.pack("<H", 1) + full_save[len(sections.metadata) + 6:]
+        self.assertIsNone(read_metadata(stream(old_save)))
+        loaded = GameState()
+        read_save(stream(old_save), loaded)
+        self.assertListEqual(self.game_state.players, loaded.players)
+        self.assertIsNone(read_metadata(stream(b'{"quads": []}')))
+
+    def test_thumbnail(self):
+        """
+        Ensure that save thumbnails depict the biomes of the board and the settlements on it, hiding the parts of the
+        board the player has not seen if fog of war is enabled.
+        """
+        self.game_state.board.quads[2][2].biome = Biome.SEA
+        thumbnail = read_metadata(stream(write_save(self.game_state, None))).thumbnail
+        self.assertEqual(palette.COLOR_DARK_BLUE, thumbnail[0][0])
+        # The player's settlement at (20, 30) is in the pixel depicting the quads from (20, 30) to (24, 34).
+        self.assertEqual(self.player.colour, thumbnail[6][4])
+
+        self.game_state.board.game_config = replace(self.TEST_CONFIG, fog_of_war=True)
+        self.player.quads_seen = {(2, 2)}
+        thumbnail = read_metadata(stream(write_save(self.game_state, None))).thumbnail
+        self.assertEqual(palette.COLOR_DARK_BLUE, thumbnail[0][0])
+        self.assertEqual(palette.COLOR_BLACK, thumbnail[6][4])
+        self.assertEqual(palette.COLOR_BLACK, thumbnail[0][1])
+
+    def test_compression(self):
+        """
+        Ensure that saves are compressed as they are written, always to the same bytes, and that both compressed and
+        uncompressed saves are read.
+        """
+        save = write_save(self.game_state, None)
+        compressed = []
+        for _ in range(2):
+            save_file = io.BytesIO()
+            with compressing(save_file) as compressed_stream:
+                for chunk in SaveSections(self.game_state, None).full():
+                    compressed_stream.write(chunk)
+            compressed.append(save_file.getvalue())
+
+        self.assertEqual(compressed[0], compressed[1])
+        self.assertLess(len(compressed[0]), len(save))
+        for save_data in [compressed[0], save]:
+            with open_save(stream(save_data)) as save_stream:
+                self.assertEqual(save, save_stream.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
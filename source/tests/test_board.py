@@ -996,6 +996,21 @@ class BoardTest(unittest.TestCase):
         self.board.process_left_click(5, 5, True, self.TEST_PLAYER, (4, 4), [], [], [], [])
         self.assertTupleEqual((4, 4), self.TEST_UNIT.location)
 
+    def test_left_click_move_unit_out_of_siege(self):
+        """
+        Ensure that when a player's unit that is besieging a settlement is moved away from it, its siege ends and this
+        is recorded in the event log.
+        """
+        self.board.events = MagicMock()
+        self.board.sieges.begin(self.TEST_UNIT, self.TEST_ENEMY_SETTLEMENT)
+        self.board.selected_unit = self.TEST_UNIT
+
+        self.board.process_left_click(5, 5, True, self.TEST_PLAYER, (4, 4), [], [], [], [])
+        self.assertTupleEqual((4, 4), self.TEST_UNIT.location)
+        self.assertFalse(self.TEST_UNIT.besieging)
+        self.board.events.unit_moved.assert_called_with(self.TEST_UNIT)
+        self.board.events.siege_ended.assert_called_with(self.TEST_UNIT)
+
     def test_left_click_move_unit_into_siege(self):
         """
         Ensure that when a player's unit is moved within range of an enemy settlement currently under siege, the unit's
@@ -5,9 +5,10 @@ from unittest.mock import patch, MagicMock
 from source.foundation.catalogue import UNIT_PLANS, BLESSINGS, PROJECTS
 from source.foundation.models import Biome, Unit, AttackData, HealData, Settlement, SetlAttackData, Player, Faction, \
     Construction, Improvement, ImprovementType, Effect, UnitPlan, GameConfig, InvestigationResult, OngoingBlessing, \
-    Quad, EconomicStatus, HarvestStatus, DeployerUnitPlan, DeployerUnit
+    Quad, EconomicStatus, HarvestStatus, DeployerUnitPlan, DeployerUnit, NightAffinity, AIPlaystyle, AttackPlaystyle, \
+    ExpansionPlaystyle
 from source.util.calculator import calculate_yield_for_quad, clamp, attack, heal, attack_setl, complete_construction, \
-    investigate_relic, get_player_totals, get_setl_totals, gen_spiral_indices
+    investigate_relic, get_player_totals, get_setl_totals, gen_spiral_indices, get_night_affinity
 
 
 class CalculatorTest(unittest.TestCase):
@@ -502,6 +503,28 @@ class CalculatorTest(unittest.TestCase):
         self.assertTrue(isinstance(test_setl.garrison[0], DeployerUnit))
         self.assertIsNone(test_setl.current_work)
 
+    def test_complete_construction_nocturne_unit(self):
+        """
+        Ensure that units recruited by a human player of The Nocturne have the corresponding night affinity, and that
+        the original plan is left untouched.
+        """
+        test_unit_plan = UnitPlan(20, 20, 10, "Nightwatch", None, 1)
+        test_setl = Settlement("Working", (50, 50), [], [], [], current_work=Construction(test_unit_plan))
+        test_player = Player("Tester", Faction.NOCTURNE, 0, settlements=[test_setl])
+
+        complete_construction(test_setl, test_player)
+        self.assertEqual(NightAffinity.NOCTURNE, test_setl.garrison[0].plan.night_affinity)
+        self.assertIsNone(test_unit_plan.night_affinity)
+
+    def test_get_night_affinity(self):
+        """
+        Ensure that only the units of human players of The Nocturne have an affinity for the night.
+        """
+        self.assertEqual(NightAffinity.NOCTURNE, get_night_affinity(Player("Tester", Faction.NOCTURNE, 0)))
+        test_ai_playstyle = AIPlaystyle(AttackPlaystyle.NEUTRAL, ExpansionPlaystyle.NEUTRAL)
+        self.assertIsNone(get_night_affinity(Player("Tester", Faction.NOCTURNE, 0, ai_playstyle=test_ai_playstyle)))
+        self.assertIsNone(get_night_affinity(Player("Tester", Faction.FRONTIERSMEN, 0)))
+
     @patch("random.randint")
     def test_investigate_relic_scrutineers(self, random_mock: MagicMock):
         """
@@ -4,7 +4,8 @@ import unittest
 from source.foundation.catalogue import Namer, SETL_NAMES, get_heathen_plan, get_heathen, UNIT_PLANS, \
     get_default_unit, get_available_improvements, BLESSINGS, IMPROVEMENTS, get_available_blessings, \
     get_all_unlockable, get_improvement, PROJECTS, get_project, get_blessing, get_unit_plan, get_available_unit_plans
-from source.foundation.models import Biome, UnitPlan, Heathen, Unit, Player, Faction, Settlement, Improvement
+from source.foundation.models import Biome, UnitPlan, Heathen, Unit, Player, Faction, Settlement, Improvement, \
+    NightAffinity
 
 
 class CatalogueTest(unittest.TestCase):
@@ -94,6 +95,14 @@ class CatalogueTest(unittest.TestCase):
         self.assertEqual(test_loc, unit.location)
         self.assertTrue(unit.garrisoned)
         self.assertEqual(expected_plan, unit.plan)
+        # The plan should be a copy, with no night affinity by default.
+        self.assertIsNot(expected_plan, unit.plan)
+        self.assertIsNone(unit.plan.night_affinity)
+
+        # Units can also be given a night affinity, without affecting the original plan.
+        nocturne_unit: Unit = get_default_unit(test_loc, NightAffinity.NOCTURNE)
+        self.assertEqual(NightAffinity.NOCTURNE, nocturne_unit.plan.night_affinity)
+        self.assertIsNone(expected_plan.night_affinity)
 
     def test_available_improvements(self):
         """
@@ -0,0 +1,153 @@
+import unittest
+from copy import deepcopy
+
+from source.foundation.climate import Climate, NightAffinity, ClimaticStat
+from source.foundation.models import UnitPlan, Unit
+
+
+class ClimateTest(unittest.TestCase):
+    """
+    The test class for climate.py.
+    """
+
+    def setUp(self) -> None:
+        """
+        Initialise a test unit of The Nocturne, and apply a test climate, restoring the default climate after each test.
+        """
+        self.climate = Climate()
+        self.climate.apply()
+        self.addCleanup(Climate().apply)
+        self.plan = UnitPlan(100, 50, 5, "Night Owl", None, 25, night_affinity=NightAffinity.NOCTURNE)
+        self.unit = Unit(40, 5, (1, 1), False, self.plan)
+
+    def test_multiplier(self):
+        """
+        Ensure that the correct multipliers are applied for each affinity and stat, in each part of the day.
+        """
+        self.climate.reset()
+        # Before the first night, no units are affected.
+        self.assertEqual(1, self.climate.multiplier(NightAffinity.HEATHEN, "power"))
+        self.assertEqual(1, self.climate.multiplier(NightAffinity.NOCTURNE, "power"))
+
+        self.climate.reset(is_night=True)
+        # At night, only power is increased.
+        self.assertEqual(2, self.climate.multiplier(NightAffinity.HEATHEN, "power"))
+        self.assertEqual(2, self.climate.multiplier(NightAffinity.NOCTURNE, "power"))
+        self.assertEqual(1, self.climate.multiplier(NightAffinity.NOCTURNE, "max_health"))
+        # Units without an affinity are never affected.
+        self.assertEqual(1, self.climate.multiplier(None, "power"))
+
+        self.climate.reset(has_dawned=True)
+        # Once a night has passed, units of The Nocturne are weakened during the day, but heathens are not.
+        self.assertEqual(1, self.climate.multiplier(NightAffinity.HEATHEN, "power"))
+        self.assertEqual(0.5, self.climate.multiplier(NightAffinity.NOCTURNE, "power"))
+        self.assertEqual(0.5, self.climate.multiplier(NightAffinity.NOCTURNE, "total_stamina"))
+
+    def test_unmodified(self):
+        """
+        Ensure that base stats are read while modifiers are suspended, and that modifiers apply again afterwards.
+        """
+        self.climate.reset(is_night=True)
+        with self.climate.unmodified():
+            self.assertEqual(100, self.plan.power)
+        self.assertEqual(200, self.plan.power)
+
+    def test_stats(self):
+        """
+        Ensure that stats are modified when read, with whole number stats being rounded.
+        """
+        self.climate.reset(has_dawned=True)
+        self.assertEqual(50, self.plan.power)
+        self.assertEqual(25, self.plan.max_health)
+        # Half of 5 rounds to 2.
+        self.assertEqual(2, self.plan.total_stamina)
+
+    def test_set_stats(self):
+        """
+        Ensure that setting a modified stat updates the base stat proportionally.
+        """
+        self.climate.reset(is_night=True)
+        self.plan.power = 300
+        self.assertEqual(300, self.plan.power)
+
+        self.climate.reset()
+        self.assertEqual(150, self.plan.power)
+
+    def test_health(self):
+        """
+        Ensure that a unit's health is modified in the same way as its plan's maximum health, including when set.
+        """
+        self.climate.reset(has_dawned=True)
+        self.assertEqual(20, self.unit.health)
+
+        self.unit.health = 25
+        self.assertEqual(25, self.unit.health)
+        self.assertEqual(self.unit.plan.max_health, self.unit.health)
+
+        self.climate.reset()
+        self.assertEqual(50, self.unit.health)
+
+    def test_class_access(self):
+        """
+        Ensure that the descriptor itself is retrieved when stats are accessed on the class rather than instances, and
+        that the stats are still required when creating plans.
+        """
+        self.assertIsInstance(UnitPlan.power, ClimaticStat)
+        self.assertEqual("max_health", UnitPlan.max_health.name)
+        self.assertTrue(UnitPlan.total_stamina.rounded)
+        with self.assertRaises(TypeError):
+            UnitPlan("Night Owl", None, 25)  # pylint: disable=no-value-for-parameter
+
+    def test_applied(self):
+        """
+        Ensure that stats are modified by the applied climate, and that the previous climate is applied again once a
+        temporarily-applied climate has been left.
+        """
+        self.climate.reset(is_night=True)
+        other_climate = Climate()
+        with other_climate.applied():
+            self.assertIs(other_climate, Climate.current)
+            self.assertEqual(100, self.plan.power)
+        self.assertIs(self.climate, Climate.current)
+        self.assertEqual(200, self.plan.power)
+
+        # Even when suspending the modifiers of a climate that has not been applied, the applied climate is restored.
+        with other_climate.unmodified():
+            self.assertEqual(100, self.plan.power)
+        self.assertIs(self.climate, Climate.current)
+        self.assertFalse(other_climate.suspended)
+
+    def test_nights_and_days(self):
+        """
+        Ensure that units of The Nocturne have their full health and stamina again at night once a night has passed,
+        and that units created during the day once a night has passed are weakened straight away.
+        """
+        self.climate.reset(has_dawned=True)
+        self.assertEqual(25, self.plan.max_health)
+        self.assertEqual(2, self.plan.total_stamina)
+
+        self.climate.is_night = True
+        self.assertEqual(50, self.plan.max_health)
+        self.assertEqual(5, self.plan.total_stamina)
+        self.assertEqual(40, self.unit.health)
+
+        self.climate.is_night = False
+        new_plan = UnitPlan(100, 50, 5, "Night Owlet", None, 25, night_affinity=NightAffinity.NOCTURNE)
+        new_unit = Unit(50, 5, (2, 2), False, new_plan)
+        self.assertEqual(50, new_plan.power)
+        self.assertEqual(25, new_unit.health)
+
+    def test_copy(self):
+        """
+        Ensure that copied plans retain their base stats.
+        """
+        self.climate.reset(is_night=True)
+        copied_plan: UnitPlan = deepcopy(self.plan)
+        self.assertEqual(self.plan, copied_plan)
+
+        self.climate.reset()
+        self.assertEqual(100, copied_plan.power)
+
+
+if __name__ == '__main__':
+    unittest.main()
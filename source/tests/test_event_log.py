@@ -0,0 +1,198 @@
+import os
+import tempfile
+import unittest
+
+from source.foundation.catalogue import BLESSINGS, get_improvement
+from source.foundation.models import GameConfig, Faction, AIPlaystyle, AttackPlaystyle, ExpansionPlaystyle, Player, \
+    Unit, UnitPlan, DeployerUnit, DeployerUnitPlan, Heathen, Settlement, OngoingBlessing, Construction, \
+    InvestigationResult, GameStartedEvent, TurnEndedEvent, SettlementFoundedEvent, BlessingSetEvent, \
+    ConstructionSetEvent, ConstructionBoughtOutEvent, UnitMovedEvent, UnitDeployedEvent, PassengerDeployedEvent, \
+    UnitGarrisonedEvent, UnitBoardedEvent, UnitAttackedEvent, SettlementAttackedEvent, UnitHealedEvent, \
+    SiegeBegunEvent, SiegeEndedEvent, RelicInvestigatedEvent, UnitDisbandedEvent
+from source.game_management.event_log import EventLog, encode_event, decode_event, HEATHEN_OWNER
+from source.game_management.game_state import GameState
+
+
+class EventLogTest(unittest.TestCase):
+    """
+    The test class for event_log.py.
+    """
+    TEST_CONFIG = GameConfig(2, Faction.AGRICULTURISTS, True, False, True)
+
+    def setUp(self) -> None:
+        """
+        Initialise a game state with two players and a heathen, and an event log attached to it.
+        """
+        self.TEST_UNIT = Unit(100, 3, (10, 10), False, UnitPlan(100, 100, 3, "Warrior", None, 25))
+        self.TEST_UNIT_2 = Unit(100, 3, (10, 10), False, UnitPlan(100, 100, 3, "Warrior", None, 25))
+        self.TEST_DEPLOYER = DeployerUnit(100, 3, (20, 20), False, DeployerUnitPlan(0, 100, 3, "Boat", None, 50))
+        self.TEST_HEATHEN = Heathen(100, 2, (30, 30), UnitPlan(80, 80, 2, "Heathen", None, 0))
+        self.TEST_SETTLEMENT = Settlement("Numero Uno", (40, 40), [], [], [])
+        self.TEST_SETTLEMENT_2 = Settlement("Numero Dos", (50, 50), [], [], [])
+        self.game_state = GameState()
+        self.game_state.players = [
+            Player("The Chosen One", Faction.AGRICULTURISTS, 0, units=[self.TEST_UNIT, self.TEST_DEPLOYER],
+                   settlements=[self.TEST_SETTLEMENT]),
+            Player("NPC1", Faction.GODLESS, 0, units=[self.TEST_UNIT_2], settlements=[self.TEST_SETTLEMENT_2],
+                   ai_playstyle=AIPlaystyle(AttackPlaystyle.AGGRESSIVE, ExpansionPlaystyle.HERMIT))
+        ]
+        self.game_state.heathens = [self.TEST_HEATHEN]
+        self.log = EventLog()
+        self.log.attach(self.game_state)
+
+    def test_encode_decode(self):
+        """
+        Ensure that events of every kind are encoded compactly, and decoded back into identical events.
+        """
+        events = [
+            GameStartedEvent(123, 15, self.TEST_CONFIG,
+                             [("The Chosen One", Faction.AGRICULTURISTS, None),
+                              ("NPC1", Faction.GODLESS, AIPlaystyle(AttackPlaystyle.AGGRESSIVE,
+                                                                    ExpansionPlaystyle.HERMIT))]),
+            SettlementFoundedEvent(0, "Numero Uno", (40, 40), None),
+            SettlementFoundedEvent(1, "Numero Dos", (50, 50), 2),
+            UnitAttackedEvent((0, 0), (HEATHEN_OWNER, 0), False),
+            RelicInvestigatedEvent((1, 0), (5, 6), InvestigationResult.FORTUNE)
+        ]
+        for event in events:
+            self.assertEqual(event, decode_event(encode_event(event)))
+        self.assertEqual('["UnitAttackedEvent",[0,0],[-1,0],false]', encode_event(events[3]))
+
+    def test_unattached(self):
+        """
+        Ensure that nothing is recorded by a log that has not been attached to a game state.
+        """
+        log = EventLog()
+        log.game_started(1, self.TEST_CONFIG)
+        log.turn_ended(1)
+        log.unit_moved(self.TEST_UNIT)
+        log.track(self.TEST_UNIT)
+        self.TEST_UNIT.location = 11, 11
+        log.untrack()
+        self.assertFalse(log.events)
+
+    def test_record(self):
+        """
+        Ensure that each kind of event is recorded with the correct references to players, units, and settlements.
+        """
+        self.game_state.players[0].ongoing_blessing = OngoingBlessing(BLESSINGS["beg_spl"])
+        self.TEST_SETTLEMENT.current_work = Construction(get_improvement("Melting Pot"))
+
+        self.log.game_started(123, self.TEST_CONFIG)
+        self.log.turn_ended(456)
+        self.log.settlement_founded(self.game_state.players[0], self.TEST_SETTLEMENT)
+        self.log.settlement_founded(self.game_state.players[1], self.TEST_SETTLEMENT_2, self.TEST_UNIT_2)
+        self.log.blessing_set(self.game_state.players[0])
+        self.log.construction_set(self.TEST_SETTLEMENT)
+        self.log.construction_bought_out(self.TEST_SETTLEMENT)
+        self.log.unit_moved(self.TEST_UNIT)
+        self.log.unit_deployed(self.TEST_SETTLEMENT, 2, self.TEST_UNIT)
+        self.log.passenger_deployed(self.TEST_DEPLOYER, 1, self.TEST_UNIT)
+        self.log.unit_garrisoned(self.TEST_UNIT, self.TEST_SETTLEMENT)
+        self.log.unit_boarded(self.TEST_UNIT, self.TEST_DEPLOYER)
+        self.log.unit_attacked(self.TEST_UNIT, self.TEST_HEATHEN, ai=False)
+        self.log.settlement_attacked(self.TEST_UNIT, self.TEST_SETTLEMENT_2)
+        self.log.unit_healed(self.TEST_UNIT_2, self.TEST_UNIT_2)
+        self.log.siege_begun(self.TEST_UNIT, self.TEST_SETTLEMENT_2)
+        self.log.siege_ended(self.TEST_UNIT)
+        self.log.relic_investigated(self.TEST_UNIT, (5, 6), InvestigationResult.VISION)
+        self.log.unit_disbanded(self.TEST_DEPLOYER)
+
+        self.assertListEqual([
+            GameStartedEvent(123, self.game_state.until_night, self.TEST_CONFIG,
+                             [("The Chosen One", Faction.AGRICULTURISTS, None),
+                              ("NPC1", Faction.GODLESS, self.game_state.players[1].ai_playstyle)]),
+            TurnEndedEvent(456),
+            SettlementFoundedEvent(0, "Numero Uno", (40, 40), None),
+            SettlementFoundedEvent(1, "Numero Dos", (50, 50), 0),
+            BlessingSetEvent(0, BLESSINGS["beg_spl"].name),
+            ConstructionSetEvent((0, 0), "Melting Pot"),
+            ConstructionBoughtOutEvent((0, 0)),
+            UnitMovedEvent((0, 0), (10, 10), 3),
+            UnitDeployedEvent((0, 0), 2, (10, 10)),
+            PassengerDeployedEvent((0, 1), 1, (10, 10)),
+            UnitGarrisonedEvent((0, 0), (0, 0), 3),
+            UnitBoardedEvent((0, 0), (0, 1), 3),
+            UnitAttackedEvent((0, 0), (HEATHEN_OWNER, 0), False),
+            SettlementAttackedEvent((0, 0), (1, 0)),
+            UnitHealedEvent((1, 0), (1, 0)),
+            SiegeBegunEvent((0, 0), (1, 0)),
+            SiegeEndedEvent((0, 0)),
+            RelicInvestigatedEvent((0, 0), (5, 6), InvestigationResult.VISION),
+            UnitDisbandedEvent((0, 1))
+        ], self.log.events)
+
+    def test_refs(self):
+        """
+        Ensure that players, units, heathens and settlements are referred to by their current positions, even once those
+        positions have changed.
+        """
+        self.assertEqual(1, self.log.player_idx(self.game_state.players[1]))
+        self.assertTupleEqual((0, 1), self.log.unit_ref(self.TEST_DEPLOYER))
+        self.assertTupleEqual((HEATHEN_OWNER, 0), self.log.unit_ref(self.TEST_HEATHEN))
+        self.assertTupleEqual((1, 0), self.log.setl_ref(self.TEST_SETTLEMENT_2))
+
+        # Removing the unit and settlement before them, and reordering the players, should change their positions.
+        self.game_state.players[0].units.remove(self.TEST_UNIT)
+        self.game_state.players[0].settlements = []
+        self.game_state.players[1].settlements.insert(0, self.TEST_SETTLEMENT)
+        self.game_state.players.reverse()
+        self.assertEqual(0, self.log.player_idx(self.game_state.players[0]))
+        self.assertTupleEqual((1, 0), self.log.unit_ref(self.TEST_DEPLOYER))
+        self.assertTupleEqual((0, 0), self.log.unit_ref(self.TEST_UNIT_2))
+        self.assertTupleEqual((HEATHEN_OWNER, 0), self.log.unit_ref(self.TEST_HEATHEN))
+        self.assertTupleEqual((0, 1), self.log.setl_ref(self.TEST_SETTLEMENT_2))
+
+        # Distinct units that are equal should still be told apart.
+        equal_unit = Unit(100, 3, (10, 10), False, UnitPlan(100, 100, 3, "Warrior", None, 25))
+        self.game_state.players[0].units.append(equal_unit)
+        self.assertTupleEqual((0, 1), self.log.unit_ref(equal_unit))
+        self.assertTupleEqual((0, 0), self.log.unit_ref(self.TEST_UNIT_2))
+
+    def test_track(self):
+        """
+        Ensure that the move of a tracked unit is recorded before any action it takes, and only if it actually moved.
+        """
+        # Units that do not move at all should not have a move recorded.
+        self.log.track(self.TEST_UNIT)
+        self.log.untrack()
+        self.assertFalse(self.log.events)
+
+        # Even units that have no valid location to move to use up their stamina.
+        self.log.track(self.TEST_UNIT)
+        self.TEST_UNIT.remaining_stamina = 0
+        self.log.untrack()
+        self.assertListEqual([UnitMovedEvent((0, 0), (10, 10), 0)], self.log.events)
+
+        # Units that move and then act should have their move recorded first, and only once.
+        self.log.track(self.TEST_UNIT_2)
+        self.TEST_UNIT_2.location = 9, 9
+        self.log.unit_attacked(self.TEST_UNIT_2, self.TEST_UNIT, ai=True)
+        self.log.untrack()
+        self.assertListEqual([UnitMovedEvent((1, 0), (9, 9), 3), UnitAttackedEvent((1, 0), (0, 0), True)],
+                             self.log.events[1:])
+
+    def test_write_read(self):
+        """
+        Ensure that only new events are appended to the log's file when it is written, and that reading the log keeps
+        only the events included in the save, with them being written to a new file next time.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.log.file_name = "events-test.jsonl"
+            self.log.turn_ended(1)
+            self.log.write(temp_dir)
+            self.log.turn_ended(2)
+            self.log.turn_ended(3)
+            self.log.write(temp_dir)
+            with open(os.path.join(temp_dir, "events-test.jsonl"), "r", encoding="utf-8") as log_file:
+                self.assertEqual(3, len(log_file.readlines()))
+
+            log = EventLog()
+            log.read(temp_dir, "events-test.jsonl", 2)
+            self.assertListEqual([TurnEndedEvent(1), TurnEndedEvent(2)], log.events)
+            self.assertIsNone(log.file_name)
+            self.assertFalse(log.written)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from source.game_management.game_controller import GameController
+
+
+class GameControllerTest(unittest.TestCase):
+    """
+    The test class for game_controller.py.
+    """
+
+    @patch("source.game_management.game_controller.MusicPlayer")
+    def setUp(self, _: MagicMock) -> None:
+        """
+        Set up the GameController to test. Note that we mock out the MusicPlayer class, as it will try to play music if
+        not mocked.
+        :param _: The unused MusicPlayer mock.
+        """
+        self.game_controller = GameController()
+
+    def test_turn_processing(self):
+        """
+        Ensure that turns are processed on a separate thread, and that the controller correctly reports when processing
+        has finished.
+        """
+        release = threading.Event()
+        process_mock = MagicMock(side_effect=release.wait)
+
+        self.assertFalse(self.game_controller.is_processing_turn())
+        # Nothing should need tidying up before a turn has been processed.
+        self.assertFalse(self.game_controller.finish_turn_processing())
+
+        self.game_controller.begin_turn_processing(process_mock)
+
+        # While the turn is still being processed, we expect it not to be able to be finished.
+        self.assertTrue(self.game_controller.is_processing_turn())
+        self.assertFalse(self.game_controller.finish_turn_processing())
+
+        release.set()
+        self.game_controller.turn_thread.join()
+
+        self.assertFalse(self.game_controller.is_processing_turn())
+        self.assertTrue(self.game_controller.finish_turn_processing())
+        self.assertIsNone(self.game_controller.turn_thread)
+        process_mock.assert_called_once()
+
+    def test_turn_processing_error(self):
+        """
+        Ensure that any error raised while processing a turn is re-raised when finishing processing.
+        """
+        self.game_controller.begin_turn_processing(MagicMock(side_effect=ValueError("Oh no")))
+        self.game_controller.turn_thread.join()
+
+        with self.assertRaises(ValueError):
+            self.game_controller.finish_turn_processing()
+        self.assertIsNone(self.game_controller.turn_thread)
+        self.assertIsNone(self.game_controller.turn_error)
+
+
+if __name__ == '__main__':
+    unittest.main()
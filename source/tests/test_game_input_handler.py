@@ -4,15 +4,17 @@ from unittest.mock import MagicMock, patch
 
 from source.display.board import Board
 from source.display.menu import SetupOption, WikiOption, MainMenuOption
+from source.display.overlay import NullOverlay
 from source.foundation.catalogue import Namer, BLESSINGS, UNIT_PLANS, get_available_improvements, \
     get_available_unit_plans, PROJECTS, IMPROVEMENTS, ACHIEVEMENTS
 from source.foundation.models import GameConfig, Faction, OverlayType, ConstructionMenu, Improvement, ImprovementType, \
     Effect, Project, ProjectType, UnitPlan, Player, Settlement, Unit, Construction, CompletedConstruction, \
-    SettlementAttackType, PauseOption, Quad, Biome, DeployerUnitPlan, DeployerUnit
+    SettlementAttackType, PauseOption, Quad, Biome, DeployerUnitPlan, DeployerUnit, Victory, VictoryType
 from source.game_management.game_controller import GameController
 from source.game_management.game_input_handler import on_key_arrow_down, on_key_arrow_up, on_key_arrow_left, \
     on_key_arrow_right, on_key_shift, on_key_f, on_key_d, on_key_s, on_key_n, on_key_a, on_key_c, on_key_tab, \
-    on_key_escape, on_key_m, on_key_j, on_key_space, on_key_b, on_key_return, on_key_x
+    on_key_escape, on_key_m, on_key_j, on_key_space, on_key_b, on_key_return, on_key_x, on_key_f3, on_key_f4, \
+    on_key_f5, on_key_f6, continue_fast_forward, FAST_FORWARD_TURNS, FAST_FORWARD_REDRAW_TURNS
 from source.game_management.game_state import GameState
 
 
@@ -683,11 +685,12 @@ class GameInputHandlerTest(unittest.TestCase):
         self.game_state.board.selected_unit = self.TEST_UNIT
         self.game_state.board.overlay.attacked_settlement = self.TEST_SETTLEMENT
         self.game_state.board.overlay.attacked_settlement_owner = self.TEST_PLAYER_2
-        self.TEST_SETTLEMENT.besieged = True
+        self.game_state.board.sieges.begin(self.TEST_UNIT, self.TEST_SETTLEMENT)
         self.TEST_SETTLEMENT.strength = 1
-        self.TEST_UNIT.besieging = True
+        self.TEST_SETTLEMENT.satisfaction = 100
         self.TEST_PLAYER.settlements = []
         self.TEST_PLAYER_2.settlements = [self.TEST_SETTLEMENT]
+        self.game_state.board.victories.rebuild(self.game_state.players)
 
         on_key_return(self.game_controller, self.game_state)
         self.game_state.board.overlay.toggle_setl_click.assert_called_with(None, None)
@@ -695,13 +698,42 @@ class GameInputHandlerTest(unittest.TestCase):
         # that.
         self.assertFalse(self.TEST_SETTLEMENT.besieged)
         self.assertFalse(self.TEST_UNIT.besieging)
-        # The settlement should have changed hands.
+        # The settlement should have changed hands, counting towards its new owner's progress towards victory.
         self.assertTrue(self.TEST_PLAYER.settlements)
         self.assertFalse(self.TEST_PLAYER_2.settlements)
+        self.assertEqual(1, self.game_state.board.victories.of(self.TEST_PLAYER).jubilated_setls)
+        self.assertFalse(self.game_state.board.victories.of(self.TEST_PLAYER_2).jubilated_setls)
         # We should also now see the settlement attack overlay.
         self.game_state.board.overlay.toggle_setl_attack.assert_called()
         self.assertFalse(self.game_state.board.attack_time_bank)
 
+    def test_return_attack_besieged_settlement_taken_concentrated(self):
+        """
+        Ensure that when a player of The Concentrated faction takes a settlement by pressing the return key, the
+        settlement disappears, no longer counting towards anyone's progress towards victory.
+        """
+        self.game_state.game_started = True
+        self.game_state.board.overlay.showing = [OverlayType.SETL_CLICK]
+        self.game_state.board.overlay.setl_attack_opt = SettlementAttackType.ATTACK
+        self.game_state.board.overlay.toggle_setl_click = MagicMock()
+        self.game_state.board.overlay.toggle_setl_attack = MagicMock()
+
+        self.game_state.board.selected_unit = self.TEST_UNIT
+        self.game_state.board.overlay.attacked_settlement = self.TEST_SETTLEMENT
+        self.game_state.board.overlay.attacked_settlement_owner = self.TEST_PLAYER_2
+        self.TEST_SETTLEMENT.strength = 1
+        self.TEST_SETTLEMENT.satisfaction = 100
+        self.TEST_PLAYER.faction = Faction.CONCENTRATED
+        self.TEST_PLAYER.settlements = []
+        self.TEST_PLAYER_2.settlements = [self.TEST_SETTLEMENT]
+        self.game_state.board.victories.rebuild(self.game_state.players)
+
+        on_key_return(self.game_controller, self.game_state)
+        self.assertFalse(self.TEST_PLAYER.settlements)
+        self.assertFalse(self.TEST_PLAYER_2.settlements)
+        self.assertFalse(self.game_state.board.victories.of(self.TEST_PLAYER).jubilated_setls)
+        self.assertFalse(self.game_state.board.victories.of(self.TEST_PLAYER_2).jubilated_setls)
+
     def test_return_besiege_settlement(self):
         """
         Ensure that the correct state and overlay modification occurs when pressing the return key to besiege a
@@ -718,6 +750,7 @@ class GameInputHandlerTest(unittest.TestCase):
         on_key_return(self.game_controller, self.game_state)
         self.assertTrue(self.TEST_UNIT.besieging)
         self.assertTrue(self.TEST_SETTLEMENT.besieged)
+        self.assertListEqual([self.TEST_UNIT], self.game_state.board.sieges.besiegers_of(self.TEST_SETTLEMENT))
         self.game_state.board.overlay.toggle_setl_click.assert_called_with(None, None)
 
     def test_return_leave_settlement_click_overlay(self):
@@ -829,6 +862,9 @@ class GameInputHandlerTest(unittest.TestCase):
         save_stats_achievements_mock.return_value = ACHIEVEMENTS[0:2]
 
         on_key_return(self.game_controller, self.game_state)
+        # The turn is processed on a separate thread, so we need to wait for it to finish.
+        self.game_controller.turn_thread.join()
+        self.assertTrue(self.game_controller.finish_turn_processing())
         save_mock.assert_called_with(self.game_state, auto=True)
         self.assertTrue(self.game_controller.last_turn_time)
         save_stats_achievements_mock.assert_called()
@@ -837,6 +873,92 @@ class GameInputHandlerTest(unittest.TestCase):
         self.game_state.process_heathens.assert_called()
         self.game_state.process_ais.assert_called_with(self.game_controller.move_maker)
 
+    @patch("source.game_management.game_input_handler.save_stats_achievements")
+    @patch("source.game_management.game_input_handler.save_game")
+    def test_return_end_turn_spectating(self, save_mock: MagicMock, save_stats_achievements_mock: MagicMock):
+        """
+        Ensure that neither the game is autosaved nor statistics updated when a turn is ended by an eliminated player
+        spectating the rest of the game.
+        :param save_mock: The mock implementation of the save_game() function.
+        :param save_stats_achievements_mock: The mock implementation of the save_stats_achievements() function.
+        """
+        self.game_state.game_started = True
+        self.game_state.ai_only = True
+        self.TEST_PLAYER.settlements = []
+        self.game_state.end_turn = MagicMock(return_value=True)
+        self.game_state.process_heathens = MagicMock()
+        self.game_state.process_ais = MagicMock()
+
+        on_key_return(self.game_controller, self.game_state)
+        self.game_controller.turn_thread.join()
+        self.assertTrue(self.game_controller.finish_turn_processing())
+        save_mock.assert_not_called()
+        save_stats_achievements_mock.assert_not_called()
+        self.game_state.process_ais.assert_called_with(self.game_controller.move_maker)
+
+    def test_fast_forward(self):
+        """
+        Ensure that turns are fast-forwarded through in batches, with notifications discarded while each batch is
+        processed, and the progress reset once there are no turns left.
+        """
+        self.game_state.game_started = True
+        overlay = self.game_state.board.overlay
+        overlays_during_turns = []
+
+        def end_turn() -> bool:
+            overlays_during_turns.append(self.game_state.board.overlay)
+            return True
+
+        self.game_state.end_turn = end_turn
+        self.game_state.process_heathens = MagicMock()
+        self.game_state.process_ais = MagicMock()
+        self.game_controller.fast_forward_left = FAST_FORWARD_REDRAW_TURNS + 2
+
+        self.assertTrue(continue_fast_forward(self.game_controller, self.game_state))
+        self.game_controller.turn_thread.join()
+        self.assertTrue(self.game_controller.finish_turn_processing())
+        # Only a single batch of turns should have been processed, with the original overlay restored afterwards.
+        self.assertEqual(FAST_FORWARD_REDRAW_TURNS, self.game_state.process_ais.call_count)
+        self.assertEqual(FAST_FORWARD_REDRAW_TURNS, self.game_controller.fast_forward_done)
+        self.assertEqual(2, self.game_controller.fast_forward_left)
+        self.assertTrue(all(isinstance(o, NullOverlay) for o in overlays_during_turns))
+        self.assertIs(overlay, self.game_state.board.overlay)
+
+        self.assertTrue(continue_fast_forward(self.game_controller, self.game_state))
+        self.game_controller.turn_thread.join()
+        self.assertTrue(self.game_controller.finish_turn_processing())
+        self.assertEqual(FAST_FORWARD_REDRAW_TURNS + 2, self.game_state.process_ais.call_count)
+        self.assertFalse(self.game_controller.fast_forward_left)
+
+        # With no turns left to process, nothing should be begun, and the progress should be reset.
+        self.assertFalse(continue_fast_forward(self.game_controller, self.game_state))
+        self.assertIsNone(self.game_controller.turn_thread)
+        self.assertFalse(self.game_controller.fast_forward_done)
+
+    def test_fast_forward_victory(self):
+        """
+        Ensure that fast-forwarding stops when a victory is achieved, with the victory displayed.
+        """
+        self.game_state.game_started = True
+        victory = Victory(self.TEST_PLAYER_2, VictoryType.ELIMINATION)
+
+        def end_turn() -> bool:
+            self.game_state.board.overlay.toggle_victory(victory)
+            return False
+
+        self.game_state.end_turn = end_turn
+        self.game_state.process_ais = MagicMock()
+        self.game_controller.fast_forward_left = FAST_FORWARD_TURNS
+
+        continue_fast_forward(self.game_controller, self.game_state)
+        self.game_controller.turn_thread.join()
+        self.assertTrue(self.game_controller.finish_turn_processing())
+        self.assertFalse(self.game_controller.fast_forward_left)
+        self.assertEqual(1, self.game_controller.fast_forward_done)
+        self.game_state.process_ais.assert_not_called()
+        self.assertTrue(self.game_state.board.overlay.is_victory())
+        self.assertEqual(victory, self.game_state.board.overlay.current_victory)
+
     def test_shift(self):
         """
         Ensure that the correct overlay toggle occurs when the shift key is pressed.
@@ -961,6 +1083,84 @@ class GameInputHandlerTest(unittest.TestCase):
         self.assertIsNone(self.game_state.board.selected_unit)
         self.game_state.board.overlay.toggle_unit.assert_called_with(None)
 
+    def test_f3(self):
+        """
+        Ensure that the F3 key toggles both turn profiling and the profiler overlay.
+        """
+        # Nothing should happen if the game has not started.
+        on_key_f3(self.game_state)
+        self.assertFalse(self.game_state.profiler.enabled)
+        self.assertFalse(self.game_state.board.overlay.is_profiler())
+
+        self.game_state.game_started = True
+        on_key_f3(self.game_state)
+        self.assertTrue(self.game_state.profiler.enabled)
+        self.assertTrue(self.game_state.board.overlay.is_profiler())
+        self.assertEqual(self.game_state.profiler, self.game_state.board.overlay.turn_profiler)
+
+        on_key_f3(self.game_state)
+        self.assertFalse(self.game_state.profiler.enabled)
+        self.assertFalse(self.game_state.board.overlay.is_profiler())
+
+    @patch("source.game_management.game_input_handler.save_turn_profiles")
+    def test_f4(self, save_turn_profiles_mock: MagicMock):
+        """
+        Ensure that the F4 key exports the recorded turn profiles, but only when the profiler overlay is displayed and
+        there are profiles to export.
+        :param save_turn_profiles_mock: The mock implementation of the save_turn_profiles() function.
+        """
+        self.game_state.game_started = True
+        on_key_f3(self.game_state)
+        # There are no profiles to export until a turn has been profiled.
+        on_key_f4(self.game_state)
+        save_turn_profiles_mock.assert_not_called()
+
+        self.game_state.profiler.begin_turn(1)
+        on_key_f4(self.game_state)
+        save_turn_profiles_mock.assert_called_with(self.game_state.profiler)
+        self.assertTrue(self.game_state.board.overlay.has_exported_profiles)
+
+    def test_f5(self):
+        """
+        Ensure that the F5 key allows the player to spectate the rest of the game once they have been eliminated,
+        fast-forwarding through the AI players' turns.
+        """
+        self.game_state.game_started = True
+        # Players still in the game cannot fast-forward.
+        on_key_f5(self.game_controller, self.game_state)
+        self.assertFalse(self.game_controller.fast_forward_left)
+
+        self.TEST_PLAYER.eliminated = True
+        self.game_state.board.overlay.toggle_elimination(self.TEST_PLAYER)
+        on_key_f5(self.game_controller, self.game_state)
+        # The game over overlay should have been dismissed, with the game now only between AI players.
+        self.assertTrue(self.game_state.ai_only)
+        self.assertFalse(self.game_state.board.overlay.is_elimination())
+        self.assertEqual(FAST_FORWARD_TURNS, self.game_controller.fast_forward_left)
+        # Pressing F5 again should fast-forward even further.
+        on_key_f5(self.game_controller, self.game_state)
+        self.assertEqual(2 * FAST_FORWARD_TURNS, self.game_controller.fast_forward_left)
+
+        # Once the game has ended, there is nothing left to fast-forward through.
+        self.game_controller.fast_forward_left = 0
+        self.game_state.board.overlay.toggle_victory(Victory(self.TEST_PLAYER_2, VictoryType.ELIMINATION))
+        on_key_f5(self.game_controller, self.game_state)
+        self.assertFalse(self.game_controller.fast_forward_left)
+
+    @patch("source.game_management.game_input_handler.save_game")
+    def test_f6(self, save_game_mock: MagicMock):
+        """
+        Ensure that the F6 key exports the current game as JSON, but only while a game is being played.
+        :param save_game_mock: The mock implementation of the save_game() function.
+        """
+        on_key_f6(self.game_state)
+        save_game_mock.assert_not_called()
+
+        self.game_state.game_started = True
+        self.game_state.on_menu = False
+        on_key_f6(self.game_state)
+        save_game_mock.assert_called_with(self.game_state, as_json=True)
+
     def test_tab(self):
         """
         Ensure that the correct iteration between settlements occurs when the TAB key is pressed.
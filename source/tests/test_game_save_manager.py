@@ -1,6 +1,11 @@
+import filecmp
+import gzip
+import io
 import json
 import os
 import pathlib
+import shutil
+import tempfile
 import unittest
 from datetime import datetime
 from itertools import chain
@@ -8,12 +13,17 @@ from unittest.mock import patch, MagicMock, mock_open
 
 from source.display.board import Board
 from source.foundation.catalogue import Namer, get_heathen_plan, ACHIEVEMENTS
+from source.foundation.climate import Climate, NightAffinity
 from source.foundation.models import GameConfig, Faction, Heathen, Project, UnitPlan, Improvement, Unit, Blessing, \
-    AIPlaystyle, AttackPlaystyle, ExpansionPlaystyle, VictoryType
+    AIPlaystyle, AttackPlaystyle, ExpansionPlaystyle, VictoryType, TurnEndedEvent, Settlement, AchievementTrigger
 from source.game_management.game_controller import GameController
 from source.game_management.game_state import GameState
-from source.saving.game_save_manager import save_game, SAVES_DIR, get_saves, load_game, save_stats_achievements, \
-    get_stats, init_app_data
+from source.saving.autosave_journal import AutosaveJournal, FULL_RECORD, DELTA_RECORD
+from source.saving.binary_save import write_save, read_save, SaveSections, open_save
+from source.saving.game_save_manager import save_game, get_saves, load_game, save_stats_achievements, load_json_save, \
+    get_stats, init_app_data, save_turn_profiles, write_atomically, AUTOSAVE_WRITER, SAVES_DIR, SNAPSHOT_INTERVAL, \
+    STATISTICS_FILE, StatisticsStore, AUTOSAVE_JOURNAL, LEGACY_BACKUPS_DIR, upgrade_legacy_saves
+from source.saving.save_decoder import JSON_SAVE_VERSION
 from source.saving.save_encoder import SaveEncoder
 
 
@@ -47,55 +57,238 @@ class GameSaveManagerTest(unittest.TestCase):
         mkdir_mock.assert_called_with(parents=True, exist_ok=True)
 
     @patch("source.saving.game_save_manager.datetime")
-    @patch("os.remove")
-    @patch("os.listdir")
-    @patch("source.saving.game_save_manager.open", new_callable=mock_open)
-    def test_save_game(self,
-                       open_mock: MagicMock,
-                       listdir_mock: MagicMock,
-                       remove_mock: MagicMock,
-                       datetime_mock: MagicMock):
-        """
-        Ensure that when saving a game state, the correct autosave modifications occur, and the correct data is written.
-        :param open_mock: The mock representation of the open() builtin, which is used to open the save file for
-        writing.
-        :param listdir_mock: The mock representation of os.listdir(), which is used to retrieve previous autosaves.
-        :param remove_mock: The mock representation of os.remove(), which is used to delete old autosaves.
+    def test_save_game(self, datetime_mock: MagicMock):
+        """
+        Ensure that when autosaving a game state, the correct data is appended to the autosave journal in the binary
+        format on a background thread, leaving any autosaves made before the journal untouched.
         :param datetime_mock: The mock representation of datetime.datetime, which is used to retrieve the current time.
         """
         test_saves = [
-            "autosave-2023-01-07T13.35.00.json",
-            "autosave-2023-01-07T13.30.00.json",
-            "autosave-2023-01-07T13.40.00.json"
+            "autosave-2023-01-07T13.35.00.sav",
+            "autosave-2023-01-07T13.30.00.sav",
+            "autosave-2023-01-07T13.40.00.sav"
         ]
-        test_time = datetime(2023, 1, 7, hour=13, minute=35, second=24)
-
-        listdir_mock.return_value = test_saves
-        datetime_mock.now.return_value = test_time
+        datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=35, second=24)
+
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir):
+            for test_save in test_saves:
+                pathlib.Path(temp_dir, test_save).touch()
+            save_game(self.game_state, auto=True)
+            # The autosave should be written in the background.
+            self.assertIsNotNone(AUTOSAVE_WRITER.thread)
+            AUTOSAVE_WRITER.wait()
+
+            self.assertListEqual([*sorted(test_saves), AUTOSAVE_JOURNAL], sorted(os.listdir(temp_dir)))
+            save, base = AutosaveJournal(os.path.join(temp_dir, AUTOSAVE_JOURNAL)).latest()
+            self.assertEqual(write_save(self.game_state, None), gzip.decompress(save))
+            self.assertIsNone(base)
 
-        # We expect the second save to be deleted because it is the oldest autosave.
-        expected_deleted_autosave = os.path.join(SAVES_DIR, test_saves[1])
-        # The save name should also be according to our test time.
-        expected_save_name = os.path.join(SAVES_DIR, "autosave-2023-01-07T13.35.24.json")
+    @patch("source.saving.game_save_manager.datetime")
+    def test_save_game_json(self, datetime_mock: MagicMock):
+        """
+        Ensure that when exporting a game state as JSON, the correct data is written.
+        :param datetime_mock: The mock representation of datetime.datetime, which is used to retrieve the current time.
+        """
+        datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=35, second=24)
         # Also determine the data we expect to be saved.
         expected_save_data = {
+            "version": JSON_SAVE_VERSION,
             "quads": list(chain.from_iterable(self.game_state.board.quads)),
             "players": self.game_state.players,
             "heathens": self.game_state.heathens,
             "turn": self.game_state.turn,
             "cfg": self.game_state.board.game_config,
-            "night_status": {"until": self.game_state.until_night, "remaining": self.game_state.nighttime_left}
+            "night_status": {"until": self.game_state.until_night, "remaining": self.game_state.nighttime_left,
+                             "dawned": self.game_state.climate.has_dawned}
         }
 
-        save_game(self.game_state, auto=True)
-        # After saving, we expect the oldest autosave to have been deleted, a new save with the correct name to have
-        # been created, and the correct data to have been written to said save.
-        remove_mock.assert_called_with(expected_deleted_autosave)
-        self.assertEqual(expected_save_name, open_mock.call_args[0][0])
-        open_mock.return_value.write.assert_called_with(json.dumps(expected_save_data, cls=SaveEncoder))
-        open_mock.return_value.close.assert_called()
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir):
+            save_game(self.game_state, as_json=True)
+            # Manual saves are written before returning.
+            self.assertIsNone(AUTOSAVE_WRITER.thread)
+            with open(os.path.join(temp_dir, "save-2023-01-07T13.35.24.json"), "r", encoding="utf-8") as save_file:
+                self.assertEqual(json.dumps(expected_save_data, cls=SaveEncoder), save_file.read())
+
+    @patch("source.saving.game_save_manager.datetime")
+    @patch("source.game_management.game_controller.MusicPlayer")
+    @patch("pyxel.mouse")
+    def test_save_game_delta(self, _: MagicMock, __: MagicMock, datetime_mock: MagicMock):
+        """
+        Ensure that autosaves are written as deltas against the most recent full autosave, which is kept for as long as
+        any deltas against it are, and that full autosaves are written periodically.
+        :param datetime_mock: The mock representation of datetime.datetime, which is used to retrieve the current time.
+        """
+        self.game_state.players[0].settlements = \
+            [Settlement("Saved", (10, 20), [], [self.game_state.board.quads[20][10]], [])]
+        self.game_controller.namer.remove_settlement_name = MagicMock()
+        self.game_controller.menu.save_idx = 0
+        loaded_state = GameState()
+
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir):
+            journal = AutosaveJournal(os.path.join(temp_dir, AUTOSAVE_JOURNAL))
+            for minute in range(5):
+                datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=minute)
+                self.game_state.turn += 1
+                save_game(self.game_state, auto=True)
+            AUTOSAVE_WRITER.wait()
+
+            # Every autosave should have been appended to the journal, as deltas against the first.
+            self.assertListEqual([AUTOSAVE_JOURNAL], os.listdir(temp_dir))
+            self.assertListEqual([FULL_RECORD] + [DELTA_RECORD] * 4, [record.kind for record in journal.scan()[0]])
+            # Loading the journal should apply its latest autosave to the full autosave it is against.
+            load_game(loaded_state, self.game_controller)
+            self.assertFalse(self.game_controller.menu.load_failed)
+            self.assertEqual(self.game_state.turn, loaded_state.turn)
+            self.assertListEqual(self.game_state.players, loaded_state.players)
+
+            datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=5)
+            self.game_state.turn += SNAPSHOT_INTERVAL
+            save_game(self.game_state, auto=True)
+            AUTOSAVE_WRITER.wait()
+            # Enough turns have passed that the next autosave should be written in full, compacting the journal.
+            self.assertListEqual([FULL_RECORD], [record.kind for record in journal.scan()[0]])
+            self.assertListEqual([AUTOSAVE_JOURNAL], os.listdir(temp_dir))
+            load_game(loaded_state, self.game_controller)
+            self.assertEqual(self.game_state.turn, loaded_state.turn)
+
+    @patch("source.saving.game_save_manager.datetime")
+    @patch("source.game_management.game_controller.MusicPlayer")
+    @patch("pyxel.mouse")
+    def test_load_game_torn_journal(self, _: MagicMock, __: MagicMock, datetime_mock: MagicMock):
+        """
+        Ensure that loading an autosave journal with a torn record at its end, e.g. due to a power loss while it was
+        being appended to, loads its latest intact autosave, and truncates the torn record.
+        :param datetime_mock: The mock representation of datetime.datetime, which is used to retrieve the current time.
+        """
+        datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=35)
+        self.game_state.players[0].settlements = \
+            [Settlement("Saved", (10, 20), [], [self.game_state.board.quads[20][10]], [])]
+        self.game_controller.namer.remove_settlement_name = MagicMock()
+        self.game_controller.menu.save_idx = 0
+        loaded_state = GameState()
+
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir):
+            journal_name = os.path.join(temp_dir, AUTOSAVE_JOURNAL)
+            save_game(self.game_state, auto=True)
+            self.game_state.turn += 1
+            save_game(self.game_state, auto=True)
+            AUTOSAVE_WRITER.wait()
+            intact_size = os.path.getsize(journal_name)
+            with open(journal_name, "ab") as journal_file:
+                journal_file.write(b"\x40\x00\x00\x00\x01torn")
+
+            load_game(loaded_state, self.game_controller)
+            self.assertFalse(self.game_controller.menu.load_failed)
+            self.assertEqual(self.game_state.turn, loaded_state.turn)
+            self.assertEqual(intact_size, os.path.getsize(journal_name))
+
+    def test_load_game_missing_base(self):
+        """
+        Ensure that when a delta save is loaded without the full save it is against, the menu is updated to reflect
+        that.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir):
+            base = SaveSections(self.game_state, None)
+            with open(os.path.join(temp_dir, "autosave-test.sav"), "wb") as save_file:
+                save_file.write(b"".join(base.delta(base, "autosave-missing.sav")))
+            self.game_controller.menu.save_idx = 0
+            load_game(self.game_state, self.game_controller)
+        self.assertTrue(self.game_controller.menu.load_failed)
+
+    @patch("source.saving.game_save_manager.datetime")
+    def test_save_game_failed(self, datetime_mock: MagicMock):
+        """
+        Ensure that when writing an autosave fails, the existing autosaves are kept, the error is raised once the
+        autosave is waited for, and the journal is recovered before it is appended to again.
+        :param datetime_mock: The mock representation of datetime.datetime, which is used to retrieve the current time.
+        """
+        datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=35, second=24)
+        test_saves = [f"autosave-2023-01-07T13.3{i}.00.sav" for i in range(3)]
+
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir), \
+                patch("os.fsync", side_effect=OSError("Disk full")):
+            for test_save in test_saves:
+                pathlib.Path(temp_dir, test_save).touch()
+            save_game(self.game_state, auto=True)
+            with self.assertRaises(OSError):
+                AUTOSAVE_WRITER.wait()
+            self.assertListEqual([*test_saves, AUTOSAVE_JOURNAL], sorted(os.listdir(temp_dir)))
+            self.assertFalse(AUTOSAVE_WRITER.journal.recovered)
+        # Once raised, the error should not be raised again.
+        AUTOSAVE_WRITER.wait()
+
+    @patch("source.saving.game_save_manager.datetime")
+    def test_save_game_base_stats(self, datetime_mock: MagicMock):
+        """
+        Ensure that the base stats of units are exported, rather than their stats as modified by the climate.
+        :param datetime_mock: The mock representation of datetime.datetime, which is used to retrieve the current time.
+        """
+        datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=35, second=24)
+        self.game_state.climate.apply()
+        self.addCleanup(Climate().apply)
+        self.game_state.climate.reset(is_night=True, has_dawned=True)
+        heathen_plan: UnitPlan = self.game_state.heathens[0].plan
+
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir):
+            save_game(self.game_state, as_json=True)
+            with open(os.path.join(temp_dir, "save-2023-01-07T13.35.24.json"), "r", encoding="utf-8") as save_file:
+                save = json.load(save_file)
+
+        # The heathen's power is doubled at night, but only its base power should have been saved.
+        self.assertEqual(heathen_plan.power / 2, save["heathens"][0]["plan"]["power"])
+        self.assertEqual(NightAffinity.HEATHEN, save["heathens"][0]["plan"]["night_affinity"])
+        self.assertTrue(save["night_status"]["dawned"])
+        # Modifiers should apply again once the game has been saved.
+        self.assertFalse(self.game_state.climate.suspended)
+
+    @patch("source.saving.game_save_manager.datetime")
+    def test_save_game_event_log(self, datetime_mock: MagicMock):
+        """
+        Ensure that saving a game with an event log writes the log alongside the save, recording how much of it the save
+        includes, and that subsequent saves append to the same log.
+        :param datetime_mock: The mock representation of datetime.datetime, which is used to retrieve the current time.
+        """
+        datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=35, second=24)
+        events = self.game_state.board.events
+        events.attach(self.game_state)
+        events.turn_ended(1)
+
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir):
+            save_game(self.game_state, as_json=True)
+            events.turn_ended(2)
+            save_game(self.game_state, auto=True)
+            AUTOSAVE_WRITER.wait()
+
+            self.assertEqual("events-2023-01-07T13.35.24.jsonl", events.file_name)
+            with open(os.path.join(temp_dir, events.file_name), "r", encoding="utf-8") as log_file:
+                self.assertEqual(2, len(log_file.readlines()))
+            with open(os.path.join(temp_dir, "save-2023-01-07T13.35.24.json"), "r", encoding="utf-8") as save_file:
+                self.assertDictEqual({"file": events.file_name, "length": 1}, json.load(save_file)["event_log"])
+            save, _ = AutosaveJournal(os.path.join(temp_dir, AUTOSAVE_JOURNAL)).latest()
+            save_stream = open_save(io.BufferedReader(io.BytesIO(save)))
+            self.assertTupleEqual((events.file_name, 2), read_save(save_stream, GameState())[2])
+
+    @patch("source.saving.game_save_manager.export_csv")
+    @patch("source.saving.game_save_manager.datetime")
+    def test_save_turn_profiles(self, datetime_mock: MagicMock, export_csv_mock: MagicMock):
+        """
+        Ensure that turn profiles are exported to a CSV file named according to the current time.
+        :param datetime_mock: The mock representation of datetime.datetime, which is used to retrieve the current time.
+        :param export_csv_mock: The mock implementation of the export_csv() function.
+        """
+        datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=35, second=24)
+        save_turn_profiles(self.game_state.profiler)
+        export_csv_mock.assert_called_with(self.game_state.profiler.profiles,
+                                           os.path.join(SAVES_DIR, "profile-2023-01-07T13.35.24.csv"))
 
-    @patch("os.path.isfile", lambda *args: True)
     def test_save_stats_achievements(self):
         """
         Ensure that the correct statistics and achievements are saved when the method is called.
@@ -137,8 +330,12 @@ class GameSaveManagerTest(unittest.TestCase):
             ]
         }
 
-        # We have to use a context manager for this patch so that we can pass the read_data param to mock_open().
-        with patch("source.saving.game_save_manager.open", mock_open(read_data=sample_stats)) as open_mock:
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir), \
+                patch("source.saving.game_save_manager.STATISTICS", StatisticsStore()) as store:
+            stats_file_name = os.path.join(temp_dir, STATISTICS_FILE)
+            with open(stats_file_name, "w", encoding="utf-8") as stats_file:
+                stats_file.write(sample_stats)
             # This method will never be called in this way, with every parameter at once, but it illustrates the same
             # functionality.
             new_achs = save_stats_achievements(self.game_state,
@@ -149,12 +346,11 @@ class GameSaveManagerTest(unittest.TestCase):
                                                faction_to_add=added_faction)
             # We expect the correct new achievements to be returned.
             self.assertEqual([ACHIEVEMENTS[23], ACHIEVEMENTS[0], ACHIEVEMENTS[4]], new_achs)
-            # We expect open() to be called twice - once for reading in the previous values, and once for saving the new
-            # values.
-            self.assertEqual(2, open_mock.call_count)
-            open_mock.return_value.write.assert_called_with(json.dumps(expected_new_stats))
+            # The new values should be written once the statistics are flushed.
+            store.flush()
+            with open(stats_file_name, "r", encoding="utf-8") as stats_file:
+                self.assertEqual(json.dumps(expected_new_stats), stats_file.read())
 
-    @patch("os.path.isfile", lambda *args: True)
     def test_save_stats_achievements_existing_victory_faction(self):
         """
         Ensure that the correct statistics and achievements are saved when the method is called and pre-existing
@@ -198,8 +394,12 @@ class GameSaveManagerTest(unittest.TestCase):
             ]
         }
 
-        # We have to use a context manager for this patch so that we can pass the read_data param to mock_open().
-        with patch("source.saving.game_save_manager.open", mock_open(read_data=sample_stats)) as open_mock:
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir), \
+                patch("source.saving.game_save_manager.STATISTICS", StatisticsStore()) as store:
+            stats_file_name = os.path.join(temp_dir, STATISTICS_FILE)
+            with open(stats_file_name, "w", encoding="utf-8") as stats_file:
+                stats_file.write(sample_stats)
             # This method will never be called in this way, with every parameter at once, but it illustrates the same
             # functionality.
             new_achs = save_stats_achievements(self.game_state,
@@ -208,12 +408,62 @@ class GameSaveManagerTest(unittest.TestCase):
                                                faction_to_add=faction)
             # We expect the correct new achievements to be returned.
             self.assertEqual([ACHIEVEMENTS[23], ACHIEVEMENTS[0], ACHIEVEMENTS[4]], new_achs)
-            # We expect open() to be called twice - once for reading in the previous values, and once for saving the new
-            # values.
-            self.assertEqual(2, open_mock.call_count)
-            open_mock.return_value.write.assert_called_with(json.dumps(expected_new_stats))
+            store.flush()
+            with open(stats_file_name, "r", encoding="utf-8") as stats_file:
+                self.assertEqual(json.dumps(expected_new_stats), stats_file.read())
+
+    @patch("source.saving.game_save_manager.STATISTICS_FLUSH_DELAY", 0.05)
+    def test_save_stats_achievements_write_behind(self):
+        """
+        Ensure that the statistics are only read once, and that several updates in quick succession are written
+        together on a background thread.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir), \
+                patch("source.saving.game_save_manager.STATISTICS", StatisticsStore()) as store, \
+                patch("source.saving.game_save_manager.write_atomically",
+                      wraps=write_atomically) as write_mock:
+            for _ in range(3):
+                save_stats_achievements(self.game_state, playtime=1)
+            # Nothing should have been written yet, as the write is delayed.
+            write_mock.assert_not_called()
+            timer = store.timer
+            timer.join()
+            # All three turns should have been written at once.
+            write_mock.assert_called_once()
+            self.assertIsNone(store.timer)
+            with open(os.path.join(temp_dir, STATISTICS_FILE), "r", encoding="utf-8") as stats_file:
+                stats_json = json.loads(stats_file.read())
+            self.assertEqual(3, stats_json["playtime"])
+            self.assertEqual(3, stats_json["turns_played"])
+            # Flushing again without any changes should not write anything.
+            store.flush()
+            write_mock.assert_called_once()
+            # The statistics should also not be read again, with the in-memory statistics being retrieved instead.
+            self.assertIs(store.stats, get_stats())
+
+    def test_save_stats_achievements_triggers(self):
+        """
+        Ensure that achievements are only verified once an event that triggers them has occurred.
+        """
+        self.game_state.players[0].units = [Unit(1, 1, (0, 0), False, UnitPlan(1, 1, 1, "Grunt", None, 1))] * 20
+        self.game_state.board.achievements.take()
+        unstoppable_force = next(ach for ach in ACHIEVEMENTS if ach.name == "Unstoppable Force")
+
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir), \
+                patch("source.saving.game_save_manager.STATISTICS", StatisticsStore()) as store:
+            # Despite the player having enough units, the achievement should not be obtained as no units were deployed.
+            self.assertFalse(save_stats_achievements(self.game_state, increment_turn=False))
+            self.game_state.board.achievements.trigger(AchievementTrigger.UNIT_DEPLOYED)
+            self.assertEqual([unstoppable_force], save_stats_achievements(self.game_state, increment_turn=False))
+            # The events that occurred should also have been cleared.
+            self.assertFalse(self.game_state.board.achievements.occurred)
+            # Write the statistics while the saves directory is still patched.
+            store.flush()
 
     @patch("os.path.isfile", lambda *args: True)
+    @patch("source.saving.game_save_manager.STATISTICS", StatisticsStore())
     def test_get_stats(self):
         """
         Ensure that the correct statistic values are parsed when the method is called.
@@ -253,6 +503,7 @@ class GameSaveManagerTest(unittest.TestCase):
             self.assertEqual(faction_count, retrieved_stats.factions[faction])
 
     @patch("source.saving.game_save_manager.SAVES_DIR", "/")
+    @patch("source.saving.game_save_manager.STATISTICS", StatisticsStore())
     def test_get_stats_no_file(self):
         """
         Ensure that when there are no statistics to load in, each value is set to zero or its equivalent.
@@ -265,13 +516,13 @@ class GameSaveManagerTest(unittest.TestCase):
         self.assertFalse(retrieved_stats.factions)
         self.assertFalse(retrieved_stats.achievements)
 
-    @patch("source.saving.game_save_manager.SAVES_DIR", "source/tests/resources")
     @patch("source.game_management.game_controller.MusicPlayer")
     @patch("pyxel.mouse")
     def test_load_game(self, mouse_mock: MagicMock, _: MagicMock):
         """
         Ensure that a pre-defined save game is correctly loaded and the game objects instantiated as the correct
-        classes.
+        classes, and that the save, which was made before saves recorded their version, is upgraded to the current
+        version when it is first loaded.
         :param mouse_mock: The mock implementation of pyxel.mouse().
         :param _: The unused MusicPlayer mock.
         """
@@ -311,7 +562,15 @@ class GameSaveManagerTest(unittest.TestCase):
         self.game_controller.music_player.play_game_music = MagicMock()
         self.game_controller.last_turn_time = 0
 
-        load_game(self.game_state, self.game_controller)
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir):
+            shutil.copy("source/tests/resources/save-test.json", temp_dir)
+            load_game(self.game_state, self.game_controller)
+            # The save should have been rewritten in place, with the original being backed up.
+            with open(os.path.join(temp_dir, "save-test.json"), "r", encoding="utf-8") as save_file:
+                self.assertEqual(JSON_SAVE_VERSION, json.load(save_file)["version"])
+            self.assertTrue(filecmp.cmp("source/tests/resources/save-test.json",
+                                        os.path.join(temp_dir, LEGACY_BACKUPS_DIR, "save-test.json"), shallow=False))
 
         human = self.game_state.players[0]
         ai = self.game_state.players[1]
@@ -369,10 +628,13 @@ class GameSaveManagerTest(unittest.TestCase):
         self.assertEqual(4, len(self.game_state.heathens))
         self.assertTrue(all(isinstance(heathen, Heathen) for heathen in self.game_state.heathens))
         self.assertTrue(all(isinstance(heathen.plan, UnitPlan) for heathen in self.game_state.heathens))
+        self.assertTrue(all(h.plan.night_affinity is NightAffinity.HEATHEN for h in self.game_state.heathens))
 
         self.assertEqual(23, self.game_state.turn)
         self.assertEqual(20, self.game_state.until_night)
         self.assertFalse(self.game_state.nighttime_left)
+        # The save was made before the climate recorded whether the first night had passed.
+        self.assertFalse(self.game_state.climate.has_dawned)
 
         mouse_mock.assert_called_with(visible=True)
         self.assertTrue(self.game_controller.last_turn_time)
@@ -390,6 +652,137 @@ class GameSaveManagerTest(unittest.TestCase):
         self.assertEqual(self.game_state.players[0], self.game_state.board.overlay.current_player)
         self.game_controller.music_player.stop_menu_music.assert_called()
         self.game_controller.music_player.play_game_music.assert_called()
+        # The save was made before event logs were introduced, so there is no log to continue.
+        self.assertIsNone(self.game_state.board.events.game_state)
+
+    @patch("source.game_management.game_controller.MusicPlayer")
+    @patch("pyxel.mouse")
+    def test_load_game_event_log(self, _: MagicMock, __: MagicMock):
+        """
+        Ensure that loading a save continues the game's event log from where the save was made.
+        """
+        self.game_controller = GameController()
+        self.game_controller.menu.save_idx = 0
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir):
+            with open("source/tests/resources/save-test.json", "r", encoding="utf-8") as save_file:
+                save = json.load(save_file)
+            save["event_log"] = {"file": "events-test.jsonl", "length": 1}
+            with open(os.path.join(temp_dir, "save-test.json"), "w", encoding="utf-8") as save_file:
+                json.dump(save, save_file)
+            shutil.copy("source/tests/resources/events-test.jsonl", temp_dir)
+
+            load_game(self.game_state, self.game_controller)
+
+        self.assertFalse(self.game_controller.menu.load_failed)
+        self.assertListEqual([TurnEndedEvent(1)], self.game_state.board.events.events)
+        self.assertIs(self.game_state, self.game_state.board.events.game_state)
+
+    @patch("source.saving.game_save_manager.datetime")
+    @patch("source.game_management.game_controller.MusicPlayer")
+    @patch("pyxel.mouse")
+    def test_load_game_binary(self, _: MagicMock, __: MagicMock, datetime_mock: MagicMock):
+        """
+        Ensure that games saved in the binary format are loaded, with the same state they were saved with.
+        :param datetime_mock: The mock representation of datetime.datetime, which is used to retrieve the current time.
+        """
+        datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=35, second=24)
+        self.game_state.players[0].settlements = \
+            [Settlement("Saved", (10, 20), [], [self.game_state.board.quads[20][10]], [])]
+        self.game_controller.namer.remove_settlement_name = MagicMock()
+        self.game_controller.menu.save_idx = 0
+        loaded_state = GameState()
+
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir):
+            save_game(self.game_state)
+            load_game(loaded_state, self.game_controller)
+
+        self.assertFalse(self.game_controller.menu.load_failed)
+        self.assertListEqual(self.game_state.players, loaded_state.players)
+        self.assertListEqual(self.game_state.heathens, loaded_state.heathens)
+        self.assertEqual(self.game_state.board.quads, loaded_state.board.quads)
+        self.assertEqual(self.TEST_CONFIG, loaded_state.board.game_config)
+        self.game_controller.namer.remove_settlement_name.assert_called_with("Saved",
+                                                                            self.game_state.board.quads[20][10].biome)
+
+    @patch("source.saving.game_save_manager.datetime")
+    @patch("source.game_management.game_controller.MusicPlayer")
+    @patch("pyxel.mouse")
+    def test_load_game_json_export(self, _: MagicMock, __: MagicMock, datetime_mock: MagicMock):
+        """
+        Ensure that games exported as JSON are loaded without migration, with the same state they were saved with.
+        :param datetime_mock: The mock representation of datetime.datetime, which is used to retrieve the current time.
+        """
+        datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=35, second=24)
+        self.game_state.players[0].settlements = \
+            [Settlement("Exported", (10, 20), [], [self.game_state.board.quads[20][10]], [])]
+        self.game_controller.namer.remove_settlement_name = MagicMock()
+        self.game_controller.menu.save_idx = 0
+        loaded_state = GameState()
+
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir), \
+                patch("source.saving.game_save_manager.migrate_player") as migrate_player_mock:
+            save_game(self.game_state, as_json=True)
+            load_game(loaded_state, self.game_controller)
+
+        self.assertFalse(self.game_controller.menu.load_failed)
+        migrate_player_mock.assert_not_called()
+        self.assertListEqual(self.game_state.players, loaded_state.players)
+        self.assertListEqual(self.game_state.heathens, loaded_state.heathens)
+        self.assertEqual(self.game_state.board.quads, loaded_state.board.quads)
+        self.assertEqual(self.TEST_CONFIG, loaded_state.board.game_config)
+
+    @patch("source.saving.game_save_manager.datetime")
+    def test_upgrade_legacy_saves(self, datetime_mock: MagicMock):
+        """
+        Ensure that only legacy saves are upgraded, that saves that cannot be read are reported, that upgraded saves
+        are loaded with the same state as the legacy saves they were upgraded from, and that the climate of the game
+        being played is unaffected by upgrading.
+        :param datetime_mock: The mock representation of datetime.datetime, which is used to retrieve the current time.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir):
+            datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=35)
+            save_game(self.game_state)
+            save_game(self.game_state, as_json=True)
+            save_game(self.game_state, auto=True)
+            AUTOSAVE_WRITER.wait()
+            shutil.copy("source/tests/resources/save-test.json", temp_dir)
+            shutil.copy("source/tests/resources/save-invalid.json", temp_dir)
+            # JSON saves that record their version are not upgraded, even if it is not at the start of the save.
+            with open(os.path.join(temp_dir, "save-versioned.json"), "w", encoding="utf-8") as save_file:
+                save_file.write('{"turn": 1, "version": 2}')
+            legacy_state = GameState()
+            with open("source/tests/resources/save-test.json", "rb") as save_file:
+                load_json_save(save_file, legacy_state)
+            self.game_state.climate.apply()
+            self.addCleanup(Climate().apply)
+            self.game_state.climate.reset(is_night=True, has_dawned=True)
+
+            self.assertTupleEqual((["save-test.json"], ["save-invalid.json"]), upgrade_legacy_saves())
+            self.assertIs(self.game_state.climate, Climate.current)
+            self.assertTrue(self.game_state.climate.is_night)
+            self.assertTrue(self.game_state.climate.has_dawned)
+            self.assertListEqual(["save-test.json"], os.listdir(os.path.join(temp_dir, LEGACY_BACKUPS_DIR)))
+            upgraded_state = GameState()
+            with open(os.path.join(temp_dir, "save-test.json"), "rb") as save_file:
+                load_json_save(save_file, upgraded_state)
+            # Upgraded saves are no longer legacy saves, so should not be upgraded again.
+            self.assertTupleEqual(([], ["save-invalid.json"]), upgrade_legacy_saves())
+
+        self.assertEqual(legacy_state.turn, upgraded_state.turn)
+        self.assertEqual(legacy_state.until_night, upgraded_state.until_night)
+        self.assertEqual(len(legacy_state.players), len(upgraded_state.players))
+        for legacy_player, upgraded_player in zip(legacy_state.players, upgraded_state.players):
+            self.assertEqual(legacy_player.faction, upgraded_player.faction)
+            self.assertEqual(legacy_player.wealth, upgraded_player.wealth)
+            self.assertEqual(legacy_player.quads_seen, upgraded_player.quads_seen)
+            self.assertListEqual([setl.name for setl in legacy_player.settlements],
+                                 [setl.name for setl in upgraded_player.settlements])
+            self.assertListEqual(legacy_player.units, upgraded_player.units)
+        self.assertListEqual(legacy_state.heathens, upgraded_state.heathens)
 
     @patch("source.saving.game_save_manager.SAVES_DIR", "source/tests/resources")
     def test_load_game_invalid(self):
@@ -427,17 +820,73 @@ class GameSaveManagerTest(unittest.TestCase):
             "README.md",
             ".secret_file",
             "save-2023-01-07T13.36.00.json",
-            "autosave-2023-01-07T13.37.00.json"
+            "save-2023-01-07T13.38.00.sav",
+            "autosave-2023-01-07T13.37.00.sav"
         ]
         listdir_mock.return_value = test_saves
         # We expect the README and the dotfile to be filtered out, and the saves to have their names formatted.
         expected_saves = [
             "2023-01-07 13.37.00 (auto)",
+            "2023-01-07 13.38.00",
             "2023-01-07 13.36.00"
         ]
 
         get_saves(self.game_controller)
         self.assertListEqual(expected_saves, self.game_controller.menu.saves)
+        # None of the files actually exist, so none of them have metadata.
+        self.assertListEqual([None] * 3, self.game_controller.menu.save_metadata)
+
+    @patch("source.saving.game_save_manager.datetime")
+    def test_get_saves_metadata(self, datetime_mock: MagicMock):
+        """
+        Ensure that the metadata of each binary save is passed to the menu alongside its name, with JSON saves having
+        none, and that the autosave journal is neither truncated nor left open when its metadata is read.
+        :param datetime_mock: The mock representation of datetime.datetime, which is used to retrieve the current time.
+        """
+        opened_saves = []
+
+        def open_tracked_save(save_file):
+            opened_saves.append(open_save(save_file))
+            return opened_saves[-1]
+
+        self.game_state.turn = 12
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("source.saving.game_save_manager.SAVES_DIR", temp_dir):
+            datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=35)
+            save_game(self.game_state)
+            datetime_mock.now.return_value = datetime(2023, 1, 7, hour=13, minute=36)
+            save_game(self.game_state, as_json=True)
+            save_game(self.game_state, auto=True)
+            self.game_state.turn = 13
+            save_game(self.game_state, auto=True)
+            AUTOSAVE_WRITER.wait()
+            # Simulate a torn record at the end of the journal.
+            journal_name = os.path.join(temp_dir, AUTOSAVE_JOURNAL)
+            with open(journal_name, "ab") as journal_file:
+                journal_file.write(b"torn")
+            journal_size = os.path.getsize(journal_name)
+            modified = datetime(2023, 1, 7, hour=13, minute=37).timestamp()
+            os.utime(journal_name, (modified, modified))
+            datetime_mock.fromtimestamp = datetime.fromtimestamp
+            with patch("source.saving.game_save_manager.open_save", open_tracked_save):
+                get_saves(self.game_controller)
+            self.assertEqual(journal_size, os.path.getsize(journal_name))
+
+        # Each save should have been closed once its metadata was read, including the full autosave that the latest
+        # autosave, a delta, is against.
+        self.assertEqual(4, len(opened_saves))
+        self.assertTrue(all(save.closed for save in opened_saves))
+
+        # The autosave journal should be listed first, as of when it was last appended to, with the metadata of its
+        # latest autosave.
+        self.assertListEqual(["2023-01-07 13.37.00 (auto)", "2023-01-07 13.36.00", "2023-01-07 13.35.00"],
+                             self.game_controller.menu.saves)
+        self.assertEqual(13, self.game_controller.menu.save_metadata[0].turn)
+        self.assertIsNone(self.game_controller.menu.save_metadata[1])
+        metadata = self.game_controller.menu.save_metadata[2]
+        self.assertEqual(12, metadata.turn)
+        self.assertEqual(self.TEST_CONFIG.player_faction, metadata.player_faction)
+        self.assertEqual(self.TEST_CONFIG.player_count, metadata.player_count)
 
 
 if __name__ == '__main__':
@@ -1,13 +1,15 @@
 import typing
 import unittest
+from copy import copy
 from unittest.mock import MagicMock, patch
 
 from source.display.board import Board
+from source.foundation.climate import Climate, NightAffinity
 from source.foundation.catalogue import Namer, UNIT_PLANS, get_heathen_plan, IMPROVEMENTS, BLESSINGS, ACHIEVEMENTS
 from source.foundation.models import GameConfig, Faction, Player, AIPlaystyle, AttackPlaystyle, ExpansionPlaystyle, \
     Unit, Heathen, Settlement, Victory, VictoryType, Construction, OngoingBlessing, EconomicStatus, UnitPlan, \
-    HarvestStatus, Quad, Biome, CompletedConstruction
-from source.game_management.game_state import GameState
+    HarvestStatus, Quad, Biome, CompletedConstruction, AchievementTrigger, VictoryProgress
+from source.game_management.game_state import GameState, save_stats_achievements
 from source.game_management.movemaker import MoveMaker
 
 
@@ -30,8 +32,10 @@ class GameStateTest(unittest.TestCase):
         self.TEST_HEATHEN = Heathen(40, 6, (3, 3), get_heathen_plan(1))
         self.TEST_SETTLEMENT = Settlement("Numero Uno", (0, 0), [], [], [self.TEST_UNIT_2])
         self.TEST_SETTLEMENT_2 = Settlement("Numero Duo", (1, 1), [], [], [])
-
         self.game_state = GameState()
+        # Apply the game's climate, making sure that it does not carry over to other tests.
+        self.game_state.climate.apply()
+        self.addCleanup(Climate().apply)
         self.game_state.players = [
             Player("Infidel", Faction.INFIDELS, 0, units=[self.TEST_UNIT],
                    ai_playstyle=AIPlaystyle(AttackPlaystyle.NEUTRAL, ExpansionPlaystyle.NEUTRAL)),
@@ -177,6 +181,31 @@ class GameStateTest(unittest.TestCase):
         # settlements unaffected by satisfaction.
         self.assertEqual(EconomicStatus.STANDARD, test_setl_real_bad.economic_status)
 
+    def test_process_player_achievement_triggers(self):
+        """
+        Ensure that changes to the non-AI player's settlements at the end of a turn are noted for achievements, while
+        changes to AI players' settlements are not.
+        """
+        setl = Settlement("Achiever", (60, 60), [], [], [], satisfaction=99)
+        self.game_state.players[0].settlements = [setl]
+        self.game_state.players[0].ai_playstyle = None
+        self.game_state.board.achievements.take()
+
+        # The settlement's statuses change, but it does not grow, as it has no harvest and is already at full strength.
+        self.game_state.process_player(self.game_state.players[0])
+        self.assertSetEqual({AchievementTrigger.STATUS_CHANGED}, self.game_state.board.achievements.take())
+        # Its statuses then remain the same, but it regains some of its lost strength.
+        setl.strength /= 2
+        self.game_state.process_player(self.game_state.players[0])
+        self.assertSetEqual({AchievementTrigger.SETTLEMENT_GREW}, self.game_state.board.achievements.take())
+
+        # Nothing should be noted for AI players.
+        self.game_state.players[0].ai_playstyle = AIPlaystyle(AttackPlaystyle.NEUTRAL, ExpansionPlaystyle.NEUTRAL)
+        setl.satisfaction = 0
+        setl.strength /= 2
+        self.game_state.process_player(self.game_state.players[0])
+        self.assertFalse(self.game_state.board.achievements.take())
+
     def test_process_player_besieged_settlements(self):
         """
         Ensure that settlements that are currently under siege or were recently have their strengths updated correctly
@@ -185,7 +214,8 @@ class GameStateTest(unittest.TestCase):
         # The first settlement is currently under active siege.
         besieged_settlement = Settlement("Under Siege", (10, 20), [], [Quad(Biome.FOREST, 0, 0, 0, 0, (10, 20))], [],
                                          besieged=True)
-        # The second settlement was under siege, but now there are no units surrounding it.
+        # The second settlement was under siege, but now there are no units surrounding it, with its only remaining
+        # besieger having since moved away.
         previously_besieged_settlement = Settlement("Previously", (30, 40), [],
                                                     [Quad(Biome.SEA, 0, 0, 0, 0, (30, 40))], [], besieged=True)
         # The third settlement was under siege some time ago, and is now recovering its strength.
@@ -200,8 +230,13 @@ class GameStateTest(unittest.TestCase):
         # Place TEST_UNIT_2 next to the final settlement, and reduce its health to simulate a defeated unit.
         self.TEST_UNIT_2.location = 71, 80
         self.TEST_UNIT_2.health = 0
-        # Give the units to another player so they are counted.
-        self.game_state.players[1].units = [self.TEST_UNIT, self.TEST_UNIT_2]
+        # Register a unit that is no longer next to the second settlement as besieging it.
+        stray_unit = Unit(100, 2, (33, 44), False, self.TEST_UNIT_PLAN)
+        # Give the units to another player and have them besiege the settlements so they are counted.
+        self.game_state.players[1].units = [self.TEST_UNIT, self.TEST_UNIT_2, stray_unit]
+        self.game_state.board.sieges.begin(self.TEST_UNIT, besieged_settlement)
+        self.game_state.board.sieges.begin(self.TEST_UNIT_2, killed_all_settlement)
+        self.game_state.board.sieges.begin(stray_unit, previously_besieged_settlement)
 
         self.game_state.players[0].settlements = \
             [besieged_settlement, previously_besieged_settlement, recovering_settlement, killed_all_settlement]
@@ -212,8 +247,10 @@ class GameStateTest(unittest.TestCase):
 
         # The first settlement should have had its strength reduced by 10% of its max.
         self.assertEqual(0.9 * besieged_settlement.max_strength, besieged_settlement.strength)
-        # The second settlement should no longer be under siege.
+        # The second settlement should no longer be under siege, and should not have lost any strength to the unit
+        # that is not next to it.
         self.assertFalse(previously_besieged_settlement.besieged)
+        self.assertEqual(previously_besieged_settlement.max_strength, previously_besieged_settlement.strength)
         # The third settlement should have had its strength increased by 10% of its max.
         self.assertEqual(50 + 0.1 * recovering_settlement.max_strength, recovering_settlement.strength)
         # The final settlement should no longer be under siege.
@@ -286,6 +323,7 @@ class GameStateTest(unittest.TestCase):
         self.game_state.board.overlay.toggle_construction_notification.assert_called_with(
             [CompletedConstruction(IMPROVEMENTS[0], self.TEST_SETTLEMENT)])
         self.assertIn(IMPROVEMENTS[0], self.TEST_SETTLEMENT.improvements)
+        self.assertIn(AchievementTrigger.IMPROVEMENT_BUILT, self.game_state.board.achievements.take())
 
     def test_process_player_settlement_level_up(self):
         """
@@ -380,6 +418,39 @@ class GameStateTest(unittest.TestCase):
         self.assertTrue(self.game_state.players[0].blessings)
         self.game_state.board.overlay.toggle_blessing_notification.assert_called_with(blessing)
         self.assertIsNone(self.game_state.players[0].ongoing_blessing)
+        self.assertIn(AchievementTrigger.BLESSING_UNDERGONE, self.game_state.board.achievements.take())
+
+    def test_process_player_victory_progress(self):
+        """
+        Ensure that changes to the player's settlements and their completed blessings are counted towards their progress
+        towards victory when they are processed at the end of a turn.
+        """
+        blessing = BLESSINGS["ard_one"]
+        self.game_state.players[0].ongoing_blessing = OngoingBlessing(blessing)
+        # Enough harvest is generated to bring the settlement up to 100% satisfaction and level it up to level 10.
+        self.TEST_SETTLEMENT.quads = [Quad(Biome.FOREST, harvest=100, wealth=0, zeal=0, fortune=blessing.cost,
+                                           location=self.TEST_SETTLEMENT.location)]
+        self.TEST_SETTLEMENT.satisfaction = 99.75
+        self.TEST_SETTLEMENT.level = 9
+        self.TEST_SETTLEMENT.harvest_reserves = 2000
+        # The settlement is also about to complete the Holy Sanctum.
+        self.TEST_SETTLEMENT.current_work = Construction(IMPROVEMENTS[-1], IMPROVEMENTS[-1].cost)
+        self.game_state.players[0].settlements = [self.TEST_SETTLEMENT]
+        self.game_state.board.victories.rebuild(self.game_state.players)
+        progress = self.game_state.board.victories.of(self.game_state.players[0])
+        self.assertEqual(VictoryProgress(constructing_sanctums=1), progress)
+
+        self.game_state.process_player(self.game_state.players[0])
+        self.assertEqual(1, progress.jubilated_setls)
+        self.assertEqual(1, progress.lvl_ten_setls)
+        self.assertTrue(progress.constructed_sanctum)
+        self.assertFalse(progress.constructing_sanctums)
+        self.assertEqual(1, progress.ardour_pieces)
+
+        # Processing the player again should not count the settlement twice.
+        self.game_state.process_player(self.game_state.players[0])
+        self.assertEqual(1, progress.jubilated_setls)
+        self.assertEqual(1, progress.lvl_ten_setls)
 
     def test_process_player_units_sold_wealth_increased(self):
         """
@@ -423,18 +494,22 @@ class GameStateTest(unittest.TestCase):
         self.game_state.nighttime_left = 0
         self.game_state.until_night = 1
         self.game_state.board.overlay.toggle_night = MagicMock()
+        self.TEST_UNIT_PLAN.night_affinity = NightAffinity.NOCTURNE
+        self.TEST_UNIT_PLAN_2.night_affinity = NightAffinity.NOCTURNE
         # We need to know the original powers for the heathen and the two units so that we can compare them later.
         original_heathen_power = self.TEST_HEATHEN.plan.power
-        self.game_state.players[0].faction = Faction.NOCTURNE
         original_unit_power = self.TEST_UNIT.plan.power
         original_unit_2_power = self.TEST_SETTLEMENT.garrison[0].plan.power
-        self.game_state.players[0].settlements = [self.TEST_SETTLEMENT]
+
+        self.game_state.board.achievements.take()
 
         self.game_state.process_climatic_effects()
 
         self.game_state.board.overlay.toggle_night.assert_called_with(True)
         # The nighttime left variable should now be initialised to some number between 5 and 20.
         self.assertTrue(self.game_state.nighttime_left)
+        self.assertTrue(self.game_state.climate.is_night)
+        self.assertSetEqual({AchievementTrigger.NIGHTFALL}, self.game_state.board.achievements.take())
         # Each unit should now have their power doubled.
         self.assertEqual(2 * original_heathen_power, self.TEST_HEATHEN.plan.power)
         self.assertEqual(2 * original_unit_power, self.TEST_UNIT.plan.power)
@@ -459,38 +534,52 @@ class GameStateTest(unittest.TestCase):
         """
         self.game_state.nighttime_left = 1
         self.game_state.until_night = 0
+        self.game_state.climate.is_night = True
         self.game_state.board.overlay.toggle_night = MagicMock()
-        self.game_state.players[0].faction = Faction.NOCTURNE
-        self.game_state.players[0].settlements = [self.TEST_SETTLEMENT]
+        self.TEST_UNIT_PLAN.night_affinity = NightAffinity.NOCTURNE
 
-        # Keep track of the heathen's power, and the units' power, health and maximum health, and total stamina for
+        # Keep track of the heathen's power, and the unit's power, health and maximum health, and total stamina for
         # later comparison.
         original_heathen_power = self.TEST_HEATHEN.plan.power
         original_unit_power = self.TEST_UNIT.plan.power
         original_unit_health = self.TEST_UNIT.health
         original_unit_max_health = self.TEST_UNIT.plan.max_health
         original_unit_total_stamina = self.TEST_UNIT.plan.total_stamina
-        original_unit_2_power = self.TEST_SETTLEMENT.garrison[0].plan.power
-        original_unit_2_health = self.TEST_UNIT_2.health
-        original_unit_2_max_health = self.TEST_UNIT_2.plan.max_health
-        original_unit_2_total_stamina = self.TEST_UNIT_2.plan.total_stamina
 
         self.game_state.process_climatic_effects()
         # The until night variable should now be initialised to some number between 10 and 20.
         self.assertTrue(self.game_state.until_night)
         self.game_state.board.overlay.toggle_night.assert_called_with(False)
+        self.assertFalse(self.game_state.climate.is_night)
+        self.assertTrue(self.game_state.climate.has_dawned)
         # Each unit should now have their power reduced. Heathens are brought back to their standard level, whereas
         # Nocturne units should have their power (and health, maximum health, and total stamina) reduced to half of the
-        # usual nighttime level.
-        self.assertEqual(round(original_heathen_power / 2), self.TEST_HEATHEN.plan.power)
-        self.assertEqual(round(original_unit_power / 4), self.TEST_UNIT.plan.power)
-        self.assertEqual(round(original_unit_health / 2), self.TEST_UNIT.health)
-        self.assertEqual(round(original_unit_max_health / 2), self.TEST_UNIT.plan.max_health)
+        # usual level.
+        self.assertEqual(original_heathen_power / 2, self.TEST_HEATHEN.plan.power)
+        self.assertEqual(original_unit_power / 4, self.TEST_UNIT.plan.power)
+        self.assertEqual(original_unit_health / 2, self.TEST_UNIT.health)
+        self.assertEqual(original_unit_max_health / 2, self.TEST_UNIT.plan.max_health)
         self.assertEqual(round(original_unit_total_stamina / 2), self.TEST_UNIT.plan.total_stamina)
-        self.assertEqual(round(original_unit_2_power / 4), self.TEST_SETTLEMENT.garrison[0].plan.power)
-        self.assertEqual(round(original_unit_2_health / 2), self.TEST_UNIT_2.health)
-        self.assertEqual(round(original_unit_2_max_health / 2), self.TEST_UNIT_2.plan.max_health)
-        self.assertEqual(round(original_unit_2_total_stamina / 2), self.TEST_UNIT_2.plan.total_stamina)
+
+    def test_process_climatic_effects_many_nights(self):
+        """
+        Ensure that unit stats are unaffected by rounding, no matter how many nights pass.
+        """
+        self.game_state.board.overlay.toggle_night = MagicMock()
+        test_plan = UnitPlan(25, 75, 5, "Odd Man", None, 25, night_affinity=NightAffinity.NOCTURNE)
+
+        for _ in range(50):
+            self.game_state.nighttime_left = 0
+            self.game_state.until_night = 1
+            self.game_state.process_climatic_effects()
+            self.assertEqual(50, test_plan.power)
+            self.assertEqual(75, test_plan.max_health)
+            self.assertEqual(5, test_plan.total_stamina)
+            self.game_state.nighttime_left = 1
+            self.game_state.process_climatic_effects()
+            self.assertEqual(12.5, test_plan.power)
+            self.assertEqual(37.5, test_plan.max_health)
+            self.assertEqual(2, test_plan.total_stamina)
 
     def test_end_turn_warning(self):
         """
@@ -502,6 +591,26 @@ class GameStateTest(unittest.TestCase):
         self.assertFalse(self.game_state.players[0].wealth)
         self.assertFalse(self.game_state.end_turn())
 
+    def test_end_turn_ai_only(self):
+        """
+        Ensure that when a turn is ended in a game between AI players only, no warnings are generated for the first
+        player.
+        """
+        self.game_state.ai_only = True
+        self.assertIsNone(self.game_state.players[0].ongoing_blessing)
+        self.assertTrue(self.game_state.end_turn())
+
+    @patch("source.saving.game_save_manager.save_stats_achievements")
+    def test_save_stats_achievements(self, save_stats_achievements_mock: MagicMock):
+        """
+        Ensure that saving statistics from the game state passes them through to the save manager.
+        :param save_stats_achievements_mock: The mock implementation of the save manager's save_stats_achievements()
+        function.
+        """
+        save_stats_achievements_mock.return_value = ACHIEVEMENTS[0:1]
+        self.assertListEqual(ACHIEVEMENTS[0:1], save_stats_achievements(self.game_state, increment_defeats=True))
+        save_stats_achievements_mock.assert_called_with(self.game_state, increment_defeats=True)
+
     @patch("source.game_management.game_state.save_stats_achievements")
     def test_end_turn_victory(self, save_stats_achievements_mock: MagicMock):
         """
@@ -543,8 +652,10 @@ class GameStateTest(unittest.TestCase):
         # Initialise settlements for each player so an elimination victory is not triggered.
         self.game_state.players[0].settlements = [self.TEST_SETTLEMENT]
         self.game_state.players[1].settlements = [self.TEST_SETTLEMENT_2]
-        # Give the AI player's settlement the Holy Sanctum, in order to trigger a Vigour victory.
+        # Give the AI player's settlement the Holy Sanctum, in order to trigger a Vigour victory. As the settlement is
+        # given it directly rather than completing it, the tracker needs to be rebuilt to count it.
         self.TEST_SETTLEMENT_2.improvements = [IMPROVEMENTS[-1]]
+        self.game_state.board.victories.rebuild(self.game_state.players)
         # Make sure there are no warnings for the player by giving the settlement a construction and the player an
         # ongoing blessing and wealth.
         self.TEST_SETTLEMENT.current_work = Construction(IMPROVEMENTS[0])
@@ -618,7 +729,7 @@ class GameStateTest(unittest.TestCase):
         self.TEST_SETTLEMENT.level = 10
         self.TEST_SETTLEMENT.current_work = Construction(IMPROVEMENTS[-1])
         # We give the player eight copies of the settlement to get close to the ten required for a Gluttony victory.
-        self.game_state.players[0].settlements = [self.TEST_SETTLEMENT] * 8
+        self.game_state.players[0].settlements = [copy(self.TEST_SETTLEMENT) for _ in range(8)]
         # We have to make sure the main player isn't the only one with a settlement, which would trigger an Elimination
         # victory. Conveniently, as there is only one other settlement in the game, the main player is also considered
         # to be close to an Elimination victory.
@@ -628,6 +739,9 @@ class GameStateTest(unittest.TestCase):
         # We give the player two of the three required pieces of ardour for a Serendipity victory.
         self.game_state.players[0].blessings = [BLESSINGS["ard_one"], BLESSINGS["ard_two"]]
         self.game_state.board.overlay.toggle_close_to_vic = MagicMock()
+        # Progress towards victory is usually tracked as turns are processed, but since we have set up the players
+        # directly, we need to count it here.
+        self.game_state.board.victories.rebuild(self.game_state.players)
 
         # No actual victory should have been detected.
         self.assertIsNone(self.game_state.check_for_victory())
@@ -657,15 +771,16 @@ class GameStateTest(unittest.TestCase):
         """
         Ensure that when the conditions are met for a Jubilation victory, it is detected.
         """
-        # Five duplicate settlements at 100 satisfaction are required for this victory.
+        # Five settlements at 100 satisfaction are required for this victory.
         self.TEST_SETTLEMENT.satisfaction = 100
-        self.game_state.players[0].settlements = [self.TEST_SETTLEMENT] * 5
+        self.game_state.players[0].settlements = [copy(self.TEST_SETTLEMENT) for _ in range(5)]
         # We have to make sure the main player isn't the only one with a settlement, which would trigger an Elimination
         # victory.
         self.game_state.players[1].settlements = [self.TEST_SETTLEMENT_2]
         # The required number of turns in a row with five settlements at 100 satisfaction is 25. As such, we set it as
         # 24 to let it be incremented by the method, and then validated.
         self.game_state.players[0].jubilation_ctr = 24
+        self.game_state.board.victories.rebuild(self.game_state.players)
 
         self.assertEqual(Victory(self.game_state.players[0], VictoryType.JUBILATION),
                          self.game_state.check_for_victory())
@@ -676,10 +791,11 @@ class GameStateTest(unittest.TestCase):
         """
         # Ten settlements at level 10 are required for this victory.
         self.TEST_SETTLEMENT.level = 10
-        self.game_state.players[0].settlements = [self.TEST_SETTLEMENT] * 10
+        self.game_state.players[0].settlements = [copy(self.TEST_SETTLEMENT) for _ in range(10)]
         # We have to make sure the main player isn't the only one with a settlement, which would trigger an Elimination
         # victory.
         self.game_state.players[1].settlements = [self.TEST_SETTLEMENT_2]
+        self.game_state.board.victories.rebuild(self.game_state.players)
 
         self.assertEqual(Victory(self.game_state.players[0], VictoryType.GLUTTONY), self.game_state.check_for_victory())
 
@@ -693,6 +809,7 @@ class GameStateTest(unittest.TestCase):
         # We have to make sure the main player isn't the only one with a settlement, which would trigger an Elimination
         # victory.
         self.game_state.players[1].settlements = [self.TEST_SETTLEMENT_2]
+        self.game_state.board.victories.rebuild(self.game_state.players)
 
         self.assertEqual(Victory(self.game_state.players[0], VictoryType.VIGOUR), self.game_state.check_for_victory())
 
@@ -720,6 +837,7 @@ class GameStateTest(unittest.TestCase):
         self.game_state.players[1].settlements = [self.TEST_SETTLEMENT_2]
         # The undergoing of the three pieces of ardour as blessings is required for this victory.
         self.game_state.players[0].blessings = [BLESSINGS["ard_one"], BLESSINGS["ard_two"], BLESSINGS["ard_three"]]
+        self.game_state.board.victories.rebuild(self.game_state.players)
 
         self.assertEqual(Victory(self.game_state.players[0], VictoryType.SERENDIPITY),
                          self.game_state.check_for_victory())
@@ -766,6 +884,7 @@ class GameStateTest(unittest.TestCase):
         self.game_state.players[1].settlements = [self.TEST_SETTLEMENT_2]
         # If the settlement's satisfaction was at 100, this 24 would be incremented to 25 and the victory triggered.
         self.game_state.players[0].jubilation_ctr = 24
+        self.game_state.board.victories.rebuild(self.game_state.players)
 
         # As such, no victory should have been achieved, and the counter should have been reset for the relevant player.
         self.assertIsNone(self.game_state.check_for_victory())
@@ -831,6 +950,32 @@ class GameStateTest(unittest.TestCase):
         self.game_state.board.overlay.toggle_attack.assert_not_called()
         self.assertFalse(self.TEST_HEATHEN.remaining_stamina)
 
+    @patch("random.choice", lambda options: options[1])
+    @patch("random.randint", lambda *args: 1)
+    def test_process_heathens_move_obstructed(self):
+        """
+        Ensure that heathens moving randomly do not move to locations that are already occupied.
+        """
+        self.TEST_UNIT.location = 50, 50
+        self.game_state.players[0].faction = Faction.AGRICULTURISTS
+        # With the random movement fixed, the heathen will attempt to move 1 to the right and 5 down, where we place a
+        # settlement.
+        self.game_state.players[1].settlements = [Settlement("Blocker", (4, 8), [],
+                                                             [Quad(Biome.SEA, 0, 0, 0, 0, (4, 8))], [])]
+
+        self.game_state.process_heathens()
+
+        # The heathen should not have moved, and should still have its stamina.
+        self.assertTupleEqual((3, 3), self.TEST_HEATHEN.location)
+        self.assertEqual(6, self.TEST_HEATHEN.remaining_stamina)
+
+        # However, once the settlement is gone, the heathen should be able to move there.
+        self.game_state.players[1].settlements = []
+        self.game_state.process_heathens()
+
+        self.assertTupleEqual((4, 8), self.TEST_HEATHEN.location)
+        self.assertFalse(self.TEST_HEATHEN.remaining_stamina)
+
     def test_process_heathens_too_much_health(self):
         """
         Ensure that heathens do not attack units that have too much more health than them.
@@ -935,6 +1080,25 @@ class GameStateTest(unittest.TestCase):
         self.game_state.process_ais(test_movemaker)
         self.assertEqual(len(self.game_state.players), test_movemaker.make_move.call_count)
 
+    def test_end_turn_profiled(self):
+        """
+        Ensure that when profiling is enabled, each phase of the turn is measured, with a breakdown for each player.
+        """
+        self.game_state.profiler.toggle()
+        self.game_state.ai_only = True
+        test_movemaker = MoveMaker(self.TEST_NAMER)
+        test_movemaker.make_move = MagicMock()
+
+        self.assertTrue(self.game_state.end_turn())
+        self.game_state.process_ais(test_movemaker)
+
+        player_names = [player.name for player in self.game_state.players]
+        self.assertListEqual([f"process_player:{name}" for name in player_names] +
+                             ["heathen_spawn_reset", "process_climatic_effects", "check_for_victory"] +
+                             [f"make_move:{name}" for name in player_names],
+                             list(self.game_state.profiler.latest.timings))
+        self.assertEqual(1, self.game_state.profiler.latest.turn)
+
 
 if __name__ == '__main__':
     unittest.main()
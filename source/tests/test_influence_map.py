@@ -0,0 +1,120 @@
+import unittest
+
+from source.foundation.models import Unit, UnitPlan, Settlement, Quad, Biome, Player, Faction
+from source.game_management.influence_map import InfluenceMap
+
+
+class InfluenceMapTest(unittest.TestCase):
+    """
+    The test class for influence_map.py.
+    """
+
+    def setUp(self) -> None:
+        """
+        Initialise an empty influence map and the test models.
+        """
+        self.influence = InfluenceMap()
+        self.TEST_UNIT = Unit(50, 3, (10, 10), False, UnitPlan(100, 100, 3, "Warrior", None, 25))
+        self.TEST_SETTLEMENT = Settlement("Weakville", (50, 50), [], [Quad(Biome.FOREST, 1.5, 2, 0.5, 1, (50, 50))],
+                                          [], strength=90)
+        self.TEST_PLAYER = Player("Enemy", Faction.AGRICULTURISTS, 0, units=[self.TEST_UNIT],
+                                  settlements=[self.TEST_SETTLEMENT])
+
+    def test_update_unit(self):
+        """
+        Ensure that a unit threatens every quad it could attack next turn for every player other than its owner, and
+        that its threat follows it when it moves.
+        """
+        self.influence.update_unit(self.TEST_UNIT, self.TEST_PLAYER.name)
+
+        self.assertEqual(100, self.influence.threat_at("Other", (10, 10)))
+        self.assertEqual(100, self.influence.threat_at("Other", (14, 6)))
+        self.assertFalse(self.influence.threat_at("Other", (15, 10)))
+        # The unit should never be a threat to its own player.
+        self.assertFalse(self.influence.threat_at(self.TEST_PLAYER.name, (10, 10)))
+
+        self.TEST_UNIT.location = 30, 30
+        self.influence.update_unit(self.TEST_UNIT, self.TEST_PLAYER.name)
+
+        self.assertFalse(self.influence.threat_at("Other", (10, 10)))
+        self.assertEqual(100, self.influence.threat_at("Other", (30, 30)))
+
+    def test_update_unit_board_edge(self):
+        """
+        Ensure that units at the edges of the board only exert influence over quads that exist.
+        """
+        self.TEST_UNIT.location = 99, 89
+        self.influence.update_unit(self.TEST_UNIT, self.TEST_PLAYER.name)
+
+        self.assertEqual(100, self.influence.threat_at("Other", (99, 89)))
+        self.assertEqual(100, self.influence.threat_at("Other", (95, 85)))
+        self.assertFalse(self.influence.threat_at("Other", (0, 0)))
+        # Locations off the board have no influence at all.
+        self.assertFalse(self.influence.threat_at("Other", (100, 89)))
+        self.assertFalse(self.influence.opportunity_at("Other", (-1, 0)))
+
+    def test_update_settlement(self):
+        """
+        Ensure that settlements present an opportunity based on their quads' yields and their weakness, and that this
+        is kept up to date as the settlement changes.
+        """
+        self.influence.update_settlement(self.TEST_SETTLEMENT, self.TEST_PLAYER.name)
+
+        # The quad yields total 5 and the settlement is 10 strength short of its maximum.
+        self.assertEqual(15, self.influence.opportunity_at("Other", (55, 45)))
+        self.assertFalse(self.influence.opportunity_at("Other", (56, 50)))
+        self.assertFalse(self.influence.opportunity_at(self.TEST_PLAYER.name, (50, 50)))
+
+        self.TEST_SETTLEMENT.strength = 40
+        self.influence.update_settlement(self.TEST_SETTLEMENT, self.TEST_PLAYER.name)
+
+        self.assertEqual(65, self.influence.opportunity_at("Other", (50, 50)))
+
+    def test_remove(self):
+        """
+        Ensure that removing an entity clears its influence, and that removing an entity that was never stamped has no
+        effect.
+        """
+        self.influence.update_unit(self.TEST_UNIT, self.TEST_PLAYER.name)
+        self.influence.remove(self.TEST_UNIT)
+        self.influence.remove(self.TEST_SETTLEMENT)
+
+        self.assertFalse(self.influence.threat_at("Other", (10, 10)))
+        self.assertFalse(self.influence.stamps)
+        self.assertFalse(any(self.influence.total_threat))
+
+    def test_refresh(self):
+        """
+        Ensure that refreshing the map applies influence for new entities, updates changed ones, and removes those
+        that no longer exist, leaving the grids identical to a map built from scratch.
+        """
+        self.influence.refresh([self.TEST_PLAYER])
+
+        self.assertEqual(100, self.influence.threat_at("Other", (10, 10)))
+        self.assertEqual(15, self.influence.opportunity_at("Other", (50, 50)))
+
+        # Move the unit, take the settlement, and add a new unit.
+        new_unit = Unit(50, 3, (70, 70), False, UnitPlan(50, 100, 2, "Bowman", None, 25))
+        self.TEST_UNIT.location = 20, 20
+        new_owner = Player("Conqueror", Faction.IMPERIALS, 0, settlements=[self.TEST_SETTLEMENT])
+        self.TEST_PLAYER.settlements = []
+        self.TEST_PLAYER.units.append(new_unit)
+        self.influence.refresh([self.TEST_PLAYER, new_owner])
+
+        from_scratch = InfluenceMap()
+        from_scratch.refresh([self.TEST_PLAYER, new_owner])
+        self.assertListEqual(from_scratch.total_threat, self.influence.total_threat)
+        self.assertListEqual(from_scratch.total_opportunity, self.influence.total_opportunity)
+        self.assertFalse(self.influence.opportunity_at(new_owner.name, (50, 50)))
+        self.assertEqual(15, self.influence.opportunity_at(self.TEST_PLAYER.name, (50, 50)))
+
+        # Lastly, eliminate the player's units entirely.
+        self.TEST_PLAYER.units = []
+        self.influence.refresh([self.TEST_PLAYER, new_owner])
+
+        self.assertFalse(any(self.influence.total_threat))
+        self.assertEqual(1, len(self.influence.stamps))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,18 @@
 import unittest
+from copy import copy
 from unittest.mock import patch, MagicMock
 
 from source.display.board import Board
 from source.foundation.catalogue import Namer, UNIT_PLANS, BLESSINGS, get_unlockable_improvements, get_improvement, \
-    get_available_improvements, get_unit_plan, IMPROVEMENTS
+    get_available_improvements, get_unit_plan, IMPROVEMENTS, get_heathen
 from source.foundation.models import GameConfig, Faction, Unit, Player, Settlement, AIPlaystyle, AttackPlaystyle, \
     ExpansionPlaystyle, Blessing, Quad, Biome, UnitPlan, SetlAttackData, Construction
+from source.game_management.event_log import EventLog
+from source.game_management.influence_map import InfluenceMap
+from source.game_management.relic_registry import RelicRegistry
+from source.game_management.unit_index import UnitIndex
 from source.game_management.movemaker import search_for_relics_or_move, set_blessing, set_player_construction, \
-    set_ai_construction, MoveMaker, move_healer_unit
+    set_ai_construction, MoveMaker, move_healer_unit, make_default_move, is_unit_engaged
 
 
 class MovemakerTest(unittest.TestCase):
@@ -36,18 +41,19 @@ class MovemakerTest(unittest.TestCase):
         self.QUADS = self.TEST_BOARD.quads
         # We need to find a relic quad before each test, because the quads are re-generated each time.
         self.relic_coords: (int, int) = -1, -1
-        for i in range(2, 90):
-            for j in range(2, 80):
+        for i in range(2, 88):
+            for j in range(2, 98):
                 if self.QUADS[i][j].is_relic:
-                    self.relic_coords = i, j
+                    self.relic_coords = j, i
                     break
             if self.relic_coords[0] != -1:
                 break
         # More than one relic can make the tests unreliable, so remove all others.
         for i in range(90):
-            for j in range(80):
-                if self.QUADS[i][j].is_relic and self.relic_coords != (i, j):
+            for j in range(100):
+                if self.QUADS[i][j].is_relic and self.relic_coords != (j, i):
                     self.QUADS[i][j].is_relic = False
+        self.RELICS = self.TEST_BOARD.relics = RelicRegistry(self.QUADS)
 
         self.TEST_SETTLEMENT = Settlement("Obstructionville", (0, 0), [], [self.QUADS[0][0]], [])
         self.TEST_SETTLEMENT_2 = Settlement("EnemyTown", (40, 40), [], [self.QUADS[40][40]], [])
@@ -638,13 +644,13 @@ class MovemakerTest(unittest.TestCase):
         self.TEST_UNIT.location = self.relic_coords[0] - 2, self.relic_coords[1]
 
         self.assertTrue(self.TEST_UNIT.remaining_stamina)
-        self.assertTrue(self.QUADS[self.relic_coords[0]][self.relic_coords[1]].is_relic)
-        search_for_relics_or_move(self.TEST_UNIT, self.QUADS, self.TEST_PLAYER, [], [], self.TEST_CONFIG)
+        self.assertTrue(self.QUADS[self.relic_coords[1]][self.relic_coords[0]].is_relic)
+        search_for_relics_or_move(self.TEST_UNIT, self.RELICS, self.TEST_PLAYER, [], [], self.TEST_CONFIG, EventLog())
 
         # The unit should have moved directly to the left of the relic, and the quad should no longer have a relic.
         self.assertTupleEqual((self.relic_coords[0] - 1, self.relic_coords[1]), self.TEST_UNIT.location)
         self.assertFalse(self.TEST_UNIT.remaining_stamina)
-        self.assertFalse(self.QUADS[self.relic_coords[0]][self.relic_coords[1]].is_relic)
+        self.assertFalse(self.QUADS[self.relic_coords[1]][self.relic_coords[0]].is_relic)
 
     @patch("source.game_management.movemaker.investigate_relic", lambda *args: None)
     def test_search_for_relics_success_right(self):
@@ -654,13 +660,13 @@ class MovemakerTest(unittest.TestCase):
         self.TEST_UNIT.location = self.relic_coords[0] + 2, self.relic_coords[1]
 
         self.assertTrue(self.TEST_UNIT.remaining_stamina)
-        self.assertTrue(self.QUADS[self.relic_coords[0]][self.relic_coords[1]].is_relic)
-        search_for_relics_or_move(self.TEST_UNIT, self.QUADS, self.TEST_PLAYER, [], [], self.TEST_CONFIG)
+        self.assertTrue(self.QUADS[self.relic_coords[1]][self.relic_coords[0]].is_relic)
+        search_for_relics_or_move(self.TEST_UNIT, self.RELICS, self.TEST_PLAYER, [], [], self.TEST_CONFIG, EventLog())
 
         # The unit should have moved directly to the right of the relic, and the quad should no longer have a relic.
         self.assertTupleEqual((self.relic_coords[0] + 1, self.relic_coords[1]), self.TEST_UNIT.location)
         self.assertFalse(self.TEST_UNIT.remaining_stamina)
-        self.assertFalse(self.QUADS[self.relic_coords[0]][self.relic_coords[1]].is_relic)
+        self.assertFalse(self.QUADS[self.relic_coords[1]][self.relic_coords[0]].is_relic)
 
     @patch("source.game_management.movemaker.investigate_relic", lambda *args: None)
     def test_search_for_relics_obstructed(self):
@@ -673,15 +679,15 @@ class MovemakerTest(unittest.TestCase):
         self.TEST_UNIT.location = self.relic_coords[0] - 2, self.relic_coords[1]
 
         self.assertTrue(self.TEST_UNIT.remaining_stamina)
-        self.assertTrue(self.QUADS[self.relic_coords[0]][self.relic_coords[1]].is_relic)
-        search_for_relics_or_move(self.TEST_UNIT, self.QUADS, self.TEST_PLAYER, [self.TEST_UNIT_3],
-                                  [self.TEST_SETTLEMENT], self.TEST_CONFIG)
+        self.assertTrue(self.QUADS[self.relic_coords[1]][self.relic_coords[0]].is_relic)
+        search_for_relics_or_move(self.TEST_UNIT, self.RELICS, self.TEST_PLAYER, [self.TEST_UNIT_3],
+                                  [self.TEST_SETTLEMENT], self.TEST_CONFIG, EventLog())
 
         # Normally, the unit would move directly to the left of the relic, but it can't move there, and as such, the
         # quad should still have a relic.
         self.assertNotEqual((self.relic_coords[0] - 1, self.relic_coords[1]), self.TEST_UNIT.location)
         self.assertFalse(self.TEST_UNIT.remaining_stamina)
-        self.assertTrue(self.QUADS[self.relic_coords[0]][self.relic_coords[1]].is_relic)
+        self.assertTrue(self.QUADS[self.relic_coords[1]][self.relic_coords[0]].is_relic)
 
     @patch("source.game_management.movemaker.investigate_relic", lambda *args: None)
     def test_search_for_relics_none_found(self):
@@ -689,10 +695,10 @@ class MovemakerTest(unittest.TestCase):
         Ensure that when there are no available relics, the unit moves randomly.
         """
         # Remove the last relic from the board.
-        self.QUADS[self.relic_coords[0]][self.relic_coords[1]].is_relic = False
+        self.RELICS.remove(self.relic_coords)
 
         self.assertTrue(self.TEST_UNIT.remaining_stamina)
-        search_for_relics_or_move(self.TEST_UNIT, self.QUADS, self.TEST_PLAYER, [], [], self.TEST_CONFIG)
+        search_for_relics_or_move(self.TEST_UNIT, self.RELICS, self.TEST_PLAYER, [], [], self.TEST_CONFIG, EventLog())
         # Make sure the unit exhausted its stamina.
         self.assertFalse(self.TEST_UNIT.remaining_stamina)
 
@@ -705,7 +711,7 @@ class MovemakerTest(unittest.TestCase):
         self.TEST_PLAYER.units = [self.TEST_HEALER_UNIT]
         original_location = self.TEST_HEALER_UNIT.location
 
-        move_healer_unit(self.TEST_PLAYER, self.TEST_HEALER_UNIT, [], [], self.QUADS, self.TEST_CONFIG)
+        move_healer_unit(self.TEST_PLAYER, self.TEST_HEALER_UNIT, [], [], self.RELICS, self.TEST_CONFIG, EventLog())
         # We expect no heal to have occurred, but the unit should still have moved.
         heal_mock.assert_not_called()
         self.assertNotEqual(original_location, self.TEST_HEALER_UNIT.location)
@@ -719,7 +725,7 @@ class MovemakerTest(unittest.TestCase):
         self.TEST_HEALER_UNIT.location = self.TEST_UNIT.location[0] - 2, self.TEST_UNIT.location[1]
         self.TEST_PLAYER.units.append(self.TEST_HEALER_UNIT)
 
-        move_healer_unit(self.TEST_PLAYER, self.TEST_HEALER_UNIT, [], [], self.QUADS, self.TEST_CONFIG)
+        move_healer_unit(self.TEST_PLAYER, self.TEST_HEALER_UNIT, [], [], self.RELICS, self.TEST_CONFIG, EventLog())
         # The healer should have moved directly to the left of the heal-able unit and healed it.
         self.assertTupleEqual((self.TEST_UNIT.location[0] - 1, self.TEST_UNIT.location[1]),
                               self.TEST_HEALER_UNIT.location)
@@ -735,7 +741,7 @@ class MovemakerTest(unittest.TestCase):
         self.TEST_HEALER_UNIT.location = self.TEST_UNIT.location[0] + 2, self.TEST_UNIT.location[1]
         self.TEST_PLAYER.units.append(self.TEST_HEALER_UNIT)
 
-        move_healer_unit(self.TEST_PLAYER, self.TEST_HEALER_UNIT, [], [], self.QUADS, self.TEST_CONFIG)
+        move_healer_unit(self.TEST_PLAYER, self.TEST_HEALER_UNIT, [], [], self.RELICS, self.TEST_CONFIG, EventLog())
         # The healer should have moved directly to the right of the heal-able unit and healed it.
         self.assertTupleEqual((self.TEST_UNIT.location[0] + 1, self.TEST_UNIT.location[1]),
                               self.TEST_HEALER_UNIT.location)
@@ -747,7 +753,7 @@ class MovemakerTest(unittest.TestCase):
         Ensure that when an AI player is making their move, if they have no ongoing blessing, one is set.
         """
         self.assertIsNone(self.TEST_PLAYER.ongoing_blessing)
-        self.movemaker.make_move(self.TEST_PLAYER, [], self.QUADS, self.TEST_CONFIG, False)
+        self.movemaker.make_move(self.TEST_PLAYER, [], self.RELICS, self.TEST_CONFIG, False)
         self.assertIsNotNone(self.TEST_PLAYER.ongoing_blessing)
 
     def test_make_move_set_construction(self):
@@ -756,7 +762,7 @@ class MovemakerTest(unittest.TestCase):
         construction is set for that settlement.
         """
         self.assertIsNone(self.TEST_SETTLEMENT.current_work)
-        self.movemaker.make_move(self.TEST_PLAYER, [], self.QUADS, self.TEST_CONFIG, False)
+        self.movemaker.make_move(self.TEST_PLAYER, [], self.RELICS, self.TEST_CONFIG, False)
         self.assertIsNotNone(self.TEST_SETTLEMENT.current_work)
 
     @patch("source.game_management.movemaker.investigate_relic", lambda *args: None)
@@ -769,7 +775,7 @@ class MovemakerTest(unittest.TestCase):
 
         self.assertFalse(self.TEST_SETTLEMENT.improvements)
 
-        self.movemaker.make_move(self.TEST_PLAYER, [], self.QUADS, self.TEST_CONFIG, False)
+        self.movemaker.make_move(self.TEST_PLAYER, [], self.RELICS, self.TEST_CONFIG, False)
 
         # We expect the settlement to now have the improvement and the player's wealth to have been reduced
         # appropriately.
@@ -788,7 +794,7 @@ class MovemakerTest(unittest.TestCase):
 
         self.assertFalse(self.TEST_SETTLEMENT.improvements)
 
-        self.movemaker.make_move(self.TEST_PLAYER, [], self.QUADS, self.TEST_CONFIG, False)
+        self.movemaker.make_move(self.TEST_PLAYER, [], self.RELICS, self.TEST_CONFIG, False)
 
         # We expect the settlement to now have the improvement.
         self.assertIn(IMPROVEMENTS[0], self.TEST_SETTLEMENT.improvements)
@@ -802,7 +808,7 @@ class MovemakerTest(unittest.TestCase):
 
         self.assertNotIn(self.TEST_SETTLER_UNIT, self.TEST_PLAYER.units)
 
-        self.movemaker.make_move(self.TEST_PLAYER, [], self.QUADS, self.TEST_CONFIG, False)
+        self.movemaker.make_move(self.TEST_PLAYER, [], self.RELICS, self.TEST_CONFIG, False)
 
         self.assertFalse(self.TEST_SETTLER_UNIT.garrisoned)
         self.assertIn(self.TEST_SETTLER_UNIT, self.TEST_PLAYER.units)
@@ -818,7 +824,7 @@ class MovemakerTest(unittest.TestCase):
 
         self.assertNotIn(self.TEST_UNIT_2, self.TEST_PLAYER.units)
 
-        self.movemaker.make_move(self.TEST_PLAYER, [], self.QUADS, self.TEST_CONFIG, False)
+        self.movemaker.make_move(self.TEST_PLAYER, [], self.RELICS, self.TEST_CONFIG, False)
 
         self.assertFalse(self.TEST_UNIT_2.garrisoned)
         self.assertIn(self.TEST_UNIT_2, self.TEST_PLAYER.units)
@@ -835,7 +841,7 @@ class MovemakerTest(unittest.TestCase):
 
         self.assertNotIn(self.TEST_UNIT_2, self.TEST_PLAYER.units)
 
-        self.movemaker.make_move(self.TEST_PLAYER, [], self.QUADS, self.TEST_CONFIG, False)
+        self.movemaker.make_move(self.TEST_PLAYER, [], self.RELICS, self.TEST_CONFIG, False)
 
         self.assertFalse(self.TEST_UNIT_2.garrisoned)
         self.assertIn(self.TEST_UNIT_2, self.TEST_PLAYER.units)
@@ -855,7 +861,7 @@ class MovemakerTest(unittest.TestCase):
         self.assertNotIn(self.TEST_UNIT_2, self.TEST_PLAYER.units)
 
         self.movemaker.make_move(self.TEST_PLAYER, [self.TEST_PLAYER, self.TEST_PLAYER_2],
-                                 self.QUADS, self.TEST_CONFIG, False)
+                                 self.RELICS, self.TEST_CONFIG, False)
 
         self.assertFalse(self.TEST_UNIT_2.garrisoned)
         self.assertIn(self.TEST_UNIT_2, self.TEST_PLAYER.units)
@@ -874,7 +880,7 @@ class MovemakerTest(unittest.TestCase):
 
         self.assertNotIn(self.TEST_UNIT_2, self.TEST_PLAYER.units)
 
-        self.movemaker.make_move(self.TEST_PLAYER, [], self.QUADS, self.TEST_CONFIG, False)
+        self.movemaker.make_move(self.TEST_PLAYER, [], self.RELICS, self.TEST_CONFIG, False)
 
         self.assertFalse(self.TEST_UNIT_2.garrisoned)
         self.assertIn(self.TEST_UNIT_2, self.TEST_PLAYER.units)
@@ -897,7 +903,7 @@ class MovemakerTest(unittest.TestCase):
         self.TEST_UNIT_3.garrisoned = True
         self.TEST_SETTLEMENT.garrison = [self.TEST_UNIT, self.TEST_UNIT_2, self.TEST_UNIT_3, extra_unit]
 
-        self.movemaker.make_move(self.TEST_PLAYER, [], self.QUADS, self.TEST_CONFIG, False)
+        self.movemaker.make_move(self.TEST_PLAYER, [], self.RELICS, self.TEST_CONFIG, False)
 
         self.assertFalse(extra_unit.garrisoned)
         self.assertIn(extra_unit, self.TEST_PLAYER.units)
@@ -913,13 +919,13 @@ class MovemakerTest(unittest.TestCase):
         self.movemaker.move_unit = MagicMock()
 
         self.movemaker.make_move(self.TEST_PLAYER, [self.TEST_PLAYER, self.TEST_PLAYER_2],
-                                 self.QUADS, self.TEST_CONFIG, False)
+                                 self.RELICS, self.TEST_CONFIG, False)
 
         self.assertEqual(1, self.movemaker.move_unit.call_count)
         self.movemaker.move_unit.assert_called_with(self.TEST_PLAYER, self.TEST_UNIT, [self.TEST_UNIT_2],
                                                     [self.TEST_PLAYER, self.TEST_PLAYER_2],
                                                     [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2],
-                                                    self.QUADS, self.TEST_CONFIG)
+                                                    self.RELICS, self.TEST_CONFIG)
 
     @patch("source.game_management.movemaker.investigate_relic", lambda *args: None)
     def test_make_move_negative_wealth(self):
@@ -932,7 +938,7 @@ class MovemakerTest(unittest.TestCase):
 
         self.assertTrue(self.TEST_PLAYER.units)
         self.assertFalse(self.TEST_PLAYER.wealth)
-        self.movemaker.make_move(self.TEST_PLAYER, [], self.QUADS, self.TEST_CONFIG, False)
+        self.movemaker.make_move(self.TEST_PLAYER, [], self.RELICS, self.TEST_CONFIG, False)
         self.assertEqual(self.TEST_UNIT.plan.cost, self.TEST_PLAYER.wealth)
         self.assertFalse(self.TEST_PLAYER.units)
 
@@ -948,12 +954,33 @@ class MovemakerTest(unittest.TestCase):
         wealth_before_combat = self.TEST_PLAYER.wealth
         infidel_player = Player("Inf", Faction.INFIDELS, 0, units=[self.TEST_UNIT_3])
 
-        self.movemaker.make_move(self.TEST_PLAYER, [self.TEST_PLAYER, infidel_player], self.QUADS, self.TEST_CONFIG,
+        self.movemaker.make_move(self.TEST_PLAYER, [self.TEST_PLAYER, infidel_player], self.RELICS, self.TEST_CONFIG,
                                  False)
 
         self.assertEqual(wealth_before_combat, self.TEST_PLAYER.wealth)
         self.assertFalse(self.TEST_PLAYER.units)
 
+    def test_make_move_negative_wealth_doesnt_remove_equal_units(self):
+        """
+        Ensure that when an AI player would have negative wealth at the end of their turn, but the unit that would be
+        sold has already been removed, a distinct unit that is equal to it is not sold in its place.
+        """
+        self.TEST_SETTLEMENT.quads[0].wealth = 0
+        equal_unit = copy(self.TEST_UNIT)
+        self.TEST_PLAYER.units.append(equal_unit)
+
+        def kill_unit(player: Player, unit: Unit, *_):
+            # Simulate the weakest unit being killed while it moves.
+            if unit is self.TEST_UNIT:
+                player.units[:] = [u for u in player.units if u is not unit]
+
+        self.movemaker.move_unit = MagicMock(side_effect=kill_unit)
+        self.movemaker.make_move(self.TEST_PLAYER, [], self.RELICS, self.TEST_CONFIG, False)
+
+        self.assertFalse(self.TEST_PLAYER.wealth)
+        self.assertEqual(1, len(self.TEST_PLAYER.units))
+        self.assertIs(equal_unit, self.TEST_PLAYER.units[0])
+
     def test_move_settler_unit_not_far_enough(self):
         """
         Ensure that when a settler unit has not moved far enough away from its original settlement, it does not found a
@@ -1030,12 +1057,128 @@ class MovemakerTest(unittest.TestCase):
         self.assertEqual(50, self.TEST_PLAYER.settlements[1].strength)
         self.assertEqual(50, self.TEST_PLAYER.settlements[1].max_strength)
 
+    def test_make_move_budget_usage_recorded(self):
+        """
+        Ensure that when an AI player makes their move within their compute budget, all of their units are fully
+        planned and the budget usage is recorded.
+        """
+        self.movemaker.move_unit = MagicMock()
+
+        self.movemaker.make_move(self.TEST_PLAYER, [], self.RELICS, self.TEST_CONFIG, False)
+
+        usage = self.movemaker.budget_usage[self.TEST_PLAYER.name]
+        self.assertEqual(self.movemaker.turn_budget, usage.budget)
+        self.assertGreater(usage.time_used, 0)
+        self.assertEqual(1, usage.units_planned)
+        self.assertFalse(usage.units_defaulted)
+        self.movemaker.move_unit.assert_called_once()
+
+    def test_make_move_budget_exhausted(self):
+        """
+        Ensure that when an AI player's compute budget has been used up, units near threats or targets are prioritised
+        for full planning, with the remaining units being given a default move.
+        """
+        self.movemaker.turn_budget = 0
+        self.movemaker.move_unit = MagicMock()
+        # Keep the player's original unit far away from everything, and place another unit near the enemy settlement.
+        self.TEST_UNIT.location = 90, 80
+        self.TEST_UNIT_2.location = 38, 40
+        self.TEST_PLAYER.units.append(self.TEST_UNIT_2)
+        # Weaken the enemy settlement to guarantee that it presents an opportunity.
+        self.TEST_SETTLEMENT_2.strength = 50
+
+        self.movemaker.make_move(self.TEST_PLAYER, [self.TEST_PLAYER, self.TEST_PLAYER_2], self.RELICS,
+                                 self.TEST_CONFIG, False)
+
+        # Even though the budget is zero, the unit near the enemy settlement should still have been fully planned, with
+        # the far away unit being moved by default.
+        self.movemaker.move_unit.assert_called_once()
+        self.assertIs(self.TEST_UNIT_2, self.movemaker.move_unit.call_args[0][1])
+        self.assertNotEqual((90, 80), self.TEST_UNIT.location)
+        self.assertFalse(self.TEST_UNIT.remaining_stamina)
+        usage = self.movemaker.budget_usage[self.TEST_PLAYER.name]
+        self.assertEqual(1, usage.units_planned)
+        self.assertEqual(1, usage.units_defaulted)
+
+    @patch("source.game_management.movemaker.make_default_move")
+    def test_make_move_budget_exhausted_heathens(self, default_move_mock: MagicMock):
+        """
+        Ensure that when units are given a default move, the locations occupied by heathens are avoided.
+        :param default_move_mock: The mock implementation of the make_default_move() function.
+        """
+        self.movemaker.turn_budget = 0
+        self.movemaker.move_unit = MagicMock()
+        self.TEST_PLAYER.units.append(self.TEST_UNIT_2)
+        heathen = get_heathen((60, 60), 1)
+
+        self.movemaker.make_move(self.TEST_PLAYER, [self.TEST_PLAYER], self.RELICS, self.TEST_CONFIG, False,
+                                 [heathen])
+
+        default_move_mock.assert_called_once()
+        unit_index: UnitIndex = default_move_mock.call_args[0][1]
+        self.assertTrue(unit_index.is_occupied(heathen.location))
+
+    def test_is_unit_engaged(self):
+        """
+        Ensure that units are correctly determined to be engaged based on the threats and opportunities at their
+        location, with settlers always being engaged.
+        """
+        influence = InfluenceMap()
+        self.TEST_UNIT.location = 30, 30
+        self.TEST_SETTLER_UNIT.location = 30, 30
+
+        self.assertFalse(is_unit_engaged(self.TEST_UNIT, self.TEST_PLAYER, influence))
+        self.assertTrue(is_unit_engaged(self.TEST_SETTLER_UNIT, self.TEST_PLAYER, influence))
+
+        # An enemy unit that can reach the unit's location should make it engaged.
+        self.TEST_UNIT_2.location = 33, 30
+        influence.update_unit(self.TEST_UNIT_2, self.TEST_PLAYER_2.name)
+        self.assertTrue(is_unit_engaged(self.TEST_UNIT, self.TEST_PLAYER, influence))
+
+        # As should an enemy settlement nearby that presents an opportunity.
+        influence.remove(self.TEST_UNIT_2)
+        self.TEST_SETTLEMENT_2.location = 30, 34
+        self.TEST_SETTLEMENT_2.strength = 50
+        influence.update_settlement(self.TEST_SETTLEMENT_2, self.TEST_PLAYER_2.name)
+        self.assertTrue(is_unit_engaged(self.TEST_UNIT, self.TEST_PLAYER, influence))
+
+        # However, the player's own settlements should not count.
+        self.assertFalse(is_unit_engaged(self.TEST_UNIT, self.TEST_PLAYER_2, influence))
+
+    def test_make_default_move(self):
+        """
+        Ensure that default moves relocate units to unoccupied locations only, and leave besieging units in place.
+        """
+        self.TEST_UNIT.location = 50, 50
+        # Occupy every location the unit could possibly move to with settlements.
+        blocker = Player("Blocker", Faction.AGRICULTURISTS, 0,
+                         settlements=[Settlement("Wall", (50, 50), [],
+                                                 [Quad(Biome.SEA, 0, 0, 0, 0, (50 + x, 50 + y))
+                                                  for x in range(-3, 4) for y in range(-3, 4) if x or y], [])])
+        unit_index = UnitIndex([self.TEST_PLAYER, blocker])
+        make_default_move(self.TEST_UNIT, unit_index)
+        self.assertTupleEqual((50, 50), self.TEST_UNIT.location)
+        self.assertEqual(3, self.TEST_UNIT.remaining_stamina)
+
+        self.TEST_UNIT.besieging = True
+        unit_index = UnitIndex([self.TEST_PLAYER])
+        make_default_move(self.TEST_UNIT, unit_index)
+        self.assertTupleEqual((50, 50), self.TEST_UNIT.location)
+
+        self.TEST_UNIT.besieging = False
+        make_default_move(self.TEST_UNIT, unit_index)
+        self.assertNotEqual((50, 50), self.TEST_UNIT.location)
+        self.assertFalse(self.TEST_UNIT.remaining_stamina)
+        # The index should also have been updated to reflect the move.
+        self.assertFalse(unit_index.is_occupied((50, 50)))
+        self.assertTrue(unit_index.is_occupied(self.TEST_UNIT.location))
+
     def test_move_unit_settler(self):
         """
         Ensure that when a settler unit is being moved, the appropriate method is called.
         """
         self.movemaker.move_settler_unit = MagicMock()
-        self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_SETTLER_UNIT, [], [], [], self.QUADS, self.TEST_CONFIG)
+        self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_SETTLER_UNIT, [], [], [], self.RELICS, self.TEST_CONFIG)
         self.movemaker.move_settler_unit.assert_called_with(self.TEST_SETTLER_UNIT, self.TEST_PLAYER, [], [])
 
     @patch("source.game_management.movemaker.move_healer_unit")
@@ -1044,9 +1187,9 @@ class MovemakerTest(unittest.TestCase):
         Ensure that when a healer unit is being moved, the appropriate method is called.
         :param move_healer_mock: The mock implementation of the move_healer_unit() function.
         """
-        self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_HEALER_UNIT, [], [], [], self.QUADS, self.TEST_CONFIG)
+        self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_HEALER_UNIT, [], [], [], self.RELICS, self.TEST_CONFIG)
         move_healer_mock.assert_called_with(self.TEST_PLAYER, self.TEST_HEALER_UNIT, [], [],
-                                            self.QUADS, self.TEST_CONFIG)
+                                            self.RELICS, self.TEST_CONFIG, self.TEST_BOARD.events)
 
     def test_move_unit_attack_infidel(self):
         """
@@ -1059,7 +1202,7 @@ class MovemakerTest(unittest.TestCase):
         infidel_player = Player("Inf", Faction.INFIDELS, 0, units=[self.TEST_UNIT_3])
 
         self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT_2, [self.TEST_UNIT_3],
-                                 [self.TEST_PLAYER, infidel_player], [], self.QUADS, self.TEST_CONFIG)
+                                 [self.TEST_PLAYER, infidel_player], [], self.RELICS, self.TEST_CONFIG)
 
         # We expect the unit to have moved next to the infidel unit, and for an attack to have been made, killing both
         # units.
@@ -1082,7 +1225,7 @@ class MovemakerTest(unittest.TestCase):
         self.TEST_PLAYER_2.units = [self.TEST_UNIT_2]
 
         self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT_3, [self.TEST_UNIT_2],
-                                 [self.TEST_PLAYER, self.TEST_PLAYER_2], [], self.QUADS, self.TEST_CONFIG)
+                                 [self.TEST_PLAYER, self.TEST_PLAYER_2], [], self.RELICS, self.TEST_CONFIG)
 
         # We expect the unit to have moved next to the other unit, and for an attack to have been made, killing both
         # units.
@@ -1104,7 +1247,7 @@ class MovemakerTest(unittest.TestCase):
         self.TEST_PLAYER_2.units = [self.TEST_UNIT_2]
 
         self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT_3, [self.TEST_UNIT_2],
-                                 [self.TEST_PLAYER, self.TEST_PLAYER_2], [], self.QUADS, self.TEST_CONFIG)
+                                 [self.TEST_PLAYER, self.TEST_PLAYER_2], [], self.RELICS, self.TEST_CONFIG)
 
         # We expect the unit to have moved next to the other unit, and for an attack to have been made, killing both
         # units.
@@ -1125,7 +1268,7 @@ class MovemakerTest(unittest.TestCase):
         self.movemaker.board_ref.overlay.toggle_attack = MagicMock()
 
         self.movemaker.move_unit(self.TEST_PLAYER_2, self.TEST_UNIT_3, [self.TEST_UNIT_2],
-                                 [self.TEST_PLAYER, self.TEST_PLAYER_2], [], self.QUADS, self.TEST_CONFIG)
+                                 [self.TEST_PLAYER, self.TEST_PLAYER_2], [], self.RELICS, self.TEST_CONFIG)
 
         # We expect the unit to have moved next to the other unit, and for an attack to have been made, killing both
         # units.
@@ -1148,7 +1291,7 @@ class MovemakerTest(unittest.TestCase):
         self.TEST_PLAYER_2.units = [self.TEST_UNIT_2]
 
         self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT_3, [self.TEST_UNIT_2],
-                                 [self.TEST_PLAYER, self.TEST_PLAYER_2], [], self.QUADS, self.TEST_CONFIG)
+                                 [self.TEST_PLAYER, self.TEST_PLAYER_2], [], self.RELICS, self.TEST_CONFIG)
 
         # We expect the unit to have moved next to the other unit, and for an attack to have been made, killing both
         # units.
@@ -1170,7 +1313,7 @@ class MovemakerTest(unittest.TestCase):
         self.movemaker.board_ref.overlay.toggle_setl_attack = MagicMock()
 
         self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT, [], [self.TEST_PLAYER_2, self.TEST_PLAYER],
-                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.QUADS, self.TEST_CONFIG)
+                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.RELICS, self.TEST_CONFIG)
 
         # We expect the unit to have moved next to the settlement, and for an attack to have been made, harming both
         # the unit and the settlement.
@@ -1182,6 +1325,26 @@ class MovemakerTest(unittest.TestCase):
         # Because the 'human' player in this test is being attacked, we also expect the overlay to have been toggled.
         self.movemaker.board_ref.overlay.toggle_setl_attack.assert_called()
 
+    def test_move_unit_attack_settlement_taken_concentrated(self):
+        """
+        Ensure that when a unit being moved for an AI player of The Concentrated faction takes a settlement, the
+        settlement disappears, no longer counting towards anyone's progress towards victory.
+        """
+        self.TEST_PLAYER.faction = Faction.CONCENTRATED
+        self.TEST_UNIT.location = self.TEST_SETTLEMENT_2.location[0] + 2, self.TEST_SETTLEMENT_2.location[1]
+        self.TEST_UNIT.health = 100
+        self.TEST_SETTLEMENT_2.strength = 1
+        self.TEST_SETTLEMENT_2.level = 10
+        self.movemaker.board_ref.victories.rebuild([self.TEST_PLAYER, self.TEST_PLAYER_2])
+
+        self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT, [], [self.TEST_PLAYER, self.TEST_PLAYER_2],
+                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.RELICS, self.TEST_CONFIG)
+
+        self.assertNotIn(self.TEST_SETTLEMENT_2, self.TEST_PLAYER.settlements)
+        self.assertFalse(self.TEST_PLAYER_2.settlements)
+        self.assertFalse(self.movemaker.board_ref.victories.of(self.TEST_PLAYER).lvl_ten_setls)
+        self.assertFalse(self.movemaker.board_ref.victories.of(self.TEST_PLAYER_2).lvl_ten_setls)
+
     @patch("source.game_management.movemaker.attack_setl")
     def test_move_unit_attack_settlement_attacker_killed(self, attack_setl_mock: MagicMock):
         """
@@ -1202,7 +1365,7 @@ class MovemakerTest(unittest.TestCase):
         self.movemaker.board_ref.overlay.toggle_setl_attack = MagicMock()
 
         self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT, [], [self.TEST_PLAYER_2, self.TEST_PLAYER],
-                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.QUADS, self.TEST_CONFIG)
+                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.RELICS, self.TEST_CONFIG)
 
         # We expect the unit to have moved next to the settlement, and for an attack to have been made, killing the unit
         # and damaging the settlement.
@@ -1222,12 +1385,11 @@ class MovemakerTest(unittest.TestCase):
         self.TEST_UNIT.location = self.TEST_SETTLEMENT_2.location[0] + 2, self.TEST_SETTLEMENT_2.location[1]
         self.TEST_UNIT.health = 100
         # In this example, the unit is currently placing the settlement under siege.
-        self.TEST_UNIT.besieging = True
+        self.movemaker.board_ref.sieges.begin(self.TEST_UNIT, self.TEST_SETTLEMENT_2)
         self.TEST_SETTLEMENT_2.strength = 10
-        self.TEST_SETTLEMENT_2.besieged = True
 
         self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT, [], [self.TEST_PLAYER, self.TEST_PLAYER_2],
-                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.QUADS, self.TEST_CONFIG)
+                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.RELICS, self.TEST_CONFIG)
 
         # We expect the unit to have moved next to the settlement, and for an attack to have been made, taking the
         # settlement for the player and ending the siege.
@@ -1247,12 +1409,11 @@ class MovemakerTest(unittest.TestCase):
         self.TEST_PLAYER.ai_playstyle.attacking = AttackPlaystyle.DEFENSIVE
         self.TEST_UNIT.location = self.TEST_SETTLEMENT_2.location[0] + 2, self.TEST_SETTLEMENT_2.location[1]
         # In this example, the unit is currently placing the settlement under siege.
-        self.TEST_UNIT.besieging = True
+        self.movemaker.board_ref.sieges.begin(self.TEST_UNIT, self.TEST_SETTLEMENT_2)
         self.TEST_SETTLEMENT_2.strength = 0
-        self.TEST_SETTLEMENT_2.besieged = True
 
         self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT, [], [self.TEST_PLAYER, self.TEST_PLAYER_2],
-                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.QUADS, self.TEST_CONFIG)
+                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.RELICS, self.TEST_CONFIG)
 
         # We expect the unit to have moved next to the settlement, and for an attack to have been made, taking the
         # settlement for the player and ending the siege.
@@ -1280,7 +1441,7 @@ class MovemakerTest(unittest.TestCase):
         self.assertFalse(self.TEST_SETTLEMENT_2.besieged)
 
         self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT, [], [self.TEST_PLAYER_2, self.TEST_PLAYER],
-                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.QUADS, self.TEST_CONFIG)
+                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.RELICS, self.TEST_CONFIG)
 
         # We expect the unit to have moved next to the settlement, and for a siege to have been begun.
         self.assertTupleEqual((self.TEST_SETTLEMENT_2.location[0] - 1, self.TEST_SETTLEMENT_2.location[1]),
@@ -1306,7 +1467,7 @@ class MovemakerTest(unittest.TestCase):
         self.assertFalse(self.TEST_SETTLEMENT_2.besieged)
 
         self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT, [], [self.TEST_PLAYER, self.TEST_PLAYER_2],
-                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.QUADS, self.TEST_CONFIG)
+                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.RELICS, self.TEST_CONFIG)
 
         # We expect the unit to have moved next to the settlement, and for a siege to have been begun.
         self.assertTupleEqual((self.TEST_SETTLEMENT_2.location[0] + 1, self.TEST_SETTLEMENT_2.location[1]),
@@ -1315,6 +1476,31 @@ class MovemakerTest(unittest.TestCase):
         self.assertTrue(self.TEST_UNIT.besieging)
         self.assertTrue(self.TEST_SETTLEMENT_2.besieged)
 
+    @patch("source.game_management.movemaker.search_for_relics_or_move")
+    def test_move_unit_no_siege_defended_settlement_neutral_ai(self, search_or_move_mock: MagicMock):
+        """
+        Ensure that when a unit is being moved for a neutral AI player, it will not place a settlement under siege if
+        the settlement is defended by units more powerful than the besieger.
+        :param search_or_move_mock: The mock implementation of the search_for_relics_or_move() function.
+        """
+        self.TEST_UNIT.location = self.TEST_SETTLEMENT_2.location[0] + 2, self.TEST_SETTLEMENT_2.location[1]
+        self.TEST_UNIT.health = 100
+        self.TEST_SETTLEMENT_2.strength = 50
+        # Station a powerful defender near the settlement, out of the unit's reach.
+        defender = Unit(100, 3, (self.TEST_SETTLEMENT_2.location[0] - 3, self.TEST_SETTLEMENT_2.location[1]), False,
+                        UnitPlan(200, 100, 3, "Defender", None, 25))
+        self.movemaker.influence.update_unit(defender, self.TEST_PLAYER_2.name)
+
+        self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT, [], [self.TEST_PLAYER, self.TEST_PLAYER_2],
+                                 [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.RELICS, self.TEST_CONFIG)
+
+        # We expect no siege to have begun, with the unit searching for relics or moving instead.
+        self.assertFalse(self.TEST_UNIT.besieging)
+        self.assertFalse(self.TEST_SETTLEMENT_2.besieged)
+        search_or_move_mock.assert_called_with(self.TEST_UNIT, self.RELICS, self.TEST_PLAYER, [],
+                                               [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.TEST_CONFIG,
+                                               self.TEST_BOARD.events)
+
     @patch("source.game_management.movemaker.search_for_relics_or_move")
     def test_move_unit_nothing_within_range(self, search_or_move_mock: MagicMock):
         """
@@ -1322,9 +1508,70 @@ class MovemakerTest(unittest.TestCase):
         for an attack or siege, the correct search/move function is called.
         :param search_or_move_mock: The mock implementation of the search_for_relics_or_move() function.
         """
-        self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT, [], [], [], self.QUADS, self.TEST_CONFIG)
-        search_or_move_mock.assert_called_with(self.TEST_UNIT, self.QUADS, self.TEST_PLAYER, [], [], self.TEST_CONFIG)
+        self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT, [], [], [], self.RELICS, self.TEST_CONFIG)
+        search_or_move_mock.assert_called_with(self.TEST_UNIT, self.RELICS, self.TEST_PLAYER, [], [], self.TEST_CONFIG,
+                                               self.TEST_BOARD.events)
+
+
+    @patch("source.game_management.movemaker.search_for_relics_or_move")
+    def test_move_unit_besieging_unit_moves_away(self, search_or_move_mock: MagicMock):
+        """
+        Ensure that when a besieging unit moves away from the settlement it is besieging, its siege is ended.
+        :param search_or_move_mock: The mock implementation of the search_for_relics_or_move() function.
+        """
+        self.TEST_PLAYER.ai_playstyle.attacking = AttackPlaystyle.DEFENSIVE
+        self.TEST_UNIT.location = self.TEST_SETTLEMENT_2.location[0] + 1, self.TEST_SETTLEMENT_2.location[1]
+        self.movemaker.board_ref.sieges.begin(self.TEST_UNIT, self.TEST_SETTLEMENT_2)
+
+        # Simulate the unit wandering away from the settlement, as it has nothing within range to attack.
+        def wander(unit: Unit, *_):
+            unit.location = unit.location[0] + 2, unit.location[1] - 3
+
+        search_or_move_mock.side_effect = wander
+        with patch.object(self.TEST_BOARD.events, "siege_ended") as siege_ended_mock:
+            self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT, [], [self.TEST_PLAYER, self.TEST_PLAYER_2],
+                                     [self.TEST_SETTLEMENT, self.TEST_SETTLEMENT_2], self.RELICS, self.TEST_CONFIG)
+            siege_ended_mock.assert_called_with(self.TEST_UNIT)
+
+        self.assertFalse(self.TEST_UNIT.besieging)
+        self.assertFalse(self.movemaker.board_ref.sieges.besiegers_of(self.TEST_SETTLEMENT_2))
+
+    def test_move_unit_besieging_unit_besieges_another_settlement(self):
+        """
+        Ensure that when a besieging unit moves to place another settlement under siege, its original siege is ended.
+        """
+        self.TEST_PLAYER.ai_playstyle.attacking = AttackPlaystyle.AGGRESSIVE
+        other_setl = Settlement("OtherTown", (44, 40), [], [self.QUADS[40][44]], [], strength=50)
+        self.TEST_PLAYER_2.settlements.append(other_setl)
+        self.TEST_UNIT.location = self.TEST_SETTLEMENT_2.location[0] + 1, self.TEST_SETTLEMENT_2.location[1]
+        self.TEST_UNIT.health = 10
+        self.movemaker.board_ref.sieges.begin(self.TEST_UNIT, self.TEST_SETTLEMENT_2)
+
+        with patch.object(self.TEST_BOARD.events, "siege_ended") as siege_ended_mock:
+            self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_UNIT, [], [self.TEST_PLAYER, self.TEST_PLAYER_2],
+                                     [other_setl, self.TEST_SETTLEMENT_2], self.RELICS, self.TEST_CONFIG)
+            siege_ended_mock.assert_called_with(self.TEST_UNIT)
+
+        # We expect the unit to have moved next to the other settlement, and to only be besieging it.
+        self.assertTupleEqual((other_setl.location[0] - 1, other_setl.location[1]), self.TEST_UNIT.location)
+        self.assertTrue(self.TEST_UNIT.besieging)
+        self.assertFalse(self.movemaker.board_ref.sieges.besiegers_of(self.TEST_SETTLEMENT_2))
+        self.assertListEqual([self.TEST_UNIT], self.movemaker.board_ref.sieges.besiegers_of(other_setl))
+
+    @patch("source.game_management.movemaker.move_healer_unit")
+    def test_move_unit_besieging_healer_moves_away(self, move_healer_mock: MagicMock):
+        """
+        Ensure that when a besieging healer unit moves away from the settlement it is besieging, its siege is ended.
+        :param move_healer_mock: The mock implementation of the move_healer_unit() function.
+        """
+        self.TEST_HEALER_UNIT.location = self.TEST_SETTLEMENT_2.location[0] + 1, self.TEST_SETTLEMENT_2.location[1]
+        self.movemaker.board_ref.sieges.begin(self.TEST_HEALER_UNIT, self.TEST_SETTLEMENT_2)
+        move_healer_mock.side_effect = lambda _, unit, *__: setattr(unit, "location", (50, 50))
+
+        self.movemaker.move_unit(self.TEST_PLAYER, self.TEST_HEALER_UNIT, [], [], [], self.RELICS, self.TEST_CONFIG)
 
+        self.assertFalse(self.TEST_HEALER_UNIT.besieging)
+        self.assertFalse(self.movemaker.board_ref.sieges.besiegers_of(self.TEST_SETTLEMENT_2))
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,12 +1,13 @@
 import typing
 import unittest
 
-from source.display.overlay import Overlay
+from source.display.overlay import Overlay, NullOverlay
 from source.foundation.catalogue import UNIT_PLANS, ACHIEVEMENTS
 from source.foundation.models import OverlayType, Settlement, Player, Faction, ConstructionMenu, Project, ProjectType, \
     Improvement, Effect, ImprovementType, UnitPlan, Blessing, Unit, CompletedConstruction, AttackData, HealData, \
     SetlAttackData, Victory, VictoryType, SettlementAttackType, PauseOption, InvestigationResult, DeployerUnitPlan, \
     DeployerUnit
+from source.game_management.turn_profiler import TurnProfiler
 
 
 class OverlayTest(unittest.TestCase):
@@ -852,6 +853,24 @@ class OverlayTest(unittest.TestCase):
         self.assertFalse(self.overlay.is_ach_notif())
         self.assertFalse(self.overlay.new_achievements)
 
+    def test_toggle_profiler(self):
+        """
+        Ensure that the Profiler overlay can be toggled correctly.
+        """
+        self.overlay.showing = []
+        self.overlay.has_exported_profiles = True
+        test_profiler = TurnProfiler()
+
+        # When not displayed, toggling should add the overlay and reset the export status.
+        self.overlay.toggle_profiler(test_profiler)
+        self.assertTrue(self.overlay.is_profiler())
+        self.assertEqual(test_profiler, self.overlay.turn_profiler)
+        self.assertFalse(self.overlay.has_exported_profiles)
+
+        # When displayed, toggling should remove the overlay.
+        self.overlay.toggle_profiler(test_profiler)
+        self.assertFalse(self.overlay.is_profiler())
+
     def test_remove_layer(self):
         """
         Ensure that a layer from the overlay can be successfully removed.
@@ -922,6 +941,31 @@ class OverlayTest(unittest.TestCase):
         self.overlay.navigate_unit(down=False)
         self.assertEqual(0, self.overlay.unit_passengers_idx)
 
+    def test_null_overlay(self):
+        """
+        Ensure that the null overlay discards every notification sent to it, apart from recording victories.
+        """
+        null_overlay = NullOverlay()
+        null_overlay.toggle_unit(self.TEST_UNIT)
+        null_overlay.toggle_warning([self.TEST_SETTLEMENT], True, True)
+        null_overlay.toggle_blessing_notification(self.TEST_BLESSING)
+        null_overlay.toggle_construction_notification(
+            [CompletedConstruction(self.TEST_IMPROVEMENT, self.TEST_SETTLEMENT)])
+        null_overlay.toggle_level_up_notification([self.TEST_SETTLEMENT])
+        null_overlay.toggle_attack(AttackData(self.TEST_UNIT, self.TEST_UNIT_2, 1, 2, True, False, False))
+        null_overlay.toggle_setl_attack(SetlAttackData(self.TEST_UNIT, self.TEST_SETTLEMENT, self.TEST_PLAYER, 1, 2,
+                                                       True, False, False))
+        null_overlay.toggle_siege_notif(self.TEST_SETTLEMENT, self.TEST_PLAYER)
+        null_overlay.toggle_elimination(self.TEST_PLAYER)
+        null_overlay.toggle_close_to_vic([self.TEST_VICTORY])
+        null_overlay.toggle_night(True)
+        null_overlay.toggle_ach_notif([ACHIEVEMENTS[0]])
+        self.assertFalse(null_overlay.showing)
+
+        null_overlay.toggle_victory(self.TEST_VICTORY)
+        self.assertFalse(null_overlay.showing)
+        self.assertEqual(self.TEST_VICTORY, null_overlay.current_victory)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+from array import array
+
+from source.foundation.models import Quad, Biome
+from source.foundation.quad_grid import QuadGrid
+
+
+class QuadGridTest(unittest.TestCase):
+    """
+    The test class for quad_grid.py.
+    """
+
+    def setUp(self) -> None:
+        """
+        Initialise a small grid of two rows of three quads, with a relic, and a selected relic.
+        """
+        self.biome_ids = bytes([0, 1, 2, 3, 0, 1])
+        self.yields = array("d", range(24))
+        self.flags = bytes([0, 2, 0, 0, 3, 1])
+        self.grid = QuadGrid(self.biome_ids, self.yields, self.flags, width=3)
+
+    def test_materialise(self):
+        """
+        Ensure that quads are materialised from the columns the first time they are accessed, and only then.
+        """
+        self.assertEqual(2, len(self.grid))
+        self.assertEqual(3, len(self.grid[0]))
+        self.assertFalse(self.grid.materialised)
+
+        quad = self.grid[1][1]
+        self.assertEqual(Quad(Biome.DESERT, 16, 17, 18, 19, (1, 1), True, True), quad)
+        self.assertIs(quad, self.grid[1][1])
+        # Negative indices should refer to the same quads as their positive counterparts.
+        self.assertIs(quad, self.grid[-1][-2])
+        self.assertListEqual([quad], self.grid.materialised)
+        with self.assertRaises(IndexError):
+            _ = self.grid[0][3]
+
+    def test_slices(self):
+        """
+        Ensure that slices of rows and of the grid are supported.
+        """
+        self.assertListEqual([self.grid[0][1], self.grid[0][2]], self.grid[0][1:])
+        self.assertListEqual([self.grid[1]], self.grid[1:])
+
+    def test_equality(self):
+        """
+        Ensure that grids are equal to lists of lists of the same quads, and are otherwise unequal.
+        """
+        quads = [[Quad(Biome.DESERT, 0, 1, 2, 3, (0, 0)), Quad(Biome.FOREST, 4, 5, 6, 7, (1, 0), is_relic=True),
+                  Quad(Biome.SEA, 8, 9, 10, 11, (2, 0))],
+                 [Quad(Biome.MOUNTAIN, 12, 13, 14, 15, (0, 1)), Quad(Biome.DESERT, 16, 17, 18, 19, (1, 1), True, True),
+                  Quad(Biome.FOREST, 20, 21, 22, 23, (2, 1), True)]]
+        self.assertEqual(quads, self.grid)
+        self.assertEqual(self.grid, quads)
+
+        quads[1][2].zeal = 0
+        self.assertNotEqual(quads, self.grid)
+        self.assertNotEqual(quads[:1], self.grid)
+        self.assertNotEqual(self.grid, None)
+        self.assertNotEqual(self.grid[0], None)
+
+    def test_relics(self):
+        """
+        Ensure that relics are found from the flags of the quads, other than for quads that have been materialised,
+        which may have since changed.
+        """
+        self.assertSetEqual({(1, 0), (1, 1)}, self.grid.relics())
+        self.grid[0][1].is_relic = False
+        self.grid[1][0].is_relic = True
+        self.assertSetEqual({(0, 1), (1, 1)}, self.grid.relics())
+
+    def test_packed(self):
+        """
+        Ensure that the packed columns include the changes made to materialised quads, without modifying the columns
+        the grid was loaded from.
+        """
+        self.grid[0][2].biome = Biome.MOUNTAIN
+        self.grid[0][2].harvest = 99
+        self.grid[1][2].selected = False
+        self.grid[1][2].is_relic = True
+
+        biome_ids, yields, flags = self.grid.packed()
+        self.assertEqual(bytes([0, 1, 3, 3, 0, 1]), biome_ids.tobytes())
+        self.assertListEqual([8, 99, 10, 11], yields[8:12].tolist())
+        self.assertEqual(bytes([0, 2, 0, 0, 3, 2]), flags.tobytes())
+        self.assertEqual(bytes([0, 1, 2, 3, 0, 1]), self.biome_ids)
+        self.assertEqual(9, self.yields[9])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+from source.foundation.models import Quad, Biome
+from source.foundation.quad_grid import QuadGrid
+from source.game_management.relic_registry import RelicRegistry
+
+
+class RelicRegistryTest(unittest.TestCase):
+    """
+    The test class for relic_registry.py.
+    """
+
+    def setUp(self) -> None:
+        """
+        Generate a board of quads with a few relics on it, and register them.
+        """
+        self.quads = [[Quad(Biome.FOREST, 0, 0, 0, 0, (j, i)) for j in range(100)] for i in range(90)]
+        self.relic_locs = [(5, 5), (12, 8), (50, 50), (99, 89)]
+        for loc in self.relic_locs:
+            self.quads[loc[1]][loc[0]].is_relic = True
+        self.relics = RelicRegistry(self.quads)
+
+    def test_init(self):
+        """
+        Ensure that the registry picks up every relic on the supplied quads.
+        """
+        self.assertEqual(4, self.relics.count)
+        for loc in self.relic_locs:
+            self.assertIn(loc, self.relics)
+        self.assertNotIn((6, 5), self.relics)
+
+    def test_init_grid(self):
+        """
+        Ensure that the registry picks up every relic on a quad grid without materialising its quads.
+        """
+        flags = bytearray(9000)
+        for loc in self.relic_locs:
+            flags[loc[1] * 100 + loc[0]] = 2
+        grid = QuadGrid(bytes(9000), [0.0] * 36000, flags)
+        relics = RelicRegistry(grid)
+
+        self.assertSetEqual(set(self.relic_locs), relics.locations)
+        self.assertFalse(grid.materialised)
+
+    def test_remove(self):
+        """
+        Ensure that removing a relic removes it from the registry and clears the relic status of its quad, and that
+        removing a relic that has already been removed has no effect.
+        """
+        self.relics.remove((12, 8))
+
+        self.assertEqual(3, self.relics.count)
+        self.assertNotIn((12, 8), self.relics)
+        self.assertFalse(self.quads[8][12].is_relic)
+        self.assertListEqual([(5, 5)], self.relics.within((10, 10), 5))
+
+        self.relics.remove((12, 8))
+        self.assertEqual(3, self.relics.count)
+
+    def test_within(self):
+        """
+        Ensure that only the relics within the given distance of a location are found, across bucket boundaries and at
+        the edges of the board.
+        """
+        # Both relics are exactly 7 away diagonally or horizontally, spanning multiple buckets.
+        self.assertListEqual([(5, 5), (12, 8)], self.relics.within((12, 1), 7))
+        self.assertListEqual([(12, 8)], self.relics.within((12, 2), 6))
+        self.assertListEqual([(99, 89)], self.relics.within((97, 87), 2))
+        self.assertFalse(self.relics.within((30, 30), 10))
+
+
+if __name__ == '__main__':
+    unittest.main()
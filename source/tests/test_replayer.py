@@ -0,0 +1,251 @@
+import copy
+import unittest
+
+from source.foundation.catalogue import UNIT_PLANS, BLESSINGS, get_improvement, get_project
+from source.foundation.climate import Climate
+from source.foundation.models import GameConfig, Faction, AIPlaystyle, AttackPlaystyle, ExpansionPlaystyle, Unit, \
+    UnitPlan, DeployerUnit, DeployerUnitPlan, Heathen, Settlement, Construction, InvestigationResult, \
+    GameStartedEvent, TurnEndedEvent, SettlementFoundedEvent, BlessingSetEvent, ConstructionSetEvent, \
+    ConstructionBoughtOutEvent, UnitMovedEvent, UnitDeployedEvent, PassengerDeployedEvent, UnitGarrisonedEvent, \
+    UnitBoardedEvent, UnitAttackedEvent, SettlementAttackedEvent, UnitHealedEvent, SiegeBegunEvent, SiegeEndedEvent, \
+    RelicInvestigatedEvent, UnitDisbandedEvent
+from source.game_management.event_log import encode_event, decode_event, HEATHEN_OWNER
+from source.game_management.replayer import replay, start_game, apply_event
+from source.sim import new_game, play_turn
+
+
+class ReplayerTest(unittest.TestCase):
+    """
+    The test class for replayer.py.
+    """
+    TEST_CONFIG = GameConfig(3, Faction.CONCENTRATED, True, True, True)
+
+    def setUp(self) -> None:
+        """
+        Start a game between the player, playing as The Concentrated, and two AI players, without any units. The
+        default climate is restored after each test, since simulated games apply their own.
+        """
+        self.addCleanup(Climate().apply)
+        playstyle = AIPlaystyle(AttackPlaystyle.AGGRESSIVE, ExpansionPlaystyle.EXPANSIONIST)
+        self.game_state = start_game(GameStartedEvent(1, 15, self.TEST_CONFIG,
+                                                      [("The Chosen One", Faction.CONCENTRATED, None),
+                                                       ("NPC1", Faction.IMPERIALS, playstyle),
+                                                       ("NPC2", Faction.FRONTIERSMEN, playstyle)]))
+        self.human, self.imperials, self.frontiersmen = self.game_state.players
+        self.TEST_UNIT = Unit(100, 3, (10, 10), False, UnitPlan(100, 100, 3, "Warrior", None, 25))
+        self.TEST_UNIT_2 = Unit(100, 3, (12, 10), False, UnitPlan(100, 100, 3, "Warrior", None, 25))
+
+    def get_name(self, location: (int, int)) -> str:
+        """
+        :param location: The location of the settlement to be named.
+        :return: A name that the namer has not yet used for a settlement at the given location.
+        """
+        return self.game_state.board.namer.names[self.game_state.board.quads[location[1]][location[0]].biome][0]
+
+    def test_replay(self):
+        """
+        Ensure that replaying the event log of a game between AI players reconstructs the same state as the game had,
+        both at the end of the game and at the end of earlier turns, without affecting the climate of the game being
+        played.
+        """
+        game_state, move_maker = new_game(4, seed=7)
+        states = {}
+        for _ in range(30):
+            states[game_state.turn] = copy.deepcopy(game_state.players), copy.deepcopy(game_state.heathens)
+            if not play_turn(game_state, move_maker):
+                break  # pragma: no cover
+        # Make sure the events survive being written to and read from a file.
+        events = [decode_event(encode_event(event)) for event in game_state.board.events.events]
+
+        climate = game_state.climate.is_night, game_state.climate.has_dawned
+        replayed = replay(events)
+        self.assertIs(game_state.climate, Climate.current)
+        self.assertTupleEqual(climate, (game_state.climate.is_night, game_state.climate.has_dawned))
+        self.assertTupleEqual(climate, (replayed.climate.is_night, replayed.climate.has_dawned))
+        self.assertListEqual(game_state.players, replayed.players)
+        self.assertListEqual(game_state.heathens, replayed.heathens)
+        self.assertEqual(game_state.turn, replayed.turn)
+        self.assertEqual(game_state.until_night, replayed.until_night)
+        self.assertEqual(game_state.nighttime_left, replayed.nighttime_left)
+
+        replayed = replay(events, until_turn=10)
+        self.assertEqual(10, replayed.turn)
+        self.assertListEqual(states[10][0], replayed.players)
+        self.assertListEqual(states[10][1], replayed.heathens)
+
+    def test_replay_invalid(self):
+        """
+        Ensure that event logs that do not begin with the start of the game, or start it again, cannot be replayed.
+        """
+        with self.assertRaises(ValueError):
+            replay([])
+        with self.assertRaises(ValueError):
+            replay([TurnEndedEvent(1)])
+        with self.assertRaises(ValueError):
+            replay([GameStartedEvent(1, 15, self.TEST_CONFIG, [("The Chosen One", Faction.CONCENTRATED, None)])] * 2)
+
+    def test_found_settlements(self):
+        """
+        Ensure that settlements are founded with the same faction-specific attributes as they originally were, with the
+        player's first settlement revealing its surroundings and coming with a unit, and settlers being consumed.
+        """
+        first_name = self.get_name((10, 10))
+        apply_event(self.game_state, SettlementFoundedEvent(0, first_name, (10, 10), None))
+        first_setl = self.human.settlements[0]
+        self.assertEqual(first_name, first_setl.name)
+        self.assertEqual(200, first_setl.strength)
+        self.assertEqual(1, len(first_setl.garrison))
+        self.assertIn((15, 15), self.human.quads_seen)
+        self.assertNotIn(first_name, self.game_state.board.namer.names[first_setl.quads[0].biome])
+
+        self.imperials.units = [Unit(25, 0, (20, 20), False, UNIT_PLANS[3])]
+        self.frontiersmen.units = [self.TEST_UNIT, Unit(25, 0, (30, 30), False, UNIT_PLANS[3])]
+        apply_event(self.game_state, SettlementFoundedEvent(1, self.get_name((20, 20)), (20, 20), 0))
+        apply_event(self.game_state, SettlementFoundedEvent(2, self.get_name((30, 30)), (30, 30), 1))
+        self.assertEqual(50, self.imperials.settlements[-1].strength)
+        self.assertEqual(75, self.frontiersmen.settlements[-1].satisfaction)
+        self.assertFalse(self.imperials.units)
+        self.assertListEqual([self.TEST_UNIT], self.frontiersmen.units)
+
+    def test_move_units(self):
+        """
+        Ensure that units are moved, deployed, garrisoned, and boarded in the same way as they originally were.
+        """
+        setl = Settlement("Numero Uno", (10, 10), [], [self.game_state.board.quads[10][10]], [self.TEST_UNIT])
+        deployer = DeployerUnit(100, 3, (20, 20), False, DeployerUnitPlan(0, 100, 3, "Boat", None, 50),
+                                passengers=[self.TEST_UNIT_2])
+        self.human.settlements = [setl]
+        self.human.units = [deployer]
+
+        apply_event(self.game_state, UnitDeployedEvent((0, 0), 0, (11, 10)))
+        self.assertFalse(setl.garrison)
+        self.assertListEqual([deployer, self.TEST_UNIT], self.human.units)
+        self.assertTupleEqual((11, 10), self.TEST_UNIT.location)
+        self.assertIn((16, 15), self.human.quads_seen)
+
+        apply_event(self.game_state, PassengerDeployedEvent((0, 0), 0, (21, 20)))
+        self.assertFalse(deployer.passengers)
+        self.assertListEqual([deployer, self.TEST_UNIT, self.TEST_UNIT_2], self.human.units)
+        self.assertTupleEqual((21, 20), self.TEST_UNIT_2.location)
+
+        apply_event(self.game_state, UnitMovedEvent((0, 1), (12, 12), 1))
+        self.assertTupleEqual((12, 12), self.TEST_UNIT.location)
+        self.assertEqual(1, self.TEST_UNIT.remaining_stamina)
+        self.assertIn((17, 17), self.human.quads_seen)
+
+        apply_event(self.game_state, UnitGarrisonedEvent((0, 1), (0, 0), 0))
+        self.assertListEqual([self.TEST_UNIT], setl.garrison)
+        self.assertTrue(self.TEST_UNIT.garrisoned)
+        self.assertFalse(self.TEST_UNIT.remaining_stamina)
+
+        apply_event(self.game_state, UnitBoardedEvent((0, 1), (0, 0), 2))
+        self.assertListEqual([self.TEST_UNIT_2], deployer.passengers)
+        self.assertListEqual([deployer], self.human.units)
+        self.assertEqual(2, self.TEST_UNIT_2.remaining_stamina)
+
+    def test_attack_units(self):
+        """
+        Ensure that attacks between units are carried out in the same way as they originally were, with any units or
+        heathens that are killed being removed.
+        """
+        heathen = Heathen(1, 2, (11, 10), UnitPlan(80, 80, 2, "Heathen", None, 0))
+        self.game_state.heathens = [heathen]
+        self.TEST_UNIT.health = 1
+        self.human.units = [self.TEST_UNIT]
+        self.imperials.units = [self.TEST_UNIT_2]
+
+        # The player's unit and the heathen should both be killed.
+        apply_event(self.game_state, UnitAttackedEvent((0, 0), (HEATHEN_OWNER, 0), False))
+        self.assertFalse(self.human.units)
+        self.assertFalse(self.game_state.heathens)
+
+        # Now the AI unit attacks another, with both of them being killed.
+        self.TEST_UNIT.health = 1
+        self.TEST_UNIT_2.health = 1
+        self.human.units = [self.TEST_UNIT]
+        setl = Settlement("Numero Uno", (13, 10), [], [], [])
+        self.human.settlements = [setl]
+        self.game_state.board.sieges.begin(self.TEST_UNIT_2, setl)
+        apply_event(self.game_state, UnitAttackedEvent((1, 0), (0, 0), True))
+        self.assertFalse(self.human.units)
+        self.assertFalse(self.imperials.units)
+        self.assertFalse(self.TEST_UNIT_2.besieging)
+
+    def test_attack_settlements(self):
+        """
+        Ensure that attacks on settlements are carried out in the same way as they originally were, with settlements
+        being taken or attackers being killed.
+        """
+        setl = Settlement("Numero Uno", (13, 10), [], [], [], strength=1)
+        self.imperials.settlements = [setl]
+        self.human.units = [self.TEST_UNIT]
+        self.game_state.board.sieges.begin(self.TEST_UNIT, setl)
+
+        # Settlements taken by The Concentrated simply disappear.
+        apply_event(self.game_state, SettlementAttackedEvent((0, 0), (1, 0)))
+        self.assertFalse(self.imperials.settlements)
+        self.assertFalse(self.human.settlements)
+        self.assertFalse(self.TEST_UNIT.besieging)
+
+        setl.strength = 1
+        self.frontiersmen.settlements = [setl]
+        self.imperials.units = [self.TEST_UNIT_2]
+        apply_event(self.game_state, SettlementAttackedEvent((1, 0), (2, 0)))
+        self.assertListEqual([setl], self.imperials.settlements)
+        self.assertFalse(self.frontiersmen.settlements)
+
+        self.TEST_UNIT_2.health = 1
+        setl.strength = 100
+        self.frontiersmen.settlements = [setl]
+        apply_event(self.game_state, SettlementAttackedEvent((1, 0), (2, 0)))
+        self.assertFalse(self.imperials.units)
+
+    def test_other_actions(self):
+        """
+        Ensure that blessings, constructions, buyouts, healing, sieges, relics, and disbanding units are all applied in
+        the same way as they originally were.
+        """
+        setl = Settlement("Numero Uno", (10, 10), [], [self.game_state.board.quads[10][10]], [])
+        self.imperials.settlements = [setl]
+        self.imperials.units = [self.TEST_UNIT, self.TEST_UNIT_2]
+        self.imperials.wealth = 1000
+        self.TEST_UNIT.health = 50
+
+        apply_event(self.game_state, BlessingSetEvent(1, BLESSINGS["beg_spl"].name))
+        self.assertEqual(BLESSINGS["beg_spl"], self.imperials.ongoing_blessing.blessing)
+
+        apply_event(self.game_state, ConstructionSetEvent((1, 0), "Warrior"))
+        # The Imperials' units are more powerful than usual.
+        self.assertEqual(150, setl.current_work.construction.power)
+        apply_event(self.game_state, ConstructionSetEvent((1, 0), get_project("Call of the Fields").name))
+        self.assertEqual(Construction(get_project("Call of the Fields")), setl.current_work)
+        apply_event(self.game_state, ConstructionSetEvent((1, 0), "Melting Pot"))
+        self.assertEqual(Construction(get_improvement("Melting Pot")), setl.current_work)
+        setl.current_work.zeal_consumed = 10
+        apply_event(self.game_state, ConstructionBoughtOutEvent((1, 0)))
+        self.assertListEqual([get_improvement("Melting Pot")], setl.improvements)
+        self.assertEqual(980, self.imperials.wealth)
+
+        apply_event(self.game_state, UnitHealedEvent((1, 1), (1, 0)))
+        self.assertEqual(100, self.TEST_UNIT.health)
+
+        other_setl = Settlement("Numero Dos", (13, 10), [], [], [])
+        self.human.settlements = [other_setl]
+        apply_event(self.game_state, SiegeBegunEvent((1, 0), (0, 0)))
+        self.assertTrue(self.TEST_UNIT.besieging)
+        self.assertTrue(other_setl.besieged)
+        apply_event(self.game_state, SiegeEndedEvent((1, 0)))
+        self.assertFalse(self.TEST_UNIT.besieging)
+
+        relic_loc = next(iter(self.game_state.board.relics.locations))
+        apply_event(self.game_state, RelicInvestigatedEvent((1, 0), relic_loc, InvestigationResult.WEALTH))
+        self.assertEqual(1005, self.imperials.wealth)
+        self.assertNotIn(relic_loc, self.game_state.board.relics)
+
+        apply_event(self.game_state, UnitDisbandedEvent((1, 1)))
+        self.assertListEqual([self.TEST_UNIT], self.imperials.units)
+        self.assertEqual(1030, self.imperials.wealth)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import dataclasses
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from source.display.board import Board
+from source.foundation.catalogue import Namer, get_heathen, IMPROVEMENTS, PROJECTS, UNIT_PLANS, BLESSINGS, \
+    get_available_unit_plans
+from source.foundation.climate import Climate, NightAffinity
+from source.foundation.models import GameConfig, Faction, Settlement, Unit, DeployerUnit, Construction, \
+    OngoingBlessing, VictoryType, HarvestStatus, UnitPlan, AIPlaystyle, AttackPlaystyle, ExpansionPlaystyle
+from source.game_management.game_state import GameState
+from source.saving.save_decoder import decode_save, JSON_SAVE_VERSION
+from source.saving.save_encoder import SaveEncoder
+
+
+class SaveDecoderTest(unittest.TestCase):
+    """
+    The test class for save_decoder.py.
+    """
+    TEST_CONFIG = GameConfig(3, Faction.NOCTURNE, True, False, True)
+
+    @patch("source.game_management.game_controller.MusicPlayer")
+    def setUp(self, _: MagicMock) -> None:
+        """
+        Initialise a test game state with a populated player, applying its climate, and restoring the default climate
+        after each test.
+        :param _: The unused MusicPlayer mock.
+        """
+        self.game_state = GameState()
+        self.game_state.climate.apply()
+        self.addCleanup(Climate().apply)
+        self.game_state.board = Board(self.TEST_CONFIG, Namer())
+        self.game_state.gen_players(self.TEST_CONFIG)
+        self.game_state.turn = 45
+        self.game_state.until_night = 0
+        self.game_state.nighttime_left = 3
+        self.game_state.heathens = [get_heathen((3, 4), 45)]
+
+        self.player = self.game_state.players[0]
+        self.player.blessings = [BLESSINGS["beg_spl"]]
+        self.player.ongoing_blessing = OngoingBlessing(BLESSINGS["inh_luc"], 12.5)
+        self.player.imminent_victories = {VictoryType.SERENDIPITY}
+        self.player.quads_seen = {(1, 2), (-1, 95)}
+        nocturne_plan = UnitPlan(100, 100, 3, "Warrior", None, 0, night_affinity=NightAffinity.NOCTURNE)
+        self.passenger = Unit(50, 1, (10, 10), False, nocturne_plan, has_acted=True)
+        self.player.units = [DeployerUnit(80, 8, (10, 10), False, UNIT_PLANS[9], besieging=True,
+                                          passengers=[self.passenger])]
+        recruited_plan = get_available_unit_plans(self.player, 5)[-1]
+        self.player.settlements = [
+            Settlement("Decoded", (20, 30), [IMPROVEMENTS[5]], [self.game_state.board.quads[30][20]],
+                       [Unit(100, 3, (20, 30), True, UNIT_PLANS[0])], current_work=Construction(recruited_plan, 20),
+                       harvest_status=HarvestStatus.PLENTIFUL)
+        ]
+        self.game_state.players[1].settlements = [
+            Settlement("Imp", (40, 40), [], [self.game_state.board.quads[40][40]], [],
+                       current_work=Construction(IMPROVEMENTS[3], 5)),
+            Settlement("Prj", (50, 50), [], [self.game_state.board.quads[50][50]], [],
+                       current_work=Construction(PROJECTS[2])),
+        ]
+        self.game_state.players[1].ai_playstyle = AIPlaystyle(AttackPlaystyle.AGGRESSIVE,
+                                                              ExpansionPlaystyle.EXPANSIONIST)
+
+    def encode(self, event_log: bool = False) -> dict:
+        """
+        :param event_log: Whether the save should refer to an event log.
+        :return: The test game state, encoded as a JSON save and parsed again.
+        """
+        save = {
+            "version": JSON_SAVE_VERSION,
+            "quads": [quad for row in self.game_state.board.quads for quad in row],
+            "players": self.game_state.players,
+            "heathens": self.game_state.heathens,
+            "turn": self.game_state.turn,
+            "cfg": self.game_state.board.game_config,
+            "night_status": {"until": self.game_state.until_night, "remaining": self.game_state.nighttime_left,
+                             "dawned": True}
+        }
+        if event_log:
+            save["event_log"] = {"file": "events-test.jsonl", "length": 12}
+        with self.game_state.climate.unmodified():
+            return json.loads(json.dumps(save, cls=SaveEncoder))
+
+    def test_round_trip(self):
+        """
+        Ensure that a game state is identical once encoded as a JSON save and decoded again, and that the climate is
+        restored.
+        """
+        save = self.encode(event_log=True)
+        loaded = GameState()
+        quads, cfg, event_log = decode_save(save, loaded)
+
+        self.assertEqual(self.TEST_CONFIG, cfg)
+        self.assertTupleEqual(("events-test.jsonl", 12), event_log)
+        self.assertListEqual(self.game_state.board.quads, quads)
+        self.assertListEqual(self.game_state.heathens, loaded.heathens)
+        self.assertEqual(45, loaded.turn)
+        self.assertEqual(0, loaded.until_night)
+        self.assertEqual(3, loaded.nighttime_left)
+        self.assertTrue(loaded.climate.is_night)
+        self.assertTrue(loaded.climate.has_dawned)
+        # Units' base stats should have been decoded, which are compared with the climate suspended.
+        with loaded.climate.unmodified():
+            self.assertListEqual(self.game_state.players, loaded.players)
+
+    def test_references(self):
+        """
+        Ensure that catalogue entries are decoded as references to the catalogue, that settlements share the quads of
+        the board, and that units and their plans are decoded as the correct classes.
+        """
+        loaded = GameState()
+        quads, _, event_log = decode_save(self.encode(), loaded)
+        player = loaded.players[0]
+        setl = player.settlements[0]
+
+        self.assertIsNone(event_log)
+        self.assertIs(IMPROVEMENTS[5], setl.improvements[0])
+        self.assertIs(quads[30][20], setl.quads[0])
+        self.assertIs(BLESSINGS["beg_spl"], player.blessings[0])
+        self.assertIs(BLESSINGS["inh_luc"], player.ongoing_blessing.blessing)
+        self.assertIs(IMPROVEMENTS[3], loaded.players[1].settlements[0].current_work.construction)
+        self.assertIs(PROJECTS[2], loaded.players[1].settlements[1].current_work.construction)
+        self.assertIsInstance(player.units[0], DeployerUnit)
+        self.assertEqual(3, player.units[0].plan.max_capacity)
+        self.assertNotIsInstance(player.units[0].passengers[0], DeployerUnit)
+        self.assertIsInstance(player.units[0].location, tuple)
+        self.assertSetEqual({(1, 2), (-1, 95)}, player.quads_seen)
+
+    def test_version_1(self):
+        """
+        Ensure that version 1 JSON saves, which stored catalogue entries and settlements' quads in full, are decoded
+        identically.
+        """
+        def encode_in_full(o):
+            return dataclasses.asdict(o) if dataclasses.is_dataclass(o) else list(o)
+
+        save = self.encode()
+        with self.game_state.climate.unmodified():
+            save["players"] = json.loads(json.dumps(self.game_state.players, default=encode_in_full))
+            save["heathens"] = json.loads(json.dumps(self.game_state.heathens, default=encode_in_full))
+        save["version"] = 1
+        loaded = GameState()
+        quads, _, _ = decode_save(save, loaded)
+
+        self.assertListEqual(self.game_state.heathens, loaded.heathens)
+        self.assertIs(quads[30][20], loaded.players[0].settlements[0].quads[0])
+        self.assertIs(PROJECTS[2], loaded.players[1].settlements[1].current_work.construction)
+        with loaded.climate.unmodified():
+            self.assertListEqual(self.game_state.players, loaded.players)
+
+    def test_version(self):
+        """
+        Ensure that JSON saves from other versions of the format are rejected.
+        """
+        save = self.encode()
+        save["version"] = JSON_SAVE_VERSION + 1
+        with self.assertRaises(ValueError):
+            decode_save(save, GameState())
+        save["version"] = 0
+        with self.assertRaises(ValueError):
+            decode_save(save, GameState())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
 import unittest
+from dataclasses import replace, fields
 
-from source.foundation.models import Effect
+from source.foundation.catalogue import IMPROVEMENTS, PROJECTS, BLESSINGS, UNIT_PLANS, get_heathen_plan
+from source.foundation.climate import NightAffinity
+from source.foundation.models import Effect, Quad, Biome, Settlement
 from source.saving.save_encoder import SaveEncoder, ObjectConverter
 
 
@@ -37,6 +40,32 @@ class SaveEncoderTest(unittest.TestCase):
         # Any other data type should return an empty dictionary, which evaluates to false.
         self.assertFalse(save_encoder.default("a"))
 
+    def test_save_encoder_references(self):
+        """
+        Ensure that catalogue entries are encoded as their names, that unit plans from the catalogue are encoded with
+        only the fields that differ from the catalogue, and that settlements' quads are encoded as their locations.
+        """
+        save_encoder = SaveEncoder()
+        self.assertEqual(IMPROVEMENTS[0].name, save_encoder.default(IMPROVEMENTS[0]))
+        self.assertEqual(PROJECTS[0].name, save_encoder.default(PROJECTS[0]))
+        self.assertEqual(BLESSINGS["beg_spl"].name, save_encoder.default(BLESSINGS["beg_spl"]))
+
+        self.assertDictEqual({"name": UNIT_PLANS[0].name}, save_encoder.default(UNIT_PLANS[0]))
+        modified_plan = replace(UNIT_PLANS[0], power=UNIT_PLANS[0].power * 2, night_affinity=NightAffinity.NOCTURNE)
+        self.assertDictEqual({"name": UNIT_PLANS[0].name, "power": modified_plan.power,
+                              "night_affinity": NightAffinity.NOCTURNE}, save_encoder.default(modified_plan))
+        # Plans that are not in the catalogue, i.e. those of heathens, are encoded in full.
+        heathen_plan = get_heathen_plan(1)
+        self.assertDictEqual({fld.name: getattr(heathen_plan, fld.name) for fld in fields(heathen_plan)},
+                             save_encoder.default(heathen_plan))
+
+        quad = Quad(Biome.SEA, 1, 2, 3, 4, (5, 6))
+        setl = Settlement("Encoded", (5, 6), [IMPROVEMENTS[0]], [quad], [])
+        encoded_setl = save_encoder.default(setl)
+        self.assertListEqual([(5, 6)], encoded_setl["quads"])
+        # Other fields are left to be encoded in turn.
+        self.assertIs(IMPROVEMENTS[0], encoded_setl["improvements"][0])
+
 
 if __name__ == '__main__':
     unittest.main()
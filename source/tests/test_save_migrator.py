@@ -3,6 +3,7 @@ import unittest
 import pyxel
 
 from source.foundation.catalogue import UNIT_PLANS
+from source.foundation.climate import NightAffinity
 from source.foundation.models import UnitPlan, Unit, AttackPlaystyle, ExpansionPlaystyle, VictoryType, Faction, \
     Settlement, Biome, Quad, GameConfig, DeployerUnitPlan, DeployerUnit
 from source.game_management.game_state import GameState
@@ -35,7 +36,8 @@ class SaveMigratorTest(unittest.TestCase):
             "prereq": None,
             "cost": test_cost,
             "can_settle": False,
-            "heals": True
+            "heals": True,
+            "night_affinity": NightAffinity.NOCTURNE.value
         })
 
         migrated_plan: UnitPlan = migrate_unit_plan(test_loaded_plan)
@@ -49,13 +51,16 @@ class SaveMigratorTest(unittest.TestCase):
         self.assertEqual(test_cost, migrated_plan.cost)
         self.assertFalse(migrated_plan.can_settle)
         self.assertTrue(migrated_plan.heals)
+        self.assertEqual(NightAffinity.NOCTURNE, migrated_plan.night_affinity)
 
-        # Now delete the heals attribute, to simulate an outdated save.
+        # Now delete the heals and night_affinity attributes, to simulate an outdated save.
         delattr(test_loaded_plan, "heals")
+        delattr(test_loaded_plan, "night_affinity")
 
         outdated_plan: UnitPlan = migrate_unit_plan(test_loaded_plan)
-        # Old unit plans should be mapped to False.
+        # Old unit plans should be mapped to False and None respectively.
         self.assertFalse(outdated_plan.heals)
+        self.assertIsNone(outdated_plan.night_affinity)
 
     def test_deployer_unit_plan(self):
         """
@@ -93,6 +98,7 @@ class SaveMigratorTest(unittest.TestCase):
         self.assertEqual(test_cost, migrated_plan.cost)
         self.assertFalse(migrated_plan.can_settle)
         self.assertFalse(migrated_plan.heals)
+        self.assertIsNone(migrated_plan.night_affinity)
         self.assertEqual(test_max_capacity, migrated_plan.max_capacity)
 
     def test_unit(self):
@@ -248,13 +254,14 @@ class SaveMigratorTest(unittest.TestCase):
         """
         Ensure that migrations occur correctly for game state.
         """
-        test_until_night = 3
-        test_nighttime_left = 0
+        test_until_night = 0
+        test_nighttime_left = 3
 
         # Simulate an up-to-date loaded save.
         test_loaded_night_status: ObjectConverter = ObjectConverter({
             "until": test_until_night,
-            "remaining": test_nighttime_left
+            "remaining": test_nighttime_left,
+            "dawned": True
         })
         test_loaded_save: ObjectConverter = ObjectConverter({
             "night_status": test_loaded_night_status
@@ -266,6 +273,20 @@ class SaveMigratorTest(unittest.TestCase):
         # For up-to-date saves, the attributes should be mapped directly.
         self.assertEqual(test_game_state.until_night, test_until_night)
         self.assertEqual(test_game_state.nighttime_left, test_nighttime_left)
+        # The climate should also be restored.
+        self.assertTrue(test_game_state.climate.is_night)
+        self.assertTrue(test_game_state.climate.has_dawned)
+
+        # Now delete the dawned attribute, to simulate an outdated save from before climatic effects were applied when
+        # stats are read.
+        delattr(test_loaded_night_status, "dawned")
+
+        migrate_climatic_effects(test_game_state, test_loaded_save)
+
+        # The stats in outdated saves have already been modified by the climate, so we expect the climate to be reset.
+        self.assertEqual(test_game_state.nighttime_left, test_nighttime_left)
+        self.assertFalse(test_game_state.climate.is_night)
+        self.assertFalse(test_game_state.climate.has_dawned)
 
         # Now delete the night_status attribute, to simulate an outdated save from before the introduction of climatic
         # effects.
@@ -0,0 +1,98 @@
+import unittest
+
+from source.foundation.catalogue import UNIT_PLANS
+from source.foundation.models import Player, Faction, Settlement, Unit, Quad, Biome
+from source.game_management.siege_registry import SiegeRegistry
+
+
+class SiegeRegistryTest(unittest.TestCase):
+    """
+    The test class for siege_registry.py.
+    """
+
+    def setUp(self) -> None:
+        """
+        Initialise a couple of test settlements and units, as well as an empty registry.
+        """
+        self.setl = Settlement("Fortress", (10, 10), [], [Quad(Biome.FOREST, 0, 0, 0, 0, (10, 10))], [])
+        self.other_setl = Settlement("Keep", (20, 20), [], [Quad(Biome.DESERT, 0, 0, 0, 0, (20, 20))], [])
+        self.unit = Unit(10, 2, (9, 10), False, UNIT_PLANS[0])
+        self.unit_2 = Unit(10, 2, (11, 11), False, UNIT_PLANS[0])
+        self.sieges = SiegeRegistry()
+
+    def test_begin(self):
+        """
+        Ensure that beginning a siege updates both the registry and the statuses of the unit and settlement, and that
+        a unit switching to another settlement leaves its original siege.
+        """
+        self.sieges.begin(self.unit, self.setl)
+        self.sieges.begin(self.unit_2, self.setl)
+
+        self.assertTrue(self.unit.besieging)
+        self.assertTrue(self.setl.besieged)
+        self.assertListEqual([self.unit, self.unit_2], self.sieges.besiegers_of(self.setl))
+        self.assertEqual(self.setl, self.sieges.target_of(self.unit))
+
+        self.sieges.begin(self.unit, self.other_setl)
+
+        self.assertListEqual([self.unit_2], self.sieges.besiegers_of(self.setl))
+        self.assertListEqual([self.unit], self.sieges.besiegers_of(self.other_setl))
+        self.assertEqual(self.other_setl, self.sieges.target_of(self.unit))
+
+    def test_end(self):
+        """
+        Ensure that ending a siege removes the unit from the registry, leaving the settlement's status alone, and that
+        ending the siege of a unit that is not besieging has no effect.
+        """
+        self.sieges.begin(self.unit, self.setl)
+        self.sieges.end(self.unit)
+
+        self.assertFalse(self.unit.besieging)
+        self.assertTrue(self.setl.besieged)
+        self.assertFalse(self.sieges.besiegers_of(self.setl))
+        self.assertIsNone(self.sieges.target_of(self.unit))
+        self.assertFalse(self.sieges.besiegers)
+
+        self.sieges.end(self.unit)
+        self.assertFalse(self.sieges.targets)
+
+    def test_lift(self):
+        """
+        Ensure that lifting a siege ends it for every besieging unit and the settlement itself.
+        """
+        self.sieges.begin(self.unit, self.setl)
+        self.sieges.begin(self.unit_2, self.setl)
+        self.sieges.lift(self.setl)
+
+        self.assertFalse(self.unit.besieging)
+        self.assertFalse(self.unit_2.besieging)
+        self.assertFalse(self.setl.besieged)
+        self.assertFalse(self.sieges.besiegers_of(self.setl))
+        self.assertFalse(self.sieges.targets)
+
+    def test_rebuild(self):
+        """
+        Ensure that the registry can be rebuilt from the statuses of the players' units and settlements, with units that
+        are not next to an enemy settlement under siege no longer being marked as besieging.
+        """
+        self.setl.besieged = True
+        self.unit.besieging = True
+        # The second unit is next to a settlement under siege, but it belongs to the same player.
+        self.unit_2.besieging = True
+        stray_unit = Unit(10, 2, (50, 50), False, UNIT_PLANS[0], besieging=True)
+        players = [
+            Player("Defender", Faction.AGRICULTURISTS, 0, settlements=[self.setl], units=[self.unit_2]),
+            Player("Attacker", Faction.CAPITALISTS, 0, settlements=[self.other_setl], units=[self.unit, stray_unit])
+        ]
+
+        self.sieges.rebuild(players)
+
+        self.assertListEqual([self.unit], self.sieges.besiegers_of(self.setl))
+        self.assertTrue(self.unit.besieging)
+        self.assertFalse(self.unit_2.besieging)
+        self.assertFalse(stray_unit.besieging)
+        self.assertIsNone(self.sieges.target_of(stray_unit))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import math
+import unittest
+from unittest.mock import patch, MagicMock
+
+from source.foundation.climate import Climate
+from source.foundation.models import Victory, VictoryType, SimulationResult, Player, Faction, TurnProfile
+from source.game_management.game_state import GameState
+from source.sim import gen_ai_players, simulate, main
+
+
+class SimTest(unittest.TestCase):
+    """
+    The test class for sim.py.
+    """
+
+    def setUp(self) -> None:
+        """
+        Restore the default climate after each test, since simulated games apply their own.
+        """
+        self.addCleanup(Climate().apply)
+
+    def test_gen_ai_players(self):
+        """
+        Ensure that the generated players are all AI players, each of a different faction.
+        """
+        players = gen_ai_players(14)
+        self.assertEqual(14, len(players))
+        self.assertTrue(all(player.ai_playstyle is not None for player in players))
+        self.assertEqual(14, len({player.faction for player in players}))
+
+    def test_simulate(self):
+        """
+        Ensure that a simulation runs for the given number of turns when no victory is achieved, and that simulations
+        with the same seed are reproducible.
+        """
+        result = simulate(4, 5, seed=1)
+        self.assertEqual(5, result.turns_played)
+        self.assertIsNone(result.victory)
+
+        # A longer simulation with the same seed should have the same outcome every time.
+        first_result = simulate(4, 200, seed=2)
+        second_result = simulate(4, 200, seed=2)
+        self.assertEqual(first_result.turns_played, second_result.turns_played)
+        self.assertEqual(first_result.victory is None, second_result.victory is None)
+        if first_result.victory is not None:
+            self.assertEqual(first_result.victory.player.name, second_result.victory.player.name)
+            self.assertEqual(first_result.victory.type, second_result.victory.type)
+
+    def test_simulate_victory(self):
+        """
+        Ensure that a simulation stops as soon as a victory is achieved, without any statistics being saved.
+        """
+        test_victory = Victory(Player("NPC1", Faction.AGRICULTURISTS, 0), VictoryType.GLUTTONY)
+        with patch.object(GameState, "check_for_victory", side_effect=[None, None, test_victory]), \
+                patch("source.saving.game_save_manager.save_stats_achievements") as save_stats_mock:
+            result = simulate(2, 10, seed=3)
+            save_stats_mock.assert_not_called()
+        self.assertEqual(3, result.turns_played)
+        self.assertEqual(test_victory, result.victory)
+
+    def test_simulate_profiled(self):
+        """
+        Ensure that a profiled simulation records the time spent in each phase of every turn, including a breakdown for
+        each AI player.
+        """
+        self.assertFalse(simulate(2, 3, seed=5).profiles)
+
+        result = simulate(2, 3, seed=5, profile=True)
+        self.assertListEqual([1, 2, 3], [profile.turn for profile in result.profiles])
+        self.assertIn("process_heathens", result.profiles[0].timings)
+        self.assertIn("make_move:NPC1", result.profiles[0].timings)
+        self.assertIn("make_move:NPC2", result.profiles[0].timings)
+
+    @patch("builtins.print")
+    @patch("source.sim.simulate")
+    def test_main(self, simulate_mock: MagicMock, print_mock: MagicMock):
+        """
+        Ensure that the command-line arguments are passed through to the simulation, and its outcome printed.
+        :param simulate_mock: The mock implementation of the simulate() function.
+        :param print_mock: The mock implementation of the print() function.
+        """
+        simulate_mock.return_value = SimulationResult(20, None, 1.5)
+        main(["--players", "3", "--turns", "20", "--seed", "4", "--budget", "0.5"])
+        simulate_mock.assert_called_with(3, 20, 4, 0.5, False)
+        print_mock.assert_any_call("No victory was achieved within 20 turns.")
+
+        simulate_mock.return_value = \
+            SimulationResult(12, Victory(Player("NPC2", Faction.CAPITALISTS, 0), VictoryType.AFFLUENCE), 1.2)
+        main(["--players", "3"])
+        print_mock.assert_any_call(f"NPC2 ({Faction.CAPITALISTS.value}) achieved a {VictoryType.AFFLUENCE.value} "
+                                   f"victory on turn 12.")
+
+    @patch("builtins.print")
+    @patch("source.sim.export_json")
+    @patch("source.sim.export_csv")
+    @patch("source.sim.simulate")
+    def test_main_profile(self, simulate_mock: MagicMock, export_csv_mock: MagicMock, export_json_mock: MagicMock, _):
+        """
+        Ensure that the turn profiles are exported in the format matching the supplied path when profiling.
+        :param simulate_mock: The mock implementation of the simulate() function.
+        :param export_csv_mock: The mock implementation of the export_csv() function.
+        :param export_json_mock: The mock implementation of the export_json() function.
+        """
+        test_profiles = [TurnProfile(1, {"check_for_victory": 0.1})]
+        simulate_mock.return_value = SimulationResult(1, None, 0.1, test_profiles)
+
+        main(["--turns", "1", "--profile", "profile.csv"])
+        simulate_mock.assert_called_with(8, 1, None, math.inf, True)
+        export_csv_mock.assert_called_with(test_profiles, "profile.csv")
+
+        main(["--turns", "1", "--profile", "profile.json"])
+        export_json_mock.assert_called_with(test_profiles, "profile.json")
+
+
+if __name__ == '__main__':
+    unittest.main()
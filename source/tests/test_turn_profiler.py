@@ -0,0 +1,88 @@
+import json
+import os
+import tempfile
+import unittest
+
+from source.foundation.models import TurnProfile
+from source.game_management.turn_profiler import TurnProfiler, export_csv, export_json
+
+
+class TurnProfilerTest(unittest.TestCase):
+    """
+    The test class for turn_profiler.py.
+    """
+
+    def setUp(self) -> None:
+        """
+        Initialise a profiler with a small ring buffer.
+        """
+        self.profiler = TurnProfiler(capacity=2)
+
+    def test_disabled(self):
+        """
+        Ensure that nothing is recorded while profiling is disabled.
+        """
+        self.profiler.begin_turn(1)
+        with self.profiler.measure("check_for_victory"):
+            pass
+        self.assertFalse(self.profiler.profiles)
+        self.assertIsNone(self.profiler.latest)
+
+    def test_measure(self):
+        """
+        Ensure that phases are timed when profiling is enabled, with repeated phases accumulating their times, and that
+        only the most recent turns are kept.
+        """
+        self.profiler.toggle()
+        # Phases measured before the first turn has begun are not attributed to any turn.
+        with self.profiler.measure("process_heathens"):
+            pass
+        self.assertFalse(self.profiler.profiles)
+
+        for turn in range(1, 4):
+            self.profiler.begin_turn(turn)
+            with self.profiler.measure("make_move:NPC1"):
+                pass
+        with self.profiler.measure("make_move:NPC1"):
+            pass
+        with self.profiler.measure("check_for_victory"):
+            pass
+
+        self.assertListEqual([2, 3], [profile.turn for profile in self.profiler.profiles])
+        self.assertEqual(3, self.profiler.latest.turn)
+        self.assertListEqual(["make_move:NPC1", "check_for_victory"], list(self.profiler.latest.timings))
+        self.assertTrue(all(seconds >= 0 for seconds in self.profiler.latest.timings.values()))
+
+    def test_toggle(self):
+        """
+        Ensure that toggling profiling off stops the current turn from being profiled any further.
+        """
+        self.profiler.toggle()
+        self.profiler.begin_turn(1)
+        self.profiler.toggle()
+        self.assertFalse(self.profiler.enabled)
+        with self.profiler.measure("check_for_victory"):
+            pass
+        self.assertFalse(self.profiler.latest.timings)
+
+    def test_export(self):
+        """
+        Ensure that profiles are correctly exported to both CSV and JSON.
+        """
+        profiles = [TurnProfile(1, {"process_player:NPC1": 0.5, "check_for_victory": 0.25}), TurnProfile(2)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, "profile.csv")
+            export_csv(profiles, csv_path)
+            with open(csv_path, "r", encoding="utf-8") as csv_file:
+                self.assertListEqual(["turn,phase,seconds", "1,process_player:NPC1,0.5", "1,check_for_victory,0.25"],
+                                     csv_file.read().splitlines())
+
+            json_path = os.path.join(temp_dir, "profile.json")
+            export_json(profiles, json_path)
+            with open(json_path, "r", encoding="utf-8") as json_file:
+                self.assertListEqual([{"turn": 1, "timings": {"process_player:NPC1": 0.5, "check_for_victory": 0.25}},
+                                      {"turn": 2, "timings": {}}], json.load(json_file))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+from source.foundation.catalogue import get_heathen_plan
+from source.foundation.models import Unit, UnitPlan, Player, Faction, Settlement, Quad, Biome, Heathen
+from source.game_management.unit_index import UnitIndex
+
+
+class UnitIndexTest(unittest.TestCase):
+    """
+    The test class for unit_index.py.
+    """
+
+    def setUp(self) -> None:
+        """
+        Initialise the test models and build an index from them.
+        """
+        self.TEST_UNIT_PLAN = UnitPlan(100, 100, 3, "Warrior", None, 25)
+        # The first two units are deliberately identical, to ensure they are treated as distinct units.
+        self.TEST_UNIT = Unit(50, 3, (12, 12), False, self.TEST_UNIT_PLAN)
+        self.TEST_UNIT_2 = Unit(50, 3, (12, 12), False, self.TEST_UNIT_PLAN)
+        self.TEST_UNIT_3 = Unit(50, 3, (8, 9), False, self.TEST_UNIT_PLAN)
+        self.TEST_HEATHEN = Heathen(40, 6, (30, 30), get_heathen_plan(1))
+        self.TEST_PLAYER = Player("Tester", Faction.AGRICULTURISTS, 0, units=[self.TEST_UNIT, self.TEST_UNIT_2],
+                                  settlements=[Settlement("Town", (40, 40), [],
+                                                          [Quad(Biome.FOREST, 0, 0, 0, 0, (40, 40))], [])])
+        self.TEST_PLAYER_2 = Player("Tester 2", Faction.INFIDELS, 0, units=[self.TEST_UNIT_3])
+        self.index = UnitIndex([self.TEST_PLAYER, self.TEST_PLAYER_2], [self.TEST_HEATHEN])
+
+    def test_init(self):
+        """
+        Ensure that the index records the owners of units and the locations occupied by units, settlements and
+        heathens.
+        """
+        self.assertIs(self.TEST_PLAYER, self.index.owner_of(self.TEST_UNIT))
+        self.assertIs(self.TEST_PLAYER, self.index.owner_of(self.TEST_UNIT_2))
+        self.assertIs(self.TEST_PLAYER_2, self.index.owner_of(self.TEST_UNIT_3))
+        self.assertIsNone(self.index.owner_of(Unit(1, 1, (0, 0), False, self.TEST_UNIT_PLAN)))
+        for loc in [(12, 12), (8, 9), (30, 30), (40, 40)]:
+            self.assertTrue(self.index.is_occupied(loc))
+        self.assertFalse(self.index.is_occupied((0, 0)))
+
+    def test_units_within(self):
+        """
+        Ensure that only the units within the given distance of a location are found, across bucket boundaries, and in
+        the order in which they were added.
+        """
+        self.assertListEqual([self.TEST_UNIT, self.TEST_UNIT_2, self.TEST_UNIT_3], self.index.units_within((10, 10), 2))
+        self.assertListEqual([self.TEST_UNIT_3], self.index.units_within((5, 5), 4))
+        self.assertFalse(self.index.units_within((5, 5), 3))
+
+    def test_relocate(self):
+        """
+        Ensure that relocating units and heathens keeps the index in sync, with shared locations only being vacated
+        once every entity has left them.
+        """
+        self.index.relocate(self.TEST_UNIT_2, (25, 25))
+
+        self.assertTupleEqual((25, 25), self.TEST_UNIT_2.location)
+        self.assertTrue(self.index.is_occupied((12, 12)))
+        self.assertListEqual([self.TEST_UNIT_2], self.index.units_within((25, 25), 0))
+        # Make sure the right unit was moved, despite the two being identical.
+        self.assertListEqual([self.TEST_UNIT], self.index.units_within((12, 12), 0))
+        self.assertIs(self.TEST_UNIT, self.index.units_within((12, 12), 0)[0])
+
+        self.index.relocate(self.TEST_UNIT, (26, 26))
+        self.index.relocate(self.TEST_HEATHEN, (31, 31))
+
+        self.assertFalse(self.index.is_occupied((12, 12)))
+        self.assertFalse(self.index.is_occupied((30, 30)))
+        self.assertTrue(self.index.is_occupied((31, 31)))
+        self.assertTupleEqual((31, 31), self.TEST_HEATHEN.location)
+
+    def test_remove(self):
+        """
+        Ensure that removed units are no longer found or owned, and that their locations are vacated.
+        """
+        self.index.remove(self.TEST_UNIT_3)
+
+        self.assertIsNone(self.index.owner_of(self.TEST_UNIT_3))
+        self.assertFalse(self.index.is_occupied((8, 9)))
+        self.assertListEqual([self.TEST_UNIT, self.TEST_UNIT_2], self.index.units_within((10, 10), 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
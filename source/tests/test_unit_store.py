@@ -0,0 +1,177 @@
+import unittest
+from copy import deepcopy
+
+from source.foundation.catalogue import get_heathen_plan
+from source.foundation.climate import Climate, NightAffinity
+from source.foundation.models import UnitPlan, Unit, Heathen, Player, Faction
+from source.foundation.unit_store import UnitColumns, UnitStore, StoredField
+
+
+class UnitStoreTest(unittest.TestCase):
+    """
+    The test class for unit_store.py.
+    """
+
+    def setUp(self) -> None:
+        """
+        Initialise a couple of test units, as well as some empty columns to hold them in.
+        """
+        self.addCleanup(Climate().apply)
+        self.plan = UnitPlan(100, 100, 3, "Held Man", None, 25)
+        self.unit = Unit(50, 1, (1, 1), False, self.plan, has_acted=True)
+        self.other_unit = Unit(100, 0, (2, 2), False, self.plan)
+        self.columns = UnitColumns()
+
+    def test_hold(self):
+        """
+        Ensure that held units become views over their rows, with their state kept in the columns.
+        """
+        self.columns.hold(self.unit)
+        self.columns.hold(self.other_unit)
+
+        self.assertListEqual([self.unit, self.other_unit], self.columns.units)
+        self.assertListEqual([50, 100], self.columns.health)
+        self.assertListEqual([1, 0], self.columns.stamina)
+        self.assertEqual(bytearray([1, 0]), self.columns.acted)
+        self.assertNotIn("health", self.unit.__dict__)
+        # The unit's attributes should be read from and written to the columns.
+        self.assertEqual(50, self.unit.health)
+        self.assertTrue(self.unit.has_acted)
+        self.unit.remaining_stamina = 0
+        self.assertEqual(0, self.columns.stamina[0])
+
+        # Holding a unit again should simply mark it as held.
+        self.columns.held[0] = 0
+        self.columns.hold(self.unit)
+        self.assertEqual(2, len(self.columns.units))
+        self.assertEqual(1, self.columns.held[0])
+
+    def test_hold_other_owner(self):
+        """
+        Ensure that units held by another owner have their state moved across, and are left alone when released by
+        their previous owner.
+        """
+        self.columns.hold(self.unit)
+        new_columns = UnitColumns()
+        new_columns.hold(self.unit)
+
+        self.assertIs(new_columns, self.unit.__dict__["_columns"])
+        self.assertListEqual([50], new_columns.health)
+
+        # The previous owner did not hold the unit again, so it is dropped without affecting the unit.
+        self.columns.held[0] = 0
+        self.columns.reset()
+        self.assertFalse(self.columns.units)
+        self.assertIs(new_columns, self.unit.__dict__["_columns"])
+        self.assertEqual(0, self.unit.__dict__["_row"])
+
+    def test_reset(self):
+        """
+        Ensure that held units are reset and healed in bulk, and that units not held this turn are released with their
+        state unchanged.
+        """
+        healthy_unit = Unit(100, 0, (3, 3), False, self.plan, has_acted=True)
+        self.columns.hold(self.unit)
+        self.columns.hold(self.other_unit)
+        self.columns.hold(healthy_unit)
+        self.columns.reset()
+
+        # The unit should have been healed by 10% of its maximum health, and the others should remain at full health.
+        self.assertEqual(60, self.unit.health)
+        self.assertEqual(100, self.other_unit.health)
+        self.assertEqual(100, healthy_unit.health)
+        for unit in [self.unit, self.other_unit, healthy_unit]:
+            self.assertEqual(3, unit.remaining_stamina)
+            self.assertFalse(unit.has_acted)
+        # None of the units have been held for next turn yet.
+        self.assertFalse(any(self.columns.held))
+
+        # Now only hold two of the units, simulating the other being killed.
+        self.columns.hold(self.other_unit)
+        self.columns.hold(healthy_unit)
+        self.unit.remaining_stamina = 0
+        self.unit.has_acted = True
+        self.columns.reset()
+
+        # The unit that was not held should be released without being reset, and the others should be renumbered.
+        self.assertListEqual([self.other_unit, healthy_unit], self.columns.units)
+        self.assertNotIn("_columns", self.unit.__dict__)
+        self.assertEqual(60, self.unit.health)
+        self.assertEqual(0, self.unit.remaining_stamina)
+        self.assertTrue(self.unit.has_acted)
+        self.assertEqual(1, healthy_unit.__dict__["_row"])
+
+    def test_reset_climate(self):
+        """
+        Ensure that units are reset and healed relative to their stats as modified by the climate.
+        """
+        climate = Climate()
+        climate.reset(has_dawned=True)
+        climate.apply()
+        self.plan.night_affinity = NightAffinity.NOCTURNE
+        self.columns.hold(self.unit)
+        self.assertEqual(25, self.unit.health)
+
+        self.columns.reset()
+        self.assertEqual(30, self.unit.health)
+        self.assertEqual(50, self.plan.max_health)
+        self.assertEqual(2, self.unit.remaining_stamina)
+
+        # Setting the unit's health should also update its base health proportionally.
+        self.unit.health = 40
+        self.assertEqual(80, self.columns.health[0])
+
+    def test_reset_heal_cap(self):
+        """
+        Ensure that units can be healed up to a cap other than their maximum health, as is the case for heathens, and
+        that units without the has_acted attribute can be released.
+        """
+        heathen = Heathen(105, 0, (4, 4), get_heathen_plan(160))
+        self.assertEqual(120, heathen.plan.max_health)
+        self.columns.hold(heathen)
+        self.columns.reset(heal_cap=100)
+
+        self.assertEqual(100, heathen.health)
+        self.assertEqual(2, heathen.remaining_stamina)
+
+        # Release the heathen by not holding it again.
+        self.columns.reset()
+        self.assertDictEqual({"health": 100, "remaining_stamina": 2},
+                             {key: heathen.__dict__[key] for key in ["health", "remaining_stamina"]})
+        self.assertNotIn("has_acted", heathen.__dict__)
+
+    def test_copy(self):
+        """
+        Ensure that copies of held units are not held in the store, but retain the state of the original.
+        """
+        self.columns.hold(self.unit)
+        copied_unit: Unit = deepcopy(self.unit)
+
+        self.assertEqual(self.unit, copied_unit)
+        self.assertNotIn("_columns", copied_unit.__dict__)
+        self.assertTrue(copied_unit.has_acted)
+        copied_unit.health = 1
+        self.assertEqual(50, self.unit.health)
+
+    def test_of(self):
+        """
+        Ensure that each player has their own columns.
+        """
+        store = UnitStore()
+        player = Player("Owner", Faction.AGRICULTURISTS, 0)
+        other_player = Player("Other", Faction.AGRICULTURISTS, 0)
+
+        self.assertIs(store.of(player), store.of(player))
+        self.assertIsNot(store.of(player), store.of(other_player))
+        self.assertIsNot(store.of(player), store.heathens)
+
+    def test_class_access(self):
+        """
+        Ensure that the descriptor itself is retrieved when attributes are accessed on the class rather than instances.
+        """
+        self.assertIsInstance(Unit.health, StoredField)
+        self.assertIsInstance(Unit.has_acted, StoredField)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+from source.upgrade_saves import main
+
+
+class UpgradeSavesTest(unittest.TestCase):
+    """
+    The test class for upgrade_saves.py.
+    """
+
+    @patch("builtins.print")
+    @patch("source.upgrade_saves.upgrade_legacy_saves")
+    def test_main(self, upgrade_mock: MagicMock, print_mock: MagicMock):
+        """
+        Ensure that the legacy saves are upgraded, and that the saves that were upgraded or could not be read are
+        printed.
+        :param upgrade_mock: The mock implementation of the upgrade_legacy_saves() function.
+        :param print_mock: The mock implementation of the print() function.
+        """
+        upgrade_mock.return_value = ["save-a.json", "save-b.json"], ["save-c.json"]
+        main([])
+        upgrade_mock.assert_called()
+        print_mock.assert_any_call("Upgraded save-a.json.")
+        print_mock.assert_any_call("Upgraded save-b.json.")
+        print_mock.assert_any_call("Could not read save-c.json, so it was left as-is.")
+        print_mock.assert_any_call("Upgraded 2 legacy saves.")
+
+        upgrade_mock.return_value = ["save-a.json"], []
+        main([])
+        print_mock.assert_called_with("Upgraded 1 legacy save.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+
+from source.foundation.catalogue import BLESSINGS, IMPROVEMENTS, get_improvement
+from source.foundation.models import Player, Faction, Settlement, Construction, VictoryProgress
+from source.game_management.victory_tracker import VictoryTracker
+
+
+class VictoryTrackerTest(unittest.TestCase):
+    """
+    The test class for victory_tracker.py.
+    """
+
+    def setUp(self) -> None:
+        """
+        Initialise a test player with a couple of settlements, as well as an empty tracker.
+        """
+        self.setl = Settlement("Utopia", (10, 10), [], [], [])
+        self.other_setl = Settlement("Dystopia", (20, 20), [], [], [])
+        self.player = Player("Victor", Faction.AGRICULTURISTS, 0, settlements=[self.setl, self.other_setl])
+        self.victories = VictoryTracker()
+
+    def test_of(self):
+        """
+        Ensure that players without any tracked progress are considered to have made none.
+        """
+        self.assertEqual(VictoryProgress(), self.victories.of(self.player))
+        self.assertIs(self.victories.of(self.player), self.victories.of(self.player))
+
+    def test_settlement_changed(self):
+        """
+        Ensure that settlements are counted towards the victories they contribute to as their satisfaction and level
+        change, without being counted twice.
+        """
+        self.setl.satisfaction = 100
+        self.setl.level = 10
+        self.victories.settlement_changed(self.player, self.setl)
+        self.victories.settlement_changed(self.player, self.setl)
+        self.victories.settlement_changed(self.player, self.other_setl)
+        self.assertEqual(VictoryProgress(1, 1), self.victories.of(self.player))
+
+        self.setl.satisfaction = 99
+        self.victories.settlement_changed(self.player, self.setl)
+        self.assertEqual(VictoryProgress(0, 1), self.victories.of(self.player))
+
+    def test_settlement_changed_captured(self):
+        """
+        Ensure that when a settlement is captured, it is counted towards its new owner's progress instead, along with
+        its construction.
+        """
+        captor = Player("Captor", Faction.IMPERIALS, 0)
+        self.setl.satisfaction = 100
+        self.setl.current_work = Construction(get_improvement("Holy Sanctum"))
+        self.victories.construction_set(self.player, self.setl)
+
+        self.victories.settlement_changed(captor, self.setl)
+        self.assertEqual(VictoryProgress(), self.victories.of(self.player))
+        self.assertEqual(VictoryProgress(jubilated_setls=1, constructing_sanctums=1), self.victories.of(captor))
+
+    def test_construction_set(self):
+        """
+        Ensure that settlements constructing the Holy Sanctum are counted once their construction has been set, and are
+        no longer counted once it has been replaced.
+        """
+        self.setl.current_work = Construction(get_improvement("Holy Sanctum"))
+        self.other_setl.current_work = Construction(get_improvement("Holy Sanctum"))
+        self.victories.construction_set(self.player, self.setl)
+        self.victories.construction_set(self.player, self.other_setl)
+        self.assertEqual(VictoryProgress(constructing_sanctums=2), self.victories.of(self.player))
+
+        self.other_setl.current_work = Construction(IMPROVEMENTS[0])
+        self.victories.construction_set(self.player, self.other_setl)
+        self.assertEqual(VictoryProgress(constructing_sanctums=1), self.victories.of(self.player))
+
+    def test_construction_completed(self):
+        """
+        Ensure that completing the Holy Sanctum counts it as constructed, and that completing any construction counts
+        the changes it made to the settlement.
+        """
+        self.setl.current_work = Construction(get_improvement("Holy Sanctum"))
+        self.victories.construction_set(self.player, self.setl)
+        self.setl.satisfaction = 100
+        self.setl.current_work = None
+        self.victories.construction_completed(self.player, self.setl, IMPROVEMENTS[0])
+        self.assertEqual(VictoryProgress(jubilated_setls=1), self.victories.of(self.player))
+
+        self.victories.construction_completed(self.player, self.setl, get_improvement("Holy Sanctum"))
+        self.assertEqual(VictoryProgress(jubilated_setls=1, constructed_sanctum=True), self.victories.of(self.player))
+
+    def test_settlement_lost(self):
+        """
+        Ensure that settlements that are lost are no longer counted, and that losing a settlement that was never counted
+        has no effect.
+        """
+        self.setl.level = 10
+        self.victories.settlement_changed(self.player, self.setl)
+        self.victories.settlement_lost(self.setl)
+        self.victories.settlement_lost(self.other_setl)
+        self.assertEqual(VictoryProgress(), self.victories.of(self.player))
+        self.assertFalse(self.victories.tallies)
+
+    def test_blessing_completed(self):
+        """
+        Ensure that only the pieces of ardour are counted when blessings are completed.
+        """
+        self.victories.blessing_completed(self.player, BLESSINGS["beg_spl"])
+        self.victories.blessing_completed(self.player, BLESSINGS["ard_one"])
+        self.victories.blessing_completed(self.player, BLESSINGS["ard_two"])
+        self.assertEqual(2, self.victories.of(self.player).ardour_pieces)
+
+    def test_rebuild(self):
+        """
+        Ensure that the tracker can be rebuilt from the players' settlements and blessings, discarding any previous
+        progress.
+        """
+        other_player = Player("Vanquished", Faction.GODLESS, 0)
+        self.victories.of(other_player).ardour_pieces = 2
+        self.setl.satisfaction = 100
+        self.other_setl.satisfaction = 100
+        # Settlements that have already constructed the Holy Sanctum are not also considered to be constructing it.
+        self.setl.improvements = [get_improvement("Holy Sanctum")]
+        self.setl.current_work = Construction(get_improvement("Holy Sanctum"))
+        self.other_setl.current_work = Construction(get_improvement("Holy Sanctum"))
+        self.player.blessings = [BLESSINGS["ard_one"], BLESSINGS["beg_spl"]]
+
+        self.victories.rebuild([self.player])
+        self.assertEqual(VictoryProgress(jubilated_setls=2, constructed_sanctum=True, constructing_sanctums=1,
+                                         ardour_pieces=1), self.victories.of(self.player))
+        self.assertEqual(VictoryProgress(), self.victories.of(other_player))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+"""
+Upgrade every legacy save in the saves directory, i.e. every JSON save made before saves recorded their version, to the
+current version of the JSON save format. Legacy saves are otherwise upgraded individually when they are first loaded.
+Each save is rewritten in place, with the original being backed up first. For example:
+
+    python -m source.upgrade_saves
+"""
+import argparse
+import typing
+
+from source.saving.game_save_manager import upgrade_legacy_saves, SAVES_DIR, LEGACY_BACKUPS_DIR
+
+
+def main(args: typing.Optional[typing.List[str]] = None):
+    """
+    Upgrade the legacy saves, and print the outcome.
+    :param args: The command-line arguments to parse, which default to those supplied to the process.
+    """
+    parser = argparse.ArgumentParser(description=f"Upgrade the legacy saves in {SAVES_DIR} to the current format, "
+                                                 f"backing them up to {LEGACY_BACKUPS_DIR}.")
+    parser.parse_args(args)
+
+    upgraded, failed = upgrade_legacy_saves()
+    for file_name in upgraded:
+        print(f"Upgraded {file_name}.")
+    for file_name in failed:
+        print(f"Could not read {file_name}, so it was left as-is.")
+    print(f"Upgraded {len(upgraded)} legacy save{'' if len(upgraded) == 1 else 's'}.")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -4,7 +4,7 @@ from copy import deepcopy
 
 from source.foundation.models import Biome, Unit, Heathen, AttackData, Player, EconomicStatus, HarvestStatus, \
     Settlement, Improvement, UnitPlan, SetlAttackData, GameConfig, InvestigationResult, Faction, Project, ProjectType, \
-    HealData, DeployerUnitPlan, DeployerUnit
+    HealData, DeployerUnitPlan, DeployerUnit, NightAffinity
 
 
 def calculate_yield_for_quad(biome: Biome) -> (float, float, float, float):
@@ -203,6 +203,18 @@ def get_setl_totals(player: Player,
     return total_wealth, total_harvest, total_zeal, total_fortune
 
 
+def get_night_affinity(player: Player) -> typing.Optional[NightAffinity]:
+    """
+    Determine the affinity for the night that units recruited by the given player have. Note that only the units of
+    the non-AI player are affected by being of The Nocturne.
+    :param player: The player recruiting the units.
+    :return: The night affinity of the player's units, if they have one.
+    """
+    if player.faction is Faction.NOCTURNE and player.ai_playstyle is None:
+        return NightAffinity.NOCTURNE
+    return None
+
+
 def complete_construction(setl: Settlement, player: Player):
     """
     Completes the current construction for the given settlement.
@@ -230,10 +242,12 @@ def complete_construction(setl: Settlement, player: Player):
             setl.level -= 1
             setl.harvest_reserves = pow(setl.level - 1, 2) * 25
             setl.produced_settler = True
+        unit_plan = deepcopy(plan)
+        unit_plan.night_affinity = get_night_affinity(player)
         if isinstance(plan, DeployerUnitPlan):
-            setl.garrison.append(DeployerUnit(plan.max_health, plan.total_stamina, setl.location, True, deepcopy(plan)))
+            setl.garrison.append(DeployerUnit(plan.max_health, plan.total_stamina, setl.location, True, unit_plan))
         else:
-            setl.garrison.append(Unit(plan.max_health, plan.total_stamina, setl.location, True, deepcopy(plan)))
+            setl.garrison.append(Unit(plan.max_health, plan.total_stamina, setl.location, True, unit_plan))
     setl.current_work = None
 
 
@@ -258,32 +272,54 @@ def investigate_relic(player: Player, unit: Unit, relic_loc: (int, int), cfg: Ga
     random_chance = random.randint(0, 100)
     # Scrutineers always succeed when investigating.
     was_successful = True if player.faction is Faction.SCRUTINEERS else random_chance < 70
+    result = InvestigationResult.NONE
     if was_successful:
         if random_chance < 10 and player.ongoing_blessing is not None:
+            result = InvestigationResult.FORTUNE
+        elif random_chance < 20 or random_chance < 30 and not cfg.fog_of_war:
+            result = InvestigationResult.WEALTH
+        elif random_chance < 30 and cfg.fog_of_war:
+            result = InvestigationResult.VISION
+        elif random_chance < 40:
+            result = InvestigationResult.HEALTH
+        elif random_chance < 50:
+            result = InvestigationResult.POWER
+        elif random_chance < 60:
+            result = InvestigationResult.STAMINA
+        else:
+            result = InvestigationResult.UPKEEP
+    grant_investigation_result(player, unit, relic_loc, result)
+    return result
+
+
+def grant_investigation_result(player: Player, unit: Unit, relic_loc: (int, int), result: InvestigationResult):
+    """
+    Grant the bonus for the given relic investigation result. Separate from the investigation itself so that previous
+    investigations can be replayed.
+    :param player: The owner of the unit that investigated the relic.
+    :param unit: The unit that investigated the relic.
+    :param relic_loc: The location of the relic.
+    :param result: The result of the investigation.
+    """
+    match result:
+        case InvestigationResult.FORTUNE:
             player.ongoing_blessing.fortune_consumed += player.ongoing_blessing.blessing.cost / 5
-            return InvestigationResult.FORTUNE
-        if random_chance < 20 or random_chance < 30 and not cfg.fog_of_war:
+        case InvestigationResult.WEALTH:
             player.wealth += 25
-            return InvestigationResult.WEALTH
-        if random_chance < 30 and cfg.fog_of_war:
+        case InvestigationResult.VISION:
             for i in range(relic_loc[1] - 10, relic_loc[1] + 11):
                 for j in range(relic_loc[0] - 10, relic_loc[0] + 11):
                     player.quads_seen.add((j, i))
-            return InvestigationResult.VISION
-        if random_chance < 40:
+        case InvestigationResult.HEALTH:
             unit.plan.max_health += 5
             unit.health += 5
-            return InvestigationResult.HEALTH
-        if random_chance < 50:
+        case InvestigationResult.POWER:
             unit.plan.power += 5
-            return InvestigationResult.POWER
-        if random_chance < 60:
+        case InvestigationResult.STAMINA:
             unit.plan.total_stamina += 1
             unit.remaining_stamina = unit.plan.total_stamina
-            return InvestigationResult.STAMINA
-        unit.plan.cost = 0
-        return InvestigationResult.UPKEEP
-    return InvestigationResult.NONE
+        case InvestigationResult.UPKEEP:
+            unit.plan.cost = 0
 
 
 def gen_spiral_indices(initial_loc: (int, int)) -> typing.List[typing.Tuple[int, int]]: